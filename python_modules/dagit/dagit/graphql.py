@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
 from asyncio import Queue, Task, get_event_loop
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
 
 from dagit.templates.playground import TEMPLATE
+from dagster_graphql.implementation.storage_queries import offload_storage_queries
 from graphene import Schema
 from graphql.error import GraphQLError
 from graphql.error import format_error as format_graphql_error
@@ -40,13 +42,28 @@ class GraphQLWS(str, Enum):
     STOP = "stop"
 
 
+# Maximum number of storage queries that run concurrently across all in-flight graphql requests
+DEFAULT_STORAGE_QUERY_MAX_WORKERS = 8
+
+
 class GraphQLServer(ABC):
-    def __init__(self, app_path_prefix: str = ""):
+    def __init__(
+        self,
+        app_path_prefix: str = "",
+        storage_query_max_workers: int = DEFAULT_STORAGE_QUERY_MAX_WORKERS,
+    ):
         self._app_path_prefix = app_path_prefix
 
         self._graphql_schema = self.build_graphql_schema()
         self._graphql_middleware = self.build_graphql_middleware()
 
+        # storage queries of independent fields run concurrently on this pool, see
+        # execute_graphql_request
+        self._storage_query_executor = ThreadPoolExecutor(
+            max_workers=check.int_param(storage_query_max_workers, "storage_query_max_workers"),
+            thread_name_prefix="dagit_storage_query",
+        )
+
     @abstractmethod
     def build_graphql_schema(self) -> Schema:
         raise NotImplementedError()
@@ -192,15 +209,22 @@ async def execute_graphql_request(
         variables: Optional[Dict[str, Any]],
         operation_name: Optional[str],
     ) -> ExecutionResult:
-        # use run_in_threadpool since underlying schema is sync
-        return await run_in_threadpool(
-            self._graphql_schema.execute,
-            query,
-            variables=variables,
-            operation_name=operation_name,
-            context=self.make_request_context(request),
-            middleware=self._graphql_middleware,
-        )
+        context = self.make_request_context(request)
+
+        def _execute():
+            with offload_storage_queries(self._storage_query_executor) as executor:
+                return self._graphql_schema.execute(
+                    query,
+                    variables=variables,
+                    operation_name=operation_name,
+                    context=context,
+                    middleware=self._graphql_middleware,
+                    executor=executor,
+                )
+
+        # use run_in_threadpool since underlying schema is sync, storage queries are further
+        # offloaded to the storage query pool so that independent fields resolve concurrently
+        return await run_in_threadpool(_execute)
 
     def execute_graphql_subscription(
         self,
@@ -33,6 +33,26 @@
 }
 """
 
+RUNS_QUERY = """
+query RunsQuery {
+    runsOrError {
+        ... on Runs {
+            count
+            results {
+                runId
+                stepStats {
+                    stepKey
+                    status
+                }
+                events {
+                    __typename
+                }
+            }
+        }
+    }
+}
+"""
+
 
 def _add_run(instance):
     @op
@@ -157,6 +177,19 @@ def test_graphql_post(test_client: TestClient):
     assert response.json() == {"data": {"__typename": "DagitQuery"}}
 
 
+def test_graphql_post_storage_queries(instance, test_client: TestClient):
+    run_id = _add_run(instance)
+
+    response = test_client.post("/graphql", json={"query": RUNS_QUERY})
+    assert response.status_code == 200, response.text
+
+    runs = response.json()["data"]["runsOrError"]
+    assert runs["count"] == len(runs["results"])
+    run = next(run for run in runs["results"] if run["runId"] == run_id)
+    assert run["stepStats"] == [{"stepKey": "my_op", "status": "SUCCESS"}]
+    assert run["events"]
+
+
 def test_graphql_ws_error(test_client: TestClient):
     # wtf pylint
     # pylint: disable=not-context-manager
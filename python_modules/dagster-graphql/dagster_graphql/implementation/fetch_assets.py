@@ -1,7 +1,9 @@
-from typing import TYPE_CHECKING, Dict, Mapping
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Tuple
 
 from dagster import AssetKey, DagsterEventType, EventRecordsFilter, check, seven
 from dagster.core.events import ASSET_EVENTS
+from dagster.core.host_representation import ExternalRepository, RepositoryLocation
+from dagster.core.host_representation.external_data import ExternalAssetNode
 
 from .utils import capture_error
 
@@ -25,6 +27,7 @@ def _normalize_asset_cursor_str(cursor_string):
 
 @capture_error
 def get_assets(graphene_info, prefix=None, cursor=None, limit=None):
+    from ..schema.asset_graph import GrapheneAssetNode
     from ..schema.pipelines.pipeline import GrapheneAsset
     from ..schema.roots.assets import GrapheneAssetConnection
 
@@ -34,58 +37,110 @@ def get_assets(graphene_info, prefix=None, cursor=None, limit=None):
     materialized_keys = instance.get_asset_keys(
         prefix=prefix, limit=limit, cursor=normalized_cursor_str
     )
-    asset_nodes_by_asset_key = {
-        asset_key: asset_node
-        for asset_key, asset_node in get_asset_nodes_by_asset_key(graphene_info).items()
+    external_asset_nodes_by_asset_key = {
+        asset_key: external_asset_node_info
+        for asset_key, external_asset_node_info in _get_external_asset_nodes_by_asset_key(
+            graphene_info
+        ).items()
         if (not prefix or asset_key.path[: len(prefix)] == prefix)
         and (not cursor or asset_key.to_string() > cursor)
     }
 
-    asset_keys = sorted(set(materialized_keys).union(asset_nodes_by_asset_key.keys()), key=str)
+    asset_keys = sorted(
+        set(materialized_keys).union(external_asset_nodes_by_asset_key.keys()), key=str
+    )
     if limit:
         asset_keys = asset_keys[:limit]
 
+    # only build graphene asset nodes for the page of assets being returned
     return GrapheneAssetConnection(
         nodes=[
             GrapheneAsset(
                 key=asset_key,
-                definition=asset_nodes_by_asset_key.get(asset_key),
+                definition=GrapheneAssetNode(*external_asset_nodes_by_asset_key[asset_key])
+                if asset_key in external_asset_nodes_by_asset_key
+                else None,
             )
             for asset_key in asset_keys
         ]
     )
 
 
-def get_asset_nodes_by_asset_key(graphene_info) -> Mapping[AssetKey, "GrapheneAssetNode"]:
+def _get_external_asset_nodes_by_asset_key(
+    graphene_info,
+) -> Mapping[AssetKey, Tuple[RepositoryLocation, ExternalRepository, ExternalAssetNode]]:
     """
     If multiple repositories have asset nodes for the same asset key, chooses the asset node that
     has an op.
     """
+    external_asset_nodes_by_asset_key: Dict[
+        AssetKey, Tuple[RepositoryLocation, ExternalRepository, ExternalAssetNode]
+    ] = {}
+    for location in graphene_info.context.repository_locations:
+        for repository in location.get_repositories().values():
+            for external_asset_node in repository.get_asset_graph().get_nodes():
+                preexisting = external_asset_nodes_by_asset_key.get(external_asset_node.asset_key)
+                if preexisting is None or preexisting[2].op_name is None:
+                    external_asset_nodes_by_asset_key[external_asset_node.asset_key] = (
+                        location,
+                        repository,
+                        external_asset_node,
+                    )
+
+    return external_asset_nodes_by_asset_key
 
-    from ..schema.asset_graph import GrapheneAssetNode
 
-    asset_nodes_by_asset_key: Dict[AssetKey, GrapheneAssetNode] = {}
+def _get_external_asset_node(
+    graphene_info, asset_key: AssetKey
+) -> Optional[Tuple[RepositoryLocation, ExternalRepository, ExternalAssetNode]]:
+    # same resolution as _get_external_asset_nodes_by_asset_key, but reads a single key from each
+    # repository's asset graph index instead of materializing every asset node
+    result = None
     for location in graphene_info.context.repository_locations:
         for repository in location.get_repositories().values():
-            for external_asset_node in repository.get_external_asset_nodes():
-                preexisting_node = asset_nodes_by_asset_key.get(external_asset_node.asset_key)
-                if preexisting_node is None or preexisting_node.external_asset_node.op_name is None:
-                    asset_nodes_by_asset_key[external_asset_node.asset_key] = GrapheneAssetNode(
-                        location, repository, external_asset_node
-                    )
+            external_asset_node = repository.get_asset_graph().get_node(asset_key)
+            if external_asset_node is None:
+                continue
+            if result is None or result[2].op_name is None:
+                result = (location, repository, external_asset_node)
 
-    return asset_nodes_by_asset_key
+    return result
+
+
+def get_asset_nodes_by_asset_key(graphene_info) -> Mapping[AssetKey, "GrapheneAssetNode"]:
+    """
+    If multiple repositories have asset nodes for the same asset key, chooses the asset node that
+    has an op.
+    """
+
+    from ..schema.asset_graph import GrapheneAssetNode
+
+    return {
+        asset_key: GrapheneAssetNode(location, repository, external_asset_node)
+        for asset_key, (
+            location,
+            repository,
+            external_asset_node,
+        ) in _get_external_asset_nodes_by_asset_key(graphene_info).items()
+    }
 
 
 def get_asset_nodes(graphene_info):
     return get_asset_nodes_by_asset_key(graphene_info).values()
 
 
+def _get_graphene_asset_node(graphene_info, asset_key: AssetKey) -> Optional["GrapheneAssetNode"]:
+    from ..schema.asset_graph import GrapheneAssetNode
+
+    external_asset_node_info = _get_external_asset_node(graphene_info, asset_key)
+    return GrapheneAssetNode(*external_asset_node_info) if external_asset_node_info else None
+
+
 def get_asset_node(graphene_info, asset_key):
     from ..schema.errors import GrapheneAssetNotFoundError
 
     check.inst_param(asset_key, "asset_key", AssetKey)
-    node = get_asset_nodes_by_asset_key(graphene_info).get(asset_key, None)
+    node = _get_graphene_asset_node(graphene_info, asset_key)
     if not node:
         return GrapheneAssetNotFoundError(asset_key=asset_key)
     return node
@@ -98,8 +153,7 @@ def get_asset(graphene_info, asset_key):
     check.inst_param(asset_key, "asset_key", AssetKey)
     instance = graphene_info.context.instance
 
-    asset_nodes_by_asset_key = get_asset_nodes_by_asset_key(graphene_info)
-    asset_node = asset_nodes_by_asset_key.get(asset_key)
+    asset_node = _get_graphene_asset_node(graphene_info, asset_key)
 
     if not asset_node and not instance.has_asset_key(asset_key):
         return GrapheneAssetNotFoundError(asset_key=asset_key)
@@ -164,15 +218,12 @@ def get_asset_run_ids(graphene_info, asset_key):
     return instance.run_ids_for_asset_key(asset_key)
 
 
-def get_assets_for_run_id(graphene_info, run_id):
-    from ..schema.pipelines.pipeline import GrapheneAsset
-
+def get_asset_keys_for_run_id(graphene_info, run_id):
     check.str_param(run_id, "run_id")
 
     records = graphene_info.context.instance.all_logs(run_id, of_type=ASSET_EVENTS)
-    asset_keys = [
+    return [
         record.dagster_event.asset_key
         for record in records
         if record.is_dagster_event and record.dagster_event.asset_key
     ]
-    return [GrapheneAsset(key=asset_key) for asset_key in asset_keys]
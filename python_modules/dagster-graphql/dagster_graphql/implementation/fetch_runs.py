@@ -14,6 +14,7 @@
 from dagster.utils import utc_datetime_from_timestamp
 
 from .external import ensure_valid_config, get_external_pipeline_or_raise
+from .loader import BatchRunStatsLoader
 from .utils import UserFacingGraphQLError, capture_error
 
 
@@ -93,18 +94,25 @@ def get_run_group(graphene_info, run_id):
 
 
 def get_runs(graphene_info, filters, cursor=None, limit=None):
-    from ..schema.pipelines.pipeline import GrapheneRun
+    records = get_run_records(graphene_info, filters, cursor, limit)
+    return get_runs_from_records(graphene_info, records)
+
 
+def get_run_records(graphene_info, filters, cursor=None, limit=None):
     check.opt_inst_param(filters, "filters", RunsFilter)
     check.opt_str_param(cursor, "cursor")
     check.opt_int_param(limit, "limit")
 
     instance = graphene_info.context.instance
+    return instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
 
-    return [
-        GrapheneRun(record)
-        for record in instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
-    ]
+
+def get_runs_from_records(graphene_info, records):
+    from ..schema.pipelines.pipeline import GrapheneRun
+
+    instance = graphene_info.context.instance
+    stats_loader = BatchRunStatsLoader(instance, [record.pipeline_run.run_id for record in records])
+    return [GrapheneRun(record, stats_loader=stats_loader) for record in records]
 
 
 PENDING_STATUSES = [
@@ -260,11 +268,12 @@ def get_asset_runs_count_by_step(graphene_info, asset_nodes):
     step_key_to_job_names: Dict[str, List[str]] = {
         asset_node.op_name: asset_node.job_names for asset_node in asset_nodes
     }
-    materializations = instance.get_latest_materialization_events(
+    # only the materialization timestamps are needed, so avoid fetching the events
+    materializations = instance.get_latest_materialization_summaries(
         [asset_node.asset_key for asset_node in asset_nodes]
     )
     for asset_node in asset_nodes:
-        event = materializations.get(asset_node.asset_key)
+        materialization = materializations.get(asset_node.asset_key)
         step_key = asset_node.op_name
         job_names = step_key_to_job_names[step_key]
         runs_count = sum(
@@ -272,8 +281,8 @@ def get_asset_runs_count_by_step(graphene_info, asset_nodes):
                 instance.get_runs_count(
                     RunsFilter(
                         pipeline_name=job_name,
-                        updated_after=utc_datetime_from_timestamp(event.timestamp)
-                        if event
+                        updated_after=utc_datetime_from_timestamp(materialization.timestamp)
+                        if materialization
                         else None,
                     )
                 )
@@ -283,11 +292,11 @@ def get_asset_runs_count_by_step(graphene_info, asset_nodes):
 
         # If a materialization has occurred, we subtract one so that the runs count
         # does not include the run that generated the materialization.
-        if event:
+        if materialization:
             runs_count -= 1
 
         jobs_runs_count[step_key] = GrapheneJobRunsCount(
-            step_key, job_names, runs_count, True if event else False
+            step_key, job_names, runs_count, True if materialization else False
         )
     return jobs_runs_count
 
@@ -358,10 +367,15 @@ def get_execution_plan(graphene_info, selector, run_config, mode):
 
 
 @capture_error
-def get_stats(graphene_info, run_id):
+def get_stats(graphene_info, run_id, stats_loader=None):
     from ..schema.pipelines.pipeline_run_stats import GrapheneRunStatsSnapshot
 
-    stats = graphene_info.context.instance.get_run_stats(run_id)
+    check.opt_inst_param(stats_loader, "stats_loader", BatchRunStatsLoader)
+
+    if stats_loader:
+        stats = stats_loader.get_run_stats(run_id)
+    else:
+        stats = graphene_info.context.instance.get_run_stats(run_id)
     stats.id = "stats-{run_id}"
     return GrapheneRunStatsSnapshot(stats)
 
@@ -7,7 +7,13 @@
 from dagster.core.events.log import EventLogEntry
 from dagster.core.host_representation import ExternalRepository
 from dagster.core.scheduler.instigation import InstigatorType
-from dagster.core.storage.pipeline_run import JobBucket, RunRecord, RunsFilter, TagBucket
+from dagster.core.storage.pipeline_run import (
+    JobBucket,
+    PipelineRunStatsSnapshot,
+    RunRecord,
+    RunsFilter,
+    TagBucket,
+)
 from dagster.core.storage.tags import SCHEDULE_NAME_TAG, SENSOR_NAME_TAG
 
 
@@ -253,6 +259,31 @@ def _fetch(self):
             self._records[record.pipeline_run.run_id] = record
 
 
+class BatchRunStatsLoader:
+    """
+    A batch loader that fetches the run stats for a set of runs by run_id. This loader is expected
+    to be instantiated once with the run_ids of a page of runs, so that resolving the stats of each
+    run in the page does not require a separate call to the event log storage.
+    """
+
+    def __init__(self, instance: DagsterInstance, run_ids: Iterable[str]):
+        self._instance = instance
+        self._run_ids: List[str] = list(run_ids)
+        self._stats: Optional[Dict[str, PipelineRunStatsSnapshot]] = None
+
+    def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
+        if run_id not in self._run_ids:
+            check.failed(
+                f"Run id {run_id} not recognized for this loader.  Expected one of: {self._run_ids}"
+            )
+        if self._stats is None:
+            self._fetch()
+        return self._stats[run_id]
+
+    def _fetch(self):
+        self._stats = self._instance.get_runs_stats(self._run_ids)
+
+
 class BatchMaterializationLoader:
     """
     A batch loader that fetches materializations for asset keys.  This loader is expected to be
@@ -0,0 +1,92 @@
+import asyncio
+import contextvars
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+from graphql.execution.executors.asyncio import AsyncioExecutor
+
+from dagster import check
+
+
+class _StorageQueryContext(NamedTuple):
+    loop: asyncio.AbstractEventLoop
+    executor: Executor
+
+
+_storage_query_context: "contextvars.ContextVar[Optional[_StorageQueryContext]]" = (
+    contextvars.ContextVar("storage_query_context", default=None)
+)
+
+
+@contextmanager
+def offload_storage_queries(executor: Executor) -> Iterator[AsyncioExecutor]:
+    """
+    Yields a graphql executor under which resolvers that query storage through
+    `resolve_storage_query` run their queries on the given (bounded) executor instead of inline,
+    so that independent fields of a request query storage concurrently.
+
+    The storage implementations are synchronous, so the queries are offloaded to threads rather
+    than awaited natively. The request is executed on a private event loop, which keeps the graphql
+    execution (including all graphene object construction) on the calling thread.
+
+    Example:
+
+    .. code-block:: python
+
+        with offload_storage_queries(thread_pool) as executor:
+            result = schema.execute(query, context=context, executor=executor)
+    """
+    check.inst_param(executor, "executor", Executor)
+
+    loop = asyncio.new_event_loop()
+    token = _storage_query_context.set(_StorageQueryContext(loop, executor))
+    try:
+        yield AsyncioExecutor(loop=loop)
+    finally:
+        _storage_query_context.reset(token)
+        loop.close()
+
+
+def _run_inline(fn: Callable) -> Any:
+    # storage queries made from an offloaded query run inline on its thread
+    token = _storage_query_context.set(None)
+    try:
+        return fn()
+    finally:
+        _storage_query_context.reset(token)
+
+
+def resolve_storage_query(
+    fetch_fn: Callable[[], Any], build_fn: Optional[Callable[[Any], Any]] = None
+) -> Any:
+    """
+    Resolves a field by calling a function that queries storage, and optionally a function that
+    builds the field's graphene objects from the query result.
+
+    Outside of `offload_storage_queries`, both are called inline and the built result is returned.
+    Within it, the query is submitted to the storage query executor and an awaitable of the built
+    result is returned, which the graphql executor resolves once the query completes. The result is
+    built on the request thread once the query completes, so the query function should only read
+    from storage and return plain records.
+    """
+    check.callable_param(fetch_fn, "fetch_fn")
+    check.opt_callable_param(build_fn, "build_fn")
+
+    query_context = _storage_query_context.get()
+    if query_context is None:
+        result = fetch_fn()
+        return build_fn(result) if build_fn else result
+
+    # carry over the request's context vars, e.g. the traced call counter
+    context = contextvars.copy_context()
+    future = query_context.loop.run_in_executor(
+        query_context.executor, context.run, _run_inline, fetch_fn
+    )
+    if not build_fn:
+        return future
+
+    async def _build():
+        return build_fn(await future)
+
+    return _build()
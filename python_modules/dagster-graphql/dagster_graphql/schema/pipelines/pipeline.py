@@ -9,12 +9,17 @@
 from dagster.utils import datetime_as_float
 
 from ...implementation.events import from_event_record
-from ...implementation.fetch_assets import get_assets_for_run_id
+from ...implementation.fetch_assets import get_asset_keys_for_run_id
 from ...implementation.fetch_pipelines import get_pipeline_reference_or_raise
-from ...implementation.fetch_runs import get_runs, get_stats, get_step_stats
+from ...implementation.fetch_runs import get_runs, get_stats
 from ...implementation.fetch_schedules import get_schedules_for_pipeline
 from ...implementation.fetch_sensors import get_sensors_for_pipeline
-from ...implementation.loader import BatchRunLoader, RepositoryScopedBatchLoader
+from ...implementation.loader import (
+    BatchRunLoader,
+    BatchRunStatsLoader,
+    RepositoryScopedBatchLoader,
+)
+from ...implementation.storage_queries import resolve_storage_query
 from ...implementation.utils import UserFacingGraphQLError, capture_error
 from ..asset_key import GrapheneAssetKey
 from ..dagster_types import GrapheneDagsterType, GrapheneDagsterTypeOrError, to_dagster_type
@@ -131,17 +136,22 @@ def resolve_assetMaterializations(self, graphene_info, **kwargs):
         if partitionInLast and self._definition:
             partitions = self._definition.get_partition_keys()[-int(partitionInLast) :]
 
-        events = get_asset_materializations(
-            graphene_info,
-            self.key,
-            partitions=partitions,
-            before_timestamp=before_timestamp,
-            after_timestamp=after_timestamp,
-            limit=limit,
-        )
-        run_ids = [event.run_id for event in events]
-        loader = BatchRunLoader(graphene_info.context.instance, run_ids) if run_ids else None
-        return [GrapheneMaterializationEvent(event=event, loader=loader) for event in events]
+        def _fetch_materializations():
+            return get_asset_materializations(
+                graphene_info,
+                self.key,
+                partitions=partitions,
+                before_timestamp=before_timestamp,
+                after_timestamp=after_timestamp,
+                limit=limit,
+            )
+
+        def _build_materializations(events):
+            run_ids = [event.run_id for event in events]
+            loader = BatchRunLoader(graphene_info.context.instance, run_ids) if run_ids else None
+            return [GrapheneMaterializationEvent(event=event, loader=loader) for event in events]
+
+        return resolve_storage_query(_fetch_materializations, _build_materializations)
 
     def resolve_assetObservations(self, graphene_info, **kwargs):
         from ...implementation.fetch_assets import get_asset_observations
@@ -153,9 +163,8 @@ def resolve_assetObservations(self, graphene_info, **kwargs):
         if partitionInLast and self._definition:
             partitions = self._definition.get_partition_keys()[-int(partitionInLast) :]
 
-        return [
-            GrapheneObservationEvent(event=event)
-            for event in get_asset_observations(
+        def _fetch_observations():
+            return get_asset_observations(
                 graphene_info,
                 self.key,
                 partitions=partitions,
@@ -163,7 +172,11 @@ def resolve_assetObservations(self, graphene_info, **kwargs):
                 after_timestamp=after_timestamp,
                 limit=limit,
             )
-        ]
+
+        return resolve_storage_query(
+            _fetch_observations,
+            lambda events: [GrapheneObservationEvent(event=event) for event in events],
+        )
 
 
 class GraphenePipelineRun(graphene.Interface):
@@ -248,7 +261,7 @@ class Meta:
         interfaces = (GraphenePipelineRun,)
         name = "Run"
 
-    def __init__(self, record):
+    def __init__(self, record, stats_loader=None):
         check.inst_param(record, "record", RunRecord)
         pipeline_run = record.pipeline_run
         super().__init__(
@@ -259,6 +272,8 @@ def __init__(self, record):
         self._pipeline_run = pipeline_run
         self._run_record = record
         self._run_stats = None
+        # optional run stats loader, provided by a parent resolver that instantiates multiple runs
+        self._stats_loader = check.opt_inst_param(stats_loader, "stats_loader", BatchRunStatsLoader)
 
     def resolve_id(self, _graphene_info):
         return self._pipeline_run.run_id
@@ -291,10 +306,13 @@ def resolve_pipelineSnapshotId(self, _graphene_info):
         return self._pipeline_run.pipeline_snapshot_id
 
     def resolve_stats(self, graphene_info):
-        return get_stats(graphene_info, self.run_id)
+        return get_stats(graphene_info, self.run_id, stats_loader=self._stats_loader)
 
     def resolve_stepStats(self, graphene_info):
-        return get_step_stats(graphene_info, self.run_id)
+        return resolve_storage_query(
+            lambda: graphene_info.context.instance.get_run_step_stats(self.run_id),
+            lambda step_stats: [GrapheneRunStepStats(stats) for stats in step_stats],
+        )
 
     def resolve_computeLogs(self, _graphene_info, stepKey):
         return GrapheneComputeLogs(runId=self.run_id, stepKey=stepKey)
@@ -354,17 +372,29 @@ def resolve_canTerminate(self, graphene_info):
         return graphene_info.context.instance.run_coordinator.can_cancel_run(self.run_id)
 
     def resolve_assets(self, graphene_info):
-        return get_assets_for_run_id(graphene_info, self.run_id)
+        return resolve_storage_query(
+            lambda: get_asset_keys_for_run_id(graphene_info, self.run_id),
+            lambda asset_keys: [GrapheneAsset(key=asset_key) for asset_key in asset_keys],
+        )
 
     def resolve_events(self, graphene_info, after=-1):
-        events = graphene_info.context.instance.logs_after(self.run_id, cursor=after)
-        return [from_event_record(event, self._pipeline_run.pipeline_name) for event in events]
+        return resolve_storage_query(
+            lambda: graphene_info.context.instance.logs_after(self.run_id, cursor=after),
+            lambda events: [
+                from_event_record(event, self._pipeline_run.pipeline_name) for event in events
+            ],
+        )
 
     def _get_run_record(self, instance):
         if not self._run_record:
             self._run_record = instance.get_run_records(RunsFilter(run_ids=[self.run_id]))[0]
         return self._run_record
 
+    def _get_run_stats(self, instance):
+        if self._stats_loader:
+            return self._stats_loader.get_run_stats(self.run_id)
+        return instance.get_run_stats(self.run_id)
+
     def resolve_startTime(self, graphene_info):
         run_record = self._get_run_record(graphene_info.context.instance)
         # If a user has not migrated in 0.13.15, then run_record will not have start_time and end_time. So it will be necessary to fill this data using the run_stats. Since we potentially make this call multiple times, we cache the result.
@@ -374,7 +404,7 @@ def resolve_startTime(self, graphene_info):
                 return None
 
             if self._run_stats is None or self._run_stats.start_time is None:
-                self._run_stats = graphene_info.context.instance.get_run_stats(self.runId)
+                self._run_stats = self._get_run_stats(graphene_info.context.instance)
             return self._run_stats.start_time
         return run_record.start_time
 
@@ -382,7 +412,7 @@ def resolve_endTime(self, graphene_info):
         run_record = self._get_run_record(graphene_info.context.instance)
         if run_record.end_time is None and self._pipeline_run.status in COMPLETED_STATUSES:
             if self._run_stats is None or self._run_stats.end_time is None:
-                self._run_stats = graphene_info.context.instance.get_run_stats(self.runId)
+                self._run_stats = self._get_run_stats(graphene_info.context.instance)
             return self._run_stats.end_time
         return run_record.end_time
 
@@ -692,7 +722,11 @@ def resolve_runs(self, graphene_info, **kwargs):
             records = self._batch_loader.get_run_records_for_job(
                 self._external_pipeline.name, kwargs.get("limit")
             )
-            return [GrapheneRun(record) for record in records]
+            stats_loader = BatchRunStatsLoader(
+                graphene_info.context.instance,
+                [record.pipeline_run.run_id for record in records],
+            )
+            return [GrapheneRun(record, stats_loader=stats_loader) for record in records]
 
         # otherwise, fall back to the default implementation
         return super().resolve_runs(graphene_info, **kwargs)
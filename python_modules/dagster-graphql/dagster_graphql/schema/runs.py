@@ -5,7 +5,8 @@
 
 from dagster import check
 
-from ..implementation.fetch_runs import get_runs, get_runs_count
+from ..implementation.fetch_runs import get_run_records, get_runs_count, get_runs_from_records
+from ..implementation.storage_queries import resolve_storage_query
 from .errors import (
     GrapheneInvalidPipelineRunsFilterError,
     GraphenePythonError,
@@ -107,10 +108,13 @@ def __init__(self, filters, cursor, limit):
         self._limit = limit
 
     def resolve_results(self, graphene_info):
-        return get_runs(graphene_info, self._filters, self._cursor, self._limit)
+        return resolve_storage_query(
+            lambda: get_run_records(graphene_info, self._filters, self._cursor, self._limit),
+            lambda records: get_runs_from_records(graphene_info, records),
+        )
 
     def resolve_count(self, graphene_info):
-        return get_runs_count(graphene_info, self._filters)
+        return resolve_storage_query(lambda: get_runs_count(graphene_info, self._filters))
 
 
 class GrapheneRunsOrError(graphene.Union):
@@ -409,11 +409,7 @@ def resolve_asset_nodes(self, graphene_info):
             origin = repo_handle.repository_location_origin
             location = graphene_info.context.get_location(origin.location_name)
             ext_repo = location.get_repository(repo_handle.repository_name)
-            nodes = [
-                node
-                for node in ext_repo.get_external_asset_nodes()
-                if node.op_name == self.solid_def_name
-            ]
+            nodes = ext_repo.get_asset_graph().get_nodes_for_op(self.solid_def_name)
             return [GrapheneAssetNode(location, ext_repo, node) for node in nodes]
 
 
@@ -99,6 +99,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -227,6 +243,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -464,38 +512,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -519,82 +535,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.1911ab01e2793bee79966087891220eb5acefe79": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"alp_a\\": {}, \\"alp_b\\": {}, \\"noop_solid\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.28035361ae42a6bf7a7ad8e82c7f0aac1768525f"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.1911ab01e2793bee79966087891220eb5acefe79",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -763,6 +703,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6591a3339b3b7730c990c87ddbe5f3d52eaa31a8": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"alp_a\\": {}, \\"alp_b\\": {}, \\"noop_solid\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.28035361ae42a6bf7a7ad8e82c7f0aac1768525f"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6591a3339b3b7730c990c87ddbe5f3d52eaa31a8",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -798,6 +791,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -853,7 +896,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -861,69 +904,51 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [],
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+          }
+        ],
         "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
+        "fields": [],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -1154,7 +1179,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.1911ab01e2793bee79966087891220eb5acefe79"
+      "root_config_key": "Shape.6591a3339b3b7730c990c87ddbe5f3d52eaa31a8"
     }
   ],
   "name": "asset_lineage_pipeline",
@@ -1262,9 +1287,9 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 10'] = '8903c7110574b90a7b398cf7d41961ff7387c5e7'
+snapshots['test_all_snapshot_ids 10'] = '87c7769cefab3f771b3ce07b7c85f39937ec44ea'
 
-snapshots['test_all_snapshot_ids 100'] = '5f6f62bc4b119095df230745aff54208db0cbeea'
+snapshots['test_all_snapshot_ids 100'] = 'c788f0c91703e132b0524b064636798ce2582b3e'
 
 snapshots['test_all_snapshot_ids 101'] = '''{
   "__class__": "PipelineSnapshot",
@@ -1359,6 +1384,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "Permissive": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -1468,7 +1509,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1476,31 +1517,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.2450dd699b86b34130d4162d906aa57730c8a63c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1508,24 +1549,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -1847,7 +1888,30 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.24b255cb9f12b96e81deff856985d50f675e763a": {
+      "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.40ce4527961dc5ac7ef4d1dc7092cbf531ba7b2c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1862,7 +1926,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416"
+            "type_key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -1893,30 +1957,7 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.24b255cb9f12b96e81deff856985d50f675e763a",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
+        "key": "Shape.40ce4527961dc5ac7ef4d1dc7092cbf531ba7b2c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -2073,209 +2114,28 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.6fbc82984917129159793266b2c425ba21ace18f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "io_manager",
-            "type_key": "Shape.44f2a71367507edd1b8e64f739222c4312b3691b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "root_manager",
-            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.6fbc82984917129159793266b2c425ba21ace18f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Any"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.ca9d191bc601d7df07b309fbcc1a5848eafee07a": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "input_partitions",
-            "type_key": "Permissive"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "output_partitions",
-            "type_key": "Permissive"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.ca9d191bc601d7df07b309fbcc1a5848eafee07a",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [],
-        "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.de7a778abb11df13f7d18c8ea327e21f3a17e14e": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "ops": "solids"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"assets\\": {}}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.4190c6873afddcfd2b8e5c79671674bc3a3286e6"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "outputs",
-            "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.de7a778abb11df13f7d18c8ea327e21f3a17e14e",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -2297,7 +2157,197 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.6fbc82984917129159793266b2c425ba21ace18f": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "io_manager",
+            "type_key": "Shape.44f2a71367507edd1b8e64f739222c4312b3691b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "root_manager",
+            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6fbc82984917129159793266b2c425ba21ace18f",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Any"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.ca9d191bc601d7df07b309fbcc1a5848eafee07a": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "input_partitions",
+            "type_key": "Permissive"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "output_partitions",
+            "type_key": "Permissive"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ca9d191bc601d7df07b309fbcc1a5848eafee07a",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [],
+        "given_name": null,
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.de7a778abb11df13f7d18c8ea327e21f3a17e14e": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "ops": "solids"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"assets\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.4190c6873afddcfd2b8e5c79671674bc3a3286e6"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "outputs",
+            "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.de7a778abb11df13f7d18c8ea327e21f3a17e14e",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -2537,7 +2587,7 @@
           "name": "root_manager"
         }
       ],
-      "root_config_key": "Shape.24b255cb9f12b96e81deff856985d50f675e763a"
+      "root_config_key": "Shape.40ce4527961dc5ac7ef4d1dc7092cbf531ba7b2c"
     }
   ],
   "name": "time_partitioned_assets_job",
@@ -2611,7 +2661,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 102'] = '21b7eeff286ec2fbc108e1489df620a6d468200a'
+snapshots['test_all_snapshot_ids 102'] = 'e9856f55662749140fea841739133cc1cc1e02af'
 
 snapshots['test_all_snapshot_ids 103'] = '''{
   "__class__": "PipelineSnapshot",
@@ -2706,6 +2756,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "Permissive": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -2815,7 +2881,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2823,31 +2889,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.2450dd699b86b34130d4162d906aa57730c8a63c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2855,24 +2921,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -3332,78 +3398,158 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.6fbc82984917129159793266b2c425ba21ace18f": {
+      "Shape.581a4950382e9cf16467fc0c3980e9c25b8dd3be": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "ops": "solids"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {}}",
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
             "description": null,
             "is_required": false,
-            "name": "io_manager",
-            "type_key": "Shape.44f2a71367507edd1b8e64f739222c4312b3691b"
+            "name": "execution",
+            "type_key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"asset_one\\": {\\"config\\": {\\"assets\\": {}}}, \\"asset_two\\": {\\"config\\": {\\"assets\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "ops",
+            "type_key": "Shape.c00b7646bc5339cff1920a8df0cfddf2fcde42e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.6fbc82984917129159793266b2c425ba21ace18f"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.581a4950382e9cf16467fc0c3980e9c25b8dd3be",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "root_manager",
-            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.6fbc82984917129159793266b2c425ba21ace18f",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+      "Shape.6fbc82984917129159793266b2c425ba21ace18f": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "io_manager",
+            "type_key": "Shape.44f2a71367507edd1b8e64f739222c4312b3691b"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
+            "name": "root_manager",
+            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
           }
         ],
         "given_name": null,
-        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+        "key": "Shape.6fbc82984917129159793266b2c425ba21ace18f",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416": {
+      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8"
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416",
+        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3442,53 +3588,23 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.9e26ad84a5a67a79cb01f0d91869aeaf2c1c625d": {
+      "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "ops": "solids"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"asset_one\\": {\\"config\\": {\\"assets\\": {}}}, \\"asset_two\\": {\\"config\\": {\\"assets\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.c00b7646bc5339cff1920a8df0cfddf2fcde42e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.6fbc82984917129159793266b2c425ba21ace18f"
+            "name": "config",
+            "type_key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c"
           }
         ],
         "given_name": null,
-        "key": "Shape.9e26ad84a5a67a79cb01f0d91869aeaf2c1c625d",
+        "key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3610,47 +3726,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -3884,7 +3959,7 @@
           "name": "root_manager"
         }
       ],
-      "root_config_key": "Shape.9e26ad84a5a67a79cb01f0d91869aeaf2c1c625d"
+      "root_config_key": "Shape.581a4950382e9cf16467fc0c3980e9c25b8dd3be"
     }
   ],
   "name": "two_assets_job",
@@ -3958,7 +4033,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 104'] = '4cc87cf8edc7623dbbb535a0555f689c302b456b'
+snapshots['test_all_snapshot_ids 104'] = '84c52751fa5ee4efa17a224e280346b9645b5b63'
 
 snapshots['test_all_snapshot_ids 105'] = '''{
   "__class__": "PipelineSnapshot",
@@ -4053,6 +4128,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -4149,7 +4240,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4157,31 +4248,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.2450dd699b86b34130d4162d906aa57730c8a63c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4189,24 +4280,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -4641,46 +4732,73 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416": {
+      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8"
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416",
+        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4719,7 +4837,30 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.c6b6cdb9e69aaa615c12dab1146ed8192ed8cf15": {
+      "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.b247d2e44272e3d26872c20403cf94409d152550": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4734,7 +4875,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416"
+            "type_key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -4765,7 +4906,7 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.c6b6cdb9e69aaa615c12dab1146ed8192ed8cf15",
+        "key": "Shape.b247d2e44272e3d26872c20403cf94409d152550",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4820,47 +4961,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -5084,7 +5184,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.c6b6cdb9e69aaa615c12dab1146ed8192ed8cf15"
+      "root_config_key": "Shape.b247d2e44272e3d26872c20403cf94409d152550"
     }
   ],
   "name": "two_ins_job",
@@ -5191,7 +5291,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 106'] = '5ab475d7ff92d1c2525b0fe010b567d5cdee783f'
+snapshots['test_all_snapshot_ids 106'] = 'c3aa906495e61042d78bf1458d0030db20fdf163'
 
 snapshots['test_all_snapshot_ids 11'] = '''{
   "__class__": "PipelineSnapshot",
@@ -5286,6 +5386,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -5414,48 +5530,39 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Int"
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
           }
         ],
         "given_name": null,
-        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
+      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5485,18 +5592,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Bool"
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
+        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
+      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5526,18 +5633,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Float"
+            "type_key": "Bool"
           }
         ],
         "given_name": null,
-        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
+        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
+      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5567,18 +5674,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "String"
+            "type_key": "Float"
           }
         ],
         "given_name": null,
-        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
+        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
+      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5600,17 +5707,26 @@
             "is_required": true,
             "name": "pickle",
             "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
+        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
+      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5632,51 +5748,51 @@
             "is_required": true,
             "name": "pickle",
             "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
+        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
+        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -5729,29 +5845,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -5958,59 +6051,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.4b186a61eaa08f5400280021050e5d42714e45ff": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "solids",
-            "type_key": "Shape.2c26874cb8ab2e6a7e6aaf6a8613343df2315e99"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.4b186a61eaa08f5400280021050e5d42714e45ff",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -6104,6 +6144,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -6229,6 +6319,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -6265,64 +6378,76 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "description": null,
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "console",
+            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+      "Shape.f28578ea4a75299f8f452a49aeb3aa9184b42bbd": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "console",
-            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
+            "is_required": true,
+            "name": "solids",
+            "type_key": "Shape.2c26874cb8ab2e6a7e6aaf6a8613343df2315e99"
           }
         ],
         "given_name": null,
-        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+        "key": "Shape.f28578ea4a75299f8f452a49aeb3aa9184b42bbd",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -6560,7 +6685,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.4b186a61eaa08f5400280021050e5d42714e45ff"
+      "root_config_key": "Shape.f28578ea4a75299f8f452a49aeb3aa9184b42bbd"
     }
   ],
   "name": "composites_pipeline",
@@ -6888,7 +7013,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 12'] = 'f4b6f14fe4bdbf5d9078b3ad659da22ae7ebc8ee'
+snapshots['test_all_snapshot_ids 12'] = '2e0c68863e139a2f82b58de35a54315c1ecea314'
 
 snapshots['test_all_snapshot_ids 13'] = '''{
   "__class__": "PipelineSnapshot",
@@ -7014,6 +7139,22 @@
           "Int"
         ]
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "Map.String.Int:name: username": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -7189,6 +7330,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -7426,38 +7599,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -7481,29 +7622,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -7681,7 +7799,205 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.471730dcd8bec485cc3c4c1614cfd55344e29c67": {
+      "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "path",
+            "type_key": "String"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Any"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "outputs",
+            "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Any"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.8200ea52244e0e10db0a58528ef4c9fe6090ca0e": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "config",
+            "type_key": "Shape.303f566e70c2a9bbe3b9c0b251dd13a17bd93ca7"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "outputs",
+            "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.8200ea52244e0e10db0a58528ef4c9fe6090ca0e",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.ae44d319f327c7c5b7b45c93550eaba147417c0d": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -7696,7 +8012,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -7727,101 +8043,17 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.471730dcd8bec485cc3c4c1614cfd55344e29c67",
+        "key": "Shape.ae44d319f327c7c5b7b45c93550eaba147417c0d",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "path",
-            "type_key": "String"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Any"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "outputs",
-            "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Any"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.8200ea52244e0e10db0a58528ef4c9fe6090ca0e": {
+      "Shape.c509723c946dae900588fedb3aad4c7e4a3bd168": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
@@ -7829,76 +8061,35 @@
             "default_value_as_json_str": null,
             "description": null,
             "is_required": true,
-            "name": "config",
-            "type_key": "Shape.303f566e70c2a9bbe3b9c0b251dd13a17bd93ca7"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "outputs",
-            "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
+            "name": "nested",
+            "type_key": "Array.Noneable.Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.8200ea52244e0e10db0a58528ef4c9fe6090ca0e",
+        "key": "Shape.c509723c946dae900588fedb3aad4c7e4a3bd168",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.c509723c946dae900588fedb3aad4c7e4a3bd168": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "nested",
-            "type_key": "Array.Noneable.Int"
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.c509723c946dae900588fedb3aad4c7e4a3bd168",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -7941,47 +8132,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -8172,7 +8322,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.471730dcd8bec485cc3c4c1614cfd55344e29c67"
+      "root_config_key": "Shape.ae44d319f327c7c5b7b45c93550eaba147417c0d"
     }
   ],
   "name": "config_with_map",
@@ -8239,7 +8389,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 14'] = '742d8762869d4e3e02e97e576a1f5c72192d210b'
+snapshots['test_all_snapshot_ids 14'] = 'a695a382086e1fc0f616a717412a9678edda65ff'
 
 snapshots['test_all_snapshot_ids 15'] = '''{
   "__class__": "PipelineSnapshot",
@@ -8334,6 +8484,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -8485,6 +8651,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -8722,38 +8920,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -8777,29 +8943,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -8901,6 +9044,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.47e5b0f628ea28b727c367ddca9d2bed7991ae7f": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "solids",
+            "type_key": "Shape.b59e30e90d1d73d983f6a6e8adf0c43123278b4a"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.47e5b0f628ea28b727c367ddca9d2bed7991ae7f",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -8924,6 +9120,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.91acd38d90b35028e9929328ca5d99ffdcb0d5de": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -9060,53 +9306,23 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.c88bc07cbe8940f5c0567003523e26b7dd16ab1a": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "solids",
-            "type_key": "Shape.b59e30e90d1d73d983f6a6e8adf0c43123278b4a"
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.c88bc07cbe8940f5c0567003523e26b7dd16ab1a",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -9184,47 +9400,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -9509,7 +9684,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.c88bc07cbe8940f5c0567003523e26b7dd16ab1a"
+      "root_config_key": "Shape.47e5b0f628ea28b727c367ddca9d2bed7991ae7f"
     }
   ],
   "name": "csv_hello_world",
@@ -9590,7 +9765,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 16'] = '49f7e87ba417c7b1511056aaecf9255df9844a81'
+snapshots['test_all_snapshot_ids 16'] = '1fa0811ed977758cc405051988b25e4d2531b54c'
 
 snapshots['test_all_snapshot_ids 17'] = '''{
   "__class__": "PipelineSnapshot",
@@ -9685,6 +9860,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -9836,6 +10027,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -10073,38 +10296,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -10128,29 +10319,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -10252,6 +10420,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.47e5b0f628ea28b727c367ddca9d2bed7991ae7f": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "solids",
+            "type_key": "Shape.b59e30e90d1d73d983f6a6e8adf0c43123278b4a"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.47e5b0f628ea28b727c367ddca9d2bed7991ae7f",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -10275,6 +10496,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.91acd38d90b35028e9929328ca5d99ffdcb0d5de": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -10411,53 +10682,23 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.c88bc07cbe8940f5c0567003523e26b7dd16ab1a": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "solids",
-            "type_key": "Shape.b59e30e90d1d73d983f6a6e8adf0c43123278b4a"
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.c88bc07cbe8940f5c0567003523e26b7dd16ab1a",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -10535,47 +10776,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -10860,7 +11060,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.c88bc07cbe8940f5c0567003523e26b7dd16ab1a"
+      "root_config_key": "Shape.47e5b0f628ea28b727c367ddca9d2bed7991ae7f"
     }
   ],
   "name": "csv_hello_world_df_input",
@@ -10941,7 +11141,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 18'] = '85fc3987e7b4710817a06edd1ff9d7904f0fbfa3'
+snapshots['test_all_snapshot_ids 18'] = '3190831982ba02010bc867ff3abaaa4f2ecf1dc7'
 
 snapshots['test_all_snapshot_ids 19'] = '''{
   "__class__": "PipelineSnapshot",
@@ -11036,6 +11236,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -11187,89 +11403,39 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Int"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Bool"
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
           }
         ],
         "given_name": null,
-        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
+      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -11299,18 +11465,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Float"
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
+        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
+      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -11340,18 +11506,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "String"
+            "type_key": "Bool"
           }
         ],
         "given_name": null,
-        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
+        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
+      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -11373,17 +11539,26 @@
             "is_required": true,
             "name": "pickle",
             "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Float"
           }
         ],
         "given_name": null,
-        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
+        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
+      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -11413,50 +11588,50 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Any"
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
+        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           }
         ],
         "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
+        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
+      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -11466,36 +11641,54 @@
             "default_provided": false,
             "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "base_dir",
-            "type_key": "StringSourceType"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851",
+        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
         "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
+      "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "base_dir",
+            "type_key": "StringSourceType"
           }
         ],
         "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
+        "key": "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -11652,53 +11845,50 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.89e0c41df9b722eb3d5206cc16fadeb374e8b1b2": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "solids",
-            "type_key": "Shape.24296dfa65b1ece08ac690b0da05733a0098a6b7"
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.89e0c41df9b722eb3d5206cc16fadeb374e8b1b2",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -11806,6 +11996,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -11842,41 +12055,53 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.e5b2338be640140d2e21ae07f288392690e77b9a": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "description": null,
+            "is_required": true,
+            "name": "solids",
+            "type_key": "Shape.24296dfa65b1ece08ac690b0da05733a0098a6b7"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.e5b2338be640140d2e21ae07f288392690e77b9a",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -12146,7 +12371,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.89e0c41df9b722eb3d5206cc16fadeb374e8b1b2"
+      "root_config_key": "Shape.e5b2338be640140d2e21ae07f288392690e77b9a"
     }
   ],
   "name": "csv_hello_world_two",
@@ -12193,9 +12418,9 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 2'] = '618482e15b87df3642af4637aef6e266f63d319f'
+snapshots['test_all_snapshot_ids 2'] = 'ab3bd476e13348b80ccb801d1c5bd2d9a3fd1deb'
 
-snapshots['test_all_snapshot_ids 20'] = '7701108dfbf164232a5decf1feb1d3e8050ed817'
+snapshots['test_all_snapshot_ids 20'] = '9618d25fd52ce304cc15bd4ccaa3993f7548ba75'
 
 snapshots['test_all_snapshot_ids 21'] = '''{
   "__class__": "PipelineSnapshot",
@@ -12290,6 +12515,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -12441,48 +12682,39 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Int"
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
           }
         ],
         "given_name": null,
-        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
+      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -12512,18 +12744,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Bool"
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
+        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
+      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -12553,18 +12785,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Float"
+            "type_key": "Bool"
           }
         ],
         "given_name": null,
-        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
+        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
+      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -12594,50 +12826,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "String"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            "type_key": "Float"
           }
         ],
         "given_name": null,
-        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
+        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
+      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -12667,50 +12867,50 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Any"
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
+        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           }
         ],
         "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
+        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
+      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -12720,36 +12920,54 @@
             "default_provided": false,
             "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "base_dir",
-            "type_key": "StringSourceType"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851",
+        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
         "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
+      "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "base_dir",
+            "type_key": "StringSourceType"
           }
         ],
         "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
+        "key": "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -12880,6 +13098,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.91acd38d90b35028e9929328ca5d99ffdcb0d5de": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -12958,7 +13226,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ad11163ea2e8d059d1c841d45a4a12331b53df8b": {
+      "Shape.b7d9e308a5a9d255193c0dcc1ec757d14f4ab71e": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -12973,7 +13241,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -13004,7 +13272,7 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.ad11163ea2e8d059d1c841d45a4a12331b53df8b",
+        "key": "Shape.b7d9e308a5a9d255193c0dcc1ec757d14f4ab71e",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -13034,6 +13302,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -13149,47 +13440,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -13495,7 +13745,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.ad11163ea2e8d059d1c841d45a4a12331b53df8b"
+      "root_config_key": "Shape.b7d9e308a5a9d255193c0dcc1ec757d14f4ab71e"
     }
   ],
   "name": "csv_hello_world_with_expectations",
@@ -13610,7 +13860,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 22'] = 'fc437a1f1c356ef72729f0ff17fbaaad9ea74913'
+snapshots['test_all_snapshot_ids 22'] = '0ba1e9e41134ff4ac3a81a3147af2e9cafe987fd'
 
 snapshots['test_all_snapshot_ids 23'] = '''{
   "__class__": "PipelineSnapshot",
@@ -13705,6 +13955,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -13856,6 +14122,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -14093,38 +14391,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -14148,29 +14414,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -14376,6 +14619,109 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.718dcdf01b89172bdeaecf350a1dcc91a0e68803": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "solids",
+            "type_key": "Shape.a345c2bd1490b60a20b00e0b8db645f24e7c3dc5"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.718dcdf01b89172bdeaecf350a1dcc91a0e68803",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -14502,7 +14848,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -14510,35 +14856,22 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [],
-        "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -14546,86 +14879,28 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e6623a11459c4187ec0fda1c6c089a95b6a4e8d6": {
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "solids",
-            "type_key": "Shape.a345c2bd1490b60a20b00e0b8db645f24e7c3dc5"
-          }
-        ],
+        "fields": [],
         "given_name": null,
-        "key": "Shape.e6623a11459c4187ec0fda1c6c089a95b6a4e8d6",
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -14984,7 +15259,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.e6623a11459c4187ec0fda1c6c089a95b6a4e8d6"
+      "root_config_key": "Shape.718dcdf01b89172bdeaecf350a1dcc91a0e68803"
     }
   ],
   "name": "dynamic_pipeline",
@@ -15165,7 +15440,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 24'] = '733135566b77db0473b6015debb50aae0c7e8ca5'
+snapshots['test_all_snapshot_ids 24'] = '9ee0e77ada994824e663654c7f0b5dc49a53085f'
 
 snapshots['test_all_snapshot_ids 25'] = '''{
   "__class__": "PipelineSnapshot",
@@ -15275,6 +15550,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -15426,6 +15717,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -15663,38 +15986,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -15718,29 +16009,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -15994,7 +16262,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.7df68601e94646b87c0edb05b7142282503f0f64": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -16002,34 +16270,20 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"count\\": 0}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.dc1eacbaac67d3ef292c2c343ce6fd5c3560d40a"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.7df68601e94646b87c0edb05b7142282503f0f64",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
             "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -16039,17 +16293,26 @@
             "is_required": false,
             "name": "retries",
             "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.7df68601e94646b87c0edb05b7142282503f0f64": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -16057,22 +16320,22 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"count\\": 0}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Shape.dc1eacbaac67d3ef292c2c343ce6fd5c3560d40a"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.7df68601e94646b87c0edb05b7142282503f0f64",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.cab9975106576aceae793c5e26d9b9b4c20fe1ac": {
+      "Shape.874ac4bea38107ff67259c053bd370dc5e939d58": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -16087,7 +16350,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -16118,27 +16381,46 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.cab9975106576aceae793c5e26d9b9b4c20fe1ac",
+        "key": "Shape.874ac4bea38107ff67259c053bd370dc5e939d58",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [],
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          }
+        ],
         "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.dc1eacbaac67d3ef292c2c343ce6fd5c3560d40a": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -16146,22 +16428,22 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "count",
-            "type_key": "Int"
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.dc1eacbaac67d3ef292c2c343ce6fd5c3560d40a",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -16169,33 +16451,51 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [],
+        "given_name": null,
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.dc1eacbaac67d3ef292c2c343ce6fd5c3560d40a": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "count",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.dc1eacbaac67d3ef292c2c343ce6fd5c3560d40a",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -16577,7 +16877,7 @@
           "name": "retry_count"
         }
       ],
-      "root_config_key": "Shape.cab9975106576aceae793c5e26d9b9b4c20fe1ac"
+      "root_config_key": "Shape.874ac4bea38107ff67259c053bd370dc5e939d58"
     }
   ],
   "name": "eventually_successful",
@@ -16721,7 +17021,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 26'] = '7ee72041854ebbeffe1e8e379a608b1277989b25'
+snapshots['test_all_snapshot_ids 26'] = '35a748b8e6c0fff7cc4fe1410381370ef571ae2d'
 
 snapshots['test_all_snapshot_ids 27'] = '''{
   "__class__": "PipelineSnapshot",
@@ -18084,6 +18384,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "Permissive": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -18193,7 +18509,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -18201,31 +18517,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.2450dd699b86b34130d4162d906aa57730c8a63c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -18233,24 +18549,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -18685,46 +19001,73 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416": {
+      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8"
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416",
+        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -18763,6 +19106,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.9a3a315bff2146cca750edbec49c6b4b4d0ce58e": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -18853,6 +19219,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.ad5c164535e2335fb1b838e696852bfce5cdacb1": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "ops": "solids"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"first_asset\\": {\\"config\\": {\\"assets\\": {}}, \\"inputs\\": {}}, \\"hanging_asset\\": {\\"config\\": {\\"assets\\": {}}}, \\"never_runs_asset\\": {\\"config\\": {\\"assets\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "ops",
+            "type_key": "Shape.05ed9f96d267708c4f3aadd6fa776ba83a567eca"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "resources",
+            "type_key": "Shape.ce80c8878e9f80d953f9042fe3a1b65fbc57abb0"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ad5c164535e2335fb1b838e696852bfce5cdacb1",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.b13a6c5637084590cc1538f9522324bfeb4b46b3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -18997,47 +19416,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -19061,59 +19439,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.fb24747bfa73d4a77b59ce0a53bb556ba98c90c1": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "field_aliases": {
-          "ops": "solids"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"first_asset\\": {\\"config\\": {\\"assets\\": {}}, \\"inputs\\": {}}, \\"hanging_asset\\": {\\"config\\": {\\"assets\\": {}}}, \\"never_runs_asset\\": {\\"config\\": {\\"assets\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.05ed9f96d267708c4f3aadd6fa776ba83a567eca"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "resources",
-            "type_key": "Shape.ce80c8878e9f80d953f9042fe3a1b65fbc57abb0"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.fb24747bfa73d4a77b59ce0a53bb556ba98c90c1",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "String": {
         "__class__": "ConfigTypeSnap",
         "description": "",
@@ -19350,7 +19675,7 @@
           "name": "root_manager"
         }
       ],
-      "root_config_key": "Shape.fb24747bfa73d4a77b59ce0a53bb556ba98c90c1"
+      "root_config_key": "Shape.ad5c164535e2335fb1b838e696852bfce5cdacb1"
     }
   ],
   "name": "hanging_job",
@@ -19560,6 +19885,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -19688,6 +20029,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -19925,38 +20298,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -19980,29 +20321,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -20153,6 +20471,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.5cf80c47fb8a8acc8231d4526f18ebd6d3b35a90": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"tag_asset_solid\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.4624799494d58c315c1b60caa7012c36bdc7a2cb"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.5cf80c47fb8a8acc8231d4526f18ebd6d3b35a90",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -20188,6 +20559,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -20243,53 +20664,23 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.98d2943e12a1e662bba17270e0c3a0161c931111": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"tag_asset_solid\\": {}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.4624799494d58c315c1b60caa7012c36bdc7a2cb"
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.98d2943e12a1e662bba17270e0c3a0161c931111",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -20332,47 +20723,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -20555,7 +20905,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.98d2943e12a1e662bba17270e0c3a0161c931111"
+      "root_config_key": "Shape.5cf80c47fb8a8acc8231d4526f18ebd6d3b35a90"
     }
   ],
   "name": "asset_tag_pipeline",
@@ -20595,7 +20945,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 30'] = '6ffee67d7c593d49a8df9f3f63009593085596fe'
+snapshots['test_all_snapshot_ids 30'] = 'd0f5861e61f54adf471acadab60b770a231d477e'
 
 snapshots['test_all_snapshot_ids 31'] = '''{
   "__class__": "PipelineSnapshot",
@@ -20690,6 +21040,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -20818,6 +21184,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -21055,38 +21453,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -21110,29 +21476,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -21165,59 +21508,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.30df9ac921795306384deb393f7377848ef5bea6": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"hard_fail_or_0\\": {\\"config\\": {\\"fail\\": false}}, \\"increment\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.7586665b4f8a1c2a1dea6cb5bfb01dd01a32e293"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.30df9ac921795306384deb393f7377848ef5bea6",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -21287,6 +21577,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.4acd0972ce1d34484129c8fc3e24ee3a8ee3852b": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"hard_fail_or_0\\": {\\"config\\": {\\"fail\\": false}}, \\"increment\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.7586665b4f8a1c2a1dea6cb5bfb01dd01a32e293"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.4acd0972ce1d34484129c8fc3e24ee3a8ee3852b",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -21345,6 +21688,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -21458,7 +21851,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -21466,69 +21859,51 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [],
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+          }
+        ],
         "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
+        "fields": [],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -21773,7 +22148,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.30df9ac921795306384deb393f7377848ef5bea6"
+      "root_config_key": "Shape.4acd0972ce1d34484129c8fc3e24ee3a8ee3852b"
     }
   ],
   "name": "hard_failer",
@@ -21847,7 +22222,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 32'] = '8659736ba62af555f092f1f50fe98443a441bfd6'
+snapshots['test_all_snapshot_ids 32'] = 'acd445c13d66cf04642f52a4be0c406c2d4b72e5'
 
 snapshots['test_all_snapshot_ids 33'] = '''{
   "__class__": "PipelineSnapshot",
@@ -21942,6 +22317,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -22093,6 +22484,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -22330,38 +22753,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -22385,29 +22776,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -22532,6 +22900,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.4a574ef88073fbf5db918ec2fabc223bff48f942": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"solid_that_gets_tags\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.800f644991ef71d03133ae0d01e27cf59dfbc9bc"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.4a574ef88073fbf5db918ec2fabc223bff48f942",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -22590,6 +23011,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.800f644991ef71d03133ae0d01e27cf59dfbc9bc": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -22648,60 +23119,30 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.a9c0ace944966fda7682da0c0a91300345469707": {
+      "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"solid_that_gets_tags\\": {}}",
+            "default_value_as_json_str": "{\\"config\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.800f644991ef71d03133ae0d01e27cf59dfbc9bc"
+            "name": "io_manager",
+            "type_key": "Shape.44f2a71367507edd1b8e64f739222c4312b3691b"
           }
         ],
         "given_name": null,
-        "key": "Shape.a9c0ace944966fda7682da0c0a91300345469707",
+        "key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -22709,15 +23150,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "io_manager",
-            "type_key": "Shape.44f2a71367507edd1b8e64f739222c4312b3691b"
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -22760,47 +23201,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -22999,7 +23399,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.a9c0ace944966fda7682da0c0a91300345469707"
+      "root_config_key": "Shape.4a574ef88073fbf5db918ec2fabc223bff48f942"
     }
   ],
   "name": "hello_world_with_tags",
@@ -23041,7 +23441,7 @@
   }
 }'''
 
-snapshots['test_all_snapshot_ids 34'] = 'a7f56bcbca508eeab8fff1e1f071d66e77ac8182'
+snapshots['test_all_snapshot_ids 34'] = '8319a50c9aae623871b222050d8af6cd483951e8'
 
 snapshots['test_all_snapshot_ids 35'] = '''{
   "__class__": "PipelineSnapshot",
@@ -23136,6 +23536,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -23264,6 +23680,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -23501,38 +23949,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -23556,82 +23972,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.17bd650b7056312bb6f2e88d8de9ce6e112f966d": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "solids",
-            "type_key": "Shape.5139b59598a4a4307257868733385b3175e06893"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.17bd650b7056312bb6f2e88d8de9ce6e112f966d",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -23782,6 +24122,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -23895,6 +24285,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -23931,64 +24344,76 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "description": null,
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "console",
+            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+      "Shape.fa0d5dc46db4f1e6b6e253485f79ca9f7865aa07": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "console",
-            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
+            "is_required": true,
+            "name": "solids",
+            "type_key": "Shape.5139b59598a4a4307257868733385b3175e06893"
           }
         ],
         "given_name": null,
-        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+        "key": "Shape.fa0d5dc46db4f1e6b6e253485f79ca9f7865aa07",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -24154,7 +24579,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.17bd650b7056312bb6f2e88d8de9ce6e112f966d"
+      "root_config_key": "Shape.fa0d5dc46db4f1e6b6e253485f79ca9f7865aa07"
     }
   ],
   "name": "infinite_loop_pipeline",
@@ -24194,7 +24619,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 36'] = '399a58b2ffd94b463150165286be9cba35bb36f1'
+snapshots['test_all_snapshot_ids 36'] = '1f3f06198dbbe3d0012c3ef34fe74d15ed0f607b'
 
 snapshots['test_all_snapshot_ids 37'] = '''{
   "__class__": "PipelineSnapshot",
@@ -24289,6 +24714,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -24385,7 +24826,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -24393,31 +24834,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.2450dd699b86b34130d4162d906aa57730c8a63c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -24425,24 +24866,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -24894,46 +25335,73 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416": {
+      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8"
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416",
+        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -24972,30 +25440,30 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.bc52b1c43d99d0004be108b5869dde9f4a119518": {
+      "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
             "description": null,
-            "is_required": true,
-            "name": "one",
-            "type_key": "String"
+            "is_required": false,
+            "name": "config",
+            "type_key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c"
           }
         ],
         "given_name": null,
-        "key": "Shape.bc52b1c43d99d0004be108b5869dde9f4a119518",
+        "key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.c9bac2d35363375ac724b07c42360cd0f8fcc6bb": {
+      "Shape.a628cafcbeeab82a3e39baa8e4336d7f8158c7c3": {
         "__class__": "ConfigTypeSnap",
         "description": "run config schema with default values from default_config",
         "enum_values": null,
@@ -25010,7 +25478,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416"
+            "type_key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -25041,61 +25509,43 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.c9bac2d35363375ac724b07c42360cd0f8fcc6bb",
+        "key": "Shape.a628cafcbeeab82a3e39baa8e4336d7f8158c7c3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+      "Shape.bc52b1c43d99d0004be108b5869dde9f4a119518": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [],
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "one",
+            "type_key": "String"
+          }
+        ],
         "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.bc52b1c43d99d0004be108b5869dde9f4a119518",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
+        "fields": [],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -25284,7 +25734,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.c9bac2d35363375ac724b07c42360cd0f8fcc6bb"
+      "root_config_key": "Shape.a628cafcbeeab82a3e39baa8e4336d7f8158c7c3"
     }
   ],
   "name": "job_with_default_config",
@@ -25324,7 +25774,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 38'] = '2cb4d7760e55cc36f1401cd3ae68c13e72691f6d'
+snapshots['test_all_snapshot_ids 38'] = '05a527197e2ef16936df5f66d1c1df47d77fb850'
 
 snapshots['test_all_snapshot_ids 39'] = '''{
   "__class__": "PipelineSnapshot",
@@ -25419,6 +25869,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -25547,6 +26013,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -25784,38 +26282,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -25839,29 +26305,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -25894,59 +26337,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.3811764247a484b88fe03cc7475997d0fc743b5f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"materialize\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.3ce25333fa832e83592b2d9c5ff9facdec7a9e04"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.3811764247a484b88fe03cc7475997d0fc743b5f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -26100,6 +26490,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -26155,6 +26595,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -26191,64 +26654,76 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "description": null,
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "console",
+            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+      "Shape.fed1e8a833752ffb53783a4234011d4f51c8ee75": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "console",
-            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"materialize\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.3ce25333fa832e83592b2d9c5ff9facdec7a9e04"
           }
         ],
         "given_name": null,
-        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+        "key": "Shape.fed1e8a833752ffb53783a4234011d4f51c8ee75",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -26414,7 +26889,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.3811764247a484b88fe03cc7475997d0fc743b5f"
+      "root_config_key": "Shape.fed1e8a833752ffb53783a4234011d4f51c8ee75"
     }
   ],
   "name": "materialization_pipeline",
@@ -26454,9 +26929,9 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 4'] = '1a693d19862a7d9b174562886fc25b2e323a7821'
+snapshots['test_all_snapshot_ids 4'] = '1ce74058d166c6bd172e0f5185204bdb7556d3eb'
 
-snapshots['test_all_snapshot_ids 40'] = 'bce175ff0a6a7308e554b08b907434645b06f386'
+snapshots['test_all_snapshot_ids 40'] = 'f497e1d6e16ea2c68ecdddb34c59a1cc46057de9'
 
 snapshots['test_all_snapshot_ids 41'] = '''{
   "__class__": "PipelineSnapshot",
@@ -26551,6 +27026,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -26679,6 +27170,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -26916,38 +27439,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -26971,29 +27462,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.229b6731a336bf9c6372da5f99a6c27bc6d086ef": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -27229,42 +27697,28 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
             "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -27274,75 +27728,81 @@
             "is_required": false,
             "name": "retries",
             "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.d0b1433c0b88701844499828b79c37b8e96b3d77": {
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
             "description": null,
-            "is_required": true,
-            "name": "a_solid_with_three_field_config",
-            "type_key": "Shape.28e26c84ce71924101ab767d68c065c48af7e8e8"
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "noop_solid",
-            "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.d0b1433c0b88701844499828b79c37b8e96b3d77",
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.d73d1b3960152ddf04f7cc49b791533641b74298": {
+      "Shape.b9c4090fc6ca056ab135f2c38854d8719d8e292a": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -27357,7 +27817,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -27388,27 +27848,37 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.d73d1b3960152ddf04f7cc49b791533641b74298",
+        "key": "Shape.b9c4090fc6ca056ab135f2c38854d8719d8e292a",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [],
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
         "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -27416,33 +27886,63 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.d0b1433c0b88701844499828b79c37b8e96b3d77": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "is_required": true,
+            "name": "a_solid_with_three_field_config",
+            "type_key": "Shape.28e26c84ce71924101ab767d68c065c48af7e8e8"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "noop_solid",
+            "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.d0b1433c0b88701844499828b79c37b8e96b3d77",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [],
+        "given_name": null,
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -27639,7 +28139,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.d73d1b3960152ddf04f7cc49b791533641b74298"
+      "root_config_key": "Shape.b9c4090fc6ca056ab135f2c38854d8719d8e292a"
     }
   ],
   "name": "more_complicated_config",
@@ -27706,7 +28206,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 42'] = '20d9cbcf9d6578f3273c51f78a13650304282f55'
+snapshots['test_all_snapshot_ids 42'] = '930be57a4a83ccc90e46627d1480dcb48ded85ec'
 
 snapshots['test_all_snapshot_ids 43'] = '''{
   "__class__": "PipelineSnapshot",
@@ -27801,6 +28301,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "Noneable.Int": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -27944,6 +28460,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -28181,38 +28729,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.15ac78f309795f7a9d95c864cb9d10865728fab3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -28239,29 +28755,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -28430,6 +28923,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -28512,98 +29055,115 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+      "Shape.8b89d58ed2644282584f96c36443c67e870f8485": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.d1d1bf8f5e40482a3fe0b3ca2c139fa567615512"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "solids",
+            "type_key": "Shape.5bbac6808da091a190b86e54ee6141db520e7a9e"
           }
         ],
         "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "key": "Shape.8b89d58ed2644282584f96c36443c67e870f8485",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.d1d1bf8f5e40482a3fe0b3ca2c139fa567615512": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "io_manager",
-            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.d1d1bf8f5e40482a3fe0b3ca2c139fa567615512",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [],
-        "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -28611,40 +29171,22 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+      "Shape.d1d1bf8f5e40482a3fe0b3ca2c139fa567615512": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -28655,65 +29197,48 @@
             "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "console",
-            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
+            "name": "io_manager",
+            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
           }
         ],
         "given_name": null,
-        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+        "key": "Shape.d1d1bf8f5e40482a3fe0b3ca2c139fa567615512",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.edfd733583d8cd6c0863174df64bffd248f11510": {
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
+        "fields": [],
+        "given_name": null,
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.d1d1bf8f5e40482a3fe0b3ca2c139fa567615512"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
             "description": null,
-            "is_required": true,
-            "name": "solids",
-            "type_key": "Shape.5bbac6808da091a190b86e54ee6141db520e7a9e"
+            "is_required": false,
+            "name": "console",
+            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
           }
         ],
         "given_name": null,
-        "key": "Shape.edfd733583d8cd6c0863174df64bffd248f11510",
+        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -28879,7 +29404,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.edfd733583d8cd6c0863174df64bffd248f11510"
+      "root_config_key": "Shape.8b89d58ed2644282584f96c36443c67e870f8485"
     }
   ],
   "name": "more_complicated_nested_config",
@@ -28910,7 +29435,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 44'] = 'dcf789ffe133eb7ff6ab45058188f207243db7f5'
+snapshots['test_all_snapshot_ids 44'] = '4a599ae7879fc0d0aba1ec5223ec237278168794'
 
 snapshots['test_all_snapshot_ids 45'] = '''{
   "__class__": "PipelineSnapshot",
@@ -29005,6 +29530,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -29133,6 +29674,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -29370,38 +29943,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -29425,29 +29966,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -29549,111 +30067,108 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.4686d260a978ada8909889bb066f19154f1db2d3": {
+      "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"solid_asset_a\\": {}, \\"solid_asset_b\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.8d9af8803c982dd39b25e0ca1fe10e7e0ca03146"
+            "is_required": true,
+            "name": "path",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Shape.4686d260a978ada8909889bb066f19154f1db2d3",
+        "key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
+      "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
             "description": null,
-            "is_required": true,
-            "name": "path",
-            "type_key": "String"
+            "is_required": false,
+            "name": "config",
+            "type_key": "Any"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "outputs",
+            "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
           }
         ],
         "given_name": null,
-        "key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2",
+        "key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
             "is_required": false,
-            "name": "outputs",
-            "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -29718,6 +30233,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.95766018d94012f8b30a223c47de1067899b0bb4": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"solid_asset_a\\": {}, \\"solid_asset_b\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.8d9af8803c982dd39b25e0ca1fe10e7e0ca03146"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.95766018d94012f8b30a223c47de1067899b0bb4",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -29750,7 +30318,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -29758,69 +30326,51 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [],
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+          }
+        ],
         "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
+        "fields": [],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -30030,7 +30580,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.4686d260a978ada8909889bb066f19154f1db2d3"
+      "root_config_key": "Shape.95766018d94012f8b30a223c47de1067899b0bb4"
     }
   ],
   "name": "multi_asset_pipeline",
@@ -30104,7 +30654,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 46'] = 'c68ee264baeeb7e0962d11d7680f39cc6e9305b9'
+snapshots['test_all_snapshot_ids 46'] = 'a8ec7ce93961ab440dbcf3279de1bf1edf96273b'
 
 snapshots['test_all_snapshot_ids 47'] = '''{
   "__class__": "PipelineSnapshot",
@@ -30199,6 +30749,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -30350,89 +30916,39 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Int"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Bool"
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
           }
         ],
         "given_name": null,
-        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
+      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -30462,18 +30978,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Float"
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
+        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
+      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -30503,18 +31019,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "String"
+            "type_key": "Bool"
           }
         ],
         "given_name": null,
-        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
+        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
+      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -30536,17 +31052,26 @@
             "is_required": true,
             "name": "pickle",
             "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Float"
           }
         ],
         "given_name": null,
-        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
+        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
+      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -30576,50 +31101,50 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Any"
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
+        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           }
         ],
         "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
+        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
+      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -30629,89 +31154,54 @@
             "default_provided": false,
             "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "base_dir",
-            "type_key": "StringSourceType"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.1c7413692bffe39a07f3f2c74164e0d5702a6280": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.925f3ae96836d265d0fb075a626a325f5cba738b"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"return_six\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.fd6fa5bda84b2d9bf99daa92ffaa130e49aab8ca"
+            "is_required": true,
+            "name": "value",
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.1c7413692bffe39a07f3f2c74164e0d5702a6280",
+        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
         "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
+      "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "base_dir",
+            "type_key": "StringSourceType"
           }
         ],
         "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
+        "key": "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -30750,6 +31240,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.3cd91949ee7acf9568bcd1cfed0be3f02b4fec8b": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.925f3ae96836d265d0fb075a626a325f5cba738b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"return_six\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.fd6fa5bda84b2d9bf99daa92ffaa130e49aab8ca"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.3cd91949ee7acf9568bcd1cfed0be3f02b4fec8b",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -30877,7 +31420,57 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.7f367cf1195276105cc53301a1b610431bb015f1": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.87938c918a12dd46666931d998a07c370111ea8b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -30892,7 +31485,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -30923,7 +31516,7 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.7f367cf1195276105cc53301a1b610431bb015f1",
+        "key": "Shape.87938c918a12dd46666931d998a07c370111ea8b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -30985,59 +31578,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.a5c651f2923eed7e34385d96985d58484cae60a7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.bef10374a7619a637bcc228e2146e8ee88399f1f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"return_six\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.fd6fa5bda84b2d9bf99daa92ffaa130e49aab8ca"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.a5c651f2923eed7e34385d96985d58484cae60a7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.a793714b5918623c92ddb83973046ee8df58a423": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -31116,6 +31656,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -31198,41 +31761,53 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.ecd4a8c0d290fecc36e4f60f8363eb0d9075f0c3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.bef10374a7619a637bcc228e2146e8ee88399f1f"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "description": null,
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "resources",
+            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"return_six\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.fd6fa5bda84b2d9bf99daa92ffaa130e49aab8ca"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.ecd4a8c0d290fecc36e4f60f8363eb0d9075f0c3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -31440,7 +32015,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.7f367cf1195276105cc53301a1b610431bb015f1"
+      "root_config_key": "Shape.87938c918a12dd46666931d998a07c370111ea8b"
     },
     {
       "__class__": "ModeDefSnap",
@@ -31478,7 +32053,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.1c7413692bffe39a07f3f2c74164e0d5702a6280"
+      "root_config_key": "Shape.3cd91949ee7acf9568bcd1cfed0be3f02b4fec8b"
     },
     {
       "__class__": "ModeDefSnap",
@@ -31530,7 +32105,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.a5c651f2923eed7e34385d96985d58484cae60a7"
+      "root_config_key": "Shape.ecd4a8c0d290fecc36e4f60f8363eb0d9075f0c3"
     }
   ],
   "name": "multi_mode_with_loggers",
@@ -31570,7 +32145,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 48'] = '34f2b685a073703f0173303d0645f6a794e8cc09'
+snapshots['test_all_snapshot_ids 48'] = '969aeb5331357d0d53f403876d32227be69c078b'
 
 snapshots['test_all_snapshot_ids 49'] = '''{
   "__class__": "PipelineSnapshot",
@@ -31665,6 +32240,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -31793,6 +32384,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -32030,38 +32653,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0ce5dccffe0b2cd130158bab0af7b9c704f2873e": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -32085,29 +32676,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -32325,42 +32893,28 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
             "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -32370,97 +32924,61 @@
             "is_required": false,
             "name": "retries",
             "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.a1b764225632d54b96a7b06985c831a7cff72498": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "io_manager",
-            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "op",
-            "type_key": "Shape.0ce5dccffe0b2cd130158bab0af7b9c704f2873e"
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.a1b764225632d54b96a7b06985c831a7cff72498",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [],
-        "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "marker_to_close",
+            "type_key": "String"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -32470,49 +32988,17 @@
             "is_required": false,
             "name": "retries",
             "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "console",
-            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f0b1ccc7ef3f692bd36c7e2528b069559ffe506f": {
+      "Shape.9d688fca7a504c11fbcfc3cf3bbd85cb24b18adc": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -32527,7 +33013,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -32558,26 +33044,26 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.f0b1ccc7ef3f692bd36c7e2528b069559ffe506f",
+        "key": "Shape.9d688fca7a504c11fbcfc3cf3bbd85cb24b18adc",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.fc3adbbf54d7ee8b03e7f0116e13d34e253c5bcf": {
+      "Shape.a1b764225632d54b96a7b06985c831a7cff72498": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
             "description": null,
-            "is_required": true,
-            "name": "num_one",
-            "type_key": "Int"
+            "is_required": false,
+            "name": "io_manager",
+            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -32585,88 +33071,202 @@
             "default_value_as_json_str": null,
             "description": null,
             "is_required": true,
-            "name": "num_two",
-            "type_key": "Int"
+            "name": "op",
+            "type_key": "Shape.0ce5dccffe0b2cd130158bab0af7b9c704f2873e"
           }
         ],
         "given_name": null,
-        "key": "Shape.fc3adbbf54d7ee8b03e7f0116e13d34e253c5bcf",
+        "key": "Shape.a1b764225632d54b96a7b06985c831a7cff72498",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.fe2c8a3955b895767072f0aa1d243b6e1714df90": {
+      "Shape.bd9317792ad7f80e6c1b9320d9abaa6cc0e6d816": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
             "description": null,
             "is_required": true,
-            "name": "config",
-            "type_key": "Int"
+            "name": "resources",
+            "type_key": "Shape.a1b764225632d54b96a7b06985c831a7cff72498"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"apply_to_three\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.68aa80b83eeb19f6dadca37a62c43d2e4fa06a12"
           }
         ],
         "given_name": null,
-        "key": "Shape.fe2c8a3955b895767072f0aa1d243b6e1714df90",
+        "key": "Shape.bd9317792ad7f80e6c1b9320d9abaa6cc0e6d816",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ffc5e014858cc140c16df521fc49ffaf0c54a20c": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [],
+        "given_name": null,
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "console",
+            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.fc3adbbf54d7ee8b03e7f0116e13d34e253c5bcf": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
             "description": null,
             "is_required": true,
-            "name": "resources",
-            "type_key": "Shape.a1b764225632d54b96a7b06985c831a7cff72498"
+            "name": "num_one",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"apply_to_three\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.68aa80b83eeb19f6dadca37a62c43d2e4fa06a12"
+            "is_required": true,
+            "name": "num_two",
+            "type_key": "Int"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.fc3adbbf54d7ee8b03e7f0116e13d34e253c5bcf",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.fe2c8a3955b895767072f0aa1d243b6e1714df90": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "config",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.ffc5e014858cc140c16df521fc49ffaf0c54a20c",
+        "key": "Shape.fe2c8a3955b895767072f0aa1d243b6e1714df90",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -32846,7 +33446,7 @@
           "name": "op"
         }
       ],
-      "root_config_key": "Shape.f0b1ccc7ef3f692bd36c7e2528b069559ffe506f"
+      "root_config_key": "Shape.9d688fca7a504c11fbcfc3cf3bbd85cb24b18adc"
     },
     {
       "__class__": "ModeDefSnap",
@@ -32898,7 +33498,7 @@
           "name": "op"
         }
       ],
-      "root_config_key": "Shape.f0b1ccc7ef3f692bd36c7e2528b069559ffe506f"
+      "root_config_key": "Shape.9d688fca7a504c11fbcfc3cf3bbd85cb24b18adc"
     },
     {
       "__class__": "ModeDefSnap",
@@ -32950,7 +33550,7 @@
           "name": "op"
         }
       ],
-      "root_config_key": "Shape.ffc5e014858cc140c16df521fc49ffaf0c54a20c"
+      "root_config_key": "Shape.bd9317792ad7f80e6c1b9320d9abaa6cc0e6d816"
     }
   ],
   "name": "multi_mode_with_resources",
@@ -33085,6 +33685,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -33213,89 +33829,39 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Int"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Bool"
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
           }
         ],
         "given_name": null,
-        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
+      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -33325,18 +33891,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Float"
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
+        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
+      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -33366,18 +33932,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "String"
+            "type_key": "Bool"
           }
         ],
         "given_name": null,
-        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
+        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
+      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -33399,17 +33965,26 @@
             "is_required": true,
             "name": "pickle",
             "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Float"
           }
         ],
         "given_name": null,
-        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
+        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
+      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -33439,73 +34014,91 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Any"
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
+        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           }
         ],
         "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
+        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
+      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "io_manager",
-            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19",
+        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
         "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
+      "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -33513,15 +34106,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "io_manager",
+            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
           }
         ],
         "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
+        "key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -33560,6 +34153,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.332e8881c108a01f1de093a902d5a6f078a805c8": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"backcompat_materialize\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.ca1df67c3c4f4de84cadb9ce629ab37480345286"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.332e8881c108a01f1de093a902d5a6f078a805c8",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -33687,6 +34333,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -33742,53 +34438,23 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.b88c81c7fb3a39039a6977f4511b014a164fc92c": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"backcompat_materialize\\": {}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.ca1df67c3c4f4de84cadb9ce629ab37480345286"
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.b88c81c7fb3a39039a6977f4511b014a164fc92c",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -33857,47 +34523,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -34080,7 +34705,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.b88c81c7fb3a39039a6977f4511b014a164fc92c"
+      "root_config_key": "Shape.332e8881c108a01f1de093a902d5a6f078a805c8"
     }
   ],
   "name": "backcompat_materialization_pipeline",
@@ -34120,7 +34745,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 50'] = 'a4292e135d796426584819daa4d346cc5b6cbb1a'
+snapshots['test_all_snapshot_ids 50'] = '656e17cd96630bde2592b81810732c503c34e668'
 
 snapshots['test_all_snapshot_ids 51'] = '''{
   "__class__": "PipelineSnapshot",
@@ -34215,6 +34840,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -34343,6 +34984,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -34580,38 +35253,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -34635,29 +35276,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -34817,76 +35435,73 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.8d63360e03124ff7f91661e81c856bf50da99ec9": {
+      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"throw_a_thing\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.d0f408acdf75a2a6072241ad7a61cb664a92d13d"
+            "name": "config",
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.8d63360e03124ff7f91661e81c856bf50da99ec9",
+        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -34925,6 +35540,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -34987,41 +35625,53 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.e648a9ec98cff614f2791856f12c231789d0db72": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"throw_a_thing\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.d0f408acdf75a2a6072241ad7a61cb664a92d13d"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.e648a9ec98cff614f2791856f12c231789d0db72",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -35210,7 +35860,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.8d63360e03124ff7f91661e81c856bf50da99ec9"
+      "root_config_key": "Shape.e648a9ec98cff614f2791856f12c231789d0db72"
     }
   ],
   "name": "naughty_programmer_pipeline",
@@ -35250,7 +35900,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 52'] = 'dff095cd6315ee5048295900fc712afc511bdcc1'
+snapshots['test_all_snapshot_ids 52'] = '346d82d63c68e7066cc0745d9d7c278ee6c3f46a'
 
 snapshots['test_all_snapshot_ids 53'] = '''{
   "__class__": "PipelineSnapshot",
@@ -35345,6 +35995,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -35441,7 +36107,39 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Selector.2450dd699b86b34130d4162d906aa57730c8a63c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -35462,43 +36160,11 @@
             "description": null,
             "is_required": false,
             "name": "multiprocess",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -35924,46 +36590,73 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416": {
+      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8"
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416",
+        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -36037,6 +36730,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -36085,48 +36801,30 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "description": null,
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "console",
+            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e9b6984f9b4b9671abe7ebb5072fb77b7206f9d2": {
+      "Shape.f236027f3509a60c73200489354125af65c3af8c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -36137,11 +36835,11 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416"
+            "name": "adder",
+            "type_key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -36149,60 +36847,37 @@
             "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+            "name": "op_1",
+            "type_key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"plus_one\\": {}, \\"subgraph\\": {\\"ops\\": {\\"adder\\": {}, \\"op_1\\": {}, \\"op_2\\": {}, \\"plus_one\\": {}}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.3e3d56f6dad4bf01ca4c757dee06e8885225a995"
+            "name": "op_2",
+            "type_key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e9b6984f9b4b9671abe7ebb5072fb77b7206f9d2",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "console",
-            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
+            "name": "plus_one",
+            "type_key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5"
           }
         ],
         "given_name": null,
-        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+        "key": "Shape.f236027f3509a60c73200489354125af65c3af8c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f236027f3509a60c73200489354125af65c3af8c": {
+      "Shape.ff0ae98dd97064f6e9f972722616a97cda50d2ea": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -36213,11 +36888,11 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
             "description": null,
             "is_required": false,
-            "name": "adder",
-            "type_key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5"
+            "name": "execution",
+            "type_key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -36225,30 +36900,30 @@
             "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "op_1",
-            "type_key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5"
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"plus_one\\": {}, \\"subgraph\\": {\\"ops\\": {\\"adder\\": {}, \\"op_1\\": {}, \\"op_2\\": {}, \\"plus_one\\": {}}}}",
             "description": null,
             "is_required": false,
-            "name": "op_2",
-            "type_key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5"
+            "name": "ops",
+            "type_key": "Shape.3e3d56f6dad4bf01ca4c757dee06e8885225a995"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "plus_one",
-            "type_key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5"
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
           }
         ],
         "given_name": null,
-        "key": "Shape.f236027f3509a60c73200489354125af65c3af8c",
+        "key": "Shape.ff0ae98dd97064f6e9f972722616a97cda50d2ea",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -36435,7 +37110,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.e9b6984f9b4b9671abe7ebb5072fb77b7206f9d2"
+      "root_config_key": "Shape.ff0ae98dd97064f6e9f972722616a97cda50d2ea"
     }
   ],
   "name": "nested_job",
@@ -36679,7 +37354,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 54'] = '56d7159ba13dd69ffe9fe6f3c591170b31026366'
+snapshots['test_all_snapshot_ids 54'] = '56a4c8a0872b03c06f5cb69132f9ea1635cb88fc'
 
 snapshots['test_all_snapshot_ids 55'] = '''{
   "__class__": "PipelineSnapshot",
@@ -36774,6 +37449,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -36902,6 +37593,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -37091,80 +37814,48 @@
           }
         ],
         "given_name": null,
-        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Any"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
+        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
+        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -37206,30 +37897,60 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
+      "Shape.00927f27da6a72050c31b69187ab471b184f57d3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
             "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "io_manager",
-            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"return_foo\\": {}, \\"return_hello_world\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.0055486a40861c19b2b5295e3afadb63203baee7"
           }
         ],
         "given_name": null,
-        "key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19",
+        "key": "Shape.00927f27da6a72050c31b69187ab471b184f57d3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
+      "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -37237,15 +37958,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "io_manager",
+            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
           }
         ],
         "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
+        "key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -37411,6 +38132,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -37466,7 +38237,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -37474,35 +38245,22 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [],
-        "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -37510,109 +38268,51 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "console",
-            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
-          }
-        ],
+        "fields": [],
         "given_name": null,
-        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ed1ab785cde4f0bf9730c3941e9dccc053a1fb43": {
+      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"return_foo\\": {}, \\"return_hello_world\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.0055486a40861c19b2b5295e3afadb63203baee7"
+            "name": "console",
+            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
           }
         ],
         "given_name": null,
-        "key": "Shape.ed1ab785cde4f0bf9730c3941e9dccc053a1fb43",
+        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -37799,7 +38499,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.ed1ab785cde4f0bf9730c3941e9dccc053a1fb43"
+      "root_config_key": "Shape.00927f27da6a72050c31b69187ab471b184f57d3"
     }
   ],
   "name": "no_config_chain_pipeline",
@@ -37873,7 +38573,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 56'] = 'af1622a30d500057dea15bce4e8fe85cdadc9ce8'
+snapshots['test_all_snapshot_ids 56'] = '452b6cbd0bc9b178210494a89ed19d9d30cb6d47'
 
 snapshots['test_all_snapshot_ids 57'] = '''{
   "__class__": "PipelineSnapshot",
@@ -37968,6 +38668,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -38119,6 +38835,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -38356,38 +39104,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -38411,29 +39127,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -38616,19 +39309,28 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
             "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -38638,40 +39340,26 @@
             "is_required": false,
             "name": "retries",
             "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
+          },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {}}",
-            "description": null,
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
             "is_required": false,
-            "name": "io_manager",
-            "type_key": "Shape.44f2a71367507edd1b8e64f739222c4312b3691b"
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.c5af673a19cc5650d6d10e53ddb057e9e84700eb": {
+      "Shape.810cd0beea02c738663715f8d4a77cf0b4fac704": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -38686,7 +39374,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -38717,76 +39405,92 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.c5af673a19cc5650d6d10e53ddb057e9e84700eb",
+        "key": "Shape.810cd0beea02c738663715f8d4a77cf0b4fac704",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.cc93adfd9d4295d647c8763e37a002ed3e92b6a8": {
+      "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"config\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "return_hello",
-            "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+            "name": "io_manager",
+            "type_key": "Shape.44f2a71367507edd1b8e64f739222c4312b3691b"
           }
         ],
         "given_name": null,
-        "key": "Shape.cc93adfd9d4295d647c8763e37a002ed3e92b6a8",
+        "key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [],
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
         "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -38794,33 +39498,54 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.cc93adfd9d4295d647c8763e37a002ed3e92b6a8": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "return_hello",
+            "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.cc93adfd9d4295d647c8763e37a002ed3e92b6a8",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [],
+        "given_name": null,
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -39025,7 +39750,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.c5af673a19cc5650d6d10e53ddb057e9e84700eb"
+      "root_config_key": "Shape.810cd0beea02c738663715f8d4a77cf0b4fac704"
     }
   ],
   "name": "no_config_pipeline",
@@ -39065,7 +39790,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 58'] = '714f13a293737d62b910f0ff9c43f670c502c2ca'
+snapshots['test_all_snapshot_ids 58'] = '6d39fa1359efe73f01731b39d7cd4f85019c6c34'
 
 snapshots['test_all_snapshot_ids 59'] = '''{
   "__class__": "PipelineSnapshot",
@@ -39160,6 +39885,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -39288,6 +40029,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -39525,38 +40298,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -39580,29 +40321,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -39635,59 +40353,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.32aa7ec6e7407e8a502d0a6094909a9365103a8e": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.ba913521099bed4314e25592059869c8f3a3c96e"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.32aa7ec6e7407e8a502d0a6094909a9365103a8e",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -39780,6 +40445,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.61b2fb57f4c42568172a528c6ca544a4c132b67a": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.ba913521099bed4314e25592059869c8f3a3c96e"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.61b2fb57f4c42568172a528c6ca544a4c132b67a",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -39815,6 +40533,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -39896,7 +40664,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -39904,69 +40672,51 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [],
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+          }
+        ],
         "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
+        "fields": [],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -40155,7 +40905,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.32aa7ec6e7407e8a502d0a6094909a9365103a8e"
+      "root_config_key": "Shape.61b2fb57f4c42568172a528c6ca544a4c132b67a"
     }
   ],
   "name": "noop_pipeline",
@@ -40195,9 +40945,9 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 6'] = 'f48190b5df84639f52bebac931ee9696e312dfc0'
+snapshots['test_all_snapshot_ids 6'] = 'a6f3de9821ea13b56a6de7b20d36ed8c7f0190b8'
 
-snapshots['test_all_snapshot_ids 60'] = '7ffd65ba8633d4c172a7b15dfee5927bed301724'
+snapshots['test_all_snapshot_ids 60'] = 'a2f5011dbb98dfef71cb42b4d645420fcea702ed'
 
 snapshots['test_all_snapshot_ids 61'] = '''{
   "__class__": "PipelineSnapshot",
@@ -42572,6 +43322,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -42700,48 +43466,39 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Int"
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
           }
         ],
         "given_name": null,
-        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
+      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -42771,18 +43528,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Bool"
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
+        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
+      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -42812,18 +43569,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Float"
+            "type_key": "Bool"
           }
         ],
         "given_name": null,
-        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
+        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
+      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -42853,18 +43610,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "String"
+            "type_key": "Float"
           }
         ],
         "given_name": null,
-        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
+        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
+      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -42886,17 +43643,26 @@
             "is_required": true,
             "name": "pickle",
             "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
+        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
+      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -42918,51 +43684,51 @@
             "is_required": true,
             "name": "pickle",
             "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
+        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
+        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -42992,29 +43758,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -43174,76 +43917,73 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.8b8881d607cf559ca312ee85b302fe73fc560163": {
+      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_solid\\": {}, \\"palp_a\\": {}, \\"palp_b\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.c8f346c2403a9e9edd9eb5e823540b9c93684f02"
+            "name": "config",
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.8b8881d607cf559ca312ee85b302fe73fc560163",
+        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -43282,6 +44022,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.c8f346c2403a9e9edd9eb5e823540b9c93684f02": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -43362,41 +44125,53 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.dcbb2980a75fc91b871f53777492f562073f39e9": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_solid\\": {}, \\"palp_a\\": {}, \\"palp_b\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.c8f346c2403a9e9edd9eb5e823540b9c93684f02"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.dcbb2980a75fc91b871f53777492f562073f39e9",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -43627,7 +44402,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.8b8881d607cf559ca312ee85b302fe73fc560163"
+      "root_config_key": "Shape.dcbb2980a75fc91b871f53777492f562073f39e9"
     }
   ],
   "name": "partitioned_asset_lineage_pipeline",
@@ -43735,7 +44510,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 66'] = '2b93a84831c17b0e2a81d20aa74126950813a9ac'
+snapshots['test_all_snapshot_ids 66'] = '0b94e94c327535d25c7566a6c933b416b7bc88d2'
 
 snapshots['test_all_snapshot_ids 67'] = '''{
   "__class__": "PipelineSnapshot",
@@ -43830,6 +44605,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -43958,48 +44749,39 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Int"
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
           }
         ],
         "given_name": null,
-        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
+      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -44029,18 +44811,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Bool"
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
+        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
+      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -44070,18 +44852,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Float"
+            "type_key": "Bool"
           }
         ],
         "given_name": null,
-        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
+        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
+      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -44111,18 +44893,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "String"
+            "type_key": "Float"
           }
         ],
         "given_name": null,
-        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
+        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
+      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -44144,17 +44926,26 @@
             "is_required": true,
             "name": "pickle",
             "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
+        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
+      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -44176,51 +44967,51 @@
             "is_required": true,
             "name": "pickle",
             "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
+        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
+        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -44250,29 +45041,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -44328,7 +45096,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.3d47bc72a814f9b5983a966552e411983d7f413f": {
+      "Shape.3f26401b31732a5b79bc625ab22f7de246bc28ef": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -44343,7 +45111,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -44374,7 +45142,7 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.3d47bc72a814f9b5983a966552e411983d7f413f",
+        "key": "Shape.3f26401b31732a5b79bc625ab22f7de246bc28ef",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -44485,6 +45253,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -44566,7 +45384,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -44574,69 +45392,51 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [],
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+          }
+        ],
         "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
+        "fields": [],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -44825,7 +45625,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.3d47bc72a814f9b5983a966552e411983d7f413f"
+      "root_config_key": "Shape.3f26401b31732a5b79bc625ab22f7de246bc28ef"
     }
   ],
   "name": "partitioned_asset_pipeline",
@@ -44865,7 +45665,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 68'] = '67320cfa7114761c18111589434bf4b9481cbb10'
+snapshots['test_all_snapshot_ids 68'] = 'a8d9888ab4eb2e365826093734e49517b65c2f1e'
 
 snapshots['test_all_snapshot_ids 69'] = '''{
   "__class__": "PipelineSnapshot",
@@ -44960,6 +45760,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -45088,89 +45904,39 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Int"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Bool"
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
           }
         ],
         "given_name": null,
-        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
+      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -45200,18 +45966,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Float"
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
+        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
+      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -45241,18 +46007,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "String"
+            "type_key": "Bool"
           }
         ],
         "given_name": null,
-        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
+        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
+      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -45274,17 +46040,26 @@
             "is_required": true,
             "name": "pickle",
             "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Float"
           }
         ],
         "given_name": null,
-        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
+        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
+      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -45314,43 +46089,84 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Any"
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
+        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
+        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -45406,29 +46222,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -45553,6 +46346,109 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.4f542aa50833dfc12431406f19130a99ac1bb13d": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "solids",
+            "type_key": "Shape.1815cce831ccec1452ddd0b2102af6d1e95cd5ee"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.4f542aa50833dfc12431406f19130a99ac1bb13d",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -45643,7 +46539,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -45651,69 +46547,51 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [],
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+          }
+        ],
         "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
+        "fields": [],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -45743,59 +46621,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f70d6456e7482ec3bdbc51d8112bbe39427d52f0": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "solids",
-            "type_key": "Shape.1815cce831ccec1452ddd0b2102af6d1e95cd5ee"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.f70d6456e7482ec3bdbc51d8112bbe39427d52f0",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "String": {
         "__class__": "ConfigTypeSnap",
         "description": "",
@@ -45984,7 +46809,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.f70d6456e7482ec3bdbc51d8112bbe39427d52f0"
+      "root_config_key": "Shape.4f542aa50833dfc12431406f19130a99ac1bb13d"
     }
   ],
   "name": "pipeline_with_enum_config",
@@ -46117,6 +46942,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -46268,6 +47109,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -46505,38 +47378,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -46560,29 +47401,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -46765,154 +47583,28 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "io_manager",
-            "type_key": "Shape.44f2a71367507edd1b8e64f739222c4312b3691b"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.c83365bd90c040f827d1b3ed0ba3df6049a81df1": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "after_failure",
-            "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "always_succeed",
-            "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "conditionally_fail",
-            "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.c83365bd90c040f827d1b3ed0ba3df6049a81df1",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [],
-        "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -46934,37 +47626,14 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "console",
-            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f6767f17075a73d8af8c9a3c4e778eef1965726e": {
+      "Shape.6f141adb66a9148218562303ede31d1328694ac3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -46979,7 +47648,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -47010,7 +47679,188 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.f6767f17075a73d8af8c9a3c4e778eef1965726e",
+        "key": "Shape.6f141adb66a9148218562303ede31d1328694ac3",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "io_manager",
+            "type_key": "Shape.44f2a71367507edd1b8e64f739222c4312b3691b"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.c83365bd90c040f827d1b3ed0ba3df6049a81df1": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "after_failure",
+            "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "always_succeed",
+            "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "conditionally_fail",
+            "type_key": "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c83365bd90c040f827d1b3ed0ba3df6049a81df1",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [],
+        "given_name": null,
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "console",
+            "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -47234,7 +48084,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.f6767f17075a73d8af8c9a3c4e778eef1965726e"
+      "root_config_key": "Shape.6f141adb66a9148218562303ede31d1328694ac3"
     }
   ],
   "name": "chained_failure_pipeline",
@@ -47342,7 +48192,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 70'] = '0697bffcee4b6aeddd017547d053825056bfe037'
+snapshots['test_all_snapshot_ids 70'] = '4f573ba2c72114b2c289f5a96c6ccad423f572cc'
 
 snapshots['test_all_snapshot_ids 71'] = '''{
   "__class__": "PipelineSnapshot",
@@ -47422,6 +48272,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -47550,48 +48416,39 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Int"
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
           }
         ],
         "given_name": null,
-        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
+      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -47621,18 +48478,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Bool"
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
+        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
+      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -47662,18 +48519,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Float"
+            "type_key": "Bool"
           }
         ],
         "given_name": null,
-        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
+        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
+      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -47703,50 +48560,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "String"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            "type_key": "Float"
           }
         ],
         "given_name": null,
-        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
+        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
+      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -47776,98 +48601,86 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Any"
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
+        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           }
         ],
         "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
+        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.13cb1584ec7d2a1119086823fa7dc084d44bbe20": {
+      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.d1d1bf8f5e40482a3fe0b3ca2c139fa567615512"
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"emit_failed_expectation\\": {}, \\"emit_successful_expectation\\": {}, \\"emit_successful_expectation_no_metadata\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.9e01a4004a80418857ab4960f0ccac5e002baa54"
+            "is_required": true,
+            "name": "value",
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.13cb1584ec7d2a1119086823fa7dc084d44bbe20",
+        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
         "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
@@ -47898,29 +48711,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -48022,6 +48812,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -48077,6 +48917,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.9bfe30b1dd784c095079e4cd303388ae7114b48e": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.d1d1bf8f5e40482a3fe0b3ca2c139fa567615512"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"emit_failed_expectation\\": {}, \\"emit_successful_expectation\\": {}, \\"emit_successful_expectation_no_metadata\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.9e01a4004a80418857ab4960f0ccac5e002baa54"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.9bfe30b1dd784c095079e4cd303388ae7114b48e",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.9e01a4004a80418857ab4960f0ccac5e002baa54": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -48121,6 +49014,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -48180,47 +49096,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -48419,7 +49294,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.13cb1584ec7d2a1119086823fa7dc084d44bbe20"
+      "root_config_key": "Shape.9bfe30b1dd784c095079e4cd303388ae7114b48e"
     }
   ],
   "name": "pipeline_with_expectations",
@@ -48486,7 +49361,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 72'] = '62484dea05c7bedb6c78d42dda1c2a48d1cac317'
+snapshots['test_all_snapshot_ids 72'] = '80525b60130963bed1d60a39ced9503610f09aa8'
 
 snapshots['test_all_snapshot_ids 73'] = '''{
   "__class__": "PipelineSnapshot",
@@ -48581,6 +49456,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -48709,48 +49600,39 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Int"
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
           }
         ],
         "given_name": null,
-        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
+      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -48780,18 +49662,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Bool"
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
+        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
+      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -48821,18 +49703,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Float"
+            "type_key": "Bool"
           }
         ],
         "given_name": null,
-        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
+        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
+      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -48862,18 +49744,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "String"
+            "type_key": "Float"
           }
         ],
         "given_name": null,
-        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
+        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
+      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -48895,17 +49777,26 @@
             "is_required": true,
             "name": "pickle",
             "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
+        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
+      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -48927,51 +49818,51 @@
             "is_required": true,
             "name": "pickle",
             "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
+        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
+        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -49024,23 +49915,53 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
+      "Shape.2285fb80f84a1a65cd582e1ee72b02aca2c58479": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "solids",
+            "type_key": "Shape.81f1e3efd1be70752765f34b9fcd3aae1b6951ad"
           }
         ],
         "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
+        "key": "Shape.2285fb80f84a1a65cd582e1ee72b02aca2c58479",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -49148,53 +50069,50 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.65a13ee3beeb7fa47de950ac583b2a0212373a6b": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "solids",
-            "type_key": "Shape.81f1e3efd1be70752765f34b9fcd3aae1b6951ad"
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.65a13ee3beeb7fa47de950ac583b2a0212373a6b",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -49349,7 +50267,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -49357,69 +50275,51 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [],
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+          }
+        ],
         "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
+        "fields": [],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -49615,7 +50515,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.65a13ee3beeb7fa47de950ac583b2a0212373a6b"
+      "root_config_key": "Shape.2285fb80f84a1a65cd582e1ee72b02aca2c58479"
     }
   ],
   "name": "pipeline_with_input_output_metadata",
@@ -49684,7 +50584,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 74'] = '8034f94b04f8f29583bda8a0d535c944992ca355'
+snapshots['test_all_snapshot_ids 74'] = '80ca39be6f1609f5f85b2b83752ba66b90cb5ff1'
 
 snapshots['test_all_snapshot_ids 75'] = '''{
   "__class__": "PipelineSnapshot",
@@ -49779,6 +50679,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -49907,6 +50823,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -50144,38 +51092,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -50225,29 +51141,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -50407,6 +51300,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.589c9a83c18f5adf35a70a737e1a0afd55fec563": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"fail_subset\\": {}, \\"one\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.54bd3fb74da7cf630182dc93d4d28a2891bafce8"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.589c9a83c18f5adf35a70a737e1a0afd55fec563",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -50442,6 +51388,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -50497,53 +51493,23 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.b2fe1cd2f74c3fe88c955b3e709ca1aa4f26524a": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"fail_subset\\": {}, \\"one\\": {}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.54bd3fb74da7cf630182dc93d4d28a2891bafce8"
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.b2fe1cd2f74c3fe88c955b3e709ca1aa4f26524a",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -50586,47 +51552,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -50844,7 +51769,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.b2fe1cd2f74c3fe88c955b3e709ca1aa4f26524a"
+      "root_config_key": "Shape.589c9a83c18f5adf35a70a737e1a0afd55fec563"
     }
   ],
   "name": "pipeline_with_invalid_definition_error",
@@ -50918,7 +51843,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 76'] = 'ac8dd3a8157213ab0aa9a4235ed20b62c1c4fe9a'
+snapshots['test_all_snapshot_ids 76'] = 'a05d563c7a2e7c59951fc92a9013ea0e7226a418'
 
 snapshots['test_all_snapshot_ids 77'] = '''{
   "__class__": "PipelineSnapshot",
@@ -51013,6 +51938,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -51141,6 +52082,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -51378,61 +52351,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -51586,6 +52504,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -51609,7 +52577,39 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.7d996ebade8d1215798e83dae35582117115bea5": {
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.9a6d517b793efae27515f78141f33087ba399e68": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -51624,7 +52624,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -51655,39 +52655,30 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.7d996ebade8d1215798e83dae35582117115bea5",
+        "key": "Shape.9a6d517b793efae27515f78141f33087ba399e68",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -51753,47 +52744,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -51976,7 +52926,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.7d996ebade8d1215798e83dae35582117115bea5"
+      "root_config_key": "Shape.9a6d517b793efae27515f78141f33087ba399e68"
     }
   ],
   "name": "pipeline_with_list",
@@ -52007,7 +52957,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 78'] = 'd94ebfc5a92a124c708dae347a27eb7b60732c91'
+snapshots['test_all_snapshot_ids 78'] = 'e637a91adc8fd1728c3c84962812e4f9a622773e'
 
 snapshots['test_all_snapshot_ids 79'] = '''{
   "__class__": "PipelineSnapshot",
@@ -52102,6 +53052,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -52230,6 +53196,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -52467,38 +53465,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0057d8ec3a9d25930397ae7953ad116cb5f6c8a6": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -52525,29 +53491,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -52739,6 +53682,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -52762,7 +53755,62 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.876ca1e2dad49793826b61559b54f6b5bc460413": {
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.9d71d8e2083b6468a26a8556e56288deec792b4e": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Int"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.9d71d8e2083b6468a26a8556e56288deec792b4e",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.b4f07e44a60ca8f270109429f4d7fdf8622cf100": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -52777,7 +53825,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -52808,62 +53856,30 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.876ca1e2dad49793826b61559b54f6b5bc460413",
+        "key": "Shape.b4f07e44a60ca8f270109429f4d7fdf8622cf100",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.9d71d8e2083b6468a26a8556e56288deec792b4e": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Int"
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.9d71d8e2083b6468a26a8556e56288deec792b4e",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -52906,47 +53922,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -53143,7 +54118,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.876ca1e2dad49793826b61559b54f6b5bc460413"
+      "root_config_key": "Shape.b4f07e44a60ca8f270109429f4d7fdf8622cf100"
     }
   ],
   "name": "required_resource_pipeline",
@@ -53185,9 +54160,9 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 8'] = 'cf3ca46e430bf50be932f6d4c6bc69f8b940f595'
+snapshots['test_all_snapshot_ids 8'] = 'b205a728dd9133424f3e7898ceba556a16e30f4c'
 
-snapshots['test_all_snapshot_ids 80'] = '6aaa658c850390ce078203114231853dd44d24f5'
+snapshots['test_all_snapshot_ids 80'] = '44a12d3e57ddac5b9bff0cd3c1f9e0b21fcc00c6'
 
 snapshots['test_all_snapshot_ids 81'] = '''{
   "__class__": "PipelineSnapshot",
@@ -53282,6 +54257,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -53433,6 +54424,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -53670,38 +54693,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -53725,29 +54716,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -53927,6 +54895,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.5866fc065b3a0f37cba2eb3bfb33aad6d12fd018": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"disable_gc\\": {}, \\"io_manager\\": {\\"config\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.2ef777f294cb4a2951e5288144dc03f96e1961aa"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "solids",
+            "type_key": "Shape.e20b0373dffb8d124d3559d45a3aeb89f818ec30"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.5866fc065b3a0f37cba2eb3bfb33aad6d12fd018",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -53962,6 +54983,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -54052,7 +55123,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -54060,68 +55131,38 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca7357f0af60eb57216129f0f965f9d5f7623e01": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"disable_gc\\": {}, \\"io_manager\\": {\\"config\\": {}}}",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.2ef777f294cb4a2951e5288144dc03f96e1961aa"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "solids",
-            "type_key": "Shape.e20b0373dffb8d124d3559d45a3aeb89f818ec30"
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca7357f0af60eb57216129f0f965f9d5f7623e01",
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -54217,47 +55258,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -54545,7 +55545,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.ca7357f0af60eb57216129f0f965f9d5f7623e01"
+      "root_config_key": "Shape.5866fc065b3a0f37cba2eb3bfb33aad6d12fd018"
     }
   ],
   "name": "retry_multi_input_early_terminate_pipeline",
@@ -54697,7 +55697,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 82'] = '4ac1665c16e3f30337a0ac123fafb51e6811b9c9'
+snapshots['test_all_snapshot_ids 82'] = 'fbe59b66bd84ebc6ccaa4eb49cb8763ca45dc61d'
 
 snapshots['test_all_snapshot_ids 83'] = '''{
   "__class__": "PipelineSnapshot",
@@ -54822,6 +55822,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -54973,6 +55989,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -55210,38 +56258,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0431b2b831cd8ba98542337b454baa92568209a2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -55346,23 +56362,53 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
+      "Shape.1a2e8090be941cff247b2742c8e252a5ed03bacc": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "solids",
+            "type_key": "Shape.5cb721e007deb0ccde56cb931d61bbe76e9829e8"
           }
         ],
         "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
+        "key": "Shape.1a2e8090be941cff247b2742c8e252a5ed03bacc",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -55657,6 +56703,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.6d69b98ab874ee7cd49ef261f03b3cf7b92fafc7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -55724,92 +56820,62 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.94cabf4b0319949a0b57d70a5f38449460592f6d": {
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+            "name": "marker_to_close",
+            "type_key": "String"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "solids",
-            "type_key": "Shape.5cb721e007deb0ccde56cb931d61bbe76e9829e8"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.94cabf4b0319949a0b57d70a5f38449460592f6d",
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+      "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{\\"config\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "io_manager",
+            "type_key": "Shape.44f2a71367507edd1b8e64f739222c4312b3691b"
           }
         ],
         "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -55817,15 +56883,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "io_manager",
-            "type_key": "Shape.44f2a71367507edd1b8e64f739222c4312b3691b"
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -55868,47 +56934,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -56212,7 +57237,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.94cabf4b0319949a0b57d70a5f38449460592f6d"
+      "root_config_key": "Shape.1a2e8090be941cff247b2742c8e252a5ed03bacc"
     }
   ],
   "name": "retry_multi_output_pipeline",
@@ -56361,7 +57386,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 84'] = '84a490c9065a2e785d65cc71f94992701a660b92'
+snapshots['test_all_snapshot_ids 84'] = '1588989c6da27054f83711a9f3fdf0b15c1693a5'
 
 snapshots['test_all_snapshot_ids 85'] = '''{
   "__class__": "PipelineSnapshot",
@@ -56456,6 +57481,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -56607,6 +57648,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -56844,38 +57917,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -56899,29 +57940,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -57145,6 +58163,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -57168,7 +58236,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.8983402b1702629b4132eb13b40d550fa3296601": {
+      "Shape.87718b4096e3435ac05bf0a03cba73a150eddf2c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -57183,7 +58251,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -57214,7 +58282,7 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.8983402b1702629b4132eb13b40d550fa3296601",
+        "key": "Shape.87718b4096e3435ac05bf0a03cba73a150eddf2c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -57253,6 +58321,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -57289,47 +58380,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.e50a680efa626d3db1bfaed6823d0a100d4e3880": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -57612,7 +58662,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.8983402b1702629b4132eb13b40d550fa3296601"
+      "root_config_key": "Shape.87718b4096e3435ac05bf0a03cba73a150eddf2c"
     }
   ],
   "name": "retry_resource_pipeline",
@@ -57690,7 +58740,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 86'] = 'cfcbb5937f50f787b8250428ff9276ff64672a0a'
+snapshots['test_all_snapshot_ids 86'] = '02163da1305a1b2bd6069c7b099a903e2edb4cae'
 
 snapshots['test_all_snapshot_ids 87'] = '''{
   "__class__": "PipelineSnapshot",
@@ -57785,6 +58835,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -57913,6 +58979,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -58150,7 +59248,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+      "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -58158,31 +59256,22 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
+            "name": "io_manager",
+            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
           }
         ],
         "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
+        "key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19",
         "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
+      "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -58190,22 +59279,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "\\"INFO\\"",
             "description": null,
             "is_required": false,
-            "name": "io_manager",
-            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+            "name": "log_level",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "\\"dagster\\"",
+            "description": null,
+            "is_required": false,
+            "name": "name",
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19",
+        "key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
+      "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -58213,70 +59311,68 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
           }
         ],
         "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
+        "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
+      "Shape.3cf09cd1db41db60757b789c6fb487dfc6367a16": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"INFO\\"",
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "log_level",
-            "type_key": "String"
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "\\"dagster\\"",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "name",
-            "type_key": "String"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"return_any\\": {}, \\"return_bool\\": {}, \\"return_int\\": {}, \\"return_str\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.f5e7bd675a1ecd6b9f358ba7a36c16632b1fe21c"
           }
         ],
         "given_name": null,
-        "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
+        "key": "Shape.3cf09cd1db41db60757b789c6fb487dfc6367a16",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -58387,6 +59483,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -58442,7 +59588,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -58450,69 +59596,51 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [],
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+          }
+        ],
         "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
+        "fields": [],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -58595,59 +59723,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.fbf3e7f0d6fa42116be55ffac7facfa6e2cddb90": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"return_any\\": {}, \\"return_bool\\": {}, \\"return_int\\": {}, \\"return_str\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.f5e7bd675a1ecd6b9f358ba7a36c16632b1fe21c"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.fbf3e7f0d6fa42116be55ffac7facfa6e2cddb90",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "String": {
         "__class__": "ConfigTypeSnap",
         "description": "",
@@ -58831,7 +59906,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.fbf3e7f0d6fa42116be55ffac7facfa6e2cddb90"
+      "root_config_key": "Shape.3cf09cd1db41db60757b789c6fb487dfc6367a16"
     }
   ],
   "name": "scalar_output_pipeline",
@@ -58952,7 +60027,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 88'] = 'abda4f3130ca7c8db1ab48884e441697f0f046b6'
+snapshots['test_all_snapshot_ids 88'] = 'cbf87693f563dfeb725f1cd62ee37894cf539486'
 
 snapshots['test_all_snapshot_ids 89'] = '''{
   "__class__": "PipelineSnapshot",
@@ -59047,6 +60122,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -59143,7 +60234,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -59151,31 +60242,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.2450dd699b86b34130d4162d906aa57730c8a63c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -59183,24 +60274,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -59591,7 +60682,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.4f8131f75a6fbaaa28e7ae386178024cb34ce63d": {
+      "Shape.604644f3392978312d2e4fe04bf000e62bf6d779": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -59599,71 +60690,68 @@
           "ops": "solids"
         },
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
             "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.604644f3392978312d2e4fe04bf000e62bf6d779"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+            "name": "noop_solid",
+            "type_key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5"
           }
         ],
         "given_name": null,
-        "key": "Shape.4f8131f75a6fbaaa28e7ae386178024cb34ce63d",
+        "key": "Shape.604644f3392978312d2e4fe04bf000e62bf6d779",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.604644f3392978312d2e4fe04bf000e62bf6d779": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "ops": "solids"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "noop_solid",
-            "type_key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5"
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.604644f3392978312d2e4fe04bf000e62bf6d779",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -59693,55 +60781,55 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416": {
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           }
         ],
         "given_name": null,
-        "key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416",
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+      "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "config",
+            "type_key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c"
           }
         ],
         "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -59761,7 +60849,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5": {
+      "Shape.dd29db775435f2f6970a02444ebe486248b9b277": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -59771,66 +60859,78 @@
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
+            "name": "execution",
+            "type_key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "outputs",
-            "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "ops",
+            "type_key": "Shape.604644f3392978312d2e4fe04bf000e62bf6d779"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
           }
         ],
         "given_name": null,
-        "key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5",
+        "key": "Shape.dd29db775435f2f6970a02444ebe486248b9b277",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "ops": "solids"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "config",
+            "type_key": "Any"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "description": null,
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "outputs",
+            "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -60019,7 +61119,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.4f8131f75a6fbaaa28e7ae386178024cb34ce63d"
+      "root_config_key": "Shape.dd29db775435f2f6970a02444ebe486248b9b277"
     }
   ],
   "name": "simple_job_a",
@@ -60152,6 +61252,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -60248,7 +61364,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -60256,31 +61372,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.2450dd699b86b34130d4162d906aa57730c8a63c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -60288,24 +61404,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -60722,53 +61838,50 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.6220bed3c4f34f2631b3c541f4a0f959a067335f": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "ops": "solids"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"simple_graph\\": {\\"ops\\": {\\"noop_solid\\": {}}}}",
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.7a0d66bb516a8510f4352ce295616019209edee9"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.6220bed3c4f34f2631b3c541f4a0f959a067335f",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -60824,7 +61937,39 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416": {
+      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": false,
+            "name": "marker_to_close",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -60836,43 +61981,64 @@
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8"
+            "type_key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c"
           }
         ],
         "given_name": null,
-        "key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416",
+        "key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
+      "Shape.9d07f66ef2d2e526d756517d8939a22719a1c952": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "ops": "solids"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
             "description": null,
             "is_required": false,
-            "name": "marker_to_close",
-            "type_key": "String"
+            "name": "execution",
+            "type_key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"simple_graph\\": {\\"ops\\": {\\"noop_solid\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "ops",
+            "type_key": "Shape.7a0d66bb516a8510f4352ce295616019209edee9"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
           }
         ],
         "given_name": null,
-        "key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c",
+        "key": "Shape.9d07f66ef2d2e526d756517d8939a22719a1c952",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -60953,47 +62119,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -61176,7 +62301,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.6220bed3c4f34f2631b3c541f4a0f959a067335f"
+      "root_config_key": "Shape.9d07f66ef2d2e526d756517d8939a22719a1c952"
     }
   ],
   "name": "composed_graph",
@@ -61241,7 +62366,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 90'] = 'f16ab1a143c4bee565c6ce846c586f966e9b45e9'
+snapshots['test_all_snapshot_ids 90'] = 'bbebd5968a4249fb4b442b4f23775b58e579e8e6'
 
 snapshots['test_all_snapshot_ids 91'] = '''{
   "__class__": "PipelineSnapshot",
@@ -61336,6 +62461,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -61432,7 +62573,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -61440,31 +62581,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.2450dd699b86b34130d4162d906aa57730c8a63c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -61472,24 +62613,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -61880,7 +63021,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.4f8131f75a6fbaaa28e7ae386178024cb34ce63d": {
+      "Shape.604644f3392978312d2e4fe04bf000e62bf6d779": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -61888,117 +63029,91 @@
           "ops": "solids"
         },
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
             "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.604644f3392978312d2e4fe04bf000e62bf6d779"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+            "name": "noop_solid",
+            "type_key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5"
           }
         ],
         "given_name": null,
-        "key": "Shape.4f8131f75a6fbaaa28e7ae386178024cb34ce63d",
+        "key": "Shape.604644f3392978312d2e4fe04bf000e62bf6d779",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.604644f3392978312d2e4fe04bf000e62bf6d779": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "ops": "solids"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "noop_solid",
-            "type_key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.604644f3392978312d2e4fe04bf000e62bf6d779",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416": {
+      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8"
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416",
+        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -62037,6 +63152,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -62050,7 +63188,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5": {
+      "Shape.dd29db775435f2f6970a02444ebe486248b9b277": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -62060,66 +63198,78 @@
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
+            "name": "execution",
+            "type_key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "outputs",
-            "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_solid\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "ops",
+            "type_key": "Shape.604644f3392978312d2e4fe04bf000e62bf6d779"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
           }
         ],
         "given_name": null,
-        "key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5",
+        "key": "Shape.dd29db775435f2f6970a02444ebe486248b9b277",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
+        "field_aliases": {
+          "ops": "solids"
+        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "config",
+            "type_key": "Any"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "description": null,
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            "name": "outputs",
+            "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
           }
         ],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.e20183fcf9f186a6569b322579dcc1e6fae8d0d5",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -62308,7 +63458,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.4f8131f75a6fbaaa28e7ae386178024cb34ce63d"
+      "root_config_key": "Shape.dd29db775435f2f6970a02444ebe486248b9b277"
     }
   ],
   "name": "simple_job_b",
@@ -62348,7 +63498,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 92'] = 'b4be449ede16dc5189cf29c1c96da3b94d04902c'
+snapshots['test_all_snapshot_ids 92'] = 'b996c49062b17ffee461ee20a8b678700568d2d2'
 
 snapshots['test_all_snapshot_ids 93'] = '''{
   "__class__": "PipelineSnapshot",
@@ -62443,6 +63593,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -62571,6 +63737,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -62808,38 +64006,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -62863,29 +64029,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -63045,6 +64188,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -63068,6 +64261,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.810a915af77869ebf12f5a89f3ea320808275c01": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"solid_asset_a\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.f1612d5762c0a8d1e571fa7f6d8e275d2c57045a"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.810a915af77869ebf12f5a89f3ea320808275c01",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -63100,7 +64346,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -63108,69 +64354,51 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+      "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [],
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+          }
+        ],
         "given_name": null,
-        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+      "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
+        "fields": [],
         "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+        "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -63226,59 +64454,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f21b7ae1426ed9787f1b317b66255ac2fa2d677c": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"solid_asset_a\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.f1612d5762c0a8d1e571fa7f6d8e275d2c57045a"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.f21b7ae1426ed9787f1b317b66255ac2fa2d677c",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "String": {
         "__class__": "ConfigTypeSnap",
         "description": "",
@@ -63438,7 +64613,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.f21b7ae1426ed9787f1b317b66255ac2fa2d677c"
+      "root_config_key": "Shape.810a915af77869ebf12f5a89f3ea320808275c01"
     }
   ],
   "name": "single_asset_pipeline",
@@ -63478,7 +64653,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 94'] = '36b71cabad16262a9e4e80b9f894b8d513473a23'
+snapshots['test_all_snapshot_ids 94'] = '920bc41d871255d1d4c6d3431fe4485c88353c76'
 
 snapshots['test_all_snapshot_ids 95'] = '''{
   "__class__": "PipelineSnapshot",
@@ -63573,6 +64748,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -63701,6 +64892,38 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "description": null,
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+          }
+        ],
+        "given_name": null,
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+        "kind": {
+          "__enum__": "ConfigTypeKind.SELECTOR"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -63938,38 +65161,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-            "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -63993,29 +65184,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -64175,6 +65343,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -64230,7 +65448,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.988f822e9cfa24f9e0b48cba0e532477dcedfc12": {
+      "Shape.a6dcd77f8fd0c99dc8e7da91959ac5ae51adf4e7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -64245,7 +65463,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -64276,7 +65494,30 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.988f822e9cfa24f9e0b48cba0e532477dcedfc12",
+        "key": "Shape.a6dcd77f8fd0c99dc8e7da91959ac5ae51adf4e7",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -64345,47 +65586,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -64568,7 +65768,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.988f822e9cfa24f9e0b48cba0e532477dcedfc12"
+      "root_config_key": "Shape.a6dcd77f8fd0c99dc8e7da91959ac5ae51adf4e7"
     }
   ],
   "name": "spew_pipeline",
@@ -64608,7 +65808,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 96'] = 'e13fdf7aa503f8fec341258a23cfeb111ca4143e'
+snapshots['test_all_snapshot_ids 96'] = 'be10101d0b5ba4ba58b383ac9e9d9ca2d74f72e8'
 
 snapshots['test_all_snapshot_ids 97'] = '''{
   "__class__": "PipelineSnapshot",
@@ -64703,6 +65903,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "Permissive": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -64812,7 +66028,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -64820,31 +66036,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_value_as_json_str": "{}",
             "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.2450dd699b86b34130d4162d906aa57730c8a63c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -64852,24 +66068,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -65329,7 +66545,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.5226d38df2bfba4efbed1eae7847d24149c16136": {
+      "Shape.5aef99189364e28ce42e62d407486d97795b9708": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -65344,7 +66560,7 @@
             "description": null,
             "is_required": false,
             "name": "execution",
-            "type_key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416"
+            "type_key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e"
           },
           {
             "__class__": "ConfigFieldSnap",
@@ -65375,14 +66591,14 @@
           }
         ],
         "given_name": null,
-        "key": "Shape.5226d38df2bfba4efbed1eae7847d24149c16136",
+        "key": "Shape.5aef99189364e28ce42e62d407486d97795b9708",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.6fbc82984917129159793266b2c425ba21ace18f": {
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -65390,70 +66606,97 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {}}",
+            "default_value_as_json_str": "0",
             "description": null,
             "is_required": false,
-            "name": "io_manager",
-            "type_key": "Shape.44f2a71367507edd1b8e64f739222c4312b3691b"
+            "name": "max_concurrent",
+            "type_key": "Int"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "root_manager",
-            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
           }
         ],
         "given_name": null,
-        "key": "Shape.6fbc82984917129159793266b2c425ba21ace18f",
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
+      "Shape.6fbc82984917129159793266b2c425ba21ace18f": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "io_manager",
+            "type_key": "Shape.44f2a71367507edd1b8e64f739222c4312b3691b"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Any"
+            "name": "root_manager",
+            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
           }
         ],
         "given_name": null,
-        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
+        "key": "Shape.6fbc82984917129159793266b2c425ba21ace18f",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416": {
+      "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
             "name": "config",
-            "type_key": "Selector.0fc78559bca2eeb6e58c8d8d38e81683bbfe79b8"
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.7abfc8561f904c5622a52b6e52f7d99e3cb10416",
+        "key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -65492,6 +66735,29 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "config",
+            "type_key": "Selector.2450dd699b86b34130d4162d906aa57730c8a63c"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.9a2649b1a5162e9157da356ed6e61646c6060d2e",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.ca9d191bc601d7df07b309fbcc1a5848eafee07a": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -65607,47 +66873,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -65881,7 +67106,7 @@
           "name": "root_manager"
         }
       ],
-      "root_config_key": "Shape.5226d38df2bfba4efbed1eae7847d24149c16136"
+      "root_config_key": "Shape.5aef99189364e28ce42e62d407486d97795b9708"
     }
   ],
   "name": "static_partitioned_assets_job",
@@ -65955,7 +67180,7 @@
   "tags": {}
 }'''
 
-snapshots['test_all_snapshot_ids 98'] = 'b7a4f97f4e8cc47e4c1145f33597d9bd6d2e7b96'
+snapshots['test_all_snapshot_ids 98'] = 'b67fd9cdf6567bf48f89817b97eb1a39bbd02de0'
 
 snapshots['test_all_snapshot_ids 99'] = '''{
   "__class__": "PipelineSnapshot",
@@ -66050,6 +67275,22 @@
         },
         "type_param_keys": null
       },
+      "Map.String.Float": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": null,
+        "given_name": null,
+        "key": "Map.String.Float",
+        "kind": {
+          "__enum__": "ConfigTypeKind.MAP"
+        },
+        "scalar_kind": null,
+        "type_param_keys": [
+          "String",
+          "Float"
+        ]
+      },
       "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -66201,89 +67442,39 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
+      "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Int"
-          }
-        ],
-        "given_name": null,
-        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
-        "kind": {
-          "__enum__": "ConfigTypeKind.SELECTOR"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
-      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "json",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "pickle",
-            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+            "is_required": false,
+            "name": "in_process",
+            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
             "description": null,
-            "is_required": true,
-            "name": "value",
-            "type_key": "Bool"
+            "is_required": false,
+            "name": "multiprocess",
+            "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
           }
         ],
         "given_name": null,
-        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
+        "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
+      "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -66313,18 +67504,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Float"
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
+        "key": "Selector.a9799b971d12ace70a2d8803c883c863417d0725",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
+      "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -66354,18 +67545,18 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "String"
+            "type_key": "Bool"
           }
         ],
         "given_name": null,
-        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
+        "key": "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
+      "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -66387,17 +67578,26 @@
             "is_required": true,
             "name": "pickle",
             "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Float"
           }
         ],
         "given_name": null,
-        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
+        "key": "Selector.d00a37e3807d37c9f69cc62997c4a5f4a176e5c3",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
+      "Selector.e04723c9d9937e3ab21206435b22247cfbe58269": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -66427,50 +67627,50 @@
             "description": null,
             "is_required": true,
             "name": "value",
-            "type_key": "Any"
+            "type_key": "String"
           }
         ],
         "given_name": null,
-        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
+        "key": "Selector.e04723c9d9937e3ab21206435b22247cfbe58269",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
+      "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
           }
         ],
         "given_name": null,
-        "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
+        "key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
+      "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -66480,36 +67680,54 @@
             "default_provided": false,
             "default_value_as_json_str": null,
             "description": null,
-            "is_required": false,
-            "name": "base_dir",
-            "type_key": "StringSourceType"
+            "is_required": true,
+            "name": "json",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "pickle",
+            "type_key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "value",
+            "type_key": "Any"
           }
         ],
         "given_name": null,
-        "key": "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851",
+        "key": "Selector.f2fe6dfdc60a1947a8f8e7cd377a012b47065bc4",
         "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
+      "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "default_provided": false,
+            "default_value_as_json_str": null,
             "description": null,
             "is_required": false,
-            "name": "config",
-            "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+            "name": "base_dir",
+            "type_key": "StringSourceType"
           }
         ],
         "given_name": null,
-        "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
+        "key": "Shape.18b2faaf1efd505374f7f25fcb61ed59bd5be851",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -66663,6 +67881,59 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.5470f9c68158eb4d2dea056ef94f71a76f79fff8": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "field_aliases": {
+          "solids": "ops"
+        },
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"in_process\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "execution",
+            "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{}",
+            "description": null,
+            "is_required": false,
+            "name": "loggers",
+            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
+            "description": null,
+            "is_required": false,
+            "name": "resources",
+            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"simple_solid\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "solids",
+            "type_key": "Shape.59cea50d986c572e8feb16c6f1f4b8cffd069f2a"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.5470f9c68158eb4d2dea056ef94f71a76f79fff8",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.59cea50d986c572e8feb16c6f1f4b8cffd069f2a": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -66724,6 +67995,56 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": null,
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+            "is_required": false,
+            "name": "resource_capacities",
+            "type_key": "Map.String.Float"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": null,
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -66779,53 +68100,23 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.c2c7de15d92ef56b8bd9705c1b4239c47b16aa9b": {
+      "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
-        "field_aliases": {
-          "solids": "ops"
-        },
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"in_process\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {\\"config\\": {}}}",
-            "description": null,
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.c2c57770aaa8b396a9e2db0762cc977ca34ead8a"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"simple_solid\\": {}}",
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
             "description": null,
             "is_required": false,
-            "name": "solids",
-            "type_key": "Shape.59cea50d986c572e8feb16c6f1f4b8cffd069f2a"
+            "name": "config",
+            "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
           }
         ],
         "given_name": null,
-        "key": "Shape.c2c7de15d92ef56b8bd9705c1b4239c47b16aa9b",
+        "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -66868,47 +68159,6 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-        "__class__": "ConfigTypeSnap",
-        "description": null,
-        "enum_values": null,
-        "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": null,
-            "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": null,
-            "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-            "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-          }
-        ],
-        "given_name": null,
-        "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-        "kind": {
-          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-        },
-        "scalar_kind": null,
-        "type_param_keys": null
-      },
       "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -67107,7 +68357,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.c2c7de15d92ef56b8bd9705c1b4239c47b16aa9b"
+      "root_config_key": "Shape.5470f9c68158eb4d2dea056ef94f71a76f79fff8"
     }
   ],
   "name": "tagged_pipeline",
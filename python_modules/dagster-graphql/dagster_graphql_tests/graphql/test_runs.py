@@ -1,6 +1,12 @@
 import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+import mock
 import yaml
+from dagster_graphql.implementation.storage_queries import offload_storage_queries
+from dagster_graphql.schema import create_schema
+from dagster_graphql.schema.logs.events import GrapheneRunStepStats
 from dagster_graphql.test.utils import (
     define_out_of_process_context,
     execute_dagster_graphql,
@@ -10,6 +16,7 @@
 from dagster_graphql_tests.graphql.graphql_context_test_suite import (
     ExecutingGraphQLContextTestMatrix,
 )
+from graphql import graphql
 
 from dagster import (
     AssetMaterialization,
@@ -225,6 +232,43 @@
 """
 
 
+RUNS_WITH_STORAGE_FIELDS_QUERY = """
+query RunsWithStorageFieldsQuery {
+    runsOrError {
+        ... on Runs {
+            count
+            results {
+                runId
+                stepStats {
+                    stepKey
+                    status
+                }
+                assets {
+                    key {
+                        path
+                    }
+                }
+                events {
+                    __typename
+                }
+            }
+        }
+    }
+    assetOrError(assetKey: {path: ["foo"]}) {
+        ... on Asset {
+            assetMaterializations {
+                runOrError {
+                    ... on Run {
+                        runId
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+
 def _get_runs_data(result, run_id):
     for run_data in result.data["pipelineOrError"]["runs"]:
         if run_data["runId"] == run_id:
@@ -912,3 +956,44 @@ def test_asset_batching():
             counts = counter.counts()
             assert counts
             assert counts.get("DagsterInstance.get_run_records") == 1
+
+
+def test_offload_storage_queries():
+    with instance_for_test() as instance:
+        repo = get_asset_repo()
+        foo_job = repo.get_job("foo_job")
+        for _ in range(3):
+            foo_job.execute_in_process(instance=instance)
+        with define_out_of_process_context(__file__, "asset_repo", instance) as context:
+            expected = execute_dagster_graphql(context, RUNS_WITH_STORAGE_FIELDS_QUERY)
+            assert expected.data
+            assert expected.data["runsOrError"]["count"] == 3
+            assert len(expected.data["assetOrError"]["assetMaterializations"]) == 3
+
+            # graphene objects are built on the request thread, not by the offloaded queries
+            step_stats_threads = set()
+
+            def _step_stats(stats):
+                step_stats_threads.add(threading.get_ident())
+                return GrapheneRunStepStats(stats)
+
+            traced_counter.set(Counter())
+            with ThreadPoolExecutor(max_workers=2) as thread_pool, mock.patch(
+                "dagster_graphql.schema.pipelines.pipeline.GrapheneRunStepStats", _step_stats
+            ):
+                with offload_storage_queries(thread_pool) as executor:
+                    result = graphql(
+                        create_schema(),
+                        RUNS_WITH_STORAGE_FIELDS_QUERY,
+                        context_value=context,
+                        executor=executor,
+                    )
+
+            assert not result.errors
+            assert result.data == expected.data
+            assert step_stats_threads == {threading.get_ident()}
+
+            # offloaded queries are still traced against the request
+            counts = traced_counter.get().counts()
+            assert counts.get("DagsterInstance.get_runs_count") == 1
+            assert counts.get("DagsterInstance.get_run_step_stats") == 3
@@ -140,6 +140,7 @@
     solid,
     static_partitioned_config,
     success_hook,
+    threadpool_executor,
     weekly_partitioned_config,
     weekly_schedule,
 )
@@ -477,6 +478,7 @@ def __dir__():
     "execute_solid_within_pipeline",
     "in_process_executor",
     "multiprocess_executor",
+    "threadpool_executor",
     "multiple_process_executor_requirements",
     "build_reconstructable_job",
     "reconstructable",
@@ -240,52 +240,63 @@ def get_step_stats_by_key(instance, pipeline_run, step_keys_to_execute):
 
 
 def verify_step(instance, pipeline_run, retry_state, step_keys_to_execute):
+    """Returns the subset of the given step keys that may be executed by this step worker. Steps
+    that were already started by another worker for the same attempt are left out, so that a
+    worker launched for several steps still executes the ones that have not started yet.
+    """
     step_stats_by_key = get_step_stats_by_key(instance, pipeline_run, step_keys_to_execute)
 
-    for step_key in step_keys_to_execute:
-        step_stat_for_key = step_stats_by_key.get(step_key)
-        current_attempt = retry_state.get_attempt_count(step_key) + 1
-
-        # When using the k8s executor, it is possible to get into an edge case when deleting
-        # a step pod. K8s will restart the pod immediately even though we don't want it to.
-        # Pod can be deleted manually or due to or node failures (for example, when running on
-        # a spot instance that is evicted).
-        #
-        # If we encounter one of the error cases below, we exit with a success exit code
-        # so that we don't cause the "Encountered failed job pods" error.
-        #
-        # Instead, the step will be marked as being in an unknown state by the executor and the
-        # pipeline will fail accordingly.
-        if current_attempt == 1 and step_stat_for_key:
-            # If this is the first attempt, there shouldn't be any step stats for this
-            # event yet.
-            instance.report_engine_event(
-                "Attempted to run {step_key} again even though it was already started. "
-                "Exiting to prevent re-running the step.".format(step_key=step_key),
-                pipeline_run,
-            )
-            return False
-        elif current_attempt > 1 and step_stat_for_key:
-            # If this is a retry, then the number of previous attempts should be exactly one less
-            # than the current attempt
-
-            if step_stat_for_key.attempts != current_attempt - 1:
-                instance.report_engine_event(
-                    "Attempted to run retry attempt {current_attempt} for step {step_key} again "
-                    "even though it was already started. Exiting to prevent re-running "
-                    "the step.".format(current_attempt=current_attempt, step_key=step_key),
-                    pipeline_run,
-                )
-                return False
-        elif current_attempt > 1 and not step_stat_for_key:
+    return [
+        step_key
+        for step_key in step_keys_to_execute
+        if _verify_step_key(instance, pipeline_run, retry_state, step_key, step_stats_by_key)
+    ]
+
+
+def _verify_step_key(instance, pipeline_run, retry_state, step_key, step_stats_by_key):
+    step_stat_for_key = step_stats_by_key.get(step_key)
+    current_attempt = retry_state.get_attempt_count(step_key) + 1
+
+    # When using the k8s executor, it is possible to get into an edge case when deleting
+    # a step pod. K8s will restart the pod immediately even though we don't want it to.
+    # Pod can be deleted manually or due to or node failures (for example, when running on
+    # a spot instance that is evicted).
+    #
+    # If we encounter one of the error cases below, we exit with a success exit code
+    # so that we don't cause the "Encountered failed job pods" error.
+    #
+    # Instead, the step will be marked as being in an unknown state by the executor and the
+    # pipeline will fail accordingly.
+    if current_attempt == 1 and step_stat_for_key:
+        # If this is the first attempt, there shouldn't be any step stats for this
+        # event yet.
+        instance.report_engine_event(
+            "Attempted to run {step_key} again even though it was already started. "
+            "Exiting to prevent re-running the step.".format(step_key=step_key),
+            pipeline_run,
+        )
+        return False
+    elif current_attempt > 1 and step_stat_for_key:
+        # If this is a retry, then the number of previous attempts should be exactly one less
+        # than the current attempt
+
+        if step_stat_for_key.attempts != current_attempt - 1:
             instance.report_engine_event(
-                "Attempting to retry attempt {current_attempt} for step {step_key} "
-                "but there is no record of the original attempt".format(
-                    current_attempt=current_attempt, step_key=step_key
-                ),
+                "Attempted to run retry attempt {current_attempt} for step {step_key} again "
+                "even though it was already started. Exiting to prevent re-running "
+                "the step.".format(current_attempt=current_attempt, step_key=step_key),
                 pipeline_run,
             )
             return False
+    elif current_attempt > 1 and not step_stat_for_key:
+        instance.report_engine_event(
+            "Attempting to retry attempt {current_attempt} for step {step_key} "
+            "but there is no record of the original attempt".format(
+                current_attempt=current_attempt, step_key=step_key
+            ),
+            pipeline_run,
+        )
+        return False
 
     return True
 
@@ -338,14 +349,15 @@ def _execute_step_command_body(
             "Pipeline run with id '{}' not found for step execution".format(args.pipeline_run_id),
         )
 
+        step_keys_to_execute = args.step_keys_to_execute
         if args.should_verify_step:
-            success = verify_step(
+            step_keys_to_execute = verify_step(
                 instance,
                 pipeline_run,
                 check.not_none(args.known_state).get_retry_state(),
                 args.step_keys_to_execute,
             )
-            if not success:
+            if not step_keys_to_execute:
                 return
 
         recon_pipeline = recon_pipeline_from_origin(
@@ -355,7 +367,7 @@ def _execute_step_command_body(
         execution_plan = create_execution_plan(
             recon_pipeline,
             run_config=pipeline_run.run_config,
-            step_keys_to_execute=args.step_keys_to_execute,
+            step_keys_to_execute=step_keys_to_execute,
             mode=pipeline_run.mode,
             known_state=args.known_state,
         )
@@ -440,6 +452,15 @@ def _execute_step_command_body(
     "waiting to load them when the server is launched. Useful for surfacing errors when the server "
     "is managed directly from Dagit",
 )
+@click.option(
+    "--defer-pipeline-snapshots",
+    is_flag=True,
+    required=False,
+    default=False,
+    help="Only send lightweight references to each pipeline/job when a client loads a repository, "
+    "instead of full pipeline snapshots. Clients fetch the snapshot for each pipeline/job when it "
+    "is first accessed. Useful for repositories with many jobs.",
+)
 @python_origin_target_argument
 @click.option(
     "--use-python-environment-entry-point",
@@ -501,6 +522,7 @@ def grpc_command(
     override_system_timezone=None,
     log_level="INFO",
     use_python_environment_entry_point=False,
+    defer_pipeline_snapshots=False,
     **kwargs,
 ):
     if seven.IS_WINDOWS and port is None:
@@ -559,6 +581,7 @@ def grpc_command(
                 if use_python_environment_entry_point
                 else DEFAULT_DAGSTER_ENTRY_POINT
             ),
+            defer_pipeline_snapshots=defer_pipeline_snapshots,
         )
 
         code_desc = " "
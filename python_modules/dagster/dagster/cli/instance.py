@@ -1,9 +1,14 @@
 import os
+import time
 
 import click
 
 from dagster import check
 from dagster.core.instance import DagsterInstance
+from dagster.core.storage.event_log.base import (
+    DEFAULT_IDS_PER_EVENT_PARTITION,
+    DEFAULT_PRUNE_EVENTS_BATCH_SIZE,
+)
 
 
 @click.group(name="instance")
@@ -65,3 +70,101 @@ def reindex_command():
         click.echo("$DAGSTER_HOME: {}\n".format(home))
 
         instance.reindex(click.echo)
+
+
+@instance_cli.command(
+    name="prune-events", help="Delete the event logs stored before the retention period."
+)
+@click.option(
+    "--older-than-days",
+    type=click.INT,
+    help=(
+        "Delete the events stored more than this many days ago. Defaults to the "
+        "`retention.event_logs.max_age_days` setting of the instance."
+    ),
+)
+@click.option(
+    "--batch-size",
+    type=click.INT,
+    default=DEFAULT_PRUNE_EVENTS_BATCH_SIZE,
+    help="The maximum number of events to delete per transaction.",
+)
+@click.option("--noprompt", is_flag=True)
+def prune_events_command(older_than_days, batch_size, noprompt):
+    with DagsterInstance.get() as instance:
+        if instance.is_ephemeral:
+            click.echo(
+                "$DAGSTER_HOME is not set; ephemeral instances do not retain event logs.  If you "
+                "intended to prune a persistent instance, please ensure that $DAGSTER_HOME is "
+                "set accordingly."
+            )
+            return
+
+        if not instance.supports_event_log_pruning:
+            raise click.UsageError(
+                "Error, the event log storage of this instance does not support pruning events."
+            )
+
+        max_age_days = (
+            older_than_days
+            if older_than_days is not None
+            else instance.event_log_retention_max_age_days
+        )
+        if max_age_days is None:
+            raise click.UsageError(
+                "Error, you must specify `--older-than-days` or set "
+                "`retention.event_logs.max_age_days` in the instance configuration."
+            )
+
+        if noprompt:
+            confirmation = "DELETE"
+        else:
+            confirmation = click.prompt(
+                "Are you sure you want to delete the events stored more than {} days ago from the "
+                "event logs? Type DELETE".format(max_age_days)
+            )
+
+        if confirmation != "DELETE":
+            click.echo("Exiting without deleting events")
+            return
+
+        before_timestamp = time.time() - max_age_days * 24 * 60 * 60
+        deleted_count = instance.prune_event_logs(before_timestamp, batch_size)
+        click.echo("Deleted {} events from the event logs".format(deleted_count))
+
+
+@instance_cli.command(
+    name="partition-events",
+    help=(
+        "Partition the event logs by storage id, so that pruning drops whole partitions of old "
+        "events. This locks the event logs while it runs, so it should be run during a "
+        "maintenance window."
+    ),
+)
+@click.option(
+    "--ids-per-partition",
+    type=click.INT,
+    default=DEFAULT_IDS_PER_EVENT_PARTITION,
+    help="The number of consecutive storage ids in each partition.",
+)
+def partition_events_command(ids_per_partition):
+    with DagsterInstance.get() as instance:
+        if instance.is_ephemeral:
+            click.echo(
+                "$DAGSTER_HOME is not set; ephemeral instances cannot be partitioned.  If you "
+                "intended to partition a persistent instance, please ensure that $DAGSTER_HOME is "
+                "set accordingly."
+            )
+            return
+
+        if not instance.supports_event_log_partitioning:
+            raise click.UsageError(
+                "Error, the event log storage of this instance does not support partitioning "
+                "events."
+            )
+
+        if ids_per_partition <= 0:
+            raise click.UsageError("Error, `--ids-per-partition` must be positive.")
+
+        instance.partition_event_logs(ids_per_partition)
+        click.echo("Partitioned the event logs")
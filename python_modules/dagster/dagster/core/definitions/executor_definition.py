@@ -3,8 +3,8 @@
 from typing import Any, Dict, Optional
 
 from dagster import check
-from dagster.builtins import Int
-from dagster.config import Field, Selector
+from dagster.builtins import Float, Int
+from dagster.config import Field, Map, Selector
 from dagster.core.definitions.configurable import (
     ConfiguredDefinitionConfigSchema,
     NamedConfigurableDefinition,
@@ -33,6 +33,17 @@ class ExecutorRequirement(PyEnum):
     PERSISTENT_OUTPUTS = "PERSISTENT_OUTPUTS"
 
 
+def get_resource_capacities_config():
+    return Field(
+        Map(str, Float),
+        is_required=False,
+        description="The capacity of each resource (e.g. cpu, memory, or custom slots) that steps "
+        'declare requirements for with the "dagster/resource_requirements" tag. Ready steps are '
+        "only executed while their requirements fit within the remaining capacities. Resources "
+        "without a capacity are not limited.",
+    )
+
+
 def multiple_process_executor_requirements():
     return [
         ExecutorRequirement.RECONSTRUCTABLE_JOB,
@@ -268,6 +279,7 @@ def _core_multiprocess_executor_creation(config: Dict[str, Any]):
         retries=RetryMode.from_config(config["retries"]),
         start_method=start_method,
         explicit_forkserver_preload=start_cfg.get("preload_modules"),
+        resource_capacities=config.get("resource_capacities"),
     )
 
 
@@ -298,6 +310,7 @@ def _core_multiprocess_executor_creation(config: Dict[str, Any]):
         ),
     ),
     "retries": get_retries_config(),
+    "resource_capacities": get_resource_capacities_config(),
 }
 
 
@@ -327,10 +340,71 @@ def multiprocess_executor(init_context):
     Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
+
+    Steps can declare the amounts of resources that they require with the
+    ``dagster/resource_requirements`` tag, e.g. ``{"dagster/resource_requirements": {"memory": 4}}``.
+    When ``resource_capacities`` are configured, e.g. ``resource_capacities: {memory: 16}``, ready
+    steps are only started while their requirements fit within the remaining capacities.
     """
     return _core_multiprocess_executor_creation(init_context.executor_config)
 
 
+def _core_threadpool_executor_creation(config: Dict[str, Any]):
+    from dagster.core.executor.threadpool import ThreadpoolExecutor
+
+    return ThreadpoolExecutor(
+        retries=RetryMode.from_config(config["retries"]),
+        max_concurrent=config["max_concurrent"],
+        resource_capacities=config.get("resource_capacities"),
+    )
+
+
+THREADPOOL_CONFIG = {
+    "max_concurrent": Field(Int, is_required=False, default_value=0),
+    "retries": get_retries_config(),
+    "resource_capacities": get_resource_capacities_config(),
+}
+
+
+@executor(
+    name="threadpool",
+    config_schema=THREADPOOL_CONFIG,
+)
+def threadpool_executor(init_context):
+    """The threadpool executor executes steps concurrently on a pool of threads in a single
+    process.
+
+    Steps share the resources initialized for the run, and outputs can be passed between them in
+    memory (e.g. with the ``mem_io_manager``), so it suits jobs whose steps mostly wait on I/O,
+    such as network requests. To select it, include the following top-level fragment in config:
+
+    .. code-block:: yaml
+
+        execution:
+          threadpool:
+            config:
+              max_concurrent: 8
+
+    The ``max_concurrent`` arg is optional and tells the execution engine how many steps may run
+    concurrently. By default, or if you set ``max_concurrent`` to be 0, this is
+    ``min(32, cpu_count + 4)``.
+
+    The stdout and stderr that each step writes through :py:data:`python:sys.stdout` and
+    :py:data:`python:sys.stderr` are captured in its compute logs. Unlike the other executors,
+    output written directly to the file descriptors of the process (e.g. by subprocesses) is not.
+
+    Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
+    where the higher the number the higher the priority. 0 is the default and both positive
+    and negative numbers can be used.
+
+    Steps can declare the amounts of resources that they require with the
+    ``dagster/resource_requirements`` tag, e.g. ``{"dagster/resource_requirements": {"memory": 4}}``.
+    When ``resource_capacities`` are configured, e.g. ``resource_capacities: {memory: 16}``, ready
+    steps are only started while their requirements fit within the remaining capacities.
+    """
+    return _core_threadpool_executor_creation(init_context.executor_config)
+
+
 default_executors = [in_process_executor, multiprocess_executor]
 
 
@@ -35,13 +35,14 @@
 )
 from dagster.core.storage.fs_asset_io_manager import fs_asset_io_manager
 from dagster.core.utils import str_format_set
+from dagster.utils.cache import CacheStats, LRUCache
 
 from .executor_definition import ExecutorDefinition
 from .graph_definition import GraphDefinition, SubselectedGraphDefinition
 from .hook_definition import HookDefinition
 from .mode import ModeDefinition
 from .partition import PartitionSetDefinition
-from .pipeline_definition import PipelineDefinition
+from .pipeline_definition import MAX_CACHED_SUBSET_DEFS, PipelineDefinition
 from .preset import PresetDefinition
 from .resource_definition import ResourceDefinition
 from .run_request import RunRequest
@@ -69,6 +70,9 @@ def __init__(
     ):
 
         self._cached_partition_set: Optional["PartitionSetDefinition"] = None
+        self._cached_op_selection_job_defs: LRUCache["JobDefinition"] = LRUCache(
+            MAX_CACHED_SUBSET_DEFS
+        )
         self._op_selection_data = check.opt_inst_param(
             _op_selection_data, "_op_selection_data", OpSelectionData
         )
@@ -218,6 +222,15 @@ def get_job_def_for_op_selection(
 
         op_selection = check.opt_list_param(op_selection, "op_selection", str)
 
+        return self._cached_op_selection_job_defs.get_or_compute(
+            (self.name, tuple(op_selection)),
+            lambda: self._get_job_def_for_op_selection(op_selection),
+        )
+
+    def get_subset_def_cache_stats(self) -> CacheStats:
+        return self._cached_op_selection_job_defs.get_stats()
+
+    def _get_job_def_for_op_selection(self, op_selection: List[str]) -> "JobDefinition":
         resolved_op_selection_dict = parse_op_selection(self, op_selection)
 
         sub_graph = get_subselected_graph_definition(self.graph, resolved_op_selection_dict)
@@ -20,6 +20,7 @@
 from dagster.core.utils import str_format_set
 from dagster.utils import frozentags, merge_dicts
 from dagster.utils.backcompat import experimental_class_warning
+from dagster.utils.cache import CacheStats, LRUCache
 
 from .dependency import (
     DependencyDefinition,
@@ -40,11 +41,16 @@
 from .utils import validate_tags
 from .version_strategy import VersionStrategy
 
+# Bound on the number of subset definitions (and their run config schemas / snapshots) kept alive
+# per pipeline definition.
+MAX_CACHED_SUBSET_DEFS = 32
+
 if TYPE_CHECKING:
     from dagster.core.definitions.partition import PartitionSetDefinition
     from dagster.core.execution.execute_in_process_result import ExecuteInProcessResult
     from dagster.core.host_representation import PipelineIndex
     from dagster.core.instance import DagsterInstance
+    from dagster.core.selector.subset_selector import SelectionIndex
     from dagster.core.snap import ConfigSchemaSnapshot, PipelineSnapshot
 
     from .run_config_schema import RunConfigSchema
@@ -249,6 +255,10 @@ def __init__(
         )
         self._cached_run_config_schemas: Dict[str, "RunConfigSchema"] = {}
         self._cached_external_pipeline = None
+        self._cached_selection_index: Optional["SelectionIndex"] = None
+        self._cached_subset_defs: LRUCache["PipelineSubsetDefinition"] = LRUCache(
+            MAX_CACHED_SUBSET_DEFS
+        )
 
         self.version_strategy = check.opt_inst_param(
             version_strategy, "version_strategy", VersionStrategy
@@ -421,13 +431,27 @@ def has_dagster_type(self, name):
     def dagster_type_named(self, name):
         return self._graph_def.dagster_type_named(name)
 
+    def get_selection_index(self) -> "SelectionIndex":
+        from dagster.core.selector.subset_selector import SelectionIndex, generate_dep_graph
+
+        if self._cached_selection_index is None:
+            self._cached_selection_index = SelectionIndex(generate_dep_graph(self))
+        return self._cached_selection_index
+
     def get_pipeline_subset_def(
         self, solids_to_execute: Optional[AbstractSet[str]]
     ) -> "PipelineDefinition":
-        return (
-            self if solids_to_execute is None else _get_pipeline_subset_def(self, solids_to_execute)
+        if solids_to_execute is None:
+            return self
+
+        return self._cached_subset_defs.get_or_compute(
+            (self.name, frozenset(solids_to_execute)),
+            lambda: _get_pipeline_subset_def(self, solids_to_execute),
         )
 
+    def get_subset_def_cache_stats(self) -> CacheStats:
+        return self._cached_subset_defs.get_stats()
+
     def has_preset(self, name: str) -> bool:
         check.str_param(name, "name")
         return name in self._preset_dict
@@ -3,6 +3,7 @@
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import uuid
 import warnings
@@ -31,6 +32,105 @@ def mirror_stream_to_file(stream, filepath):
             yield pids
 
 
+class _ThreadRoutedStream:
+    """Stands in for sys.stdout or sys.stderr while threads capture their output, writing what each
+    thread writes to the file that it has routed its output to, as well as to the original stream.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    @property
+    def original_stream(self):
+        return self._stream
+
+    @property
+    def file_stream(self):
+        return getattr(self._local, "file_stream", None)
+
+    @file_stream.setter
+    def file_stream(self, file_stream):
+        self._local.file_stream = file_stream
+
+    def write(self, data):
+        file_stream = self.file_stream
+        if file_stream is not None:
+            file_stream.write(data)
+        return self._stream.write(data)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        file_stream = self.file_stream
+        if file_stream is not None:
+            file_stream.flush()
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+_thread_routed_streams_lock = threading.Lock()
+# the routed stdout and stderr, while any threads are capturing their output
+_thread_routed_streams = None
+_thread_routed_streams_count = 0
+
+
+@contextmanager
+def _route_thread_streams():
+    global _thread_routed_streams, _thread_routed_streams_count  # pylint: disable=global-statement
+
+    with _thread_routed_streams_lock:
+        if _thread_routed_streams_count == 0:
+            _thread_routed_streams = (
+                _ThreadRoutedStream(sys.stdout),
+                _ThreadRoutedStream(sys.stderr),
+            )
+            sys.stdout, sys.stderr = _thread_routed_streams
+        _thread_routed_streams_count += 1
+        stdout, stderr = _thread_routed_streams
+
+    try:
+        yield stdout, stderr
+    finally:
+        with _thread_routed_streams_lock:
+            _thread_routed_streams_count -= 1
+            if _thread_routed_streams_count == 0:
+                # leave the streams alone if they were replaced while routed
+                if sys.stdout is stdout:
+                    sys.stdout = stdout.original_stream
+                if sys.stderr is stderr:
+                    sys.stderr = stderr.original_stream
+                _thread_routed_streams = None
+
+
+@contextmanager
+def redirect_thread_output_to_files(out_path, err_path):
+    """Mirrors the stdout and stderr written by the current thread to files, leaving the output of
+    any other threads alone.
+
+    Unlike mirror_stream_to_file, which redirects the file descriptors of the whole process, only
+    output written through sys.stdout and sys.stderr is captured, so output written directly to the
+    file descriptors (e.g. by subprocesses or C extensions) is not.
+    """
+    ensure_file(out_path)
+    ensure_file(err_path)
+    with open(out_path, "a+", buffering=1) as out_file, open(
+        err_path, "a+", buffering=1
+    ) as err_file:
+        with _route_thread_streams() as (stdout, stderr):
+            stdout.file_stream = out_file
+            stderr.file_stream = err_file
+            try:
+                yield
+            finally:
+                stdout.file_stream = None
+                stderr.file_stream = None
+
+
 def should_disable_io_stream_redirect():
     # See https://stackoverflow.com/a/52377087
     # https://www.python.org/dev/peps/pep-0528/
@@ -1,17 +1,22 @@
 import time
 from typing import Callable, Dict, Iterator, List, Optional, Set, cast
 
-from dagster import check
+from dagster import check, seven
 from dagster.core.errors import (
     DagsterExecutionInterruptedError,
     DagsterInvariantViolationError,
     DagsterUnknownStepStateError,
 )
 from dagster.core.events import DagsterEvent
-from dagster.core.execution.context.system import PlanOrchestrationContext
+from dagster.core.execution.context.system import IPlanContext, PlanOrchestrationContext
 from dagster.core.execution.plan.state import KnownExecutionState, StepOutputVersionData
 from dagster.core.execution.retries import RetryMode, RetryState
-from dagster.core.storage.tags import PRIORITY_TAG
+from dagster.core.storage.pipeline_run import PipelineRunStatus, RunsFilter
+from dagster.core.storage.tags import (
+    CRITICAL_PATH_FROM_HISTORY_TAG,
+    PRIORITY_TAG,
+    RESOURCE_REQUIREMENTS_TAG,
+)
 from dagster.utils.interrupts import pop_captured_interrupt
 
 from .outputs import StepOutputData, StepOutputHandle
@@ -23,6 +28,61 @@ def _default_sort_key(step: ExecutionStep) -> float:
     return int(step.tags.get(PRIORITY_TAG, 0)) * -1
 
 
+def get_step_resource_requirements(step: ExecutionStep) -> Dict[str, float]:
+    """The amounts of each resource (e.g. cpu, memory, or custom slots) that the step requires,
+    set as a JSON object in the ``dagster/resource_requirements`` tag.
+    """
+    requirements_str = step.tags.get(RESOURCE_REQUIREMENTS_TAG)
+    if requirements_str is None:
+        return {}
+
+    requirements = seven.json.loads(requirements_str)
+    if not isinstance(requirements, dict) or not all(
+        isinstance(amount, (int, float)) for amount in requirements.values()
+    ):
+        raise DagsterInvariantViolationError(
+            f'Invalid "{RESOURCE_REQUIREMENTS_TAG}" tag on step "{step.key}": expected a JSON '
+            f"object mapping resource names to numbers, got {requirements_str}"
+        )
+
+    return {name: float(amount) for name, amount in requirements.items()}
+
+
+def get_prior_step_durations(
+    plan_context: IPlanContext, execution_plan: ExecutionPlan
+) -> Optional[Dict[str, float]]:
+    """The durations in seconds of the steps of the most recent successful run of the same job,
+    used to weight the critical paths of the steps of the plan.
+
+    Only looked up for runs tagged with ``dagster/critical_path_from_history: true``, since it
+    queries the run and event log storage before execution starts.
+    """
+    check.inst_param(plan_context, "plan_context", IPlanContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+
+    if plan_context.get_tag(CRITICAL_PATH_FROM_HISTORY_TAG) != "true":
+        return None
+
+    # the order of a single step does not matter
+    if len(execution_plan.step_handles_to_execute) <= 1:
+        return None
+
+    prior_runs = plan_context.instance.get_runs(
+        filters=RunsFilter(
+            job_name=plan_context.pipeline_name, statuses=[PipelineRunStatus.SUCCESS]
+        ),
+        limit=1,
+    )
+    if not prior_runs:
+        return None
+
+    return {
+        step_stats.step_key: step_stats.end_time - step_stats.start_time
+        for step_stats in plan_context.instance.get_run_step_stats(prior_runs[0].run_id)
+        if step_stats.start_time is not None and step_stats.end_time is not None
+    }
+
+
 class ActiveExecution:
     """State machine used to track progress through execution of an ExecutionPlan"""
 
@@ -33,6 +93,8 @@ def __init__(
         retry_state: RetryState,
         sort_key_fn: Optional[Callable[[ExecutionStep], float]] = None,
         step_output_versions: Optional[List[StepOutputVersionData]] = None,
+        resource_capacities: Optional[Dict[str, float]] = None,
+        step_durations: Optional[Dict[str, float]] = None,
     ):
         self._plan: ExecutionPlan = check.inst_param(
             execution_plan, "execution_plan", ExecutionPlan
@@ -52,6 +114,20 @@ def __init__(
             step_output_versions, "step_output_versions", of_type=StepOutputVersionData
         )
 
+        # Steps are only admitted for execution while the resources that they require fit within
+        # these capacities, see get_steps_to_execute
+        self._resource_capacities = check.opt_dict_param(
+            resource_capacities, "resource_capacities", key_type=str
+        )
+        # the constrained resource requirements of the admitted steps, by step key
+        self._admitted_requirements: Dict[str, Dict[str, float]] = {}
+
+        # Ready steps with the same sort key are ordered by the length of the chain of steps
+        # waiting on them (optionally weighted by their durations), so that the longest chains
+        # start first. Computed lazily, and again whenever dynamic outputs resolve new steps.
+        self._step_durations = check.opt_dict_param(step_durations, "step_durations", key_type=str)
+        self._critical_path_lengths: Optional[Dict[str, float]] = None
+
         self._context_guard: bool = False  # Prevent accidental direct use
 
         # We decide what steps to skip based on what outputs are yielded by upstream steps
@@ -164,6 +240,7 @@ def _update(self) -> None:
                 self._pending[step_key] = deps
 
             self._new_dynamic_mappings = False
+            self._critical_path_lengths = None
 
         for step_key, requirements in self._pending.items():
             # If any upstream deps failed - this is not executable
@@ -253,12 +330,19 @@ def get_steps_to_execute(self, limit: Optional[int] = None) -> List[ExecutionSte
         check.opt_int_param(limit, "limit")
         self._update()
 
+        critical_path_lengths = self._get_critical_path_lengths()
+        # sorts are stable, so the critical path only breaks ties in the sort key
         steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
+            sorted(
+                [self.get_step_by_key(key) for key in self._executable],
+                key=lambda step: -critical_path_lengths.get(step.key, 0.0),
+            ),
             key=self._sort_key_fn,
         )
 
-        if limit:
+        if self._resource_capacities:
+            steps = self._admit_steps(steps, limit)
+        elif limit:
             steps = steps[:limit]
 
         for step in steps:
@@ -268,6 +352,55 @@ def get_steps_to_execute(self, limit: Optional[int] = None) -> List[ExecutionSte
 
         return steps
 
+    def _get_critical_path_lengths(self) -> Dict[str, float]:
+        if self._critical_path_lengths is None:
+            self._critical_path_lengths = self._plan.get_critical_path_lengths(self._step_durations)
+        return self._critical_path_lengths
+
+    def _get_resources_in_use(self) -> Dict[str, float]:
+        self._admitted_requirements = {
+            key: requirements
+            for key, requirements in self._admitted_requirements.items()
+            if key in self._in_flight
+        }
+
+        in_use: Dict[str, float] = {}
+        for requirements in self._admitted_requirements.values():
+            for name, amount in requirements.items():
+                in_use[name] = in_use.get(name, 0.0) + amount
+        return in_use
+
+    def _admit_steps(self, steps: List[ExecutionStep], limit: Optional[int]) -> List[ExecutionStep]:
+        # Greedily packs the sorted steps into the remaining capacities, so that a step that does
+        # not fit does not hold back the lower priority steps that do. A step that requires more
+        # than a capacity is admitted once nothing else is using that resource, so that it can't
+        # wait forever.
+        in_use = self._get_resources_in_use()
+
+        admitted = []
+        for step in steps:
+            if limit and len(admitted) >= limit:
+                break
+
+            requirements = {
+                name: amount
+                for name, amount in get_step_resource_requirements(step).items()
+                if name in self._resource_capacities
+            }
+            if not all(
+                in_use.get(name, 0.0) + amount <= self._resource_capacities[name]
+                or not in_use.get(name)
+                for name, amount in requirements.items()
+            ):
+                continue
+
+            for name, amount in requirements.items():
+                in_use[name] = in_use.get(name, 0.0) + amount
+            self._admitted_requirements[step.key] = requirements
+            admitted.append(step)
+
+        return admitted
+
     def get_steps_to_skip(self) -> List[ExecutionStep]:
         self._update()
 
@@ -1,6 +1,8 @@
+import concurrent.futures
+import queue
 import sys
 from contextlib import ExitStack
-from typing import Iterator, List, cast
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from dagster import check
 from dagster.core.definitions import Failure, HookExecutionResult, RetryRequested
@@ -13,6 +15,7 @@
 )
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.context.system import PlanExecutionContext, StepExecutionContext
+from dagster.core.execution.plan.active import get_prior_step_durations
 from dagster.core.execution.plan.execute_step import core_dagster_event_sequence_for_step
 from dagster.core.execution.plan.objects import (
     ErrorSource,
@@ -24,6 +27,8 @@
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
+THREADPOOL_TICK_SECONDS = 1
+
 
 def inner_plan_execution_iterator(
     pipeline_context: PlanExecutionContext, execution_plan: ExecutionPlan
@@ -31,7 +36,10 @@ def inner_plan_execution_iterator(
     check.inst_param(pipeline_context, "pipeline_context", PlanExecutionContext)
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
-    with execution_plan.start(retry_mode=pipeline_context.retry_mode) as active_execution:
+    with execution_plan.start(
+        retry_mode=pipeline_context.retry_mode,
+        step_durations=get_prior_step_durations(pipeline_context, execution_plan),
+    ) as active_execution:
 
         # It would be good to implement a reference tracking algorithm here to
         # garbage collect results that are no longer needed by any steps
@@ -114,6 +122,183 @@ def inner_plan_execution_iterator(
                 yield hook_event
 
 
+def threadpool_plan_execution_iterator(
+    pipeline_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    max_concurrent: int,
+    resource_capacities: Optional[Dict[str, float]] = None,
+) -> Iterator[DagsterEvent]:
+    """Executes the steps of the plan concurrently on a pool of threads, which share the resources
+    of the pipeline context.
+
+    Only this thread updates the active execution, with the events that the step threads hand
+    back to it.
+    """
+    check.inst_param(pipeline_context, "pipeline_context", PlanExecutionContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.int_param(max_concurrent, "max_concurrent")
+    check.opt_dict_param(resource_capacities, "resource_capacities", key_type=str)
+
+    event_queue: "queue.Queue[Tuple[str, Union[DagsterEvent, _StepThreadFinished]]]" = queue.Queue()
+
+    with execution_plan.start(
+        retry_mode=pipeline_context.retry_mode,
+        step_durations=get_prior_step_durations(pipeline_context, execution_plan),
+        resource_capacities=resource_capacities,
+    ) as active_execution:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="dagster-step"
+        ) as thread_pool:
+            running_step_keys: Set[str] = set()
+            # a step that is up for retry is only handed back to the active execution once its
+            # thread has finished, so that the retry does not start while the step is running
+            retry_events: Dict[str, DagsterEvent] = {}
+            # errors raised from steps (when raise_on_error is set), which stop new steps from
+            # being started and are re-raised once the running steps have finished
+            step_errors: List[Exception] = []
+            stopping = False
+
+            while (not stopping and not active_execution.is_complete) or running_step_keys:
+                if active_execution.check_for_interrupts():
+                    yield DagsterEvent.engine_event(
+                        pipeline_context,
+                        "Threadpool executor: received termination signal - waiting for running "
+                        "steps to finish",
+                        EngineEventData.interrupted(list(running_step_keys)),
+                    )
+                    stopping = True
+                    active_execution.mark_interrupted()
+
+                if not stopping:
+                    steps = (
+                        active_execution.get_steps_to_execute(
+                            limit=max_concurrent - len(running_step_keys)
+                        )
+                        if len(running_step_keys) < max_concurrent
+                        else []
+                    )
+                    for step in steps:
+                        step_context = cast(
+                            StepExecutionContext,
+                            pipeline_context.for_step(
+                                step, active_execution.retry_state.get_attempt_count(step.key)
+                            ),
+                        )
+                        running_step_keys.add(step.key)
+                        thread_pool.submit(
+                            _execute_step_in_thread, pipeline_context, step_context, event_queue
+                        )
+
+                    if not running_step_keys and not active_execution.is_complete:
+                        # the remaining steps are waiting to be retried
+                        active_execution.sleep_til_ready()
+                        continue
+
+                if running_step_keys:
+                    try:
+                        # wake up periodically to check for interrupts
+                        step_key, item = event_queue.get(timeout=THREADPOOL_TICK_SECONDS)
+                    except queue.Empty:
+                        continue
+
+                    while True:
+                        if isinstance(item, _StepThreadFinished):
+                            running_step_keys.remove(step_key)
+                            if item.error:
+                                step_errors.append(item.error)
+                                stopping = True
+                            if step_key in retry_events:
+                                active_execution.handle_event(retry_events.pop(step_key))
+                            active_execution.verify_complete(pipeline_context, step_key)
+                        elif item.is_step_up_for_retry:
+                            yield item
+                            retry_events[step_key] = item
+                        else:
+                            yield item
+                            active_execution.handle_event(item)
+
+                        try:
+                            step_key, item = event_queue.get_nowait()
+                        except queue.Empty:
+                            break
+
+                # process skips from failures or uncovered inputs
+                yield from active_execution.plan_events_iterator(pipeline_context)
+
+            if step_errors:
+                raise step_errors[0]
+            elif stopping:
+                raise DagsterExecutionInterruptedError()
+
+
+class _StepThreadFinished(NamedTuple):
+    error: Optional[Exception]
+
+
+def _execute_step_in_thread(
+    pipeline_context: PlanExecutionContext,
+    step_context: StepExecutionContext,
+    event_queue: "queue.Queue[Tuple[str, Union[DagsterEvent, _StepThreadFinished]]]",
+) -> None:
+    step_key = step_context.step.key
+    error = None
+    try:
+        step_event_list = []
+        for step_event in _thread_step_event_sequence(pipeline_context, step_context):
+            step_event_list.append(step_event)
+            event_queue.put((step_key, step_event))
+
+        for hook_event in _trigger_hook(step_context, step_event_list):
+            event_queue.put((step_key, hook_event))
+    except Exception as e:  # pylint: disable=broad-except
+        error = e
+    finally:
+        event_queue.put((step_key, _StepThreadFinished(error)))
+
+
+def _thread_step_event_sequence(
+    pipeline_context: PlanExecutionContext, step_context: StepExecutionContext
+) -> Iterator[DagsterEvent]:
+    # capture the logs that this step's thread writes, leaving those of the other steps alone
+    with ExitStack() as stack:
+        log_capture_error = None
+        try:
+            stack.enter_context(
+                pipeline_context.instance.compute_log_manager.watch_thread(
+                    step_context.pipeline_run, step_context.step.key
+                )
+            )
+        except Exception as e:
+            yield DagsterEvent.engine_event(
+                pipeline_context=pipeline_context,
+                message="Exception while setting up compute log capture",
+                event_specific_data=EngineEventData(
+                    error=serializable_error_info_from_exc_info(sys.exc_info())
+                ),
+                step_handle=step_context.step.handle,
+            )
+            log_capture_error = e
+
+        if not log_capture_error:
+            yield DagsterEvent.capture_logs(
+                step_context, log_key=step_context.step.key, steps=[step_context.step]
+            )
+
+        yield from check.generator(dagster_event_sequence_for_step(step_context))
+
+        try:
+            stack.close()
+        except Exception:
+            yield DagsterEvent.engine_event(
+                pipeline_context=pipeline_context,
+                message="Exception while cleaning up compute log capture",
+                event_specific_data=EngineEventData(
+                    error=serializable_error_info_from_exc_info(sys.exc_info())
+                ),
+                step_handle=step_context.step.handle,
+            )
+
+
 def _trigger_hook(
     step_context: StepExecutionContext, step_event_list: List[DagsterEvent]
 ) -> Iterator[DagsterEvent]:
@@ -731,6 +731,70 @@ def get_executable_step_deps(self) -> Dict[str, Set[str]]:
             self.step_dict, self.step_handles_to_execute, self.executable_map
         )
 
+    def get_critical_path_lengths(
+        self, step_durations: Optional[Dict[str, float]] = None
+    ) -> Dict[str, float]:
+        """For each step to execute, the length of the longest chain of steps to execute that
+        starts with it, i.e. how much of the remaining plan is waiting on it.
+
+        Args:
+            step_durations (Optional[Dict[str, float]]): Weights each step by its (e.g. historical)
+                duration in seconds. Steps missing from it are weighted by the mean duration. If
+                not provided, every step has a weight of 1.
+
+        Returns:
+            Dict[str, float]: Maps step keys to their critical path lengths.
+        """
+        check.opt_dict_param(step_durations, "step_durations", key_type=str)
+
+        step_keys = set(self.executable_map.keys()) | set(self.step_keys_to_execute)
+
+        downstream: Dict[str, Set[str]] = defaultdict(set)
+        for step_key in step_keys:
+            step = self.get_step_by_key(step_key)
+            if isinstance(step, ExecutionStep):
+                deps = step.get_execution_dependency_keys()
+            else:
+                deps = step.get_all_dependency_keys()
+            for dep in deps:
+                if dep in step_keys:
+                    downstream[dep].add(step_key)
+
+        # steps resolved from dynamic outputs are also upstream of whatever is still waiting on
+        # their unresolved form
+        for step_key, handle in self.executable_map.items():
+            if isinstance(handle, ResolvedFromDynamicStepHandle):
+                downstream[step_key] |= downstream.get(handle.unresolved_form.to_key(), set())
+
+        if step_durations:
+            default_duration = sum(step_durations.values()) / len(step_durations)
+            weights = {key: step_durations.get(key, default_duration) for key in step_keys}
+        else:
+            weights = {key: 1.0 for key in step_keys}
+
+        lengths: Dict[str, float] = {}
+        for root_key in sorted(step_keys):
+            # iterative post-order traversal, since chains of steps can be longer than the
+            # recursion limit
+            stack = [root_key]
+            while stack:
+                step_key = stack[-1]
+                if step_key in lengths:
+                    stack.pop()
+                    continue
+
+                unvisited = [key for key in downstream[step_key] if key not in lengths]
+                if unvisited:
+                    stack.extend(unvisited)
+                    continue
+
+                stack.pop()
+                lengths[step_key] = weights[step_key] + max(
+                    [lengths[key] for key in downstream[step_key]], default=0.0
+                )
+
+        return lengths
+
     def resolve(
         self,
         mappings: Dict[str, Dict[str, List[str]]],
@@ -918,6 +982,8 @@ def start(
         self,
         retry_mode: RetryMode,
         sort_key_fn: Optional[Callable[[ExecutionStep], float]] = None,
+        resource_capacities: Optional[Dict[str, float]] = None,
+        step_durations: Optional[Dict[str, float]] = None,
     ) -> "ActiveExecution":
         from .active import ActiveExecution
 
@@ -927,6 +993,8 @@ def start(
             self.known_state.get_retry_state() if self.known_state else RetryState(),
             sort_key_fn,
             self.known_state.step_output_versions if self.known_state else [],
+            resource_capacities,
+            step_durations,
         )
 
     def step_handle_for_single_step_plans(
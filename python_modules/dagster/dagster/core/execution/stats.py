@@ -1,6 +1,6 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, List, NamedTuple, Optional, cast
+from typing import Dict, Iterable, List, NamedTuple, Optional, cast
 
 from dagster import check
 from dagster.core.definitions import ExpectationResult
@@ -85,100 +85,197 @@ class StepEventStatus(Enum):
     IN_PROGRESS = "IN_PROGRESS"
 
 
+STEP_STATS_EVENT_TYPES = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.ENGINE_EVENT,
+}
+
+# the status of a step after each of the events that end it
+STEP_STATS_END_STATUSES = {
+    DagsterEventType.STEP_SUCCESS: StepEventStatus.SUCCESS,
+    DagsterEventType.STEP_FAILURE: StepEventStatus.FAILURE,
+    DagsterEventType.STEP_SKIPPED: StepEventStatus.SKIPPED,
+}
+
+
+def is_step_stats_event(event: EventLogEntry) -> bool:
+    """Whether the given event contributes to the step stats of the step it is scoped to."""
+    if not event.is_dagster_event or not event.dagster_event.step_key:
+        return False
+
+    dagster_event = event.dagster_event
+    if dagster_event.event_type == DagsterEventType.ENGINE_EVENT:
+        return bool(
+            dagster_event.engine_event_data.marker_start
+            or dagster_event.engine_event_data.marker_end
+        )
+
+    return dagster_event.event_type in STEP_STATS_EVENT_TYPES
+
+
+class StepStatsAccumulator:
+    """Folds the step-scoped events of a single step, in the order they were stored, into the
+    values needed to build its RunStepKeyStatsSnapshot.
+
+    Used both to build step stats from the full event log of a run and to maintain them
+    incrementally as events are written. Materialization events and expectation results are only
+    counted, since they are stored in the event log itself.
+    """
+
+    def __init__(
+        self,
+        status: Optional[StepEventStatus] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        attempts: Optional[int] = None,
+        materialization_count: int = 0,
+        expectation_count: int = 0,
+        attempts_list: Optional[List["RunStepMarker"]] = None,
+        last_restart_time: Optional[float] = None,
+        markers: Optional[Dict[str, "RunStepMarker"]] = None,
+    ):
+        self.status = status
+        self.start_time = start_time
+        self.end_time = end_time
+        self.attempts = attempts
+        self.materialization_count = materialization_count
+        self.expectation_count = expectation_count
+        # attempts that ended in a retry, the final attempt is derived from end_time
+        self.attempts_list = attempts_list or []
+        self.last_restart_time = last_restart_time
+        self.markers = markers or {}
+
+    @property
+    def has_stats(self) -> bool:
+        """Whether any event that marks the step as started, finished, or as having produced output
+        has been folded in. Marker and retry events alone do not surface a step."""
+        return (
+            self.start_time is not None
+            or self.end_time is not None
+            or self.attempts is not None
+            or self.materialization_count > 0
+            or self.expectation_count > 0
+        )
+
+    def apply(self, event: EventLogEntry) -> None:
+        dagster_event = event.get_dagster_event()
+        event_type = dagster_event.event_type
+        timestamp = event.timestamp
+
+        if event_type == DagsterEventType.STEP_START:
+            # a step that is started again, e.g. by a resumed run, reports the stats of its latest
+            # start
+            self.start_time = timestamp
+            self.attempts = 1
+            self.last_restart_time = None
+        elif event_type == DagsterEventType.STEP_RESTARTED:
+            self.attempts = int(self.attempts or 0) + 1
+            self.last_restart_time = timestamp
+        elif event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+            self.add_retried_attempt(timestamp)
+        elif event_type in STEP_STATS_END_STATUSES:
+            self.end_time = timestamp
+            self.status = STEP_STATS_END_STATUSES[event_type]
+        elif event_type == DagsterEventType.ASSET_MATERIALIZATION:
+            self.materialization_count += 1
+        elif event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+            self.expectation_count += 1
+        elif event_type == DagsterEventType.ENGINE_EVENT:
+            marker_start = dagster_event.engine_event_data.marker_start
+            marker_end = dagster_event.engine_event_data.marker_end
+            if marker_start:
+                self.start_marker(marker_start, timestamp)
+            if marker_end:
+                self.end_marker(marker_end, timestamp)
+
+    def add_retried_attempt(self, end_time: float) -> None:
+        self.attempts_list.append(
+            RunStepMarker(start_time=self._attempt_start_time, end_time=end_time)
+        )
+
+    def start_marker(self, key: str, timestamp: float) -> None:
+        marker = self.markers.get(key, RunStepMarker())
+        self.markers[key] = marker._replace(start_time=timestamp)
+
+    def end_marker(self, key: str, timestamp: float) -> None:
+        marker = self.markers.get(key, RunStepMarker())
+        self.markers[key] = marker._replace(end_time=timestamp)
+
+    @property
+    def _attempt_start_time(self) -> Optional[float]:
+        return self.last_restart_time if self.last_restart_time is not None else self.start_time
+
+    def to_snapshot(
+        self,
+        run_id: str,
+        step_key: str,
+        materialization_events: Optional[List[EventLogEntry]] = None,
+        expectation_results: Optional[List[ExpectationResult]] = None,
+    ) -> "RunStepKeyStatsSnapshot":
+        attempts_list = list(self.attempts_list)
+        if self.end_time:
+            attempts_list.append(
+                RunStepMarker(start_time=self._attempt_start_time, end_time=self.end_time)
+            )
+            status = self.status
+        else:
+            status = StepEventStatus.IN_PROGRESS
+
+        return RunStepKeyStatsSnapshot(
+            run_id=run_id,
+            step_key=step_key,
+            status=status,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            materialization_events=materialization_events,
+            expectation_results=expectation_results,
+            attempts=self.attempts,
+            attempts_list=attempts_list,
+            markers=list(self.markers.values()),
+        )
+
+
 def build_run_step_stats_from_events(
     run_id: str, records: Iterable[EventLogEntry]
 ) -> List["RunStepKeyStatsSnapshot"]:
-    by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    attempts = defaultdict(list)
-    attempt_events = defaultdict(list)
-    markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    accumulators: Dict[str, StepStatsAccumulator] = defaultdict(StepStatsAccumulator)
+    materialization_events: Dict[str, List[EventLogEntry]] = defaultdict(list)
+    expectation_results: Dict[str, List[ExpectationResult]] = defaultdict(list)
+    # steps are returned in the order in which they first surfaced
+    step_keys: Dict[str, None] = {}
+
     for event in records:
-        if not event.is_dagster_event:
+        if not is_step_stats_event(event):
             continue
         dagster_event = event.get_dagster_event()
-
         step_key = dagster_event.step_key
-        if not step_key:
-            continue
 
-        if dagster_event.event_type == DagsterEventType.STEP_START:
-            by_step_key[step_key]["start_time"] = event.timestamp
-            by_step_key[step_key]["attempts"] = 1
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.FAILURE
-        if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-            by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
-        if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
+        accumulator = accumulators[step_key]
+        accumulator.apply(event)
+        if accumulator.has_stats:
+            step_keys.setdefault(step_key)
+
         if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
-            materialization_events = by_step_key[step_key].get("materialization_events", [])
-            materialization_events.append(event)
-            by_step_key[step_key]["materialization_events"] = materialization_events
-        if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+            materialization_events[step_key].append(event)
+        elif dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
             expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
-            expectation_result = expectation_data.expectation_result
-            step_expectation_results = by_step_key[step_key].get("expectation_results", [])
-            step_expectation_results.append(expectation_result)
-            by_step_key[step_key]["expectation_results"] = step_expectation_results
-        if dagster_event.event_type in (
-            DagsterEventType.STEP_UP_FOR_RETRY,
-            DagsterEventType.STEP_RESTARTED,
-        ):
-            attempt_events[step_key].append(event)
-        if dagster_event.event_type == DagsterEventType.ENGINE_EVENT:
-            if dagster_event.engine_event_data.marker_start:
-                key = dagster_event.engine_event_data.marker_start
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "start": event.timestamp}
-                else:
-                    markers[step_key][key]["start"] = event.timestamp
-
-            if dagster_event.engine_event_data.marker_end:
-                key = dagster_event.engine_event_data.marker_end
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "end": event.timestamp}
-                else:
-                    markers[step_key][key]["end"] = event.timestamp
-
-    for step_key, step_stats in by_step_key.items():
-        events = attempt_events[step_key]
-        step_attempts = []
-        attempt_start = step_stats.get("start_time")
-
-        for event in events:
-            if not event.dagster_event:
-                continue
-            if event.dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
-                step_attempts.append(
-                    RunStepMarker(start_time=attempt_start, end_time=event.timestamp)
-                )
-            elif event.dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-                attempt_start = event.timestamp
-        if step_stats.get("end_time"):
-            step_attempts.append(
-                RunStepMarker(start_time=attempt_start, end_time=step_stats["end_time"])
-            )
-        else:
-            by_step_key[step_key]["status"] = StepEventStatus.IN_PROGRESS
-        attempts[step_key] = step_attempts
+            expectation_results[step_key].append(expectation_data.expectation_result)
 
     return [
-        RunStepKeyStatsSnapshot(
-            run_id=run_id,
-            step_key=step_key,
-            attempts_list=attempts[step_key],
-            markers=[
-                RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
-                for marker in markers[step_key].values()
-            ],
-            **value,
+        accumulators[step_key].to_snapshot(
+            run_id,
+            step_key,
+            materialization_events=materialization_events[step_key],
+            expectation_results=expectation_results[step_key],
         )
-        for step_key, value in by_step_key.items()
+        for step_key in step_keys
     ]
 
 
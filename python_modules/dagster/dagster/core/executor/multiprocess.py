@@ -1,7 +1,7 @@
 import multiprocessing
 import os
 import sys
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from dagster import MetadataEntry, check
 from dagster.core.errors import (
@@ -12,6 +12,7 @@
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster.core.execution.context.system import PlanOrchestrationContext
+from dagster.core.execution.plan.active import get_prior_step_durations
 from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.retries import RetryMode
@@ -96,6 +97,7 @@ def __init__(
         max_concurrent: int,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[List[str]] = None,
+        resource_capacities: Optional[Dict[str, float]] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
@@ -113,6 +115,9 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._resource_capacities = check.opt_dict_param(
+            resource_capacities, "resource_capacities", key_type=str
+        )
 
     @property
     def retries(self):
@@ -161,7 +166,11 @@ def execute(self, plan_context, execution_plan):
         # garbage collect results that are no longer needed by any steps
         # https://github.com/dagster-io/dagster/issues/811
         with time_execution_scope() as timer_result:
-            with execution_plan.start(retry_mode=self.retries) as active_execution:
+            with execution_plan.start(
+                retry_mode=self.retries,
+                resource_capacities=self._resource_capacities,
+                step_durations=get_prior_step_durations(plan_context, execution_plan),
+            ) as active_execution:
                 active_iters = {}
                 errors = {}
                 term_events = {}
@@ -1,5 +1,7 @@
+import threading
 import time
-from typing import Dict, List, Optional, cast
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Iterable, List, Optional, cast
 
 import pendulum
 
@@ -11,16 +13,71 @@
     MetadataEntry,
     log_step_event,
 )
+from dagster.core.events.log import EventLogEntry
 from dagster.core.execution.context.system import PlanOrchestrationContext
+from dagster.core.execution.plan.active import get_prior_step_durations
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.plan.step import ExecutionStep
 from dagster.core.execution.retries import RetryMode
 from dagster.core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
 from dagster.grpc.types import ExecuteStepArgs
+from dagster.utils import frozentags
 
 from ..base import Executor
 
 
+class WatchedEvents:
+    """The dagster events of a run delivered by an event log watch, reconciled with the events
+    fetched by cursor queries so that each event is consumed once.
+
+    Watches deliver the events of a run in the order they are stored, but depending on the storage
+    they may or may not deliver the events stored before the watch started, and an event may be
+    delivered after a cursor query has already returned it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # the delivered events that have not been consumed yet
+        self._delivered: Deque[EventLogEntry] = deque()
+        # the events returned by cursor queries that have not been delivered yet
+        self._queried: Deque[EventLogEntry] = deque()
+        # whether a cursor query has run, after which the delivered events follow the cursor
+        self._synced = False
+
+    def on_event_delivered(self, event: EventLogEntry) -> bool:
+        """Records a delivered event. Returns whether it is new to the consumer."""
+        with self._lock:
+            if event in self._queried:
+                # events are delivered in order, so the queried events before this one were stored
+                # before the watch started and will not be delivered
+                while self._queried.popleft() != event:
+                    pass
+                return False
+
+            self._delivered.append(event)
+            return True
+
+    def on_events_queried(self, events: List[EventLogEntry]):
+        """Records the events returned by a cursor query, which are consumed from the query."""
+        with self._lock:
+            for event in events:
+                if self._delivered and self._delivered[0] == event:
+                    self._delivered.popleft()
+                else:
+                    self._queried.append(event)
+            self._synced = True
+
+    def pop_delivered(self) -> Optional[List[EventLogEntry]]:
+        """Consumes the delivered events, or returns None if the event log must be queried."""
+        with self._lock:
+            if not self._synced:
+                return None
+
+            events = list(self._delivered)
+            self._delivered.clear()
+            return events
+
+
 class StepDelegatingExecutor(Executor):
     def __init__(
         self,
@@ -29,6 +86,10 @@ def __init__(
         sleep_seconds: Optional[float] = None,
         check_step_health_interval_seconds: Optional[int] = None,
         should_verify_step: bool = False,
+        max_steps_per_worker: Optional[int] = None,
+        watch_events: bool = False,
+        watch_fallback_sleep_seconds: Optional[float] = None,
+        resource_capacities: Optional[Dict[str, float]] = None,
     ):
         self._step_handler = step_handler
         self._retries = retries
@@ -42,13 +103,37 @@ def __init__(
             ),
         )
         self._should_verify_step = should_verify_step
+        self._max_steps_per_worker = cast(
+            int, check.opt_int_param(max_steps_per_worker, "max_steps_per_worker", default=1)
+        )
+        check.invariant(
+            self._max_steps_per_worker > 0, "max_steps_per_worker must be greater than 0"
+        )
+        # When watching, the event log storage notifies the executor of new events for the run
+        # (e.g. via LISTEN/NOTIFY in postgres), and the event log is only polled as a fallback.
+        self._watch_events = check.bool_param(watch_events, "watch_events")
+        self._watch_fallback_sleep_seconds = cast(
+            float,
+            check.opt_float_param(
+                watch_fallback_sleep_seconds, "watch_fallback_sleep_seconds", default=1.0
+            ),
+        )
+        self._resource_capacities = check.opt_dict_param(
+            resource_capacities, "resource_capacities", key_type=str
+        )
 
     @property
     def retries(self):
         return self._retries
 
-    def _pop_events(self, instance, run_id) -> List[DagsterEvent]:
-        events = instance.logs_after(run_id, self._event_cursor, of_type=set(DagsterEventType))
+    def _pop_events(self, instance, run_id, events_delivered=False) -> List[DagsterEvent]:
+        # the events delivered by the watch are consumed without querying the event log, which is
+        # only queried as a fallback when the watch has not delivered any events
+        events = self._watched_events.pop_delivered() if events_delivered else None
+        if events is None:
+            events = instance.logs_after(run_id, self._event_cursor, of_type=set(DagsterEventType))
+            if self._watch_events:
+                self._watched_events.on_events_queried(events)
         self._event_cursor += len(events)
         dagster_events = [event.dagster_event for event in events]
         check.invariant(None not in dagster_events, "Query should not return a non dagster event")
@@ -81,11 +166,54 @@ def _log_new_events(self, events, plan_context, running_steps):
                 event,
             )
 
+    def _batch_steps(self, steps: Iterable[ExecutionStep]) -> List[List[ExecutionStep]]:
+        # Ready steps are independent of each other, so any of them can share a worker. Only steps
+        # with the same tags are packed together, since step handlers configure the worker (e.g.
+        # the image or k8s resources) from the step tags.
+        steps_by_tags: Dict[frozentags, List[ExecutionStep]] = OrderedDict()
+        for step in steps:
+            steps_by_tags.setdefault(frozentags(step.tags), []).append(step)
+
+        return [
+            tagged_steps[i : i + self._max_steps_per_worker]
+            for tagged_steps in steps_by_tags.values()
+            for i in range(0, len(tagged_steps), self._max_steps_per_worker)
+        ]
+
+    def _running_step_handler_contexts(
+        self, running_steps, step_handler_contexts
+    ) -> List[StepHandlerContext]:
+        # the distinct worker invocations that still have a running step
+        contexts: List[StepHandlerContext] = []
+        for step_key in running_steps:
+            context = step_handler_contexts[step_key]
+            if not any(context is existing for existing in contexts):
+                contexts.append(context)
+        return contexts
+
+    def _log_batch_events(
+        self, events, plan_context, running_steps, step_handler_contexts, step_handler_context
+    ):
+        # A worker invocation may run several steps, some of which may have already completed or
+        # been relaunched for a retry by another worker, so only events for the steps that are
+        # still running in this worker are logged.
+        self._log_new_events(
+            [
+                event
+                for event in events
+                if event.step_key in running_steps
+                and step_handler_contexts[event.step_key] is step_handler_context
+            ],
+            plan_context,
+            running_steps,
+        )
+
     def execute(self, plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan):
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
         self._event_cursor = -1  # pylint: disable=attribute-defined-outside-init
+        self._watched_events = WatchedEvents()  # pylint: disable=attribute-defined-outside-init
 
         yield DagsterEvent.engine_event(
             plan_context,
@@ -93,8 +221,58 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
             EngineEventData(),
         )
 
-        with execution_plan.start(retry_mode=self.retries) as active_execution:
+        new_events_written = threading.Event()
+
+        def _on_event_written(event):
+            if event.is_dagster_event and self._watched_events.on_event_delivered(event):
+                new_events_written.set()
+
+        if self._watch_events:
+            plan_context.instance.watch_event_logs(
+                plan_context.run_id, self._event_cursor, _on_event_written
+            )
+
+        steps_will_resume = False
+        try:
+            steps_will_resume = yield from self._execute(
+                plan_context, execution_plan, new_events_written
+            )
+        finally:
+            if self._watch_events:
+                plan_context.instance.end_watch_event_logs(plan_context.run_id, _on_event_written)
+
+            # the steps of a run that will be resumed keep running in their workers
+            if not steps_will_resume:
+                self._step_handler.cleanup_run(plan_context.run_id)
+
+    def _wait_for_new_events(self, new_events_written: threading.Event) -> bool:
+        """Returns whether the watch delivered new events, rather than the wait timing out."""
+        if not self._watch_events:
+            time.sleep(self._sleep_seconds)
+            return False
+
+        events_delivered = new_events_written.wait(timeout=self._watch_fallback_sleep_seconds)
+        # cleared before the events are popped, so that events written after the pop wake the
+        # next wait
+        new_events_written.clear()
+        return events_delivered
+
+    def _execute(
+        self,
+        plan_context: PlanOrchestrationContext,
+        execution_plan: ExecutionPlan,
+        new_events_written: threading.Event,
+    ):
+        """Yields the events of the execution. Returns whether it was interrupted by a run that
+        will be resumed, in which case the steps in flight are left running in their workers."""
+        with execution_plan.start(
+            retry_mode=self.retries,
+            resource_capacities=self._resource_capacities,
+            step_durations=get_prior_step_durations(plan_context, execution_plan),
+        ) as active_execution:
             running_steps: Dict[str, ExecutionStep] = {}
+            # the context of the worker invocation that each running step was launched in
+            step_handler_contexts: Dict[str, StepHandlerContext] = {}
 
             if plan_context.resume_from_failure:
                 yield DagsterEvent.engine_event(
@@ -120,25 +298,24 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         step.handle,
                     )
 
+                    step_handler_context = self._get_step_handler_context(
+                        plan_context, [step], active_execution
+                    )
                     # TODO: check if failure event included. For now, hacky assumption that
                     # we don't log anything on successful check
-                    if self._step_handler.check_step_health(
-                        self._get_step_handler_context(plan_context, [step], active_execution)
-                    ):
+                    if self._step_handler.check_step_health(step_handler_context):
                         # health check failed, launch the step
                         self._log_new_events(
-                            self._step_handler.launch_step(
-                                self._get_step_handler_context(
-                                    plan_context, [step], active_execution
-                                )
-                            ),
+                            self._step_handler.launch_step(step_handler_context),
                             plan_context,
                             {step.key: step for step in possibly_in_flight_steps},
                         )
 
                     running_steps[step.key] = step
+                    step_handler_contexts[step.key] = step_handler_context
 
             last_check_step_health_time = pendulum.now("UTC")
+            events_delivered = False
 
             # Order of events is important here. During an interation, we call handle_event, then get_steps_to_execute,
             # then is_complete. get_steps_to_execute updates the state of ActiveExecution, and without it
@@ -146,22 +323,23 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
             while not active_execution.is_complete:
 
                 if active_execution.check_for_interrupts():
-                    if not plan_context.instance.run_will_resume(plan_context.run_id):
+                    run_will_resume = plan_context.instance.run_will_resume(plan_context.run_id)
+                    if not run_will_resume:
                         yield DagsterEvent.engine_event(
                             plan_context,
                             "Executor received termination signal, forwarding to steps",
                             EngineEventData.interrupted(list(running_steps.keys())),
                         )
                         active_execution.mark_interrupted()
-                        for _, step in running_steps.items():
-                            self._log_new_events(
-                                self._step_handler.terminate_step(
-                                    self._get_step_handler_context(
-                                        plan_context, [step], active_execution
-                                    )
-                                ),
+                        for step_handler_context in self._running_step_handler_contexts(
+                            running_steps, step_handler_contexts
+                        ):
+                            self._log_batch_events(
+                                self._step_handler.terminate_step(step_handler_context),
                                 plan_context,
                                 running_steps,
+                                step_handler_contexts,
+                                step_handler_context,
                             )
 
                     else:
@@ -179,11 +357,12 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         )
                         active_execution.mark_interrupted()
 
-                    return
+                    return run_will_resume
 
                 for dagster_event in self._pop_events(
                     plan_context.instance,
                     plan_context.run_id,
+                    events_delivered,
                 ):  # type: ignore
 
                     # STEP_SKIPPED events are only emitted by ActiveExecution, which already handles
@@ -199,6 +378,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         if dagster_event.is_step_success or dagster_event.is_step_failure:
                             assert isinstance(dagster_event.step_key, str)
                             del running_steps[dagster_event.step_key]
+                            del step_handler_contexts[dagster_event.step_key]
                             active_execution.verify_complete(plan_context, dagster_event.step_key)
 
                 # process skips from failures or uncovered inputs
@@ -210,25 +390,31 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                     curr_time - last_check_step_health_time
                 ).total_seconds() >= self._check_step_health_interval_seconds:
                     last_check_step_health_time = curr_time
-                    for _, step in running_steps.items():
-                        self._log_new_events(
-                            self._step_handler.check_step_health(
-                                self._get_step_handler_context(
-                                    plan_context, [step], active_execution
-                                )
-                            ),
+                    for step_handler_context in self._running_step_handler_contexts(
+                        running_steps, step_handler_contexts
+                    ):
+                        self._log_batch_events(
+                            self._step_handler.check_step_health(step_handler_context),
                             plan_context,
                             running_steps,
+                            step_handler_contexts,
+                            step_handler_context,
                         )
 
-                for step in active_execution.get_steps_to_execute():
-                    running_steps[step.key] = step
+                for steps in self._batch_steps(active_execution.get_steps_to_execute()):
+                    # health checks and termination reuse the launch context, so that step
+                    # handlers can identify the worker from the same arguments it was launched with
+                    step_handler_context = self._get_step_handler_context(
+                        plan_context, steps, active_execution
+                    )
+                    for step in steps:
+                        running_steps[step.key] = step
+                        step_handler_contexts[step.key] = step_handler_context
                     self._log_new_events(
-                        self._step_handler.launch_step(
-                            self._get_step_handler_context(plan_context, [step], active_execution)
-                        ),
+                        self._step_handler.launch_step(step_handler_context),
                         plan_context,
                         running_steps,
                     )
 
-                time.sleep(self._sleep_seconds)
+                if not active_execution.is_complete:
+                    events_delivered = self._wait_for_new_events(new_events_written)
@@ -61,3 +61,9 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> List[Da
     @abstractmethod
     def terminate_step(self, step_handler_context: StepHandlerContext) -> List[DagsterEvent]:
         pass
+
+    def cleanup_run(self, run_id: str) -> None:
+        # Called once the steps of the run have finished, to release any workers that the step
+        # handler keeps for the run. Not called if the run will be resumed, since its steps may
+        # still be running.
+        pass
@@ -0,0 +1,83 @@
+import os
+from functools import partial
+from typing import Dict, Optional
+
+from dagster import check
+from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.execution.api import ExecuteRunWithPlanIterable
+from dagster.core.execution.context.system import PlanOrchestrationContext
+from dagster.core.execution.context_creation_pipeline import PlanExecutionContextManager
+from dagster.core.execution.plan.execute_plan import threadpool_plan_execution_iterator
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.retries import RetryMode
+from dagster.utils.timing import format_duration, time_execution_scope
+
+from .base import Executor
+
+
+def get_default_max_concurrent_threads():
+    # the default of concurrent.futures.ThreadPoolExecutor, which suits I/O bound steps
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class ThreadpoolExecutor(Executor):
+    def __init__(
+        self,
+        retries: RetryMode,
+        max_concurrent: int,
+        resource_capacities: Optional[Dict[str, float]] = None,
+    ):
+        self._retries = check.inst_param(retries, "retries", RetryMode)
+        max_concurrent = max_concurrent if max_concurrent else get_default_max_concurrent_threads()
+        self._max_concurrent = check.int_param(max_concurrent, "max_concurrent")
+        self._resource_capacities = check.opt_dict_param(
+            resource_capacities, "resource_capacities", key_type=str
+        )
+
+    @property
+    def retries(self):
+        return self._retries
+
+    def execute(self, plan_context, execution_plan):
+        check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
+        check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+
+        step_keys_to_execute = execution_plan.step_keys_to_execute
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            "Executing steps in process (pid: {pid}) on up to {max_concurrent} threads".format(
+                pid=os.getpid(), max_concurrent=self._max_concurrent
+            ),
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
+
+        with time_execution_scope() as timer_result:
+            yield from iter(
+                ExecuteRunWithPlanIterable(
+                    execution_plan=plan_context.execution_plan,
+                    iterator=partial(
+                        threadpool_plan_execution_iterator,
+                        max_concurrent=self._max_concurrent,
+                        resource_capacities=self._resource_capacities,
+                    ),
+                    execution_context_manager=PlanExecutionContextManager(
+                        pipeline=plan_context.pipeline,
+                        retry_mode=plan_context.retry_mode,
+                        execution_plan=plan_context.execution_plan,
+                        run_config=plan_context.run_config,
+                        pipeline_run=plan_context.pipeline_run,
+                        instance=plan_context.instance,
+                        raise_on_error=plan_context.raise_on_error,
+                        output_capture=plan_context.output_capture,
+                    ),
+                )
+            )
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            "Finished steps in process (pid: {pid}) in {duration_ms}".format(
+                pid=os.getpid(), duration_ms=format_duration(timer_result.millis)
+            ),
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
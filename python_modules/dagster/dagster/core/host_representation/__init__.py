@@ -7,6 +7,7 @@
 that have been persisted. e.g. HistoricalPipeline
 """
 from .external import (
+    ExternalAssetGraph,
     ExternalExecutionPlan,
     ExternalPartitionSet,
     ExternalPipeline,
@@ -24,6 +25,7 @@
     ExternalPartitionSetExecutionParamData,
     ExternalPartitionTagsData,
     ExternalPipelineData,
+    ExternalPipelineRef,
     ExternalPipelineSubsetResult,
     ExternalPresetData,
     ExternalRepositoryData,
@@ -1,6 +1,19 @@
+import threading
 import warnings
-from collections import OrderedDict
-from typing import TYPE_CHECKING, List, Optional, Sequence, Union
+from collections import OrderedDict, defaultdict
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from dagster import check
 from dagster.core.definitions.events import AssetKey
@@ -20,6 +33,7 @@
     ExternalAssetNode,
     ExternalPartitionSetData,
     ExternalPipelineData,
+    ExternalPresetData,
     ExternalRepositoryData,
     ExternalScheduleData,
     ExternalSensorData,
@@ -40,22 +54,40 @@ class ExternalRepository:
     """
 
     def __init__(
-        self, external_repository_data: ExternalRepositoryData, repository_handle: RepositoryHandle
+        self,
+        external_repository_data: ExternalRepositoryData,
+        repository_handle: RepositoryHandle,
+        pipeline_data_loader: Optional[Callable[[str], ExternalPipelineData]] = None,
     ):
         self.external_repository_data = check.inst_param(
             external_repository_data, "external_repository_data", ExternalRepositoryData
         )
-        self._pipeline_index_map = OrderedDict()
-        self._job_index_map = OrderedDict()
+        # Used to fetch the ExternalPipelineData for a pipeline on first access, when the
+        # repository data only contains ExternalPipelineRefs
+        self._pipeline_data_loader = check.opt_callable_param(
+            pipeline_data_loader, "pipeline_data_loader"
+        )
+        self._pipeline_data_lock = threading.Lock()
+        self._external_pipeline_datas: Dict[str, ExternalPipelineData] = {}
+        self._pipeline_index_map: Dict[str, PipelineIndex] = {}
+
+        # names of all pipelines / jobs in the repository, in order
+        self._pipeline_names: List[str] = []
+        self._job_names: Set[str] = set()
+
         for external_pipeline_data in external_repository_data.external_pipeline_datas:
             key = external_pipeline_data.pipeline_snapshot.name
-            index = PipelineIndex(
-                external_pipeline_data.pipeline_snapshot,
-                external_pipeline_data.parent_pipeline_snapshot,
-            )
-            self._pipeline_index_map[key] = index
+            self._cache_external_pipeline_data(key, external_pipeline_data)
+            self._pipeline_names.append(key)
             if external_pipeline_data.is_job:
-                self._job_index_map[key] = index
+                self._job_names.add(key)
+
+        for external_pipeline_ref in external_repository_data.external_pipeline_refs or []:
+            self._pipeline_names.append(external_pipeline_ref.name)
+            if external_pipeline_ref.is_job:
+                self._job_names.add(external_pipeline_ref.name)
+
+        self._pipeline_name_set = set(self._pipeline_names)
 
         self._handle = check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
 
@@ -72,32 +104,60 @@ def __init__(
             for external_partition_set_data in external_repository_data.external_partition_set_datas
         )
 
-        # pylint: disable=unsubscriptable-object
-        _asset_jobs: OrderedDict[str, List[ExternalAssetNode]] = OrderedDict()
-        for asset_node in external_repository_data.external_asset_graph_data:
-            for job_name in asset_node.job_names:
-                if job_name not in _asset_jobs:
-                    _asset_jobs[job_name] = [asset_node]
-                else:
-                    _asset_jobs[job_name].append(asset_node)
-        # pylint: disable=unsubscriptable-object
-        self._asset_jobs: OrderedDict[str, Sequence[ExternalAssetNode]] = OrderedDict(_asset_jobs)
+        self._asset_graph: Optional[ExternalAssetGraph] = None
 
     @property
     def name(self):
         return self.external_repository_data.name
 
+    def _cache_external_pipeline_data(
+        self, pipeline_name: str, external_pipeline_data: ExternalPipelineData
+    ):
+        self._external_pipeline_datas[pipeline_name] = external_pipeline_data
+        self._pipeline_index_map[pipeline_name] = PipelineIndex(
+            external_pipeline_data.pipeline_snapshot,
+            external_pipeline_data.parent_pipeline_snapshot,
+        )
+
+    def _ensure_external_pipeline_data(self, pipeline_name: str):
+        if pipeline_name in self._external_pipeline_datas:
+            return
+
+        check.invariant(
+            pipeline_name in self._pipeline_name_set,
+            f"Could not find pipeline data named {pipeline_name}",
+        )
+        check.invariant(
+            self._pipeline_data_loader is not None,
+            f"Pipeline data for {pipeline_name} was deferred, but no loader was provided to fetch it",
+        )
+
+        with self._pipeline_data_lock:
+            if pipeline_name not in self._external_pipeline_datas:
+                self._cache_external_pipeline_data(
+                    pipeline_name, self._pipeline_data_loader(pipeline_name)
+                )
+
+    def get_external_pipeline_data(self, pipeline_name: str) -> ExternalPipelineData:
+        self._ensure_external_pipeline_data(pipeline_name)
+        return self._external_pipeline_datas[pipeline_name]
+
     def get_pipeline_index(self, pipeline_name):
+        self._ensure_external_pipeline_data(pipeline_name)
         return self._pipeline_index_map[pipeline_name]
 
     def has_pipeline(self, pipeline_name):
-        return pipeline_name in self._pipeline_index_map
+        return pipeline_name in self._pipeline_name_set
+
+    def get_pipeline_names(self) -> List[str]:
+        return list(self._pipeline_names)
 
     def get_pipeline_indices(self):
-        return self._pipeline_index_map.values()
+        # a generator, so that deferred pipeline data is only loaded as the indices are consumed
+        return (self.get_pipeline_index(pipeline_name) for pipeline_name in self._pipeline_names)
 
     def has_external_pipeline(self, pipeline_name):
-        return pipeline_name in self._pipeline_index_map
+        return pipeline_name in self._pipeline_name_set
 
     def get_external_schedule(self, schedule_name):
         return ExternalSchedule(
@@ -145,16 +205,37 @@ def get_external_partition_sets(self):
     def get_full_external_pipeline(self, pipeline_name: str) -> "ExternalPipeline":
         check.str_param(pipeline_name, "pipeline_name")
         return ExternalPipeline(
-            self.external_repository_data.get_external_pipeline_data(pipeline_name),
+            self.get_external_pipeline_data(pipeline_name),
             repository_handle=self.handle,
             pipeline_index=self.get_pipeline_index(pipeline_name),
         )
 
+    def _get_external_pipeline(self, pipeline_name: str) -> "ExternalPipeline":
+        if pipeline_name in self._external_pipeline_datas:
+            return self.get_full_external_pipeline(pipeline_name)
+
+        # listing pipelines should not load the data of every deferred pipeline, so return a
+        # pipeline that only loads its data once something other than its name is accessed
+        return ExternalPipeline(
+            None,
+            repository_handle=self.handle,
+            pipeline_name=pipeline_name,
+            is_job=pipeline_name in self._job_names,
+            external_pipeline_loader=partial(self._load_external_pipeline, pipeline_name),
+        )
+
+    def _load_external_pipeline(
+        self, pipeline_name: str
+    ) -> Tuple[ExternalPipelineData, PipelineIndex]:
+        return self.get_external_pipeline_data(pipeline_name), self.get_pipeline_index(
+            pipeline_name
+        )
+
     def get_all_external_pipelines(self):
-        return [self.get_full_external_pipeline(pn) for pn in self._pipeline_index_map]
+        return [self._get_external_pipeline(pn) for pn in self._pipeline_names]
 
     def has_external_job(self, job_name):
-        return job_name in self._job_index_map
+        return job_name in self._job_names
 
     def get_external_job(self, job_name) -> "ExternalPipeline":
         check.str_param(job_name, "job_name")
@@ -163,13 +244,15 @@ def get_external_job(self, job_name) -> "ExternalPipeline":
             check.failed(f"Could not find job data for {job_name}")
 
         return ExternalPipeline(
-            self.external_repository_data.get_external_pipeline_data(job_name),
+            self.get_external_pipeline_data(job_name),
             repository_handle=self.handle,
             pipeline_index=self.get_pipeline_index(job_name),
         )
 
     def get_external_jobs(self) -> List["ExternalPipeline"]:
-        return [self.get_external_job(pn) for pn in self._job_index_map]
+        return [
+            self._get_external_pipeline(pn) for pn in self._pipeline_names if pn in self._job_names
+        ]
 
     @property
     def handle(self):
@@ -188,25 +271,117 @@ def get_external_origin_id(self):
         """
         return self.get_external_origin().get_id()
 
+    def get_asset_graph(self) -> "ExternalAssetGraph":
+        # built on first access and kept for the lifetime of this repository snapshot
+        if self._asset_graph is None:
+            self._asset_graph = ExternalAssetGraph(
+                self.external_repository_data.external_asset_graph_data
+            )
+        return self._asset_graph
+
     def get_external_asset_nodes(self, job_name=None) -> Sequence[ExternalAssetNode]:
         return (
             self.external_repository_data.external_asset_graph_data
             if job_name is None
-            else self._asset_jobs.get(job_name, [])
+            else self.get_asset_graph().get_nodes_for_job(job_name)
         )
 
     def get_external_asset_node(self, asset_key: AssetKey) -> Optional[ExternalAssetNode]:
-        matching = [
-            asset_node
-            for asset_node in self.external_repository_data.external_asset_graph_data
-            if asset_node.asset_key == asset_key
-        ]
-        return matching[0] if matching else None
+        return self.get_asset_graph().get_node(asset_key)
 
     def get_display_metadata(self):
         return self.handle.display_metadata
 
 
+class ExternalAssetGraph:
+    """
+    An index over the asset nodes of an ExternalRepository, with asset nodes keyed by asset key,
+    job and op name, and upstream / downstream adjacency between asset keys. Transitive
+    upstream / downstream closures are computed on demand and memoized.
+    """
+
+    def __init__(self, external_asset_nodes: Sequence[ExternalAssetNode]):
+        check.sequence_param(
+            external_asset_nodes, "external_asset_nodes", of_type=ExternalAssetNode
+        )
+
+        self._nodes_by_key: Dict[AssetKey, ExternalAssetNode] = OrderedDict()
+        self._nodes_by_job: Dict[str, List[ExternalAssetNode]] = OrderedDict()
+        self._nodes_by_op_name: Dict[str, List[ExternalAssetNode]] = defaultdict(list)
+        self._upstream_keys: Dict[AssetKey, Set[AssetKey]] = defaultdict(set)
+        self._downstream_keys: Dict[AssetKey, Set[AssetKey]] = defaultdict(set)
+        self._closures: Dict[Tuple[AssetKey, str], AbstractSet[AssetKey]] = {}
+
+        for node in external_asset_nodes:
+            # if an asset key appears more than once, prefer the node that has an op
+            preexisting_node = self._nodes_by_key.get(node.asset_key)
+            if preexisting_node is None or preexisting_node.op_name is None:
+                self._nodes_by_key[node.asset_key] = node
+            for job_name in node.job_names:
+                self._nodes_by_job.setdefault(job_name, []).append(node)
+            if node.op_name:
+                self._nodes_by_op_name[node.op_name].append(node)
+            for dep in node.dependencies:
+                self._upstream_keys[node.asset_key].add(dep.upstream_asset_key)
+                self._downstream_keys[dep.upstream_asset_key].add(node.asset_key)
+            for depended_by in node.depended_by:
+                self._downstream_keys[node.asset_key].add(depended_by.downstream_asset_key)
+                self._upstream_keys[depended_by.downstream_asset_key].add(node.asset_key)
+
+    @property
+    def asset_keys(self) -> Sequence[AssetKey]:
+        return list(self._nodes_by_key.keys())
+
+    def has_node(self, asset_key: AssetKey) -> bool:
+        return asset_key in self._nodes_by_key
+
+    def get_node(self, asset_key: AssetKey) -> Optional[ExternalAssetNode]:
+        return self._nodes_by_key.get(asset_key)
+
+    def get_nodes(self) -> Sequence[ExternalAssetNode]:
+        return list(self._nodes_by_key.values())
+
+    def get_nodes_for_job(self, job_name: str) -> Sequence[ExternalAssetNode]:
+        return self._nodes_by_job.get(job_name, [])
+
+    def get_nodes_for_op(self, op_name: str) -> Sequence[ExternalAssetNode]:
+        return self._nodes_by_op_name.get(op_name, [])
+
+    def get_upstream_asset_keys(self, asset_key: AssetKey) -> AbstractSet[AssetKey]:
+        return self._upstream_keys.get(asset_key, set())
+
+    def get_downstream_asset_keys(self, asset_key: AssetKey) -> AbstractSet[AssetKey]:
+        return self._downstream_keys.get(asset_key, set())
+
+    def get_all_upstream_asset_keys(self, asset_key: AssetKey) -> AbstractSet[AssetKey]:
+        return self._get_closure(asset_key, "upstream")
+
+    def get_all_downstream_asset_keys(self, asset_key: AssetKey) -> AbstractSet[AssetKey]:
+        return self._get_closure(asset_key, "downstream")
+
+    def _get_closure(self, asset_key: AssetKey, direction: str) -> AbstractSet[AssetKey]:
+        cache_key = (asset_key, direction)
+        if cache_key in self._closures:
+            return self._closures[cache_key]
+
+        adjacency = self._upstream_keys if direction == "upstream" else self._downstream_keys
+        result: Set[AssetKey] = set()
+        queue = list(adjacency.get(asset_key, set()))
+        while queue:
+            key = queue.pop()
+            if key in result:
+                continue
+            result.add(key)
+            closure = self._closures.get((key, direction))
+            if closure is not None:
+                result.update(closure)
+            else:
+                queue.extend(adjacency.get(key, set()))
+
+        self._closures[cache_key] = frozenset(result)
+        return self._closures[cache_key]
+
+
 class ExternalPipeline(RepresentedPipeline):
     """
     ExternalPipeline is a object that represents a loaded pipeline definition that
@@ -214,26 +389,68 @@ class ExternalPipeline(RepresentedPipeline):
     objects such as these to interact with user-defined artifacts.
     """
 
-    def __init__(self, external_pipeline_data, repository_handle, pipeline_index=None):
+    def __init__(
+        self,
+        external_pipeline_data: Optional[ExternalPipelineData],
+        repository_handle: RepositoryHandle,
+        pipeline_index: Optional[PipelineIndex] = None,
+        pipeline_name: Optional[str] = None,
+        is_job: Optional[bool] = None,
+        external_pipeline_loader: Optional[
+            Callable[[], Tuple[ExternalPipelineData, PipelineIndex]]
+        ] = None,
+    ):
         check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
-        check.inst_param(external_pipeline_data, "external_pipeline_data", ExternalPipelineData)
+        check.opt_inst_param(external_pipeline_data, "external_pipeline_data", ExternalPipelineData)
         check.opt_inst_param(pipeline_index, "pipeline_index", PipelineIndex)
 
-        if pipeline_index is None:
-            pipeline_index = PipelineIndex(
-                external_pipeline_data.pipeline_snapshot,
-                external_pipeline_data.parent_pipeline_snapshot,
+        if external_pipeline_data is None:
+            # the data of a pipeline that was deferred when its repository was loaded is fetched
+            # with the loader on first access, so only its name and whether it is a job are known
+            # up front
+            self._name = check.str_param(pipeline_name, "pipeline_name")
+            self._is_job = check.bool_param(is_job, "is_job")
+            self._external_pipeline_loader = check.callable_param(
+                external_pipeline_loader, "external_pipeline_loader"
             )
+        else:
+            if pipeline_index is None:
+                pipeline_index = PipelineIndex(
+                    external_pipeline_data.pipeline_snapshot,
+                    external_pipeline_data.parent_pipeline_snapshot,
+                )
+            self._name = pipeline_index.pipeline_snapshot.name
+            self._is_job = external_pipeline_data.is_job
+            self._external_pipeline_loader = None
 
         super(ExternalPipeline, self).__init__(pipeline_index=pipeline_index)
         self._external_pipeline_data = external_pipeline_data
         self._repository_handle = repository_handle
-        self._active_preset_dict = {ap.name: ap for ap in external_pipeline_data.active_presets}
-        self._handle = PipelineHandle(self._pipeline_index.name, repository_handle)
+        self._active_preset_dict: Optional[Dict[str, ExternalPresetData]] = None
+        self._handle = PipelineHandle(self._name, repository_handle)
+
+    def _get_external_pipeline_data(self) -> ExternalPipelineData:
+        if self._external_pipeline_data is None:
+            external_pipeline_data, pipeline_index = self._external_pipeline_loader()
+            self._external_pipeline_data = external_pipeline_data
+            if self._memoized_pipeline_index is None:
+                self._memoized_pipeline_index = pipeline_index
+        return self._external_pipeline_data
+
+    def _load_pipeline_index(self) -> PipelineIndex:
+        self._get_external_pipeline_data()
+        return self._memoized_pipeline_index
+
+    def _get_active_preset_dict(self) -> Dict[str, ExternalPresetData]:
+        if self._active_preset_dict is None:
+            self._active_preset_dict = {
+                ap.name: ap for ap in self._get_external_pipeline_data().active_presets
+            }
+        return self._active_preset_dict
 
     @property
     def name(self):
-        return self._pipeline_index.pipeline_snapshot.name
+        return self._name
 
     @property
     def description(self):
@@ -245,7 +462,7 @@ def solid_names_in_topological_order(self):
 
     @property
     def external_pipeline_data(self):
-        return self._external_pipeline_data
+        return self._get_external_pipeline_data()
 
     @property
     def repository_handle(self):
@@ -269,7 +486,7 @@ def solids_to_execute(self):
 
     @property
     def active_presets(self):
-        return list(self._active_preset_dict.values())
+        return list(self._get_active_preset_dict().values())
 
     @property
     def solid_names(self):
@@ -281,11 +498,11 @@ def has_solid_invocation(self, solid_name):
 
     def has_preset(self, preset_name):
         check.str_param(preset_name, "preset_name")
-        return preset_name in self._active_preset_dict
+        return preset_name in self._get_active_preset_dict()
 
     def get_preset(self, preset_name):
         check.str_param(preset_name, "preset_name")
-        return self._active_preset_dict[preset_name]
+        return self._get_active_preset_dict()[preset_name]
 
     @property
     def available_modes(self):
@@ -346,7 +563,7 @@ def pipeline_snapshot(self):
 
     @property
     def is_job(self):
-        return self._external_pipeline_data.is_job
+        return self._is_job
 
 
 class ExternalExecutionPlan:
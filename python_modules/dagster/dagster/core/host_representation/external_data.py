@@ -51,6 +51,7 @@ class ExternalRepositoryData(
             ("external_partition_set_datas", Sequence["ExternalPartitionSetData"]),
             ("external_sensor_datas", Sequence["ExternalSensorData"]),
             ("external_asset_graph_data", Sequence["ExternalAssetNode"]),
+            ("external_pipeline_refs", Optional[Sequence["ExternalPipelineRef"]]),
         ],
     )
 ):
@@ -62,6 +63,7 @@ def __new__(
         external_partition_set_datas: Sequence["ExternalPartitionSetData"],
         external_sensor_datas: Optional[Sequence["ExternalSensorData"]] = None,
         external_asset_graph_data: Optional[Sequence["ExternalAssetNode"]] = None,
+        external_pipeline_refs: Optional[Sequence["ExternalPipelineRef"]] = None,
     ):
         return super(ExternalRepositoryData, cls).__new__(
             cls,
@@ -87,8 +89,15 @@ def __new__(
                 "external_asset_graph_dats",
                 of_type=ExternalAssetNode,
             ),
+            external_pipeline_refs=check.opt_nullable_sequence_param(
+                external_pipeline_refs, "external_pipeline_refs", of_type=ExternalPipelineRef
+            ),
         )
 
+    @property
+    def has_deferred_pipeline_datas(self) -> bool:
+        return self.external_pipeline_refs is not None
+
     def get_pipeline_snapshot(self, name):
         check.str_param(name, "name")
 
@@ -96,6 +105,7 @@ def get_pipeline_snapshot(self, name):
             if external_pipeline_data.name == name:
                 return external_pipeline_data.pipeline_snapshot
 
+        self._check_not_deferred(name)
         check.failed("Could not find pipeline snapshot named " + name)
 
     def get_external_pipeline_data(self, name):
@@ -105,8 +115,16 @@ def get_external_pipeline_data(self, name):
             if external_pipeline_data.name == name:
                 return external_pipeline_data
 
+        self._check_not_deferred(name)
         check.failed("Could not find external pipeline data named " + name)
 
+    def _check_not_deferred(self, name):
+        check.invariant(
+            not any(ref.name == name for ref in self.external_pipeline_refs or []),
+            f"The data of pipeline {name} was deferred, and is not included in the repository "
+            "data. Use ExternalRepository.get_external_pipeline_data to load it.",
+        )
+
     def get_external_schedule_data(self, name):
         check.str_param(name, "name")
 
@@ -162,6 +180,19 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class ExternalPipelineRef(NamedTuple("_ExternalPipelineRef", [("name", str), ("is_job", bool)])):
+    """A lightweight reference to a pipeline, sent in place of its ExternalPipelineData when the
+    repository's pipeline snapshots are deferred until first access."""
+
+    def __new__(cls, name: str, is_job: bool):
+        return super(ExternalPipelineRef, cls).__new__(
+            cls,
+            name=check.str_param(name, "name"),
+            is_job=check.bool_param(is_job, "is_job"),
+        )
+
+
 @whitelist_for_serdes
 class ExternalPipelineData(
     NamedTuple(
@@ -745,15 +776,41 @@ def __new__(
 
 def external_repository_data_from_def(
     repository_def: RepositoryDefinition,
+    defer_pipeline_datas: bool = False,
 ) -> ExternalRepositoryData:
+    """
+    Args:
+        repository_def (RepositoryDefinition): The repository to represent.
+        defer_pipeline_datas (bool): If True, only lightweight ExternalPipelineRefs are included
+            for the repository's pipelines, and the full ExternalPipelineData for each pipeline is
+            expected to be fetched separately when it is first accessed.
+    """
     check.inst_param(repository_def, "repository_def", RepositoryDefinition)
+    check.bool_param(defer_pipeline_datas, "defer_pipeline_datas")
 
     pipelines = repository_def.get_all_pipelines()
     return ExternalRepositoryData(
         name=repository_def.name,
-        external_pipeline_datas=sorted(
-            list(map(external_pipeline_data_from_def, pipelines)),
-            key=lambda pd: pd.name,
+        external_pipeline_datas=(
+            []
+            if defer_pipeline_datas
+            else sorted(
+                list(map(external_pipeline_data_from_def, pipelines)),
+                key=lambda pd: pd.name,
+            )
+        ),
+        external_pipeline_refs=(
+            sorted(
+                [
+                    ExternalPipelineRef(
+                        name=pipeline.name, is_job=isinstance(pipeline, JobDefinition)
+                    )
+                    for pipeline in pipelines
+                ],
+                key=lambda ref: ref.name,
+            )
+            if defer_pipeline_datas
+            else None
         ),
         external_schedule_datas=sorted(
             list(map(external_schedule_data_from_def, repository_def.schedule_defs)),
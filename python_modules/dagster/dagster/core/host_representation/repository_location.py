@@ -3,6 +3,7 @@
 import threading
 from abc import abstractmethod
 from contextlib import AbstractContextManager
+from functools import partial
 from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Union, cast
 
 from dagster import check
@@ -22,10 +23,10 @@
 from dagster.api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
 from dagster.core.code_pointer import CodePointer
 from dagster.core.definitions.reconstruct import ReconstructablePipeline, ReconstructableRepository
-from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.errors import DagsterInvariantViolationError, DagsterUserCodeProcessError
 from dagster.core.execution.api import create_execution_plan
 from dagster.core.execution.plan.state import KnownExecutionState
-from dagster.core.host_representation import ExternalPipelineSubsetResult
+from dagster.core.host_representation import ExternalPipelineData, ExternalPipelineSubsetResult
 from dagster.core.host_representation.external import (
     ExternalExecutionPlan,
     ExternalPipeline,
@@ -54,6 +55,7 @@
 from dagster.serdes import deserialize_as
 from dagster.seven.compat.pendulum import PendulumDateTime
 from dagster.utils import merge_dicts
+from dagster.utils.cache import CacheStats, LRUCache
 from dagster.utils.hosted_user_process import external_repo_from_def
 
 from .selector import PipelineSelector
@@ -71,6 +73,10 @@
     )
     from dagster.core.host_representation.external_data import ExternalSensorExecutionErrorData
 
+# Bound on the number of pipeline subset snapshots fetched from a code location that are kept in
+# memory. The location (and so the cache) is replaced whenever the location is reloaded.
+MAX_CACHED_SUBSET_RESULTS = 64
+
 
 class RepositoryLocation(AbstractContextManager):
     """
@@ -507,6 +513,9 @@ def __init__(
 
         self.server_id = None
         self._external_repositories_data = None
+        self._subset_result_cache: LRUCache[ExternalPipelineSubsetResult] = LRUCache(
+            MAX_CACHED_SUBSET_RESULTS
+        )
 
         self._executable_path = None
         self._container_image = None
@@ -561,6 +570,7 @@ def __init__(
                         repository_name=repo_name,
                         repository_location=self,
                     ),
+                    pipeline_data_loader=partial(self._load_external_pipeline_data, repo_name),
                 )
                 for repo_name, repo_data in self._external_repositories_data.items()
             }
@@ -682,11 +692,44 @@ def get_subset_external_pipeline_result(
             ),
         )
 
-        external_repository = self.get_repository(selector.repository_name)
-        pipeline_handle = PipelineHandle(selector.pipeline_name, external_repository.handle)
-        return sync_get_external_pipeline_subset_grpc(
-            self.client, pipeline_handle.get_external_origin(), selector.solid_selection
+        cache_key = (
+            selector.repository_name,
+            selector.pipeline_name,
+            tuple(selector.solid_selection) if selector.solid_selection else None,
         )
+        result = self._subset_result_cache.get(cache_key)
+        if result is None:
+            external_repository = self.get_repository(selector.repository_name)
+            pipeline_handle = PipelineHandle(selector.pipeline_name, external_repository.handle)
+            result = sync_get_external_pipeline_subset_grpc(
+                self.client, pipeline_handle.get_external_origin(), selector.solid_selection
+            )
+            # as on the server, don't cache errors, which may be transient
+            if result.success:
+                self._subset_result_cache.set(cache_key, result)
+
+        return result
+
+    def _load_external_pipeline_data(
+        self, repository_name: str, pipeline_name: str
+    ) -> ExternalPipelineData:
+        # Used by ExternalRepository to fetch pipeline data that was deferred when the repository
+        # was loaded. The subset endpoint returns the full pipeline when no selection is given.
+        result = self.get_subset_external_pipeline_result(
+            PipelineSelector(
+                location_name=self.name,
+                repository_name=repository_name,
+                pipeline_name=pipeline_name,
+                solid_selection=None,
+            )
+        )
+        if not result.success:
+            raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+        return result.external_pipeline_data
+
+    def get_subset_result_cache_stats(self) -> CacheStats:
+        return self._subset_result_cache.get_stats()
 
     def get_external_partition_config(
         self, repository_handle: RepositoryHandle, partition_set_name: str, partition_name: str
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from dagster import check
 
@@ -14,8 +15,20 @@ class RepresentedPipeline(ABC):
     another process *or* could be referring to a historical view of the pipeline.
     """
 
-    def __init__(self, pipeline_index):
-        self._pipeline_index = check.inst_param(pipeline_index, "pipeline_index", PipelineIndex)
+    def __init__(self, pipeline_index: Optional[PipelineIndex]):
+        # None for a pipeline whose index is loaded on first access, by _load_pipeline_index
+        self._memoized_pipeline_index = check.opt_inst_param(
+            pipeline_index, "pipeline_index", PipelineIndex
+        )
+
+    @property
+    def _pipeline_index(self) -> PipelineIndex:
+        if self._memoized_pipeline_index is None:
+            self._memoized_pipeline_index = self._load_pipeline_index()
+        return self._memoized_pipeline_index
+
+    def _load_pipeline_index(self) -> PipelineIndex:
+        check.failed(f"{self.__class__.__name__} was created without a pipeline index")
 
     # Temporary method to allow for incrementally
     # replacing pipeline index with the representation hierarchy
@@ -86,7 +86,11 @@
     from dagster.core.snap import ExecutionPlanSnapshot, PipelineSnapshot
     from dagster.core.storage.compute_log_manager import ComputeLogManager
     from dagster.core.storage.event_log import EventLogStorage
-    from dagster.core.storage.event_log.base import EventLogRecord, EventRecordsFilter
+    from dagster.core.storage.event_log.base import (
+        AssetMaterializationSummary,
+        EventLogRecord,
+        EventRecordsFilter,
+    )
     from dagster.core.storage.root import LocalArtifactStorage
     from dagster.core.storage.runs import RunStorage
     from dagster.core.storage.schedules import ScheduleStorage
@@ -612,6 +616,44 @@ def cancellation_thread_poll_interval_seconds(self) -> int:
             "cancellation_thread_poll_interval_seconds", 10
         )
 
+    # retention
+
+    @property
+    def retention_settings(self) -> Dict:
+        return self.get_settings("retention")
+
+    @property
+    def event_log_retention_max_age_days(self) -> Optional[int]:
+        return (self.retention_settings.get("event_logs") or {}).get("max_age_days")
+
+    @property
+    def run_retention_max_age_days(self) -> Dict[str, int]:
+        return (self.retention_settings.get("runs") or {}).get("max_age_days") or {}
+
+    @property
+    def tick_retention_max_age_days(self) -> Dict[str, int]:
+        return (self.retention_settings.get("ticks") or {}).get("max_age_days") or {}
+
+    @property
+    def retention_enabled(self) -> bool:
+        return bool(
+            self.event_log_retention_max_age_days is not None
+            or self.run_retention_max_age_days
+            or self.tick_retention_max_age_days
+        )
+
+    @property
+    def retention_batch_size(self) -> int:
+        return self.retention_settings.get("batch_size", 100)
+
+    @property
+    def retention_batch_interval_seconds(self) -> float:
+        return self.retention_settings.get("batch_interval_seconds", 1.0)
+
+    @property
+    def retention_poll_interval_seconds(self) -> int:
+        return self.retention_settings.get("poll_interval_seconds", 3600)
+
     # python logs
 
     @property
@@ -704,6 +746,10 @@ def get_execution_plan_snapshot(self, snapshot_id: str) -> "ExecutionPlanSnapsho
     def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
         return self._event_storage.get_stats_for_run(run_id)
 
+    @traced
+    def get_runs_stats(self, run_ids: Sequence[str]) -> Dict[str, PipelineRunStatsSnapshot]:
+        return self._event_storage.get_stats_for_runs(run_ids)
+
     @traced
     def get_run_step_stats(self, run_id, step_keys=None) -> List["RunStepKeyStatsSnapshot"]:
         return self._event_storage.get_step_stats_for_run(run_id, step_keys)
@@ -1122,6 +1168,27 @@ def delete_run(self, run_id: str):
         self._event_storage.delete_events(run_id)
 
     # event storage
+    @property
+    def supports_event_log_pruning(self):
+        return self._event_storage.supports_prune_events
+
+    def prune_event_logs(
+        self,
+        before_timestamp: float,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+    ) -> int:
+        if batch_size is None:
+            return self._event_storage.prune_events(before_timestamp, max_batches=max_batches)
+        return self._event_storage.prune_events(before_timestamp, batch_size, max_batches)
+
+    @property
+    def supports_event_log_partitioning(self):
+        return self._event_storage.supports_partition_events
+
+    def partition_event_logs(self, ids_per_partition: int):
+        self._event_storage.partition_events(ids_per_partition)
+
     @traced
     def logs_after(
         self,
@@ -1169,6 +1236,12 @@ def get_latest_materialization_events(
     ) -> Mapping[AssetKey, Optional["EventLogEntry"]]:
         return self._event_storage.get_latest_materialization_events(asset_keys)
 
+    @traced
+    def get_latest_materialization_summaries(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Optional["AssetMaterializationSummary"]]:
+        return self._event_storage.get_latest_materialization_summaries(asset_keys)
+
     @traced
     def get_event_records(
         self,
@@ -1793,8 +1866,8 @@ def update_tick(self, tick):
     def get_tick_stats(self, origin_id):
         return self._schedule_storage.get_tick_stats(origin_id)
 
-    def purge_ticks(self, origin_id, tick_status, before):
-        self._schedule_storage.purge_ticks(origin_id, tick_status, before)
+    def purge_ticks(self, origin_id, tick_status, before, limit=None):
+        return self._schedule_storage.purge_ticks(origin_id, tick_status, before, limit=limit)
 
     def wipe_all_schedules(self):
         if self._scheduler:
@@ -1846,6 +1919,7 @@ def get_required_daemon_types(self):
         from dagster.daemon.daemon import (
             BackfillDaemon,
             MonitoringDaemon,
+            RetentionDaemon,
             SchedulerDaemon,
             SensorDaemon,
         )
@@ -1863,6 +1937,8 @@ def get_required_daemon_types(self):
             daemons.append(QueuedRunCoordinatorDaemon.daemon_type())
         if self.run_monitoring_enabled:
             daemons.append(MonitoringDaemon.daemon_type())
+        if self.retention_enabled:
+            daemons.append(RetentionDaemon.daemon_type())
         return daemons
 
     # backfill
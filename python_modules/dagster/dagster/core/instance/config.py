@@ -127,4 +127,43 @@ def dagster_instance_config_schema():
                 "cancellation_thread_poll_interval_seconds": Field(int, is_required=False),
             },
         ),
+        "retention": Field(
+            {
+                "event_logs": Field(
+                    {
+                        "max_age_days": Field(int, is_required=False),
+                    },
+                    is_required=False,
+                ),
+                "runs": Field(
+                    {
+                        "max_age_days": Field(
+                            {
+                                "success": Field(int, is_required=False),
+                                "failure": Field(int, is_required=False),
+                                "canceled": Field(int, is_required=False),
+                            },
+                            is_required=False,
+                        ),
+                    },
+                    is_required=False,
+                ),
+                "ticks": Field(
+                    {
+                        "max_age_days": Field(
+                            {
+                                "success": Field(int, is_required=False),
+                                "failure": Field(int, is_required=False),
+                                "skipped": Field(int, is_required=False),
+                            },
+                            is_required=False,
+                        ),
+                    },
+                    is_required=False,
+                ),
+                "batch_size": Field(int, is_required=False),
+                "batch_interval_seconds": Field(float, is_required=False),
+                "poll_interval_seconds": Field(int, is_required=False),
+            },
+        ),
     }
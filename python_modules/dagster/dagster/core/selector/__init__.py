@@ -1,4 +1,5 @@
 from .subset_selector import (
+    SelectionIndex,
     Traverser,
     generate_dep_graph,
     parse_clause,
@@ -1,17 +1,31 @@
 import re
 import sys
 from collections import defaultdict, deque
-from typing import TYPE_CHECKING, AbstractSet, Dict, List, NamedTuple
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 from dagster.core.definitions.dependency import DependencyStructure
 from dagster.core.errors import DagsterExecutionStepNotFoundError, DagsterInvalidSubsetError
 from dagster.utils import check
+from dagster.utils.cache import LRUCache
 
 if TYPE_CHECKING:
     from dagster.core.definitions.job_definition import JobDefinition
 
 MAX_NUM = sys.maxsize
 
+# Bound on the number of distinct selection queries whose resolution is memoized per index. Dagit
+# issues a new query per keystroke in the op selection box, so this needs to be bounded.
+MAX_CACHED_SELECTIONS = 256
+
 
 class OpSelectionData(
     NamedTuple(
@@ -126,6 +140,142 @@ def fetch_downstream(self, item_name, depth):
         return self._fetch_items(item_name, depth, "downstream")
 
 
+class SelectionIndex:
+    """Precomputed index over a dependency graph, used to evaluate selection queries.
+
+    Each item is assigned a position, and the direct upstream / downstream neighbors of every item
+    are stored as integer bitsets. Evaluating a clause is then a series of bitwise unions rather
+    than a set-based BFS, and transitive closures are memoized per (item, direction, depth) so that
+    repeated queries against the same graph (e.g. from Dagit's op selection input) are cheap.
+
+    Args:
+        graph (Dict[str, Dict[str, Set[str]]]): the input and output dependency graph, as returned
+            by :py:func:`generate_dep_graph`.
+    """
+
+    def __init__(self, graph):
+        check.dict_param(graph, "graph")
+        names = list(graph["upstream"].keys())
+        for name in graph["downstream"].keys():
+            if name not in graph["upstream"]:
+                names.append(name)
+
+        self._names: List[str] = names
+        self._positions: Dict[str, int] = {name: i for i, name in enumerate(names)}
+        self._adjacency: Dict[str, List[int]] = {
+            direction: [self._mask_for(graph[direction].get(name, set())) for name in names]
+            for direction in ("upstream", "downstream")
+        }
+        self._closures: Dict[Tuple[int, str, int], int] = {}
+        self._resolved_selections: LRUCache[FrozenSet[str]] = LRUCache(MAX_CACHED_SELECTIONS)
+
+    def _mask_for(self, item_names) -> int:
+        mask = 0
+        for item_name in item_names:
+            position = self._positions.get(item_name)
+            if position is not None:
+                mask |= 1 << position
+        return mask
+
+    def has_item(self, item_name: str) -> bool:
+        return item_name in self._positions
+
+    def names_for_mask(self, mask: int) -> FrozenSet[str]:
+        names = []
+        while mask:
+            lowest_bit = mask & -mask
+            names.append(self._names[lowest_bit.bit_length() - 1])
+            mask ^= lowest_bit
+        return frozenset(names)
+
+    def _neighbors(self, mask: int, direction: str) -> int:
+        adjacency = self._adjacency[direction]
+        neighbors = 0
+        while mask:
+            lowest_bit = mask & -mask
+            neighbors |= adjacency[lowest_bit.bit_length() - 1]
+            mask ^= lowest_bit
+        return neighbors
+
+    def _full_closure(self, position: int, direction: str) -> int:
+        adjacency = self._adjacency[direction]
+        result = 0
+        frontier = adjacency[position]
+        while frontier:
+            result |= frontier
+            next_frontier = 0
+            while frontier:
+                lowest_bit = frontier & -frontier
+                curr_position = lowest_bit.bit_length() - 1
+                closure = self._closures.get((curr_position, direction, MAX_NUM))
+                # reuse already computed closures instead of walking those items again
+                if closure is None:
+                    next_frontier |= adjacency[curr_position]
+                else:
+                    result |= closure
+                frontier ^= lowest_bit
+            frontier = next_frontier & ~result
+        return result
+
+    def fetch_mask(self, item_name: str, depth: int, direction: str) -> int:
+        """Bitset of the items reachable from item_name in the given direction within depth
+        levels."""
+        position = self._positions[item_name]
+        key = (position, direction, depth)
+        if key in self._closures:
+            return self._closures[key]
+
+        if depth == MAX_NUM:
+            result = self._full_closure(position, direction)
+        else:
+            result = 0
+            frontier = 1 << position
+            curr_depth = 0
+            while frontier and curr_depth < depth:
+                frontier = self._neighbors(frontier, direction) & ~result
+                result |= frontier
+                curr_depth += 1
+
+        self._closures[key] = result
+        return result
+
+    def clause_to_mask(self, clause) -> int:
+        """Bitset of the items selected by a single selection clause, 0 if the clause is invalid."""
+        if not isinstance(clause, str):
+            return 0
+        parts = parse_clause(clause)
+        if parts is None:
+            return 0
+        up_depth, item_name, down_depth = parts
+        if not self.has_item(item_name):
+            return 0
+
+        return (
+            (1 << self._positions[item_name])
+            | self.fetch_mask(item_name, up_depth, "upstream")
+            | self.fetch_mask(item_name, down_depth, "downstream")
+        )
+
+    def resolve_selection(self, selection: List[str]) -> Optional[FrozenSet[str]]:
+        """Resolve a list of selection clauses to the names of the selected items. Returns None if
+        any of the clauses does not select any item."""
+        cache_key = tuple(selection)
+        cached = self._resolved_selections.get(cache_key)
+        if cached is not None:
+            return cached
+
+        selected = 0
+        for clause in selection:
+            mask = self.clause_to_mask(clause)
+            if not mask:
+                return None
+            selected |= mask
+
+        resolved = self.names_for_mask(selected)
+        self._resolved_selections.set(cache_key, resolved)
+        return resolved
+
+
 def parse_clause(clause):
     def _get_depth(part):
         if part == "":
@@ -267,23 +417,17 @@ def parse_solid_selection(pipeline_def, solid_selection):
     if len(solid_selection) == 1 and solid_selection[0] == "*":
         return frozenset(pipeline_def.graph.node_names())
 
-    graph = generate_dep_graph(pipeline_def)
-    solids_set = set()
-
-    # loop over clauses
-    for clause in solid_selection:
-        subset = clause_to_subset(graph, clause)
-        if len(subset) == 0:
-            raise DagsterInvalidSubsetError(
-                "No qualified {node_type} to execute found for {selection_type}={requested}".format(
-                    requested=solid_selection,
-                    node_type="ops" if pipeline_def.is_job else "solids",
-                    selection_type="op_selection" if pipeline_def.is_job else "solid_selection",
-                )
+    solids_set = pipeline_def.get_selection_index().resolve_selection(solid_selection)
+    if solids_set is None:
+        raise DagsterInvalidSubsetError(
+            "No qualified {node_type} to execute found for {selection_type}={requested}".format(
+                requested=solid_selection,
+                node_type="ops" if pipeline_def.is_job else "solids",
+                selection_type="op_selection" if pipeline_def.is_job else "solid_selection",
             )
-        solids_set.update(subset)
+        )
 
-    return frozenset(solids_set)
+    return solids_set
 
 
 def parse_step_selection(step_deps, step_selection):
@@ -312,7 +456,6 @@ def parse_step_selection(step_deps, step_selection):
 
     # generate dep graph
     graph = {"upstream": step_deps, "downstream": downstream_deps}
-    steps_set = set()
 
     step_keys = parse_items_from_selection(step_selection)
     invalid_keys = [key for key in step_keys if key not in step_deps]
@@ -322,15 +465,12 @@ def parse_step_selection(step_deps, step_selection):
             step_keys=invalid_keys,
         )
 
-    # loop over clauses
-    for clause in step_selection:
-        subset = clause_to_subset(graph, clause)
-        if len(subset) == 0:
-            raise DagsterInvalidSubsetError(
-                "No qualified steps to execute found for step_selection={requested}".format(
-                    requested=step_selection
-                ),
-            )
-        steps_set.update(subset)
+    steps_set = SelectionIndex(graph).resolve_selection(step_selection)
+    if steps_set is None:
+        raise DagsterInvalidSubsetError(
+            "No qualified steps to execute found for step_selection={requested}".format(
+                requested=step_selection
+            ),
+        )
 
-    return frozenset(steps_set)
+    return steps_set
@@ -6,6 +6,7 @@
 from rx import Observable
 
 from dagster import check
+from dagster.core.execution.compute_logs import redirect_thread_output_to_files
 from dagster.core.instance import MayHaveInstanceWeakref
 from dagster.core.storage.pipeline_run import PipelineRun
 
@@ -70,6 +71,50 @@ def watch(self, pipeline_run, step_key=None):
             yield
         self.on_watch_finish(pipeline_run, step_key)
 
+    @contextmanager
+    def watch_thread(self, pipeline_run, step_key):
+        """
+        Watch the stdout/stderr written by the current thread for a given run_id / step_key and
+        persist it. Unlike `watch`, which captures the output of the whole process, this attributes
+        the output of steps executing concurrently in different threads to the right steps.
+
+        Args:
+            pipeline_run (PipelineRun): The pipeline run config
+            step_key (String): The step_key for a compute step
+        """
+        check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+        check.str_param(step_key, "step_key")
+
+        if not self.enabled(pipeline_run, step_key):
+            yield
+            return
+
+        self.on_watch_start(pipeline_run, step_key)
+        with self._watch_thread_logs(pipeline_run, step_key):
+            yield
+        self.on_watch_finish(pipeline_run, step_key)
+
+    @contextmanager
+    def _watch_thread_logs(self, pipeline_run, step_key):
+        """
+        Method to watch the stdout/stderr logs written by the current thread for a given run_id /
+        step_key. By default, the logs are written to the local paths of the logs, as with the
+        managers that stage logs locally before uploading them. Compute log managers without local
+        paths do not capture the logs of threads.
+
+        Args:
+            pipeline_run (PipelineRun): The pipeline run config
+            step_key (String): The step_key for a compute step
+        """
+        outpath = self.get_local_path(pipeline_run.run_id, step_key, ComputeIOType.STDOUT)
+        errpath = self.get_local_path(pipeline_run.run_id, step_key, ComputeIOType.STDERR)
+        if not outpath or not errpath:
+            yield
+            return
+
+        with redirect_thread_output_to_files(outpath, errpath):
+            yield
+
     @contextmanager
     @abstractmethod
     def _watch_logs(self, pipeline_run, step_key=None):
@@ -178,6 +223,14 @@ def on_subscribe(self, subscription):
     def on_unsubscribe(self, subscription):
         pass
 
+    def delete_logs(self, run_id):
+        """Delete the compute logs captured for a given run, e.g. when the run is deleted. Compute
+        log managers that do not support deleting logs leave them in place.
+
+        Args:
+            run_id (str): The id of the pipeline run.
+        """
+
     def observable(self, run_id, key, io_type, cursor=None):
         """Return an Observable which streams back log data from the execution logs for a given
         compute step.
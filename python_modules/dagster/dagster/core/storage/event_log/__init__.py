@@ -1,4 +1,5 @@
 from .base import (
+    AssetMaterializationSummary,
     EventLogEntry,
     EventLogRecord,
     EventLogStorage,
@@ -7,6 +8,12 @@
 )
 from .in_memory import InMemoryEventLogStorage
 from .polling_event_watcher import SqlPollingEventWatcher
-from .schema import AssetKeyTable, SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from .schema import (
+    AssetKeyTable,
+    RunStatsTable,
+    SqlEventLogStorageMetadata,
+    SqlEventLogStorageTable,
+    StepStatsTable,
+)
 from .sql_event_log import SqlEventLogStorage
 from .sqlite import ConsolidatedSqliteEventLogStorage, SqliteEventLogStorage
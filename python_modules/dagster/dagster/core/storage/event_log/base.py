@@ -3,6 +3,7 @@
 from datetime import datetime
 from typing import (
     Callable,
+    Dict,
     Iterable,
     List,
     Mapping,
@@ -27,6 +28,10 @@
 from dagster.core.storage.pipeline_run import PipelineRunStatsSnapshot
 from dagster.serdes import whitelist_for_serdes
 
+# The number of events deleted per transaction when pruning the event log
+DEFAULT_PRUNE_EVENTS_BATCH_SIZE = 1000
+DEFAULT_IDS_PER_EVENT_PARTITION = 1000000
+
 
 class RunShardedEventsCursor(NamedTuple):
     """Pairs an id-based event log cursor with a timestamp-based run cursor, for improved
@@ -47,6 +52,18 @@ class EventLogRecord(NamedTuple):
     event_log_entry: EventLogEntry
 
 
+class AssetMaterializationSummary(NamedTuple):
+    """Describes the latest materialization of an asset without its event, so that it can be looked
+    up for many assets at once. The event itself can be fetched by its storage id, if known.
+    """
+
+    asset_key: AssetKey
+    storage_id: Optional[int]
+    timestamp: float
+    run_id: str
+    partition: Optional[str]
+
+
 @whitelist_for_serdes
 class EventRecordsFilter(
     NamedTuple(
@@ -145,6 +162,10 @@ def get_stats_for_run(self, run_id: str) -> PipelineRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
 
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Dict[str, PipelineRunStatsSnapshot]:
+        """Get a summary of events that have ocurred in each of the given runs, keyed by run id."""
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
     def get_step_stats_for_run(self, run_id: str, step_keys=None) -> List[RunStepKeyStatsSnapshot]:
         """Get per-step stats for a pipeline run."""
         logs = self.get_logs_for_run(run_id)
@@ -187,6 +208,46 @@ def reindex_assets(self, print_fn: Callable = lambda _: None, force: bool = Fals
     def wipe(self):
         """Clear the log storage."""
 
+    @property
+    def supports_prune_events(self) -> bool:
+        """
+        Whether the event log storage supports prune_events.
+        """
+        return False
+
+    def prune_events(
+        self,
+        before_timestamp: float,
+        batch_size: int = DEFAULT_PRUNE_EVENTS_BATCH_SIZE,
+        max_batches: Optional[int] = None,
+    ) -> int:
+        """Delete the events stored before the given timestamp, in batches of at most batch_size
+        events per transaction. The asset index is preserved, including the latest materialization
+        event of each asset. If max_batches is set, at most that many batches are deleted, so that
+        callers can resume pruning with later calls until no events are deleted.
+
+        Returns the number of deleted events.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support pruning events by timestamp"
+        )
+
+    @property
+    def supports_partition_events(self) -> bool:
+        """
+        Whether the event log storage supports partition_events.
+        """
+        return False
+
+    def partition_events(self, ids_per_partition: int = DEFAULT_IDS_PER_EVENT_PARTITION):
+        """Convert the event log table into partitions of ids_per_partition consecutive storage ids,
+        so that prune_events can drop whole partitions of old events instead of deleting them row
+        by row.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support partitioning events by storage id"
+        )
+
     @abstractmethod
     def watch(self, run_id: str, start_cursor: int, callback: Callable):
         """Call this method to start watching."""
@@ -251,6 +312,23 @@ def get_latest_materialization_events(
     ) -> Mapping[AssetKey, Optional[EventLogEntry]]:
         pass
 
+    def get_latest_materialization_summaries(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Optional[AssetMaterializationSummary]]:
+        # base implementation, deriving the summaries from the latest materialization events
+        return {
+            asset_key: AssetMaterializationSummary(
+                asset_key=asset_key,
+                storage_id=None,
+                timestamp=event.timestamp,
+                run_id=event.run_id,
+                partition=event.dagster_event.partition,
+            )
+            if event
+            else None
+            for asset_key, event in self.get_latest_materialization_events(asset_keys).items()
+        }
+
     @abstractmethod
     def get_asset_events(
         self,
@@ -10,6 +10,7 @@
 from dagster.serdes import ConfigurableClass
 
 from .base import (
+    DEFAULT_PRUNE_EVENTS_BATCH_SIZE,
     EventLogRecord,
     EventLogStorage,
     EventRecordsFilter,
@@ -112,6 +113,45 @@ def store_event(self, event):
     def delete_events(self, run_id):
         del self._logs[run_id]
 
+    @property
+    def supports_prune_events(self):
+        return True
+
+    def prune_events(
+        self, before_timestamp, batch_size=DEFAULT_PRUNE_EVENTS_BATCH_SIZE, max_batches=None
+    ):
+        # the events are pruned in a single batch, since no lock is held on a database
+        check.float_param(before_timestamp, "before_timestamp")
+        check.int_param(batch_size, "batch_size")
+        check.opt_int_param(max_batches, "max_batches")
+
+        # keep the latest materialization of each asset, as the sql storages do
+        latest_materializations = {}
+        for records in self._logs.values():
+            for record in records:
+                if (
+                    record.is_dagster_event
+                    and record.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION
+                    and record.dagster_event.asset_key
+                ):
+                    latest_materializations[record.dagster_event.asset_key] = record
+        preserved_ids = {id(record) for record in latest_materializations.values()}
+
+        deleted_count = 0
+        for run_id in list(self._logs.keys()):
+            records = [
+                record
+                for record in self._logs[run_id]
+                if record.timestamp >= before_timestamp or id(record) in preserved_ids
+            ]
+            deleted_count += len(self._logs[run_id]) - len(records)
+            if records:
+                self._logs[run_id] = records
+            else:
+                del self._logs[run_id]
+
+        return deleted_count
+
     def upgrade(self):
         pass
 
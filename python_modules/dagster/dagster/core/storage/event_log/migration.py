@@ -2,17 +2,34 @@
 from tqdm import tqdm
 
 from dagster import AssetKey, seven
+from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventLogEntry
 from dagster.serdes import deserialize_json_to_dagster_namedtuple
 from dagster.utils import utc_datetime_from_timestamp
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+STEP_STATS_TABLE = "step_stats_table"  # builds the step stats table from the event log
+RUN_STATS_TABLE = "run_stats_table"  # builds the run stats table from the event log
+# extracts typed latest materialization columns into the asset_keys table
+ASSET_KEY_MATERIALIZATION_COLS = "asset_key_materialization_columns"
+ASSET_PARTITIONS_TABLE = "asset_partitions_table"  # builds the asset partitions table
+# builds the cross-run event index in the index shard of the run-sharded sqlite storage
+CROSS_RUN_EVENT_INDEX_TABLE = "cross_run_event_index_table"
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
+    STEP_STATS_TABLE: lambda: migrate_step_stats_data,
+    RUN_STATS_TABLE: lambda: migrate_run_stats_data,
+}
+ASSET_DATA_MIGRATIONS = {
+    ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns,
+    ASSET_KEY_MATERIALIZATION_COLS: lambda: migrate_asset_key_materialization_columns,
+    ASSET_PARTITIONS_TABLE: lambda: migrate_asset_partitions_data,
+}
+SQLITE_EVENT_LOG_DATA_MIGRATIONS = {
+    CROSS_RUN_EVENT_INDEX_TABLE: lambda: migrate_cross_run_event_index_data,
 }
-ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
 
 
 def migrate_event_log_data(instance=None):
@@ -29,11 +46,20 @@ def migrate_event_log_data(instance=None):
     if not isinstance(event_log_storage, SqlEventLogStorage):
         return
 
+    rebuild_step_stats = event_log_storage.has_secondary_index(STEP_STATS_TABLE)
+    rebuild_run_stats = event_log_storage.has_secondary_index(RUN_STATS_TABLE)
+
     for run in instance.get_runs():
         event_records_by_id = event_log_storage.get_logs_for_run_by_log_id(run.run_id)
         for record_id, event in event_records_by_id.items():
             event_log_storage.update_event_log_record(record_id, event)
 
+        # the step and run stats are built from the extracted columns, so rebuild them as well
+        if rebuild_step_stats:
+            event_log_storage.rebuild_step_stats(run.run_id)
+        if rebuild_run_stats:
+            event_log_storage.rebuild_run_stats(run.run_id)
+
 
 def migrate_asset_key_data(event_log_storage, print_fn=None):
     """
@@ -72,6 +98,69 @@ def migrate_asset_key_data(event_log_storage, print_fn=None):
                 pass
 
 
+def migrate_step_stats_data(event_log_storage, print_fn=None):
+    """
+    Utility method to build the step stats table from the step events of existing runs.
+    Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    run_ids = event_log_storage.get_all_run_ids()
+    if print_fn:
+        print_fn(f"Found {len(run_ids)} runs to index.")
+        run_ids = tqdm(run_ids)
+
+    for run_id in run_ids:
+        # run shards that predate the step stats table are rebuilt when their schema is upgraded
+        if event_log_storage.has_step_stats_table(run_id):
+            event_log_storage.rebuild_step_stats(run_id)
+
+
+def migrate_run_stats_data(event_log_storage, print_fn=None):
+    """
+    Utility method to build the run stats table from the events of existing runs.
+    Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    run_ids = event_log_storage.get_all_run_ids()
+    if print_fn:
+        print_fn(f"Found {len(run_ids)} runs to index.")
+        run_ids = tqdm(run_ids)
+
+    for run_id in run_ids:
+        # sqlite storages list every database file in their directory, not all of which are shards
+        if event_log_storage.has_event_log_table(run_id):
+            event_log_storage.rebuild_run_stats(run_id)
+
+
+def migrate_cross_run_event_index_data(event_log_storage, print_fn=None):
+    """
+    Utility method to build the cross-run event index of a run-sharded sqlite event log storage from
+    the events in its run shards. Takes in event_log_storage, and a print_fn to keep track of
+    progress.
+    """
+    from dagster.core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
+
+    if not isinstance(event_log_storage, SqliteEventLogStorage):
+        return
+
+    run_ids = event_log_storage.get_all_run_ids()
+    if print_fn:
+        print_fn(f"Found {len(run_ids)} runs to index.")
+        run_ids = tqdm(run_ids)
+
+    for run_id in run_ids:
+        if event_log_storage.has_event_log_table(run_id):
+            event_log_storage.rebuild_cross_run_event_index(run_id)
+
+
 def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
     from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
     from dagster.serdes import serialize_dagster_namedtuple
@@ -167,6 +256,96 @@ def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
                 )
 
 
+def migrate_asset_key_materialization_columns(event_log_storage, print_fn=None):
+    """
+    Utility method to fill the typed latest materialization columns of the asset_keys table from the
+    latest materialization of each asset in the event log. Takes in event_log_storage, and a
+    print_fn to keep track of progress.
+    """
+    from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    from .schema import AssetKeyTable, SqlEventLogStorageTable
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    with event_log_storage.index_connection() as conn:
+        if print_fn:
+            print_fn("Querying asset keys.")
+        asset_key_strs = [
+            asset_key_str
+            for (asset_key_str,) in conn.execute(db.select([AssetKeyTable.c.asset_key])).fetchall()
+        ]
+
+        if print_fn:
+            print_fn(f"Found {len(asset_key_strs)} assets to reindex.")
+            asset_key_strs = tqdm(asset_key_strs)
+
+        for asset_key_str in asset_key_strs:
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if not asset_key:
+                continue
+
+            row = conn.execute(
+                db.select(
+                    [
+                        SqlEventLogStorageTable.c.id,
+                        SqlEventLogStorageTable.c.timestamp,
+                        SqlEventLogStorageTable.c.run_id,
+                        SqlEventLogStorageTable.c.partition,
+                    ]
+                )
+                .where(
+                    db.and_(
+                        db.or_(
+                            SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
+                            SqlEventLogStorageTable.c.asset_key == asset_key.to_string(legacy=True),
+                        ),
+                        SqlEventLogStorageTable.c.dagster_event_type
+                        == DagsterEventType.ASSET_MATERIALIZATION.value,
+                    )
+                )
+                .order_by(SqlEventLogStorageTable.c.id.desc())
+                .limit(1)
+            ).fetchone()
+            if not row:
+                # the asset has only been observed, or its materializations have been deleted
+                continue
+
+            storage_id, timestamp, run_id, partition = row
+            conn.execute(
+                AssetKeyTable.update()  # pylint: disable=no-value-for-parameter
+                .values(
+                    last_materialization_storage_id=storage_id,
+                    last_materialization_event_timestamp=timestamp,
+                    last_run_id=run_id,
+                    last_materialization_partition=partition,
+                )
+                .where(
+                    AssetKeyTable.c.asset_key == asset_key_str,
+                )
+            )
+
+
+def migrate_asset_partitions_data(event_log_storage, print_fn=None):
+    """
+    Utility method to build the asset partitions table from the partitioned materializations in
+    existing event log records. Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    asset_keys = event_log_storage.all_asset_keys()
+    if print_fn:
+        print_fn(f"Found {len(asset_keys)} assets to index.")
+        asset_keys = tqdm(asset_keys)
+
+    for asset_key in asset_keys:
+        event_log_storage.rebuild_asset_partitions(asset_key)
+
+
 def sql_asset_event_generator(conn, cursor=None, batch_size=1000):
     from .schema import SqlEventLogStorageTable
 
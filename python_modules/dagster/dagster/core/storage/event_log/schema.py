@@ -50,6 +50,66 @@
     ),  # guarded by secondary index check
     db.Column("tags", db.TEXT),  # guarded by secondary index check
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+    # typed columns describing the latest materialization, so that it can be looked up for many
+    # assets without deserializing their events. Unlike last_materialization_timestamp, these are
+    # not updated upon observation. Guarded by secondary index check.
+    db.Column("last_materialization_storage_id", db.Integer),
+    db.Column("last_materialization_event_timestamp", db.types.TIMESTAMP),
+    db.Column("last_materialization_partition", db.Text),
+)
+
+# Per-step summary of the step-scoped events in a run, maintained as events are stored so that
+# step stats can be read without deserializing and folding the full event log for the run.
+# Guarded by secondary index check.
+StepStatsTable = db.Table(
+    "step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.Text, nullable=False),
+    db.Column("status", db.String(63)),
+    db.Column("start_time", db.Float),
+    db.Column("end_time", db.Float),
+    db.Column("attempts", db.Integer),
+    db.Column("materialization_count", db.Integer, nullable=False, default=0),
+    db.Column("expectation_count", db.Integer, nullable=False, default=0),
+    # serialized attempt and marker intervals
+    db.Column("intervals", db.Text),
+    db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
+# Per-run counters and timestamps of the events summarized in run stats, maintained as events are
+# stored so that the stats of many runs can be read without aggregating over their event logs.
+# Guarded by secondary index check.
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), unique=True, nullable=False),
+    db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+    db.Column("steps_failed", db.Integer, nullable=False, default=0),
+    db.Column("materializations", db.Integer, nullable=False, default=0),
+    db.Column("expectations", db.Integer, nullable=False, default=0),
+    db.Column("enqueued_time", db.Float),
+    db.Column("launch_time", db.Float),
+    db.Column("start_time", db.Float),
+    db.Column("end_time", db.Float),
+    db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
+# Per-partition summary of the materializations of each asset, maintained as materializations are
+# stored so that partition status can be read without aggregating over the event log of the asset.
+# Guarded by secondary index check.
+AssetPartitionsTable = db.Table(
+    "asset_partitions",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("asset_key", MySQLCompatabilityTypes.UniqueText, nullable=False),
+    db.Column("partition", db.Text, nullable=False),
+    db.Column("materialization_count", db.Integer, nullable=False, default=0),
+    db.Column("last_materialization_storage_id", db.Integer),
+    db.Column("last_materialization_timestamp", db.types.TIMESTAMP),
+    db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
 db.Index("idx_run_id", SqlEventLogStorageTable.c.run_id)
@@ -75,3 +135,42 @@
     SqlEventLogStorageTable.c.id,
     mysql_length={"dagster_event_type": 64},
 )
+db.Index("idx_event_timestamp", SqlEventLogStorageTable.c.timestamp)
+db.Index(
+    "idx_step_stats_run_step",
+    StepStatsTable.c.run_id,
+    StepStatsTable.c.step_key,
+    unique=True,
+    mysql_length={"step_key": 64},
+)
+db.Index(
+    "idx_asset_partitions_asset_partition",
+    AssetPartitionsTable.c.asset_key,
+    AssetPartitionsTable.c.partition,
+    unique=True,
+    mysql_length={"partition": 255},
+)
+
+# Tables that are only used by the index shard of the run-sharded SqliteEventLogStorage, kept out of
+# SqlEventLogStorageMetadata so that they are not created by other event log storages.
+SqliteEventLogIndexShardMetadata = db.MetaData()
+
+# Mirrors a compact row for each event of the types that are queried across runs (e.g. run status
+# events for run status sensors), pointing at the event's storage id in its run shard.
+# Guarded by secondary index check.
+CrossRunEventIndexTable = db.Table(
+    "cross_run_event_index",
+    SqliteEventLogIndexShardMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("storage_id", db.Integer, nullable=False),
+    db.Column("dagster_event_type", db.Text, nullable=False),
+    db.Column("timestamp", db.types.TIMESTAMP),
+)
+
+db.Index(
+    "idx_cross_run_event_type_timestamp",
+    CrossRunEventIndexTable.c.dagster_event_type,
+    CrossRunEventIndexTable.c.timestamp,
+)
+db.Index("idx_cross_run_event_run_id", CrossRunEventIndexTable.c.run_id)
@@ -1,6 +1,6 @@
 import logging
 from abc import abstractmethod
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from typing import Dict, Iterable, List, Mapping, Optional, Sequence, cast
 
@@ -13,24 +13,71 @@
 from dagster.core.errors import DagsterEventLogInvalidForRun
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventLogEntry
-from dagster.core.execution.stats import build_run_step_stats_from_events
+from dagster.core.execution.stats import (
+    STEP_STATS_END_STATUSES,
+    STEP_STATS_EVENT_TYPES,
+    StepEventStatus,
+    StepStatsAccumulator,
+    build_run_step_stats_from_events,
+    is_step_stats_event,
+)
 from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster.serdes.errors import DeserializationError
 from dagster.utils import datetime_as_float, utc_datetime_from_naive, utc_datetime_from_timestamp
 
 from ..pipeline_run import PipelineRunStatsSnapshot
 from .base import (
+    DEFAULT_PRUNE_EVENTS_BATCH_SIZE,
+    AssetMaterializationSummary,
     EventLogRecord,
     EventLogStorage,
     EventRecordsFilter,
     RunShardedEventsCursor,
     extract_asset_events_cursor,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
-from .schema import AssetKeyTable, SecondaryIndexMigrationTable, SqlEventLogStorageTable
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    ASSET_KEY_MATERIALIZATION_COLS,
+    ASSET_PARTITIONS_TABLE,
+    EVENT_LOG_DATA_MIGRATIONS,
+    RUN_STATS_TABLE,
+    STEP_STATS_TABLE,
+)
+from .schema import (
+    AssetKeyTable,
+    AssetPartitionsTable,
+    RunStatsTable,
+    SecondaryIndexMigrationTable,
+    SqlEventLogStorageTable,
+    StepStatsTable,
+)
 
 MIN_ASSET_ROWS = 25
 
+# The maximum number of events deleted by a single statement, which bounds the time locks are held
+# and the number of storage ids bound in the statement, since sqlite limits the number of bound
+# parameters of a statement (to 999 before sqlite 3.32)
+DELETE_EVENTS_BATCH_SIZE = 500
+
+# run stats columns that count the events of a given type
+RUN_STATS_COUNT_COLUMNS = {
+    DagsterEventType.STEP_SUCCESS: "steps_succeeded",
+    DagsterEventType.STEP_FAILURE: "steps_failed",
+    DagsterEventType.ASSET_MATERIALIZATION: "materializations",
+    DagsterEventType.STEP_EXPECTATION_RESULT: "expectations",
+}
+
+# run stats columns that record the timestamp of the latest event of a given type
+RUN_STATS_TIME_COLUMNS = {
+    DagsterEventType.PIPELINE_ENQUEUED: "enqueued_time",
+    DagsterEventType.PIPELINE_STARTING: "launch_time",
+    DagsterEventType.PIPELINE_START: "start_time",
+    DagsterEventType.PIPELINE_SUCCESS: "end_time",
+    DagsterEventType.PIPELINE_FAILURE: "end_time",
+    DagsterEventType.PIPELINE_CANCELED: "end_time",
+}
+
 
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
@@ -103,8 +150,17 @@ def has_asset_key_index_cols(self):
             column_names = [x.get("name") for x in db.inspect(conn).get_columns(AssetKeyTable.name)]
             return "last_materialization_timestamp" in column_names
 
-    def store_asset(self, event):
+    def has_event_log_table(self, run_id):
+        with self.run_connection(run_id) as conn:
+            return SqlEventLogStorageTable.name in db.inspect(conn).get_table_names()
+
+    def has_step_stats_table(self, run_id):
+        with self.run_connection(run_id) as conn:
+            return StepStatsTable.name in db.inspect(conn).get_table_names()
+
+    def store_asset(self, event, storage_id=None):
         check.inst_param(event, "event", EventLogEntry)
+        check.opt_int_param(storage_id, "storage_id")
         if not event.is_dagster_event or not event.dagster_event.asset_key:
             return
 
@@ -120,7 +176,8 @@ def store_asset(self, event):
         if event.dagster_event.is_asset_observation:
             self.store_asset_observation(event)
         elif event.dagster_event.is_step_materialization:
-            self.store_asset_materialization(event)
+            self.store_asset_materialization(event, storage_id)
+            self.store_asset_partition(event, storage_id)
 
     def store_asset_observation(self, event):
         # last_materialization_timestamp is updated upon observation or materialization
@@ -140,7 +197,7 @@ def store_asset_observation(self, event):
                 except db.exc.IntegrityError:
                     conn.execute(update_statement)
 
-    def store_asset_materialization(self, event):
+    def store_asset_materialization(self, event, storage_id=None):
         # We switched to storing the entire event record of the last materialization instead of just
         # the AssetMaterialization object, so that we have access to metadata like timestamp,
         # pipeline, run_id, etc.
@@ -157,6 +214,7 @@ def store_asset_materialization(self, event):
         # See store_asset method above for more details
         if self.has_asset_key_index_cols():
             materialization = event.dagster_event.step_materialization_data.materialization
+            materialization_values = self.get_asset_key_materialization_values(event, storage_id)
             insert_statement = (
                 AssetKeyTable.insert().values(  # pylint: disable=no-value-for-parameter
                     asset_key=event.dagster_event.asset_key.to_string(),
@@ -164,6 +222,7 @@ def store_asset_materialization(self, event):
                     last_materialization_timestamp=utc_datetime_from_timestamp(event.timestamp),
                     last_run_id=event.run_id,
                     tags=seven.json.dumps(materialization.tags) if materialization.tags else None,
+                    **materialization_values,
                 )
             )
             update_statement = (
@@ -173,6 +232,7 @@ def store_asset_materialization(self, event):
                     last_materialization_timestamp=utc_datetime_from_timestamp(event.timestamp),
                     last_run_id=event.run_id,
                     tags=seven.json.dumps(materialization.tags) if materialization.tags else None,
+                    **materialization_values,
                 )
                 .where(
                     AssetKeyTable.c.asset_key == event.dagster_event.asset_key.to_string(),
@@ -203,6 +263,94 @@ def store_asset_materialization(self, event):
             except db.exc.IntegrityError:
                 conn.execute(update_statement)
 
+    def get_asset_key_materialization_values(self, event, storage_id):
+        """Returns the values of the typed latest materialization columns of the asset_keys table
+        for a materialization event, or no values if the columns have not been migrated yet."""
+        if not self.has_secondary_index(ASSET_KEY_MATERIALIZATION_COLS):
+            return {}
+
+        return dict(
+            last_materialization_storage_id=storage_id,
+            # matches the representation of the timestamp in the event log
+            last_materialization_event_timestamp=datetime.utcfromtimestamp(event.timestamp),
+            last_materialization_partition=event.dagster_event.partition,
+        )
+
+    def store_asset_partition(self, event, storage_id=None):
+        """Folds a partitioned materialization into the summary row for its asset partition in the
+        asset_partitions table, so that partition status can be read without aggregating over the
+        event log of the asset.
+
+        Args:
+            event (EventLogEntry): The materialization event that was stored.
+            storage_id (Optional[int]): The id of the stored event.
+        """
+        check.inst_param(event, "event", EventLogEntry)
+        partition = event.dagster_event.partition
+        if not partition or not self.has_secondary_index(ASSET_PARTITIONS_TABLE):
+            return
+
+        asset_key_str = event.dagster_event.asset_key.to_string()
+        # matches the representation of the timestamp in the event log
+        timestamp = datetime.utcfromtimestamp(event.timestamp)
+        update_statement = (
+            AssetPartitionsTable.update()  # pylint: disable=no-value-for-parameter
+            .where(
+                db.and_(
+                    AssetPartitionsTable.c.asset_key == asset_key_str,
+                    AssetPartitionsTable.c.partition == partition,
+                )
+            )
+            .values(
+                materialization_count=AssetPartitionsTable.c.materialization_count + 1,
+                last_materialization_storage_id=storage_id,
+                last_materialization_timestamp=timestamp,
+                update_timestamp=pendulum.now("UTC"),
+            )
+        )
+
+        with self.index_connection() as conn:
+            if conn.execute(update_statement).rowcount:
+                return
+
+            try:
+                conn.execute(
+                    AssetPartitionsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        asset_key=asset_key_str,
+                        partition=partition,
+                        materialization_count=1,
+                        last_materialization_storage_id=storage_id,
+                        last_materialization_timestamp=timestamp,
+                    )
+                )
+            except db.exc.IntegrityError:
+                # the row was inserted by a concurrent writer for the same partition
+                conn.execute(update_statement)
+
+    def rebuild_asset_partitions(self, asset_key):
+        """Recomputes the asset_partitions rows of an asset from its materializations in the event
+        log, ignoring those from before the asset was last wiped. Used to backfill the
+        asset_partitions table for materializations that were stored before it was maintained."""
+        check.inst_param(asset_key, "asset_key", AssetKey)
+
+        summaries = self._get_asset_partition_summaries_from_events([asset_key])[asset_key]
+        with self.index_connection() as conn:
+            conn.execute(
+                AssetPartitionsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    AssetPartitionsTable.c.asset_key == asset_key.to_string()
+                )
+            )
+            for partition, (count, storage_id, timestamp) in summaries.items():
+                conn.execute(
+                    AssetPartitionsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        asset_key=asset_key.to_string(),
+                        partition=partition,
+                        materialization_count=count,
+                        last_materialization_storage_id=storage_id,
+                        last_materialization_timestamp=timestamp,
+                    )
+                )
+
     def store_event(self, event):
         """Store an event corresponding to a pipeline run.
 
@@ -214,7 +362,8 @@ def store_event(self, event):
         run_id = event.run_id
 
         with self.run_connection(run_id) as conn:
-            conn.execute(insert_event_statement)
+            result = conn.execute(insert_event_statement)
+            storage_id = result.inserted_primary_key[0]
 
         if (
             event.is_dagster_event
@@ -224,7 +373,148 @@ def store_event(self, event):
             )
             and event.dagster_event.asset_key
         ):
-            self.store_asset(event)
+            self.store_asset(event, storage_id)
+
+        self.store_step_stats(event)
+        self.store_run_stats(event)
+
+    def store_run_stats(self, event):
+        """Updates the counters and timestamps of the run stats row for the run of an event, so
+        that run stats can be read without aggregating over the event log of the run.
+
+        Args:
+            event (EventLogEntry): The event to fold into the stats of its run.
+        """
+        check.inst_param(event, "event", EventLogEntry)
+        if not event.is_dagster_event:
+            return
+
+        event_type = event.dagster_event.event_type
+        if event_type in RUN_STATS_COUNT_COLUMNS:
+            column_name = RUN_STATS_COUNT_COLUMNS[event_type]
+            update_value = RunStatsTable.c[column_name] + 1
+            insert_value = 1
+        elif event_type in RUN_STATS_TIME_COLUMNS:
+            column_name = RUN_STATS_TIME_COLUMNS[event_type]
+            update_value = insert_value = event.timestamp
+        else:
+            return
+
+        if not self.has_secondary_index(RUN_STATS_TABLE):
+            return
+
+        run_id = event.run_id
+        update_statement = (
+            RunStatsTable.update()  # pylint: disable=no-value-for-parameter
+            .where(RunStatsTable.c.run_id == run_id)
+            .values({column_name: update_value, "update_timestamp": pendulum.now("UTC")})
+        )
+        insert_values = _run_stats_row_values(_empty_run_stats(run_id))
+        insert_values[column_name] = insert_value
+
+        with self.index_connection() as conn:
+            if conn.execute(update_statement).rowcount:
+                return
+
+            try:
+                conn.execute(
+                    RunStatsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        run_id=run_id, **insert_values
+                    )
+                )
+            except db.exc.IntegrityError:
+                # the row was inserted by a concurrent writer for the same run
+                conn.execute(update_statement)
+
+    def rebuild_run_stats(self, run_id):
+        """Recomputes the run_stats row of a run from its event log. Used to backfill the run_stats
+        table for runs that were stored before it was maintained."""
+        check.str_param(run_id, "run_id")
+
+        stats = self._get_stats_from_events(run_id)
+        with self.index_connection() as conn:
+            conn.execute(
+                RunStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    RunStatsTable.c.run_id == run_id
+                )
+            )
+            conn.execute(
+                RunStatsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    run_id=run_id,
+                    **_run_stats_row_values(stats),
+                )
+            )
+
+    def store_step_stats(self, event):
+        """Folds a step-scoped event into the summary row for its step in the step_stats table, so
+        that step stats can be read without replaying the event log of the run.
+
+        Args:
+            event (EventLogEntry): The event to fold into the step stats of its step.
+        """
+        check.inst_param(event, "event", EventLogEntry)
+        if not is_step_stats_event(event) or not self.has_secondary_index(STEP_STATS_TABLE):
+            return
+
+        run_id = event.run_id
+        step_key = event.dagster_event.step_key
+
+        # Events for a step are written both by the process executing the step and by the
+        # orchestrator, so the row is updated with a single statement that folds the event into the
+        # stored values, rather than with a read-modify-write that could lose concurrent updates.
+        update_statement = (
+            StepStatsTable.update()  # pylint: disable=no-value-for-parameter
+            .where(StepStatsTable.c.run_id == run_id)
+            .where(StepStatsTable.c.step_key == step_key)
+            .values(update_timestamp=pendulum.now("UTC"), **_step_stats_update_values(event))
+        )
+
+        with self.run_connection(run_id) as conn:
+            if conn.execute(update_statement).rowcount:
+                return
+
+            accumulator = StepStatsAccumulator()
+            accumulator.apply(event)
+            try:
+                conn.execute(
+                    StepStatsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        run_id=run_id,
+                        step_key=step_key,
+                        intervals=_step_stats_interval_entries([event]),
+                        **_step_stats_row_values(accumulator),
+                    )
+                )
+            except db.exc.IntegrityError:
+                # the row was inserted by a concurrent writer for the same step
+                conn.execute(update_statement)
+
+    def rebuild_step_stats(self, run_id):
+        """Recomputes the step_stats rows of a run from its event log. Used to backfill the
+        step_stats table for runs that were stored before it was maintained."""
+        check.str_param(run_id, "run_id")
+
+        accumulators: Dict[str, StepStatsAccumulator] = defaultdict(StepStatsAccumulator)
+        events_by_step_key: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        for event in self._get_step_stats_events(run_id):
+            if is_step_stats_event(event):
+                accumulators[event.dagster_event.step_key].apply(event)
+                events_by_step_key[event.dagster_event.step_key].append(event)
+
+        with self.run_connection(run_id) as conn:
+            conn.execute(
+                StepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    StepStatsTable.c.run_id == run_id
+                )
+            )
+            for step_key, accumulator in accumulators.items():
+                conn.execute(
+                    StepStatsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        run_id=run_id,
+                        step_key=step_key,
+                        intervals=_step_stats_interval_entries(events_by_step_key[step_key]),
+                        **_step_stats_row_values(accumulator),
+                    )
+                )
 
     def get_logs_for_run_by_log_id(
         self,
@@ -318,6 +608,30 @@ def get_logs_for_run(
     def get_stats_for_run(self, run_id):
         check.str_param(run_id, "run_id")
 
+        if self.has_secondary_index(RUN_STATS_TABLE):
+            return self.get_stats_for_runs([run_id])[run_id]
+
+        return self._get_stats_from_events(run_id)
+
+    def get_stats_for_runs(self, run_ids):
+        check.list_param(run_ids, "run_ids", of_type=str)
+
+        if not self.has_secondary_index(RUN_STATS_TABLE):
+            return super(SqlEventLogStorage, self).get_stats_for_runs(run_ids)
+
+        if not run_ids:
+            return {}
+
+        with self.index_connection() as conn:
+            rows = conn.execute(
+                db.select([RunStatsTable]).where(RunStatsTable.c.run_id.in_(run_ids))
+            ).fetchall()
+
+        stats_by_run_id = {row["run_id"]: _run_stats_from_row(row) for row in rows}
+        # runs without any stats events have no row in the run_stats table
+        return {run_id: stats_by_run_id.get(run_id, _empty_run_stats(run_id)) for run_id in run_ids}
+
+    def _get_stats_from_events(self, run_id):
         query = (
             db.select(
                 [
@@ -376,36 +690,26 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
-        # Originally, this was two different queries:
-        # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
-        #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
-        # 2) one query which fetched all the raw events for a specific event type and then inspected
-        #    the deserialized event object to aggregate stats derived from sequences of events.
-        #    (e.g. marker events, materializations, expectations resuls, attempts timing, etc.)
-        #
-        # For simplicity, we now just do the second type of query and derive the stats in Python
-        # from the raw events.  This has the benefit of being easier to read and also the benefit of
-        # being able to share code with the in-memory event log storage implementation.  We may
-        # choose to revisit this in the future, especially if we are able to do JSON-column queries
-        # in SQL as a way of bypassing the serdes layer in all cases.
+        if self.has_secondary_index(STEP_STATS_TABLE):
+            return self._get_step_stats_from_table(run_id, step_keys)
+
+        # Without the step_stats table, we fetch all the step-scoped events for the run and derive
+        # the stats in Python from the raw events.  This has the benefit of being able to share
+        # code with the in-memory event log storage implementation, but requires deserializing
+        # every step event of the run.
+        return build_run_step_stats_from_events(
+            run_id, self._get_step_stats_events(run_id, step_keys)
+        )
+
+    def _get_step_stats_events(self, run_id, step_keys=None, event_types=None):
+        event_types = event_types or STEP_STATS_EVENT_TYPES
         raw_event_query = (
             db.select([SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .where(SqlEventLogStorageTable.c.step_key != None)
             .where(
                 SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_START.value,
-                        DagsterEventType.STEP_SUCCESS.value,
-                        DagsterEventType.STEP_SKIPPED.value,
-                        DagsterEventType.STEP_FAILURE.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.ASSET_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.STEP_UP_FOR_RETRY.value,
-                        DagsterEventType.ENGINE_EVENT.value,
-                    ]
+                    [event_type.value for event_type in event_types]
                 )
             )
             .order_by(SqlEventLogStorageTable.c.id.asc())
@@ -419,16 +723,84 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
             results = conn.execute(raw_event_query).fetchall()
 
         try:
-            records = [
+            return [
                 check.inst_param(
                     deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
                 )
                 for (json_str,) in results
             ]
-            return build_run_step_stats_from_events(run_id, records)
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+    def _get_step_stats_from_table(self, run_id, step_keys=None):
+        query = (
+            db.select([StepStatsTable])
+            .where(StepStatsTable.c.run_id == run_id)
+            .order_by(StepStatsTable.c.id.asc())
+        )
+        if step_keys:
+            query = query.where(StepStatsTable.c.step_key.in_(step_keys))
+
+        with self.run_connection(run_id) as conn:
+            rows = conn.execute(query).fetchall()
+
+        try:
+            accumulators = OrderedDict(
+                (row["step_key"], _step_stats_accumulator_from_row(row)) for row in rows
+            )
+        except seven.JSONDecodeError as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        accumulators = OrderedDict(
+            (step_key, accumulator)
+            for step_key, accumulator in accumulators.items()
+            if accumulator.has_stats
+        )
+
+        # materialization events and expectation results are only counted in the step_stats
+        # table, so fetch just those events for the steps that produced any
+        materialization_events: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        expectation_results = defaultdict(list)
+        step_keys_with_events = [
+            step_key
+            for step_key, accumulator in accumulators.items()
+            if accumulator.materialization_count or accumulator.expectation_count
+        ]
+        if step_keys_with_events:
+            for event in self._get_step_stats_events(
+                run_id,
+                step_keys_with_events,
+                event_types=[
+                    DagsterEventType.ASSET_MATERIALIZATION,
+                    DagsterEventType.STEP_EXPECTATION_RESULT,
+                ],
+            ):
+                dagster_event = event.dagster_event
+                if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                    materialization_events[dagster_event.step_key].append(event)
+                else:
+                    expectation_results[dagster_event.step_key].append(
+                        dagster_event.event_specific_data.expectation_result
+                    )
+
+        return [
+            accumulator.to_snapshot(
+                run_id,
+                step_key,
+                materialization_events=materialization_events[step_key],
+                expectation_results=expectation_results[step_key],
+            )
+            for step_key, accumulator in accumulators.items()
+        ]
+
+    def get_all_run_ids(self):
+        """Returns the ids of all runs with events in the event log storage."""
+        with self.index_connection() as conn:
+            results = conn.execute(
+                db.select([SqlEventLogStorageTable.c.run_id]).distinct()
+            ).fetchall()
+        return [run_id for (run_id,) in results if run_id]
+
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
             if not force:
@@ -466,18 +838,86 @@ def wipe(self):
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
 
+        if self.has_secondary_index(STEP_STATS_TABLE):
+            with self.run_connection(run_id=None) as conn:
+                conn.execute(StepStatsTable.delete())  # pylint: disable=no-value-for-parameter
+
+        if self.has_secondary_index(RUN_STATS_TABLE):
+            with self.index_connection() as conn:
+                conn.execute(RunStatsTable.delete())  # pylint: disable=no-value-for-parameter
+
+        if self.has_secondary_index(ASSET_PARTITIONS_TABLE):
+            with self.index_connection() as conn:
+                conn.execute(
+                    AssetPartitionsTable.delete()  # pylint: disable=no-value-for-parameter
+                )
+
     def delete_events(self, run_id):
+        asset_keys = self.get_partitioned_asset_keys_for_run(run_id)
+
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
 
-    def delete_events_for_run(self, conn, run_id):
+        self.delete_step_stats_for_run(run_id)
+        self.delete_run_stats_for_run(run_id)
+        for asset_key in asset_keys:
+            self.rebuild_asset_partitions(asset_key)
+
+    def get_partitioned_asset_keys_for_run(self, run_id):
+        """Returns the keys of the assets with partitioned materializations in the given run, whose
+        asset_partitions rows must be rebuilt when the events of the run are deleted."""
         check.str_param(run_id, "run_id")
 
-        delete_statement = (
-            SqlEventLogStorageTable.delete().where(  # pylint: disable=no-value-for-parameter
-                SqlEventLogStorageTable.c.run_id == run_id
+        if not self.has_secondary_index(ASSET_PARTITIONS_TABLE):
+            return []
+
+        query = (
+            db.select([SqlEventLogStorageTable.c.asset_key])
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id == run_id,
+                    SqlEventLogStorageTable.c.partition != None,
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                )
             )
+            .distinct()
         )
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        asset_keys = {AssetKey.from_db_string(asset_key_str) for (asset_key_str,) in results}
+        return [asset_key for asset_key in asset_keys if asset_key]
+
+    def delete_run_stats_for_run(self, run_id):
+        check.str_param(run_id, "run_id")
+
+        if not self.has_secondary_index(RUN_STATS_TABLE):
+            return
+
+        with self.index_connection() as conn:
+            conn.execute(
+                RunStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    RunStatsTable.c.run_id == run_id
+                )
+            )
+
+    def delete_step_stats_for_run(self, run_id):
+        check.str_param(run_id, "run_id")
+
+        if not self.has_secondary_index(STEP_STATS_TABLE):
+            return
+
+        with self.run_connection(run_id) as conn:
+            conn.execute(
+                StepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    StepStatsTable.c.run_id == run_id
+                )
+            )
+
+    def delete_events_for_run(self, conn, run_id):
+        check.str_param(run_id, "run_id")
+
         removed_asset_key_query = (
             db.select([SqlEventLogStorageTable.c.asset_key])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
@@ -489,7 +929,7 @@ def delete_events_for_run(self, conn, run_id):
             AssetKey.from_db_string(row[0])
             for row in conn.execute(removed_asset_key_query).fetchall()
         ]
-        conn.execute(delete_statement)
+        self._delete_events_in_batches(conn, SqlEventLogStorageTable.c.run_id == run_id)
         if len(removed_asset_keys) > 0:
             keys_to_check = []
             keys_to_check.extend([key.to_string() for key in removed_asset_keys])
@@ -513,6 +953,90 @@ def delete_events_for_run(self, conn, run_id):
                     )
                 )
 
+    def _delete_events_in_batches(self, conn, condition):
+        # deletes the events matching the condition a batch at a time, so that no statement holds
+        # its locks for long
+        select_batch_query = (
+            db.select([SqlEventLogStorageTable.c.id])
+            .where(condition)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+            .limit(DELETE_EVENTS_BATCH_SIZE)
+        )
+        while True:
+            storage_ids = [row[0] for row in conn.execute(select_batch_query).fetchall()]
+            if storage_ids:
+                conn.execute(
+                    SqlEventLogStorageTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        SqlEventLogStorageTable.c.id.in_(storage_ids)
+                    )
+                )
+            if len(storage_ids) < DELETE_EVENTS_BATCH_SIZE:
+                return
+
+    def prune_events(
+        self, before_timestamp, batch_size=DEFAULT_PRUNE_EVENTS_BATCH_SIZE, max_batches=None
+    ):
+        check.float_param(before_timestamp, "before_timestamp")
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be greater than 0")
+        check.opt_int_param(max_batches, "max_batches")
+
+        return self.prune_events_for_connection(
+            self.index_connection, before_timestamp, batch_size, max_batches
+        )
+
+    def prune_events_for_connection(self, connect, before_timestamp, batch_size, max_batches=None):
+        """Deletes the events stored before the given timestamp from the event log table reachable
+        through the given connection factory.
+
+        The events are deleted in batches of at most batch_size events, each selected through the
+        timestamp index and deleted in its own transaction, so that no long-running lock is held.
+        The events that the asset index points at as the latest materialization of an asset are
+        kept. If max_batches is set, at most that many batches are deleted, and the remaining events
+        are left for a later call.
+        """
+        before_datetime = datetime.utcfromtimestamp(before_timestamp)
+
+        select_batch_query = (
+            db.select([SqlEventLogStorageTable.c.id])
+            .where(SqlEventLogStorageTable.c.timestamp < before_datetime)
+            .order_by(SqlEventLogStorageTable.c.timestamp.asc(), SqlEventLogStorageTable.c.id.asc())
+            .limit(batch_size)
+        )
+        if self.has_secondary_index(ASSET_KEY_MATERIALIZATION_COLS):
+            select_batch_query = select_batch_query.where(
+                SqlEventLogStorageTable.c.id.notin_(
+                    db.select([AssetKeyTable.c.last_materialization_storage_id]).where(
+                        AssetKeyTable.c.last_materialization_storage_id != None
+                    )
+                )
+            )
+
+        deleted_count = 0
+        batch_count = 0
+        while max_batches is None or batch_count < max_batches:
+            with connect() as conn:
+                storage_ids = [row[0] for row in conn.execute(select_batch_query).fetchall()]
+                # bound in slices, since sqlite limits the number of bound parameters of a statement
+                for i in range(0, len(storage_ids), DELETE_EVENTS_BATCH_SIZE):
+                    deleted_count += conn.execute(
+                        SqlEventLogStorageTable.delete().where(  # pylint: disable=no-value-for-parameter
+                            SqlEventLogStorageTable.c.id.in_(
+                                storage_ids[i : i + DELETE_EVENTS_BATCH_SIZE]
+                            )
+                        )
+                    ).rowcount
+
+            batch_count += 1
+            if len(storage_ids) < batch_size:
+                break
+
+        return deleted_count
+
+    @property
+    def supports_prune_events(self):
+        return True
+
     @property
     def is_persistent(self):
         return True
@@ -737,10 +1261,133 @@ def get_asset_keys(
         asset_keys = [AssetKey.from_db_string(row[0]) for row in sorted(rows, key=lambda x: x[0])]
         return [asset_key for asset_key in asset_keys if asset_key]
 
+    def get_latest_materialization_summaries(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Optional[AssetMaterializationSummary]]:
+        check.list_param(asset_keys, "asset_keys", AssetKey)
+
+        if not self.has_secondary_index(ASSET_KEY_MATERIALIZATION_COLS):
+            return super().get_latest_materialization_summaries(asset_keys)
+
+        query = db.select(
+            [
+                AssetKeyTable.c.asset_key,
+                AssetKeyTable.c.last_materialization_storage_id,
+                AssetKeyTable.c.last_materialization_event_timestamp,
+                AssetKeyTable.c.last_run_id,
+                AssetKeyTable.c.last_materialization_partition,
+                AssetKeyTable.c.wipe_timestamp,
+            ]
+        ).where(
+            db.and_(
+                AssetKeyTable.c.asset_key.in_([asset_key.to_string() for asset_key in asset_keys]),
+                AssetKeyTable.c.last_materialization_event_timestamp != None,
+            )
+        )
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        results: Dict[AssetKey, Optional[AssetMaterializationSummary]] = {}
+        for asset_key_str, storage_id, timestamp, run_id, partition, wipe_timestamp in rows:
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if not asset_key:
+                continue
+            timestamp = utc_datetime_from_naive(timestamp)
+            if wipe_timestamp and timestamp <= utc_datetime_from_naive(wipe_timestamp):
+                # the asset has not been materialized since being wiped
+                continue
+            results[asset_key] = AssetMaterializationSummary(
+                asset_key=asset_key,
+                storage_id=storage_id,
+                timestamp=timestamp.timestamp(),
+                run_id=run_id,
+                partition=partition,
+            )
+
+        return results
+
     def get_latest_materialization_events(
         self, asset_keys: Sequence[AssetKey]
     ) -> Mapping[AssetKey, Optional[EventLogEntry]]:
         check.list_param(asset_keys, "asset_keys", AssetKey)
+
+        if self.has_secondary_index(ASSET_KEY_MATERIALIZATION_COLS):
+            # look up the events by storage id, instead of deserializing the last materialization
+            # stored in the asset_keys table or joining against the event log by timestamp
+            summaries = self.get_latest_materialization_summaries(asset_keys)
+            events_by_storage_id = self._get_events_by_storage_id(
+                [summary.storage_id for summary in summaries.values() if summary.storage_id]
+            )
+            results = {
+                asset_key: events_by_storage_id[summary.storage_id]
+                for asset_key, summary in summaries.items()
+                if summary.storage_id in events_by_storage_id
+            }
+
+            # the latest materialization of an asset may have been deleted since it was stored, in
+            # which case the latest remaining one since the asset was last wiped is looked up from
+            # the event log
+            deleted_asset_keys = [
+                asset_key
+                for asset_key, summary in summaries.items()
+                if summary.storage_id is not None and asset_key not in results
+            ]
+            if deleted_asset_keys:
+                results.update(self._get_latest_materialization_events_by_id(deleted_asset_keys))
+
+            # materializations stored without a storage id are looked up from the asset rows
+            asset_keys = [
+                asset_key for asset_key, summary in summaries.items() if summary.storage_id is None
+            ]
+            if not asset_keys:
+                return results
+            results.update(self._get_latest_materialization_events_from_asset_rows(asset_keys))
+            return results
+
+        return self._get_latest_materialization_events_from_asset_rows(asset_keys)
+
+    def _get_latest_materialization_events_by_id(self, asset_keys):
+        # materializations stored under the legacy string of an asset key and from before the asset
+        # was last wiped are included and excluded, as in the asset-scoped event queries
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    db.func.max(SqlEventLogStorageTable.c.id).label("id"),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key.in_(
+                        [asset_key.to_string() for asset_key in asset_keys]
+                        + [asset_key.to_string(legacy=True) for asset_key in asset_keys]
+                    ),
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.asset_key)
+        )
+        query = self._add_assets_wipe_filter_to_query(
+            query, self._get_assets_details(asset_keys), asset_keys
+        )
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        latest_storage_ids: Dict[AssetKey, int] = {}
+        for asset_key_str, storage_id in rows:
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if asset_key and storage_id > latest_storage_ids.get(asset_key, -1):
+                latest_storage_ids[asset_key] = storage_id
+
+        events_by_storage_id = self._get_events_by_storage_id(list(latest_storage_ids.values()))
+        return {
+            asset_key: events_by_storage_id[storage_id]
+            for asset_key, storage_id in latest_storage_ids.items()
+            if storage_id in events_by_storage_id
+        }
+
+    def _get_latest_materialization_events_from_asset_rows(self, asset_keys):
         rows = self._fetch_asset_rows(asset_keys=asset_keys)
         to_backcompat_fetch = set()
         results: Dict[AssetKey, Optional[EventLogEntry]] = {}
@@ -799,6 +1446,23 @@ def get_latest_materialization_events(
 
         return results
 
+    def _get_events_by_storage_id(self, storage_ids):
+        if not storage_ids:
+            return {}
+
+        query = db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]).where(
+            SqlEventLogStorageTable.c.id.in_(storage_ids)
+        )
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        events_by_storage_id = {}
+        for storage_id, json_str in rows:
+            event = deserialize_json_to_dagster_namedtuple(json_str)
+            if isinstance(event, EventLogEntry):
+                events_by_storage_id[storage_id] = event
+        return events_by_storage_id
+
     def _fetch_asset_rows(self, asset_keys=None, prefix=None, limit=None, cursor=None):
         # fetches rows containing asset_key, last_materialization, and asset_details from the DB,
         # applying the filters specified in the arguments.
@@ -1157,17 +1821,63 @@ def wipe_asset(self, asset_key):
                     )
                 )
 
+        if self.has_secondary_index(ASSET_PARTITIONS_TABLE):
+            with self.index_connection() as conn:
+                conn.execute(
+                    AssetPartitionsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        AssetPartitionsTable.c.asset_key == asset_key.to_string()
+                    )
+                )
+
     def get_materialization_count_by_partition(
         self, asset_keys: Sequence[AssetKey]
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         check.list_param(asset_keys, "asset_keys", AssetKey)
 
+        if not self.has_secondary_index(ASSET_PARTITIONS_TABLE):
+            return {
+                asset_key: {partition: count for partition, (count, _, _) in summaries.items()}
+                for asset_key, summaries in self._get_asset_partition_summaries_from_events(
+                    asset_keys
+                ).items()
+            }
+
+        query = db.select(
+            [
+                AssetPartitionsTable.c.asset_key,
+                AssetPartitionsTable.c.partition,
+                AssetPartitionsTable.c.materialization_count,
+            ]
+        ).where(
+            AssetPartitionsTable.c.asset_key.in_(
+                [asset_key.to_string() for asset_key in asset_keys]
+            )
+        )
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        materialization_count_by_partition: Dict[AssetKey, Dict[str, int]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for asset_key_str, partition, count in results:
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if asset_key:
+                materialization_count_by_partition[asset_key][partition] = count
+
+        return materialization_count_by_partition
+
+    def _get_asset_partition_summaries_from_events(self, asset_keys):
+        """Aggregates the materializations of the given assets in the event log by partition into
+        a (count, last storage id, last timestamp) tuple, ignoring materializations from before
+        each asset was last wiped."""
         query = (
             db.select(
                 [
                     SqlEventLogStorageTable.c.asset_key,
                     SqlEventLogStorageTable.c.partition,
                     db.func.count(SqlEventLogStorageTable.c.id),
+                    db.func.max(SqlEventLogStorageTable.c.id),
+                    db.func.max(SqlEventLogStorageTable.c.timestamp),
                 ]
             )
             .where(
@@ -1181,6 +1891,8 @@ def get_materialization_count_by_partition(
                         ),
                     ),
                     SqlEventLogStorageTable.c.partition != None,
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
                 )
             )
             .group_by(SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition)
@@ -1192,15 +1904,23 @@ def get_materialization_count_by_partition(
         with self.index_connection() as conn:
             results = conn.execute(query).fetchall()
 
-        materialization_count_by_partition: Dict[AssetKey, Dict[str, int]] = {
+        summaries_by_asset_key: Dict[AssetKey, Dict[str, tuple]] = {
             asset_key: {} for asset_key in asset_keys
         }
-        for row in results:
-            asset_key = AssetKey.from_db_string(row[0])
-            if asset_key:
-                materialization_count_by_partition[asset_key][row[1]] = row[2]
+        for asset_key_str, partition, count, storage_id, timestamp in results:
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if asset_key not in summaries_by_asset_key:
+                continue
+            # rows stored under the legacy and current representation of an asset key are merged
+            summaries = summaries_by_asset_key[asset_key]
+            if partition in summaries:
+                prev_count, prev_storage_id, prev_timestamp = summaries[partition]
+                count += prev_count
+                storage_id = max(storage_id, prev_storage_id)
+                timestamp = max(timestamp, prev_timestamp)
+            summaries[partition] = (count, storage_id, timestamp)
 
-        return materialization_count_by_partition
+        return summaries_by_asset_key
 
 
 def _get_from_row(row, column):
@@ -1209,3 +1929,139 @@ def _get_from_row(row, column):
     if not row.has_key(column):
         return None
     return row[column]
+
+
+def _empty_run_stats(run_id):
+    return PipelineRunStatsSnapshot(
+        run_id=run_id,
+        steps_succeeded=0,
+        steps_failed=0,
+        materializations=0,
+        expectations=0,
+        enqueued_time=None,
+        launch_time=None,
+        start_time=None,
+        end_time=None,
+    )
+
+
+def _run_stats_from_row(row):
+    return PipelineRunStatsSnapshot(
+        run_id=row["run_id"],
+        steps_succeeded=row["steps_succeeded"],
+        steps_failed=row["steps_failed"],
+        materializations=row["materializations"],
+        expectations=row["expectations"],
+        enqueued_time=row["enqueued_time"],
+        launch_time=row["launch_time"],
+        start_time=row["start_time"],
+        end_time=row["end_time"],
+    )
+
+
+def _run_stats_row_values(stats):
+    return dict(
+        steps_succeeded=stats.steps_succeeded,
+        steps_failed=stats.steps_failed,
+        materializations=stats.materializations,
+        expectations=stats.expectations,
+        enqueued_time=stats.enqueued_time,
+        launch_time=stats.launch_time,
+        start_time=stats.start_time,
+        end_time=stats.end_time,
+    )
+
+
+def _step_stats_interval_entries(events):
+    """Serializes the parts of step stats events that are kept as attempt and marker intervals, as
+    lines of an append-only log that is replayed when the row is read. Appending to the log lets
+    each event be folded into the row with a single update statement."""
+    lines = []
+    for event in events:
+        dagster_event = event.dagster_event
+        event_type = dagster_event.event_type
+        if event_type == DagsterEventType.STEP_START:
+            # replayed so that the attempts before a later start keep their own start time
+            lines.append(["start", event.timestamp])
+        elif event_type == DagsterEventType.STEP_RESTARTED:
+            lines.append(["restart", event.timestamp])
+        elif event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+            lines.append(["retry", event.timestamp])
+        elif event_type == DagsterEventType.ENGINE_EVENT:
+            if dagster_event.engine_event_data.marker_start:
+                lines.append(
+                    ["marker_start", dagster_event.engine_event_data.marker_start, event.timestamp]
+                )
+            if dagster_event.engine_event_data.marker_end:
+                lines.append(
+                    ["marker_end", dagster_event.engine_event_data.marker_end, event.timestamp]
+                )
+
+    if not lines:
+        return None
+
+    return "".join(seven.json.dumps(line) + "\n" for line in lines)
+
+
+def _step_stats_update_values(event):
+    """The column values that fold a step stats event into an existing step_stats row."""
+    event_type = event.dagster_event.event_type
+    values = {}
+    if event_type == DagsterEventType.STEP_START:
+        values["start_time"] = event.timestamp
+        values["attempts"] = 1
+    elif event_type == DagsterEventType.STEP_RESTARTED:
+        values["attempts"] = db.func.coalesce(StepStatsTable.c.attempts, 0) + 1
+    elif event_type in STEP_STATS_END_STATUSES:
+        values["end_time"] = event.timestamp
+        values["status"] = STEP_STATS_END_STATUSES[event_type].value
+    elif event_type == DagsterEventType.ASSET_MATERIALIZATION:
+        values["materialization_count"] = StepStatsTable.c.materialization_count + 1
+    elif event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+        values["expectation_count"] = StepStatsTable.c.expectation_count + 1
+
+    interval_entries = _step_stats_interval_entries([event])
+    if interval_entries:
+        values["intervals"] = db.func.coalesce(StepStatsTable.c.intervals, "").concat(
+            interval_entries
+        )
+
+    return values
+
+
+def _step_stats_accumulator_from_row(row):
+    accumulator = StepStatsAccumulator(
+        status=StepEventStatus(row["status"]) if row["status"] else None,
+        start_time=row["start_time"],
+        end_time=row["end_time"],
+        attempts=row["attempts"],
+        materialization_count=row["materialization_count"],
+        expectation_count=row["expectation_count"],
+    )
+
+    for line in (row["intervals"] or "").splitlines():
+        entry = seven.json.loads(line)
+        if entry[0] == "start":
+            accumulator.start_time = entry[1]
+            accumulator.last_restart_time = None
+        elif entry[0] == "restart":
+            accumulator.last_restart_time = entry[1]
+        elif entry[0] == "retry":
+            accumulator.add_retried_attempt(entry[1])
+        elif entry[0] == "marker_start":
+            accumulator.start_marker(entry[1], entry[2])
+        elif entry[0] == "marker_end":
+            accumulator.end_marker(entry[1], entry[2])
+
+    return accumulator
+
+
+def _step_stats_row_values(accumulator):
+    return dict(
+        status=accumulator.status.value if accumulator.status else None,
+        start_time=accumulator.start_time,
+        end_time=accumulator.end_time,
+        attempts=accumulator.attempts,
+        materialization_count=accumulator.materialization_count,
+        expectation_count=accumulator.expectation_count,
+    )
@@ -0,0 +1,22 @@
+"""add asset partitions table
+
+Revision ID: 0e2b06191bc2
+Revises: 666994e33225
+Create Date: 2026-10-19 14:02:41.517203
+
+"""
+from dagster.core.storage.migration.utils import create_asset_partitions_table
+
+# revision identifiers, used by Alembic.
+revision = "0e2b06191bc2"
+down_revision = "666994e33225"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_asset_partitions_table()
+
+
+def downgrade():
+    pass
@@ -0,0 +1,22 @@
+"""add event log timestamp idx
+
+Revision ID: 18fded346c84
+Revises: 642116ca1136
+Create Date: 2026-10-19 18:02:41.519347
+
+"""
+from dagster.core.storage.migration.utils import create_event_log_timestamp_idx
+
+# revision identifiers, used by Alembic.
+revision = "18fded346c84"
+down_revision = "642116ca1136"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_event_log_timestamp_idx()
+
+
+def downgrade():
+    pass
@@ -0,0 +1,22 @@
+"""add run stats table
+
+Revision ID: 3f523c6adf1b
+Revises: 8284269c54f2
+Create Date: 2026-10-19 11:36:58.657467
+
+"""
+from dagster.core.storage.migration.utils import create_run_stats_table
+
+# revision identifiers, used by Alembic.
+revision = "3f523c6adf1b"
+down_revision = "8284269c54f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_run_stats_table()
+
+
+def downgrade():
+    pass
@@ -0,0 +1,22 @@
+"""add asset key materialization columns
+
+Revision ID: 642116ca1136
+Revises: 0e2b06191bc2
+Create Date: 2026-10-19 15:21:09.804412
+
+"""
+from dagster.core.storage.migration.utils import add_asset_key_materialization_columns
+
+# revision identifiers, used by Alembic.
+revision = "642116ca1136"
+down_revision = "0e2b06191bc2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_asset_key_materialization_columns()
+
+
+def downgrade():
+    pass
@@ -0,0 +1,32 @@
+"""add cross run event index table
+
+Revision ID: 666994e33225
+Revises: 3f523c6adf1b
+Create Date: 2026-10-19 11:56:17.238755
+
+"""
+# pylint: disable=no-member
+# alembic dynamically populates the alembic.context module
+
+from alembic import context
+
+from dagster.core.storage.event_log.sqlite.sqlite_event_log import INDEX_SHARD_NAME
+from dagster.core.storage.migration.utils import create_cross_run_event_index_table
+
+# revision identifiers, used by Alembic.
+revision = "666994e33225"
+down_revision = "3f523c6adf1b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # the cross-run index only lives in the index shard, not in the run shards
+    if context.config.attributes.get("run_id") != INDEX_SHARD_NAME:
+        return
+
+    create_cross_run_event_index_table()
+
+
+def downgrade():
+    pass
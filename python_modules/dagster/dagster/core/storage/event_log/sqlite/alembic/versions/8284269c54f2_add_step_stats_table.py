@@ -0,0 +1,22 @@
+"""add step stats table
+
+Revision ID: 8284269c54f2
+Revises: 05844c702676
+Create Date: 2026-10-19 10:55:05.906025
+
+"""
+from dagster.core.storage.migration.utils import create_step_stats_table
+
+# revision identifiers, used by Alembic.
+revision = "8284269c54f2"
+down_revision = "05844c702676"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_step_stats_table()
+
+
+def downgrade():
+    pass
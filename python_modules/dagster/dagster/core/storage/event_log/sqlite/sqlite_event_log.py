@@ -7,19 +7,25 @@
 import warnings
 from collections import defaultdict
 from contextlib import contextmanager
+from datetime import datetime
 from typing import Iterable, Optional
 
 import sqlalchemy as db
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, StaticPool
 from tqdm import tqdm
 from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 
 from dagster import check, seven
 from dagster.config.source import StringSource
-from dagster.core.events import DagsterEventType
+from dagster.core.errors import DagsterEventLogInvalidForRun
+from dagster.core.events import EVENT_TYPE_TO_PIPELINE_RUN_STATUS, DagsterEventType
 from dagster.core.events.log import EventLogEntry
-from dagster.core.storage.event_log.base import EventLogRecord, EventRecordsFilter
+from dagster.core.storage.event_log.base import (
+    DEFAULT_PRUNE_EVENTS_BATCH_SIZE,
+    EventLogRecord,
+    EventRecordsFilter,
+)
 from dagster.core.storage.pipeline_run import PipelineRunStatus, RunsFilter
 from dagster.core.storage.sql import (
     check_alembic_revision,
@@ -35,13 +41,48 @@
     ConfigurableClassData,
     deserialize_json_to_dagster_namedtuple,
 )
+from dagster.serdes.errors import DeserializationError
 from dagster.utils import mkdir_p
+from dagster.utils.cache import LRUCache
 
-from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from ..migration import (
+    CROSS_RUN_EVENT_INDEX_TABLE,
+    SQLITE_EVENT_LOG_DATA_MIGRATIONS,
+    STEP_STATS_TABLE,
+)
+from ..schema import (
+    CrossRunEventIndexTable,
+    SqlEventLogStorageMetadata,
+    SqlEventLogStorageTable,
+    SqliteEventLogIndexShardMetadata,
+)
 from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
 
 INDEX_SHARD_NAME = "index"
 
+# The maximum number of shard engines (and their open connections) to keep around. Engines for
+# shards that have not been connected to recently are disposed, which closes their database files.
+MAX_CACHED_SHARD_ENGINES = 32
+
+# Event types that are mirrored into the cross-run event index of the index shard, so that
+# cross-run queries for them (e.g. from run status sensors) do not need to open every run shard
+CROSS_RUN_INDEXED_EVENT_TYPES = set(EVENT_TYPE_TO_PIPELINE_RUN_STATUS.keys())
+
+# The values of the event types that end a run, after which its shard is no longer written to
+RUN_END_EVENT_TYPES = {
+    DagsterEventType.RUN_SUCCESS.value,
+    DagsterEventType.RUN_FAILURE.value,
+    DagsterEventType.RUN_CANCELED.value,
+}
+
+# The maximum number of values bound in a single IN clause. Longer lists are split into chunks, since
+# sqlite limits the number of bound parameters of a statement (to 999 before sqlite 3.32).
+MAX_IN_CLAUSE_VALUES = 500
+
+# How long a watchdog waits after a modification of a run shard before reading new events, so that
+# a burst of writes is picked up with a single read
+WATCHDOG_DEBOUNCE_SECONDS = 0.05
+
 
 class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """SQLite-backed event log storage.
@@ -86,10 +127,18 @@ def __init__(self, base_dir, inst_data=None):
         # Ensure that multiple threads (like the event log watcher) interact safely with each other
         self._db_lock = threading.Lock()
 
+        # Engines for recently used shards, each holding a single open connection that is reused
+        # across calls to _connect, so that writing an event does not open the database file anew
+        self._shard_engines = LRUCache(
+            MAX_CACHED_SHARD_ENGINES, on_evict=lambda _shard, engine: engine.dispose()
+        )
+
+        self._secondary_index_cache = {}
+
         if not os.path.exists(self.path_for_shard(INDEX_SHARD_NAME)):
             conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
             engine = create_engine(conn_string, poolclass=NullPool)
-            self._initdb(engine)
+            self._initdb(engine, is_index_shard=True)
             self.reindex_events()
             self.reindex_assets()
 
@@ -103,13 +152,20 @@ def upgrade(self):
         alembic_config = get_alembic_config(__file__)
         if all_run_ids:
             for run_id in tqdm(all_run_ids):
+                has_step_stats_table = self.has_step_stats_table(run_id)
                 with self.run_connection(run_id) as conn:
                     run_alembic_upgrade(alembic_config, conn, run_id)
 
+                # backfill the step stats of shards that predate the step stats table
+                if not has_step_stats_table and self.has_secondary_index(STEP_STATS_TABLE):
+                    self.rebuild_step_stats(run_id)
+
         print("Updating event log storage for index db on disk...")  # pylint: disable=print-call
         with self.index_connection() as conn:
-            run_alembic_upgrade(alembic_config, conn, "index")
+            run_alembic_upgrade(alembic_config, conn, INDEX_SHARD_NAME)
 
+        with self._db_lock:
+            self._dispose_shard_engines()
         self._initialized_dbs = set()
 
     @property
@@ -124,6 +180,23 @@ def config_type(cls):
     def from_config_value(inst_data, config_value):
         return SqliteEventLogStorage(inst_data=inst_data, **config_value)
 
+    def has_secondary_index(self, name):
+        if name not in self._secondary_index_cache:
+            self._secondary_index_cache[name] = super(
+                SqliteEventLogStorage, self
+            ).has_secondary_index(name)
+        return self._secondary_index_cache[name]
+
+    def enable_secondary_index(self, name):
+        super(SqliteEventLogStorage, self).enable_secondary_index(name)
+        if name in self._secondary_index_cache:
+            del self._secondary_index_cache[name]
+
+    def reindex_events(self, print_fn=None, force=False):
+        super(SqliteEventLogStorage, self).reindex_events(print_fn, force)
+        for migration_name, migration_fn in SQLITE_EVENT_LOG_DATA_MIGRATIONS.items():
+            self._apply_migration(migration_name, migration_fn, print_fn, force)
+
     def get_all_run_ids(self):
         all_filenames = glob.glob(os.path.join(self._base_dir, "*.db"))
         return [
@@ -139,7 +212,7 @@ def conn_string_for_shard(self, shard_name):
         check.str_param(shard_name, "shard_name")
         return create_db_conn_string(self._base_dir, shard_name)
 
-    def _initdb(self, engine):
+    def _initdb(self, engine, is_index_shard=False):
         alembic_config = get_alembic_config(__file__)
 
         retry_limit = 10
@@ -152,6 +225,8 @@ def _initdb(self, engine):
 
                     if not (db_revision and head_revision):
                         SqlEventLogStorageMetadata.create_all(engine)
+                        if is_index_shard:
+                            SqliteEventLogIndexShardMetadata.create_all(engine)
                         engine.execute("PRAGMA journal_mode=WAL;")
                         stamp_alembic_rev(alembic_config, connection)
 
@@ -167,6 +242,10 @@ def _initdb(self, engine):
                     "table asset_keys already exists" in err_msg
                     or "table secondary_indexes already exists" in err_msg
                     or "table event_logs already exists" in err_msg
+                    or "table step_stats already exists" in err_msg
+                    or "table run_stats already exists" in err_msg
+                    or "table cross_run_event_index already exists" in err_msg
+                    or "table asset_partitions already exists" in err_msg
                     or "database is locked" in err_msg
                     or "table alembic_version already exists" in err_msg
                     or "UNIQUE constraint failed: alembic_version.version_num" in err_msg
@@ -185,18 +264,45 @@ def _initdb(self, engine):
                     time.sleep(0.2)
                     retry_limit -= 1
 
-    @contextmanager
-    def _connect(self, shard):
-        with self._db_lock:
-            check.str_param(shard, "shard")
+    def _get_shard_engine(self, shard):
+        engine = self._shard_engines.get(shard)
+
+        if engine is not None and not os.path.exists(self.path_for_shard(shard)):
+            # the shard was deleted from disk (e.g. wiped by another process) since its engine was
+            # created, so the open connection refers to a file that no longer exists
+            self._shard_engines.pop(shard)
+            self._initialized_dbs.discard(shard)
+            engine = None
 
+        if engine is None:
             conn_string = self.conn_string_for_shard(shard)
-            engine = create_engine(conn_string, poolclass=NullPool)
 
             if not shard in self._initialized_dbs:
-                self._initdb(engine)
+                init_engine = create_engine(conn_string, poolclass=NullPool)
+                self._initdb(init_engine, is_index_shard=shard == INDEX_SHARD_NAME)
+                init_engine.dispose()
                 self._initialized_dbs.add(shard)
 
+            # Connections are only ever used while holding self._db_lock, so a single connection
+            # can safely be shared across threads.
+            engine = create_engine(
+                conn_string,
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False},
+            )
+            self._shard_engines.set(shard, engine)
+
+        return engine
+
+    def _dispose_shard_engines(self):
+        self._shard_engines.clear()
+
+    @contextmanager
+    def _connect(self, shard):
+        with self._db_lock:
+            check.str_param(shard, "shard")
+
+            engine = self._get_shard_engine(shard)
             conn = engine.connect()
 
             try:
@@ -204,7 +310,6 @@ def _connect(self, shard):
                     yield conn
             finally:
                 conn.close()
-            engine.dispose()
 
     def run_connection(self, run_id=None):
         return self._connect(run_id)
@@ -225,7 +330,10 @@ def store_event(self, event):
         run_id = event.run_id
 
         with self.run_connection(run_id) as conn:
-            conn.execute(insert_event_statement)
+            result = conn.execute(insert_event_statement)
+            storage_id = result.inserted_primary_key[0]
+
+        self.store_cross_run_event(event, storage_id)
 
         if event.is_dagster_event and event.dagster_event.asset_key:
             check.invariant(
@@ -235,13 +343,78 @@ def store_event(self, event):
             )
             # mirror the event in the cross-run index database
             with self.index_connection() as conn:
-                conn.execute(insert_event_statement)
+                result = conn.execute(insert_event_statement)
+                # cross-run asset queries read the mirrored event, so track it by its index id
+                index_storage_id = result.inserted_primary_key[0]
 
             if (
                 event.dagster_event.is_step_materialization
                 or event.dagster_event.is_asset_observation
             ):
-                self.store_asset(event)
+                self.store_asset(event, index_storage_id)
+
+        self.store_step_stats(event)
+        self.store_run_stats(event)
+
+    def store_cross_run_event(self, event, storage_id):
+        """Mirrors a compact row for the event into the cross-run event index in the index shard,
+        if it is of a type that is queried across runs.
+
+        Args:
+            event (EventLogEntry): The event that was stored.
+            storage_id (int): The id of the event in its run shard.
+        """
+        if (
+            not event.is_dagster_event
+            or event.dagster_event.event_type not in CROSS_RUN_INDEXED_EVENT_TYPES
+            or not self.has_secondary_index(CROSS_RUN_EVENT_INDEX_TABLE)
+        ):
+            return
+
+        with self.index_connection() as conn:
+            conn.execute(
+                CrossRunEventIndexTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    run_id=event.run_id,
+                    storage_id=storage_id,
+                    dagster_event_type=event.dagster_event.event_type_value,
+                    timestamp=datetime.utcfromtimestamp(event.timestamp),
+                )
+            )
+
+    def rebuild_cross_run_event_index(self, run_id):
+        """Recomputes the cross-run event index rows of a run from its run shard. Used to backfill
+        the index for runs that were stored before it was maintained."""
+        check.str_param(run_id, "run_id")
+
+        query = db.select(
+            [
+                SqlEventLogStorageTable.c.id,
+                SqlEventLogStorageTable.c.dagster_event_type,
+                SqlEventLogStorageTable.c.timestamp,
+            ]
+        ).where(
+            SqlEventLogStorageTable.c.dagster_event_type.in_(
+                [event_type.value for event_type in CROSS_RUN_INDEXED_EVENT_TYPES]
+            )
+        )
+        with self.run_connection(run_id) as conn:
+            rows = conn.execute(query).fetchall()
+
+        with self.index_connection() as conn:
+            conn.execute(
+                CrossRunEventIndexTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    CrossRunEventIndexTable.c.run_id == run_id
+                )
+            )
+            for storage_id, dagster_event_type, timestamp in rows:
+                conn.execute(
+                    CrossRunEventIndexTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        run_id=run_id,
+                        storage_id=storage_id,
+                        dagster_event_type=dagster_event_type,
+                        timestamp=timestamp,
+                    )
+                )
 
     def get_event_records(
         self,
@@ -269,6 +442,17 @@ def get_event_records(
                 event_records_filter=event_records_filter, limit=limit, ascending=ascending
             )
 
+        is_cross_run_indexed_query = (
+            event_records_filter
+            and event_records_filter.event_type in CROSS_RUN_INDEXED_EVENT_TYPES
+            and not event_records_filter.asset_key
+            and self.has_secondary_index(CROSS_RUN_EVENT_INDEX_TABLE)
+        )
+        if is_cross_run_indexed_query:
+            return self._get_cross_run_indexed_event_records(
+                event_records_filter=event_records_filter, limit=limit, ascending=ascending
+            )
+
         query = db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
         if event_records_filter and event_records_filter.asset_key:
             asset_details = next(iter(self._get_assets_details([event_records_filter.asset_key])))
@@ -345,7 +529,119 @@ def get_event_records(
 
         return event_records[:limit]
 
+    def _get_cross_run_indexed_event_records(self, event_records_filter, limit, ascending):
+        """Resolves a query for an event type in the cross-run event index with a single query
+        against the index shard, then fetches the matching events from their run shards."""
+        query = db.select(
+            [
+                CrossRunEventIndexTable.c.id,
+                CrossRunEventIndexTable.c.run_id,
+                CrossRunEventIndexTable.c.storage_id,
+                CrossRunEventIndexTable.c.timestamp,
+            ]
+        ).where(
+            CrossRunEventIndexTable.c.dagster_event_type == event_records_filter.event_type.value
+        )
+
+        if event_records_filter.before_timestamp:
+            query = query.where(
+                CrossRunEventIndexTable.c.timestamp
+                < datetime.utcfromtimestamp(event_records_filter.before_timestamp)
+            )
+
+        if event_records_filter.after_timestamp:
+            query = query.where(
+                CrossRunEventIndexTable.c.timestamp
+                > datetime.utcfromtimestamp(event_records_filter.after_timestamp)
+            )
+
+        if ascending:
+            query = query.order_by(
+                CrossRunEventIndexTable.c.timestamp.asc(), CrossRunEventIndexTable.c.id.asc()
+            )
+        else:
+            query = query.order_by(
+                CrossRunEventIndexTable.c.timestamp.desc(), CrossRunEventIndexTable.c.id.desc()
+            )
+        if limit:
+            query = query.limit(limit)
+
+        # The storage ids of run shards are not comparable across runs, so the run-sharded cursor
+        # is resolved using the update timestamp of the runs, as in the shard-scanning query.
+        if isinstance(event_records_filter.after_cursor, RunShardedEventsCursor):
+            run_records = self._instance.get_run_records(
+                filters=RunsFilter(
+                    updated_after=event_records_filter.after_cursor.run_updated_after
+                )
+            )
+            run_ids = [run_record.pipeline_run.run_id for run_record in run_records]
+
+            # the runs are queried in chunks, each ordered and limited like the full query, and
+            # the results are merged
+            index_rows = []
+            with self.index_connection() as conn:
+                for i in range(0, len(run_ids), MAX_IN_CLAUSE_VALUES):
+                    run_ids_chunk = run_ids[i : i + MAX_IN_CLAUSE_VALUES]
+                    index_rows.extend(
+                        conn.execute(
+                            query.where(CrossRunEventIndexTable.c.run_id.in_(run_ids_chunk))
+                        ).fetchall()
+                    )
+            index_rows = sorted(
+                index_rows, key=lambda row: (row.timestamp, row.id), reverse=not ascending
+            )
+            if limit:
+                index_rows = index_rows[:limit]
+        else:
+            with self.index_connection() as conn:
+                index_rows = conn.execute(query).fetchall()
+
+        storage_ids_by_run_id = defaultdict(list)
+        for _, run_id, storage_id, _ in index_rows:
+            storage_ids_by_run_id[run_id].append(storage_id)
+
+        events_by_pointer = {}
+        for run_id, storage_ids in storage_ids_by_run_id.items():
+            with self.run_connection(run_id) as conn:
+                for i in range(0, len(storage_ids), MAX_IN_CLAUSE_VALUES):
+                    results = conn.execute(
+                        db.select(
+                            [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]
+                        ).where(
+                            SqlEventLogStorageTable.c.id.in_(
+                                storage_ids[i : i + MAX_IN_CLAUSE_VALUES]
+                            )
+                        )
+                    ).fetchall()
+                    for row_id, json_str in results:
+                        events_by_pointer[(run_id, row_id)] = json_str
+
+        event_records = []
+        for _, run_id, storage_id, _ in index_rows:
+            json_str = events_by_pointer.get((run_id, storage_id))
+            if json_str is None:
+                continue
+            try:
+                event_record = deserialize_json_to_dagster_namedtuple(json_str)
+            except seven.JSONDecodeError:
+                logging.warning("Could not parse event record id `{}`.".format(storage_id))
+                continue
+            if not isinstance(event_record, EventLogEntry):
+                logging.warning(
+                    "Could not resolve event record as EventLogEntry for id `{}`.".format(
+                        storage_id
+                    )
+                )
+                continue
+            event_records.append(
+                EventLogRecord(storage_id=storage_id, event_log_entry=event_record)
+            )
+
+        return event_records
+
     def delete_events(self, run_id):
+        asset_keys = self.get_partitioned_asset_keys_for_run(run_id)
+
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
 
@@ -353,7 +649,111 @@ def delete_events(self, run_id):
         with self.index_connection() as conn:
             self.delete_events_for_run(conn, run_id)
 
+        if self.has_secondary_index(CROSS_RUN_EVENT_INDEX_TABLE):
+            with self.index_connection() as conn:
+                conn.execute(
+                    CrossRunEventIndexTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        CrossRunEventIndexTable.c.run_id == run_id
+                    )
+                )
+
+        self.delete_step_stats_for_run(run_id)
+        self.delete_run_stats_for_run(run_id)
+        for asset_key in asset_keys:
+            self.rebuild_asset_partitions(asset_key)
+
+    def prune_events(
+        self, before_timestamp, batch_size=DEFAULT_PRUNE_EVENTS_BATCH_SIZE, max_batches=None
+    ):
+        """Overridden method to delete the run shards whose events were all stored before the given
+        timestamp as a whole, instead of deleting their events row by row. Run shards with events
+        on both sides of the cutoff, and the shards of runs that have not finished, are kept. The
+        mirrored asset events in the index shard are pruned like the events of a non-sharded
+        storage. Each deleted run shard counts as a batch towards max_batches.
+        """
+        check.float_param(before_timestamp, "before_timestamp")
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be greater than 0")
+        check.opt_int_param(max_batches, "max_batches")
+
+        before_datetime = datetime.utcfromtimestamp(before_timestamp)
+        deleted_count = 0
+        batch_count = 0
+        for run_id in self.get_all_run_ids():
+            if max_batches is not None and batch_count >= max_batches:
+                return deleted_count
+
+            # sqlite storages list every database file in their directory, not all of which are
+            # shards
+            if not self.has_event_log_table(run_id):
+                continue
+
+            with self.run_connection(run_id) as conn:
+                event_count, last_timestamp = conn.execute(
+                    db.select(
+                        [
+                            db.func.count(SqlEventLogStorageTable.c.id),
+                            db.func.max(SqlEventLogStorageTable.c.timestamp),
+                        ]
+                    )
+                ).fetchone()
+
+                if not event_count or last_timestamp >= before_datetime:
+                    continue
+
+                # a run that has not finished may still write to its shard
+                run_status_event_type = conn.execute(
+                    db.select([SqlEventLogStorageTable.c.dagster_event_type])
+                    .where(
+                        SqlEventLogStorageTable.c.dagster_event_type.in_(
+                            [event_type.value for event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS]
+                        )
+                    )
+                    .order_by(SqlEventLogStorageTable.c.id.desc())
+                    .limit(1)
+                ).scalar()
+
+            if run_status_event_type not in RUN_END_EVENT_TYPES:
+                continue
+
+            self._delete_shard(run_id)
+            deleted_count += event_count
+            batch_count += 1
+
+            if self.has_secondary_index(CROSS_RUN_EVENT_INDEX_TABLE):
+                with self.index_connection() as conn:
+                    conn.execute(
+                        CrossRunEventIndexTable.delete().where(  # pylint: disable=no-value-for-parameter
+                            CrossRunEventIndexTable.c.run_id == run_id
+                        )
+                    )
+
+        if max_batches is not None and batch_count >= max_batches:
+            return deleted_count
+
+        deleted_count += self.prune_events_for_connection(
+            self.index_connection,
+            before_timestamp,
+            batch_size,
+            None if max_batches is None else max_batches - batch_count,
+        )
+        return deleted_count
+
+    def _delete_shard(self, shard):
+        with self._db_lock:
+            # close the open connection to the shard before deleting its files
+            self._shard_engines.pop(shard)
+            self._initialized_dbs.discard(shard)
+            path = self.path_for_shard(shard)
+            for filename in [path, path + "-wal", path + "-shm"]:
+                if os.path.exists(filename):
+                    os.unlink(filename)
+
     def wipe(self):
+        # close the open connections to the shards before deleting their files
+        with self._db_lock:
+            self._dispose_shard_engines()
+
         # should delete all the run-sharded dbs as well as the index db
         for filename in (
             glob.glob(os.path.join(self._base_dir, "*.db"))
@@ -363,6 +763,7 @@ def wipe(self):
             os.unlink(filename)
 
         self._initialized_dbs = set()
+        self._secondary_index_cache = {}
 
     def _delete_mirrored_events_for_asset_key(self, asset_key):
         with self.index_connection() as conn:
@@ -396,16 +797,83 @@ def watch(self, run_id, start_cursor, callback):
     def end_watch(self, run_id, handler):
         if handler in self._watchers[run_id]:
             event_handler, watch = self._watchers[run_id][handler]
+            event_handler.stop()
             self._obs.remove_handler_for_watch(event_handler, watch)
             del self._watchers[run_id][handler]
 
+    def get_storage_id_for_cursor(self, run_id, cursor):
+        """Returns the storage id of the event at the given zero-indexed cursor in the run shard, as
+        used by get_logs_for_run, or 0 if the cursor precedes all events of the run."""
+        check.str_param(run_id, "run_id")
+        check.int_param(cursor, "cursor")
+
+        if cursor < 0:
+            return 0
+
+        with self.run_connection(run_id) as conn:
+            row = conn.execute(
+                db.select([SqlEventLogStorageTable.c.id])
+                .where(SqlEventLogStorageTable.c.run_id == run_id)
+                .order_by(SqlEventLogStorageTable.c.id.asc())
+                .offset(cursor)
+                .limit(1)
+            ).fetchone()
+            if row:
+                return row[0]
+
+            # the cursor is past the last stored event
+            max_id = conn.execute(
+                db.select([db.func.max(SqlEventLogStorageTable.c.id)]).where(
+                    SqlEventLogStorageTable.c.run_id == run_id
+                )
+            ).scalar()
+            return max_id or 0
+
+    def get_logs_for_run_after_storage_id(self, run_id, storage_id):
+        """Returns the events of a run whose storage id is greater than the given one, as a list
+        of (storage_id, event) tuples ordered by storage id. Unlike get_logs_for_run, this does not
+        scan past the events that were already read."""
+        check.str_param(run_id, "run_id")
+        check.int_param(storage_id, "storage_id")
+
+        query = (
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.id > storage_id)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        try:
+            return [
+                (
+                    record_id,
+                    check.inst_param(
+                        deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+                    ),
+                )
+                for record_id, json_str in results
+            ]
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
     def dispose(self):
         if self._obs:
             self._obs.stop()
             self._obs.join(timeout=15)
 
+        with self._db_lock:
+            self._dispose_shard_engines()
+
 
 class SqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
+    """Calls back with the new events of a run as they are written to its shard.
+
+    Modifications of the shard are debounced, so that a burst of writes results in a single read,
+    and each read only fetches the rows after the last one that was seen.
+    """
+
     def __init__(self, event_log_storage, run_id, callback, start_cursor, **kwargs):
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", SqliteEventLogStorage
@@ -413,26 +881,82 @@ def __init__(self, event_log_storage, run_id, callback, start_cursor, **kwargs):
         self._run_id = check.str_param(run_id, "run_id")
         self._cb = check.callable_param(callback, "callback")
         self._log_path = event_log_storage.path_for_shard(run_id)
+        # Writes through an open connection land in the write-ahead log, and are only checkpointed
+        # into the database file itself once the log grows large or the last connection closes.
+        self._wal_path = self._log_path + "-wal"
         self._cursor = start_cursor if start_cursor is not None else -1
-        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
+        # storage id of the last event that was read, resolved from the cursor on the first read
+        self._last_storage_id = None
+
+        self._stopped = False
+        self._timer = None
+        self._timer_lock = threading.Lock()
+        # serializes reads, since a debounced read may fire while the previous one is running
+        self._process_lock = threading.Lock()
+
+        super(SqliteEventLogStorageWatchdog, self).__init__(
+            patterns=[self._log_path, self._wal_path], **kwargs
+        )
+
+    def stop(self):
+        self._stopped = True
+        with self._timer_lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+
+    def _schedule_process_log(self):
+        with self._timer_lock:
+            if self._stopped or self._timer:
+                # a scheduled read will pick up this modification
+                return
+            self._timer = threading.Timer(WATCHDOG_DEBOUNCE_SECONDS, self._process_scheduled_log)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _process_scheduled_log(self):
+        with self._timer_lock:
+            # clear the timer before reading, so that modifications made during the read schedule
+            # another one
+            self._timer = None
+        self._process_log()
 
     def _process_log(self):
-        events = self._event_log_storage.get_logs_for_run(self._run_id, self._cursor)
-        self._cursor += len(events)
-        for event in events:
-            status = None
-            try:
-                status = self._cb(event)
-            except Exception:
-                logging.exception("Exception in callback for event watch on run %s.", self._run_id)
+        with self._process_lock:
+            if self._stopped:
+                return
 
-            if (
-                status == PipelineRunStatus.SUCCESS
-                or status == PipelineRunStatus.FAILURE
-                or status == PipelineRunStatus.CANCELED
-            ):
-                self._event_log_storage.end_watch(self._run_id, self._cb)
+            if self._last_storage_id is None:
+                self._last_storage_id = self._event_log_storage.get_storage_id_for_cursor(
+                    self._run_id, self._cursor
+                )
+
+            records = self._event_log_storage.get_logs_for_run_after_storage_id(
+                self._run_id, self._last_storage_id
+            )
+            if records:
+                self._last_storage_id = records[-1][0]
+                self._cursor += len(records)
+
+            for _storage_id, event in records:
+                if self._stopped:
+                    return
+                self._process_event(event)
+
+    def _process_event(self, event):
+        status = None
+        try:
+            status = self._cb(event)
+        except Exception:
+            logging.exception("Exception in callback for event watch on run %s.", self._run_id)
+
+        if (
+            status == PipelineRunStatus.SUCCESS
+            or status == PipelineRunStatus.FAILURE
+            or status == PipelineRunStatus.CANCELED
+        ):
+            self._event_log_storage.end_watch(self._run_id, self._cb)
 
     def on_modified(self, event):
-        check.invariant(event.src_path == self._log_path)
-        self._process_log()
+        check.invariant(event.src_path in (self._log_path, self._wal_path))
+        self._schedule_process_log()
@@ -1,5 +1,6 @@
 import hashlib
 import os
+import shutil
 import sys
 from collections import defaultdict
 from contextlib import contextmanager
@@ -131,6 +132,10 @@ def download_url(self, run_id, key, io_type):
         check.inst_param(io_type, "io_type", ComputeIOType)
         return "/download/{}/{}/{}".format(run_id, key, io_type.value)
 
+    def delete_logs(self, run_id):
+        check.str_param(run_id, "run_id")
+        shutil.rmtree(self._run_directory(run_id), ignore_errors=True)
+
     def on_subscribe(self, subscription):
         self._subscription_manager.add_subscription(subscription)
 
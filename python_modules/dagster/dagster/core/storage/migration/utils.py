@@ -195,6 +195,21 @@ def extract_asset_keys_idx_columns():
     op.add_column("asset_keys", db.Column("tags", db.TEXT))
 
 
+def add_asset_key_materialization_columns():
+    if not has_table("asset_keys"):
+        return
+
+    if has_column("asset_keys", "last_materialization_storage_id"):
+        return
+
+    # add typed latest materialization columns to avoid event deserialization
+    op.add_column("asset_keys", db.Column("last_materialization_storage_id", db.Integer))
+    op.add_column(
+        "asset_keys", db.Column("last_materialization_event_timestamp", db.types.TIMESTAMP)
+    )
+    op.add_column("asset_keys", db.Column("last_materialization_partition", db.Text))
+
+
 def create_event_log_event_idx():
     if not has_table("event_logs"):
         return
@@ -207,6 +222,119 @@ def create_event_log_event_idx():
     )
 
 
+def create_event_log_timestamp_idx():
+    if not has_table("event_logs"):
+        return
+
+    indices = [x.get("name") for x in get_inspector().get_indexes("event_logs")]
+    if "idx_event_timestamp" in indices:
+        return
+
+    op.create_index("idx_event_timestamp", "event_logs", ["timestamp"])
+
+
+def create_step_stats_table():
+    if not has_table("event_logs"):
+        return
+
+    if has_table("step_stats"):
+        return
+
+    op.create_table(
+        "step_stats",
+        db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+        db.Column("run_id", db.String(255), nullable=False),
+        db.Column("step_key", db.Text, nullable=False),
+        db.Column("status", db.String(63)),
+        db.Column("start_time", db.Float),
+        db.Column("end_time", db.Float),
+        db.Column("attempts", db.Integer),
+        db.Column("materialization_count", db.Integer, nullable=False),
+        db.Column("expectation_count", db.Integer, nullable=False),
+        db.Column("intervals", db.Text),
+        db.Column("update_timestamp", db.DateTime, server_default=db.text("CURRENT_TIMESTAMP")),
+    )
+    op.create_index(
+        "idx_step_stats_run_step",
+        "step_stats",
+        ["run_id", "step_key"],
+        unique=True,
+        mysql_length={"step_key": 64},
+    )
+
+
+def create_run_stats_table():
+    if not has_table("event_logs"):
+        return
+
+    if has_table("run_stats"):
+        return
+
+    op.create_table(
+        "run_stats",
+        db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+        db.Column("run_id", db.String(255), unique=True, nullable=False),
+        db.Column("steps_succeeded", db.Integer, nullable=False),
+        db.Column("steps_failed", db.Integer, nullable=False),
+        db.Column("materializations", db.Integer, nullable=False),
+        db.Column("expectations", db.Integer, nullable=False),
+        db.Column("enqueued_time", db.Float),
+        db.Column("launch_time", db.Float),
+        db.Column("start_time", db.Float),
+        db.Column("end_time", db.Float),
+        db.Column("update_timestamp", db.DateTime, server_default=db.text("CURRENT_TIMESTAMP")),
+    )
+
+
+def create_asset_partitions_table():
+    if not has_table("event_logs"):
+        return
+
+    if has_table("asset_partitions"):
+        return
+
+    op.create_table(
+        "asset_partitions",
+        db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+        db.Column("asset_key", db.String(512), nullable=False),
+        db.Column("partition", db.Text, nullable=False),
+        db.Column("materialization_count", db.Integer, nullable=False),
+        db.Column("last_materialization_storage_id", db.Integer),
+        db.Column("last_materialization_timestamp", db.types.TIMESTAMP),
+        db.Column("update_timestamp", db.DateTime, server_default=db.text("CURRENT_TIMESTAMP")),
+    )
+    op.create_index(
+        "idx_asset_partitions_asset_partition",
+        "asset_partitions",
+        ["asset_key", "partition"],
+        unique=True,
+        mysql_length={"partition": 255},
+    )
+
+
+def create_cross_run_event_index_table():
+    if not has_table("event_logs"):
+        return
+
+    if has_table("cross_run_event_index"):
+        return
+
+    op.create_table(
+        "cross_run_event_index",
+        db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+        db.Column("run_id", db.String(255), nullable=False),
+        db.Column("storage_id", db.Integer, nullable=False),
+        db.Column("dagster_event_type", db.Text, nullable=False),
+        db.Column("timestamp", db.types.TIMESTAMP),
+    )
+    op.create_index(
+        "idx_cross_run_event_type_timestamp",
+        "cross_run_event_index",
+        ["dagster_event_type", "timestamp"],
+    )
+    op.create_index("idx_cross_run_event_run_id", "cross_run_event_index", ["run_id"])
+
+
 def create_run_range_indices():
     if not has_table("runs"):
         return
@@ -489,6 +489,7 @@ class RunsFilter(
             ("updated_after", Optional[datetime]),
             ("mode", Optional[str]),
             ("created_before", Optional[datetime]),
+            ("updated_before", Optional[datetime]),
         ],
     )
 ):
@@ -502,6 +503,7 @@ def __new__(
         updated_after: Optional[datetime] = None,
         mode: Optional[str] = None,
         created_before: Optional[datetime] = None,
+        updated_before: Optional[datetime] = None,
         pipeline_name: Optional[str] = None,  # for backcompat purposes
     ):
         job_name = job_name or pipeline_name
@@ -518,6 +520,7 @@ def __new__(
             updated_after=check.opt_inst_param(updated_after, "updated_after", datetime),
             mode=check.opt_str_param(mode, "mode"),
             created_before=check.opt_inst_param(created_before, "created_before", datetime),
+            updated_before=check.opt_inst_param(updated_before, "updated_before", datetime),
         )
 
     @property
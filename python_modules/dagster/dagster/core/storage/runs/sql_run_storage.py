@@ -238,6 +238,9 @@ def _add_filters_to_query(self, query, filters: RunsFilter):
         if filters.created_before:
             query = query.where(RunsTable.c.create_timestamp < filters.created_before)
 
+        if filters.updated_before:
+            query = query.where(RunsTable.c.update_timestamp < filters.updated_before)
+
         return query
 
     def _runs_query(
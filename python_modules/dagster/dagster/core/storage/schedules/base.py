@@ -102,13 +102,24 @@ def update_tick(self, tick: InstigatorTick):
         """
 
     @abc.abstractmethod
-    def purge_ticks(self, origin_id: str, tick_status: TickStatus, before: float):
+    def purge_ticks(
+        self,
+        origin_id: str,
+        tick_status: TickStatus,
+        before: float,
+        limit: Optional[int] = None,
+    ) -> int:
         """Wipe ticks for an instigator for a certain status and timestamp.
 
         Args:
             origin_id (str): The id of the instigator target to delete
             tick_status (TickStatus): The tick status to wipe
             before (datetime): All ticks before this datetime will get purged
+            limit (Optional[int]): The maximum number of ticks to purge, oldest first. Defaults to
+                purging all matching ticks.
+
+        Returns:
+            int: The number of ticks purged.
         """
 
     @abc.abstractmethod
@@ -255,20 +255,46 @@ def update_tick(self, tick):
 
         return tick
 
-    def purge_ticks(self, origin_id, tick_status, before):
+    def purge_ticks(self, origin_id, tick_status, before, limit=None):
         check.str_param(origin_id, "origin_id")
         check.inst_param(tick_status, "tick_status", TickStatus)
         check.float_param(before, "before")
+        check.opt_int_param(limit, "limit")
 
         utc_before = utc_datetime_from_timestamp(before)
 
         with self.connect() as conn:
+            if limit is None:
+                result = conn.execute(
+                    JobTickTable.delete()  # pylint: disable=no-value-for-parameter
+                    .where(JobTickTable.c.status == tick_status.value)
+                    .where(JobTickTable.c.timestamp < utc_before)
+                    .where(JobTickTable.c.job_origin_id == origin_id)
+                )
+                return result.rowcount
+
+            # select the ids to delete up front, so that bounded purges only lock the rows that are
+            # actually removed
+            tick_ids = [
+                row[0]
+                for row in conn.execute(
+                    db.select([JobTickTable.c.id])
+                    .where(JobTickTable.c.status == tick_status.value)
+                    .where(JobTickTable.c.timestamp < utc_before)
+                    .where(JobTickTable.c.job_origin_id == origin_id)
+                    .order_by(JobTickTable.c.id.asc())
+                    .limit(limit)
+                ).fetchall()
+            ]
+            if not tick_ids:
+                return 0
+
             conn.execute(
-                JobTickTable.delete()  # pylint: disable=no-value-for-parameter
-                .where(JobTickTable.c.status == tick_status.value)
-                .where(JobTickTable.c.timestamp < utc_before)
-                .where(JobTickTable.c.job_origin_id == origin_id)
+                JobTickTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    JobTickTable.c.id.in_(tick_ids)
+                )
             )
+            return len(tick_ids)
 
     def get_tick_stats(self, origin_id):
         check.str_param(origin_id, "origin_id")
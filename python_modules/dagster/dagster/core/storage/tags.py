@@ -37,6 +37,12 @@
 
 PRIORITY_TAG = "{prefix}priority".format(prefix=SYSTEM_TAG_PREFIX)
 
+RESOURCE_REQUIREMENTS_TAG = "{prefix}resource_requirements".format(prefix=SYSTEM_TAG_PREFIX)
+
+CRITICAL_PATH_FROM_HISTORY_TAG = "{prefix}critical_path_from_history".format(
+    prefix=SYSTEM_TAG_PREFIX
+)
+
 DOCKER_IMAGE_TAG = "{prefix}image".format(prefix=SYSTEM_TAG_PREFIX)
 
 USER_EDITABLE_SYSTEM_TAGS = [PRIORITY_TAG]
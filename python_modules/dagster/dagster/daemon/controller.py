@@ -15,6 +15,7 @@
     BackfillDaemon,
     DagsterDaemon,
     MonitoringDaemon,
+    RetentionDaemon,
     SchedulerDaemon,
     SensorDaemon,
 )
@@ -302,6 +303,8 @@ def create_daemon_of_type(daemon_type, instance):
         return BackfillDaemon(interval_seconds=DEFAULT_DAEMON_INTERVAL_SECONDS)
     elif daemon_type == MonitoringDaemon.daemon_type():
         return MonitoringDaemon(interval_seconds=instance.run_monitoring_poll_interval_seconds)
+    elif daemon_type == RetentionDaemon.daemon_type():
+        return RetentionDaemon(interval_seconds=instance.retention_poll_interval_seconds)
     else:
         raise Exception(f"Unexpected daemon type {daemon_type}")
 
@@ -13,6 +13,7 @@
 from dagster.core.workspace import IWorkspace
 from dagster.daemon.backfill import execute_backfill_iteration
 from dagster.daemon.monitoring import execute_monitoring_iteration
+from dagster.daemon.retention import RetentionProgress, execute_retention_iteration
 from dagster.daemon.sensor import execute_sensor_iteration_loop
 from dagster.daemon.types import DaemonHeartbeat
 from dagster.scheduler.scheduler import execute_scheduler_iteration_loop
@@ -160,6 +161,7 @@ def _check_add_heartbeat(
                 daemon_type,
                 daemon_uuid,
                 errors=[error for (error, timestamp) in self._errors],
+                progress=self.heartbeat_progress(),
             )
         )
         if (
@@ -173,6 +175,14 @@ def _check_add_heartbeat(
             )
             self._last_log_time = curr_time
 
+    def heartbeat_progress(self):
+        """
+        Counters describing the work done by the daemon so far, reported in its heartbeats.
+
+        returns: Optional[Dict[str, int]]
+        """
+        return None
+
     @abstractmethod
     def core_loop(self, instance, workspace):
         """
@@ -249,3 +259,19 @@ def daemon_type(cls):
 
     def run_iteration(self, instance, workspace):
         yield from execute_monitoring_iteration(instance, workspace, self._logger)
+
+
+class RetentionDaemon(IntervalDaemon):
+    def __init__(self, interval_seconds):
+        super().__init__(interval_seconds)
+        self._progress = RetentionProgress()
+
+    @classmethod
+    def daemon_type(cls):
+        return "RETENTION"
+
+    def heartbeat_progress(self):
+        return self._progress.to_dict()
+
+    def run_iteration(self, instance, workspace):
+        yield from execute_retention_iteration(instance, self._logger, self._progress)
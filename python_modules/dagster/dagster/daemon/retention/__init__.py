@@ -0,0 +1 @@
+from .retention_daemon import RetentionProgress, execute_retention_iteration
@@ -0,0 +1,153 @@
+import sys
+import time
+
+import pendulum
+
+from dagster import DagsterInstance, check
+from dagster.core.scheduler.instigation import TickStatus
+from dagster.core.storage.pipeline_run import PipelineRunStatus, RunsFilter
+from dagster.utils.error import serializable_error_info_from_exc_info
+
+RETENTION_RUN_STATUSES = {
+    "success": PipelineRunStatus.SUCCESS,
+    "failure": PipelineRunStatus.FAILURE,
+    "canceled": PipelineRunStatus.CANCELED,
+}
+
+RETENTION_TICK_STATUSES = {
+    "success": TickStatus.SUCCESS,
+    "failure": TickStatus.FAILURE,
+    "skipped": TickStatus.SKIPPED,
+}
+
+
+class RetentionProgress:
+    """Running totals of the rows deleted by the retention daemon, reported in its heartbeats."""
+
+    def __init__(self):
+        self.runs_deleted = 0
+        self.ticks_deleted = 0
+        self.events_deleted = 0
+
+    def to_dict(self):
+        return {
+            "runs_deleted": self.runs_deleted,
+            "ticks_deleted": self.ticks_deleted,
+            "events_deleted": self.events_deleted,
+        }
+
+
+def purge_runs(instance: DagsterInstance, logger, progress, status, before, batch_size, interval):
+    """Delete the runs of the given status that were last updated before the cutoff, along with
+    their event logs and compute logs, oldest first and at most batch_size runs at a time. Each run
+    is deleted in its own transactions, so no lock on the runs or event log tables is held across
+    runs."""
+    while True:
+        run_records = instance.get_run_records(
+            filters=RunsFilter(statuses=[status], updated_before=before),
+            limit=batch_size,
+            order_by="update_timestamp",
+            ascending=True,
+        )
+        if not run_records:
+            return
+
+        for record in run_records:
+            run_id = record.pipeline_run.run_id
+            instance.delete_run(run_id)
+            instance.compute_log_manager.delete_logs(run_id)
+            progress.runs_deleted += 1
+
+        logger.info(f"Deleted {len(run_records)} {status.value} runs")
+        yield
+
+        if len(run_records) < batch_size:
+            return
+        time.sleep(interval)
+
+
+def purge_ticks(
+    instance: DagsterInstance, logger, progress, tick_status, before, batch_size, interval
+):
+    """Delete the ticks of the given status that happened before the cutoff, for every instigator
+    with stored state, at most batch_size ticks at a time."""
+    for instigator_state in instance.all_instigator_state():
+        origin_id = instigator_state.instigator_origin_id
+        while True:
+            num_deleted = instance.purge_ticks(
+                origin_id, tick_status, before=before.timestamp(), limit=batch_size
+            )
+            progress.ticks_deleted += num_deleted
+            if num_deleted:
+                logger.info(
+                    f"Deleted {num_deleted} {tick_status.value} ticks for {instigator_state.name}"
+                )
+            yield
+
+            if num_deleted < batch_size:
+                break
+            time.sleep(interval)
+
+
+def purge_event_logs(instance: DagsterInstance, logger, progress, before, batch_size, interval):
+    """Delete the events stored before the cutoff from the event logs, a batch of at most
+    batch_size events at a time, until a batch deletes no events."""
+    while True:
+        num_deleted = instance.prune_event_logs(
+            before.timestamp(), batch_size=batch_size, max_batches=1
+        )
+        progress.events_deleted += num_deleted
+        if num_deleted:
+            logger.info(f"Deleted {num_deleted} events from the event logs")
+        yield
+
+        if not num_deleted:
+            return
+        time.sleep(interval)
+
+
+def execute_retention_iteration(instance: DagsterInstance, logger, progress: RetentionProgress):
+    check.inst_param(progress, "progress", RetentionProgress)
+
+    now = pendulum.now("UTC")
+    batch_size = instance.retention_batch_size
+    interval = instance.retention_batch_interval_seconds
+
+    for status_name, max_age_days in instance.run_retention_max_age_days.items():
+        status = RETENTION_RUN_STATUSES[status_name]
+        # run timestamps are stored as naive UTC datetimes
+        before = now.subtract(days=max_age_days).naive()
+        try:
+            yield from purge_runs(instance, logger, progress, status, before, batch_size, interval)
+        except Exception:
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+            logger.error(f"Hit error while deleting {status.value} runs: {error_info}")
+            yield error_info
+
+    for status_name, max_age_days in instance.tick_retention_max_age_days.items():
+        tick_status = RETENTION_TICK_STATUSES[status_name]
+        before = now.subtract(days=max_age_days)
+        try:
+            yield from purge_ticks(
+                instance, logger, progress, tick_status, before, batch_size, interval
+            )
+        except Exception:
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+            logger.error(f"Hit error while deleting {tick_status.value} ticks: {error_info}")
+            yield error_info
+
+    if instance.event_log_retention_max_age_days is not None:
+        if not instance.supports_event_log_pruning:
+            logger.warning(
+                "Event log retention is configured, but the event log storage does not support "
+                "pruning events. Skipping event log retention."
+            )
+            return
+
+        before = now.subtract(days=instance.event_log_retention_max_age_days)
+        try:
+            yield from purge_event_logs(instance, logger, progress, before, batch_size, interval)
+        except Exception:
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+            logger.error(f"Hit error while pruning event logs: {error_info}")
+            yield error_info
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import List, NamedTuple, Optional, cast
+from typing import Dict, List, NamedTuple, Optional, cast
 
 from dagster import check
 from dagster.serdes import DefaultNamedTupleSerializer, unpack_inner_value, whitelist_for_serdes
@@ -47,6 +47,7 @@ def value_from_storage_dict(
                 whitelist_map,
                 descent_path=f"{descent_path}.errors",
             ),
+            progress=storage_dict.get("progress"),
         )
 
 
@@ -59,6 +60,7 @@ class DaemonHeartbeat(
             ("daemon_type", str),
             ("daemon_id", Optional[str]),
             ("errors", Optional[List[SerializableErrorInfo]]),
+            ("progress", Optional[Dict[str, int]]),
         ],
     ),
 ):
@@ -68,6 +70,7 @@ def __new__(
         daemon_type: str,
         daemon_id: str,
         errors: Optional[List[SerializableErrorInfo]] = None,
+        progress: Optional[Dict[str, int]] = None,
     ):
         errors = check.opt_list_param(errors, "errors", of_type=SerializableErrorInfo)
 
@@ -77,6 +80,11 @@ def __new__(
             daemon_type=check.str_param(daemon_type, "daemon_type"),
             daemon_id=check.opt_str_param(daemon_id, "daemon_id"),
             errors=errors,
+            # counters reported by daemons that do incremental work, e.g. the number of runs
+            # deleted by the retention daemon
+            progress=check.opt_nullable_dict_param(
+                progress, "progress", key_type=str, value_type=int
+            ),
         )
 
 
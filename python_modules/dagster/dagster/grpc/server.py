@@ -30,6 +30,7 @@
 )
 from dagster.serdes.ipc import IPCErrorMessage, ipc_write_stream, open_ipc_subprocess
 from dagster.utils import find_free_port, frozenlist, safe_tempfile_path_unmanaged
+from dagster.utils.cache import CacheStats, LRUCache
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 from .__generated__ import api_pb2
@@ -75,6 +76,8 @@
 
 STREAMING_CHUNK_SIZE = 4000000
 
+MAX_CACHED_SUBSET_SNAPSHOTS = 64
+
 
 class CouldNotBindGrpcServerToAddress(Exception):
     pass
@@ -165,6 +168,7 @@ def __init__(
         lazy_load_user_code=False,
         fixed_server_id=None,
         entry_point=None,
+        defer_pipeline_snapshots=False,
     ):
         super(DagsterApiServer, self).__init__()
 
@@ -172,6 +176,10 @@ def __init__(
         check.int_param(heartbeat_timeout, "heartbeat_timeout")
         check.invariant(heartbeat_timeout > 0, "heartbeat_timeout must be greater than 0")
 
+        self._defer_pipeline_snapshots = check.bool_param(
+            defer_pipeline_snapshots, "defer_pipeline_snapshots"
+        )
+
         self._server_termination_event = check.inst_param(
             server_termination_event, "server_termination_event", ThreadingEventType
         )
@@ -199,6 +207,9 @@ def __init__(
 
         self._serializable_load_error = None
 
+        # Serialized ExternalPipelineSubsetResults, keyed by pipeline and solid selection
+        self._subset_snapshot_cache: LRUCache[str] = LRUCache(MAX_CACHED_SUBSET_SNAPSHOTS)
+
         self._entry_point = (
             frozenlist(check.list_param(entry_point, "entry_point", of_type=str))
             if entry_point != None
@@ -444,15 +455,31 @@ def ExternalPipelineSubsetSnapshot(self, request, _context):
             PipelineSubsetSnapshotArgs,
         )
 
-        return api_pb2.ExternalPipelineSubsetSnapshotReply(
-            serialized_external_pipeline_subset_result=serialize_dagster_namedtuple(
-                get_external_pipeline_subset_result(
-                    self._recon_pipeline_from_origin(pipeline_subset_snapshot_args.pipeline_origin),
-                    pipeline_subset_snapshot_args.solid_selection,
-                )
+        pipeline_origin = pipeline_subset_snapshot_args.pipeline_origin
+        solid_selection = pipeline_subset_snapshot_args.solid_selection
+        cache_key = (
+            pipeline_origin.external_repository_origin.repository_name,
+            pipeline_origin.pipeline_name,
+            tuple(solid_selection) if solid_selection else None,
+        )
+
+        serialized_result = self._subset_snapshot_cache.get(cache_key)
+        if serialized_result is None:
+            result = get_external_pipeline_subset_result(
+                self._recon_pipeline_from_origin(pipeline_origin), solid_selection
             )
+            serialized_result = serialize_dagster_namedtuple(result)
+            # don't cache errors, so that they are reported with a fresh stack trace
+            if result.success:
+                self._subset_snapshot_cache.set(cache_key, serialized_result)
+
+        return api_pb2.ExternalPipelineSubsetSnapshotReply(
+            serialized_external_pipeline_subset_result=serialized_result
         )
 
+    def get_subset_snapshot_cache_stats(self) -> CacheStats:
+        return self._subset_snapshot_cache.get_stats()
+
     def _get_serialized_external_repository_data(self, request):
         repository_origin = deserialize_json_to_dagster_namedtuple(
             request.serialized_repository_python_origin
@@ -461,7 +488,10 @@ def _get_serialized_external_repository_data(self, request):
         check.inst_param(repository_origin, "repository_origin", ExternalRepositoryOrigin)
         recon_repo = self._recon_repository_from_origin(repository_origin)
         return serialize_dagster_namedtuple(
-            external_repository_data_from_def(recon_repo.get_definition())
+            external_repository_data_from_def(
+                recon_repo.get_definition(),
+                defer_pipeline_datas=self._defer_pipeline_snapshots,
+            )
         )
 
     def ExternalRepository(self, request, _context):
@@ -777,6 +807,7 @@ def __init__(
         ipc_output_file=None,
         fixed_server_id=None,
         entry_point=None,
+        defer_pipeline_snapshots=False,
     ):
         check.opt_str_param(host, "host")
         check.opt_int_param(port, "port")
@@ -826,6 +857,7 @@ def __init__(
                 lazy_load_user_code=lazy_load_user_code,
                 fixed_server_id=fixed_server_id,
                 entry_point=entry_point,
+                defer_pipeline_snapshots=defer_pipeline_snapshots,
             )
         except Exception:
             if self._ipc_output_file:
@@ -0,0 +1,106 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, NamedTuple, Optional, TypeVar
+
+from dagster import check
+
+T = TypeVar("T")
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[T]):
+    """Thread-safe, size-bounded least-recently-used cache that tracks hits, misses and evictions.
+
+    Args:
+        max_size (int): The maximum number of entries to keep. When full, the least recently used
+            entry is evicted to make room for a new one.
+        on_evict (Optional[Callable[[Hashable, T], None]]): Called with the key and value of each
+            entry that is evicted, popped, or cleared, e.g. to release resources held by the value.
+    """
+
+    def __init__(self, max_size: int, on_evict: Optional[Callable[[Hashable, T], None]] = None):
+        self._max_size = check.int_param(max_size, "max_size")
+        check.invariant(max_size > 0, "max_size must be greater than 0")
+        self._on_evict = check.opt_callable_param(on_evict, "on_evict")
+        self._entries: "OrderedDict[Hashable, T]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[T]:
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: Hashable, value: T) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                evicted_key, evicted_value = self._entries.popitem(last=False)
+                self._evictions += 1
+                if self._on_evict:
+                    self._on_evict(evicted_key, evicted_value)
+
+    def get_or_compute(self, key: Hashable, compute_fn: Callable[[], T]) -> T:
+        """Return the cached value for key, computing and caching it on a miss. The value is
+        computed outside of the lock, so concurrent misses for the same key may compute it more
+        than once."""
+        value = self.get(key)
+        if value is None:
+            value = compute_fn()
+            self.set(key, value)
+        return value
+
+    def pop(self, key: Hashable) -> Optional[T]:
+        """Remove the entry for key, if present, and return its value."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            value = self._entries.pop(key)
+            if self._on_evict:
+                self._on_evict(key, value)
+            return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            entries = list(self._entries.items())
+            self._entries.clear()
+            if self._on_evict:
+                for key, value in entries:
+                    self._on_evict(key, value)
+
+    def get_stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self._max_size,
+            )
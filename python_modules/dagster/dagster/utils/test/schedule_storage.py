@@ -590,6 +590,28 @@ def test_purge_ticks(self, storage):
         ticks = storage.get_ticks("my_sensor")
         assert len(ticks) == 2
 
+    def test_purge_ticks_with_limit(self, storage):
+        assert storage
+
+        now = pendulum.now()
+        for minutes in range(5, 0, -1):
+            storage.create_tick(
+                self.build_sensor_tick(
+                    now.subtract(minutes=minutes).timestamp(), TickStatus.SKIPPED
+                )
+            )
+        before = now.subtract(seconds=30).timestamp()
+
+        assert storage.purge_ticks("my_sensor", TickStatus.SKIPPED, before, limit=2) == 2
+        ticks = storage.get_ticks("my_sensor")
+        assert len(ticks) == 3
+        # the oldest ticks are purged first
+        assert min(tick.timestamp for tick in ticks) == now.subtract(minutes=3).timestamp()
+
+        assert storage.purge_ticks("my_sensor", TickStatus.SKIPPED, before, limit=5) == 3
+        assert storage.purge_ticks("my_sensor", TickStatus.SKIPPED, before, limit=5) == 0
+        assert storage.get_ticks("my_sensor") == []
+
     def test_ticks_filtered(self, storage):
         storage.create_tick(self.build_sensor_tick(time.time(), status=TickStatus.STARTED))
         storage.create_tick(self.build_sensor_tick(time.time(), status=TickStatus.SUCCESS))
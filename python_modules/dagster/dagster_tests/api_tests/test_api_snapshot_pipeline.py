@@ -7,6 +7,7 @@
 from dagster.core.errors import DagsterUserCodeProcessError
 from dagster.core.host_representation.external_data import ExternalPipelineSubsetResult
 from dagster.core.host_representation.handle import PipelineHandle
+from dagster.core.host_representation.selector import PipelineSelector
 from dagster.utils.error import serializable_error_info_from_exc_info
 
 from .utils import get_bar_repo_repository_location
@@ -46,6 +47,43 @@ def test_pipeline_with_valid_subset_snapshot_api_grpc():
         assert external_pipeline_subset_result.external_pipeline_data.name == "foo"
 
 
+def test_pipeline_subset_snapshot_cached():
+    with get_bar_repo_repository_location() as repository_location:
+        selector = PipelineSelector(
+            location_name=repository_location.name,
+            repository_name="bar_repo",
+            pipeline_name="foo",
+            solid_selection=["do_something"],
+        )
+
+        result = repository_location.get_subset_external_pipeline_result(selector)
+        assert result.success
+        assert repository_location.get_subset_external_pipeline_result(selector) is result
+
+        stats = repository_location.get_subset_result_cache_stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.size == 1
+
+
+def test_pipeline_subset_snapshot_errors_not_cached():
+    with get_bar_repo_repository_location() as repository_location:
+        selector = PipelineSelector(
+            location_name=repository_location.name,
+            repository_name="bar_repo",
+            pipeline_name="foo",
+            solid_selection=["invalid_solid"],
+        )
+
+        for _ in range(2):
+            with pytest.raises(DagsterUserCodeProcessError):
+                repository_location.get_subset_external_pipeline_result(selector)
+
+        stats = repository_location.get_subset_result_cache_stats()
+        assert stats.misses == 2
+        assert stats.size == 0
+
+
 def test_pipeline_with_invalid_subset_snapshot_api_grpc():
     with get_bar_repo_repository_location() as repository_location:
         pipeline_handle = PipelineHandle(
@@ -22,6 +22,8 @@
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'resource_capacities': {
+                },
                 'retries': {
                     'disabled': {
                     },
@@ -80,6 +82,8 @@
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'resource_capacities': {
+                },
                 'retries': {
                     'disabled': {
                     },
@@ -138,6 +142,8 @@
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'resource_capacities': {
+                },
                 'retries': {
                     'disabled': {
                     },
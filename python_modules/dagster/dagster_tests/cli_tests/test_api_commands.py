@@ -292,6 +292,20 @@ def test_execute_step_verify_step():
                     instance, run, retries, step_keys_to_execute=["do_something"]
                 )
 
+            # Steps launched together are verified separately, so that the ones that have not
+            # started yet are still executed
+            with mock.patch("dagster.cli.api.get_step_stats_by_key") as _step_stats_by_key:
+                _step_stats_by_key.return_value = {
+                    "do_something": RunStepKeyStatsSnapshot(
+                        run_id=run.run_id, step_key="do_something", attempts=1
+                    )
+                }
+
+                retries = RetryState()
+                assert verify_step(
+                    instance, run, retries, step_keys_to_execute=["do_something", "do_input"]
+                ) == ["do_input"]
+
             runner_execute_step(
                 runner,
                 [input_json],
@@ -0,0 +1,65 @@
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from dagster import execute_pipeline, pipeline, solid
+from dagster.cli.instance import partition_events_command, prune_events_command
+from dagster.core.test_utils import instance_for_test
+
+
+@solid
+def noop_solid(_):
+    pass
+
+
+@pipeline
+def noop_pipeline():
+    noop_solid()
+
+
+@pytest.fixture(name="retention_instance")
+def mock_retention_instance(mocker):
+    with instance_for_test(
+        overrides={"retention": {"event_logs": {"max_age_days": 30}}}
+    ) as instance:
+        mocker.patch(
+            "dagster.core.instance.DagsterInstance.get",
+            return_value=instance,
+        )
+        yield instance
+
+
+def test_prune_events_requires_max_age(mocker):
+    with instance_for_test() as instance:
+        mocker.patch("dagster.core.instance.DagsterInstance.get", return_value=instance)
+        runner = CliRunner()
+        result = runner.invoke(prune_events_command, ["--noprompt"])
+        assert result.exit_code == 2
+        assert "you must specify `--older-than-days`" in result.output
+
+
+def test_prune_events(retention_instance):
+    result = execute_pipeline(noop_pipeline, instance=retention_instance)
+    num_events = len(retention_instance.all_logs(result.run_id))
+
+    runner = CliRunner()
+
+    # the events are within the configured retention period
+    result_one = runner.invoke(prune_events_command, ["--noprompt"])
+    assert result_one.exit_code == 0
+    assert "Deleted 0 events" in result_one.output
+    assert len(retention_instance.all_logs(result.run_id)) == num_events
+
+    time.sleep(0.01)
+    result_two = runner.invoke(prune_events_command, ["--older-than-days", "0", "--noprompt"])
+    assert result_two.exit_code == 0
+    assert "Deleted {} events".format(num_events) in result_two.output
+    assert retention_instance.all_logs(result.run_id) == []
+
+
+def test_partition_events_unsupported(retention_instance):
+    runner = CliRunner()
+    result = runner.invoke(partition_events_command, ["--ids-per-partition", "100"])
+    assert result.exit_code == 2
+    assert "does not support partitioning events" in result.output
@@ -1,3 +1,5 @@
+import time
+
 import pytest
 
 from dagster import job, op
@@ -7,6 +9,7 @@
 from dagster.core.execution.plan.objects import StepSuccessData
 from dagster.core.execution.plan.outputs import StepOutputData, StepOutputHandle
 from dagster.core.execution.retries import RetryMode
+from dagster.core.test_utils import instance_for_test
 
 
 def define_foo_job():
@@ -148,3 +151,217 @@ def test_recover_in_between_steps():
                 step_key="bar_op",
             )
         )
+
+
+def define_resource_requirements_job():
+    @op(tags={"dagster/resource_requirements": {"memory": 8}})
+    def big_op_1():
+        pass
+
+    @op(tags={"dagster/resource_requirements": {"memory": 8}})
+    def big_op_2():
+        pass
+
+    @op(tags={"dagster/resource_requirements": {"memory": 2, "cpu": 1}})
+    def small_op():
+        pass
+
+    @op(tags={"dagster/resource_requirements": {"gpu": 2}})
+    def oversized_op():
+        pass
+
+    @op
+    def plain_op():
+        pass
+
+    @job
+    def resource_requirements_job():
+        big_op_1()
+        big_op_2()
+        small_op()
+        oversized_op()
+        plain_op()
+
+    return resource_requirements_job
+
+
+def test_resource_capacities():
+    resource_requirements_job = define_resource_requirements_job()
+
+    with create_execution_plan(resource_requirements_job).start(
+        RetryMode.DISABLED, resource_capacities={"memory": 10, "gpu": 1}
+    ) as active_execution:
+        # big_op_2 doesn't fit alongside big_op_1, but the steps after it are packed in, and the
+        # oversized step runs alone. cpu has no capacity, so isn't limited.
+        steps = active_execution.get_steps_to_execute()
+        assert sorted(step.key for step in steps) == [
+            "big_op_1",
+            "oversized_op",
+            "plain_op",
+            "small_op",
+        ]
+        assert not active_execution.get_steps_to_execute()
+
+        for step in steps:
+            active_execution.handle_event(
+                DagsterEvent(
+                    DagsterEventType.STEP_SUCCESS.value,
+                    pipeline_name=resource_requirements_job.name,
+                    event_specific_data=StepSuccessData(duration_ms=10.0),
+                    step_key=step.key,
+                )
+            )
+
+        # capacity is released once the steps complete
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["big_op_2"]
+        active_execution.handle_event(
+            DagsterEvent(
+                DagsterEventType.STEP_SUCCESS.value,
+                pipeline_name=resource_requirements_job.name,
+                event_specific_data=StepSuccessData(duration_ms=10.0),
+                step_key="big_op_2",
+            )
+        )
+
+
+def test_invalid_resource_requirements():
+    @op(tags={"dagster/resource_requirements": {"memory": "lots"}})
+    def bad_op():
+        pass
+
+    @job
+    def bad_job():
+        bad_op()
+
+    with pytest.raises(
+        DagsterInvariantViolationError, match='Invalid "dagster/resource_requirements" tag'
+    ):
+        with create_execution_plan(bad_job).start(
+            RetryMode.DISABLED, resource_capacities={"memory": 10}
+        ) as active_execution:
+            active_execution.get_steps_to_execute()
+
+
+def define_critical_path_job():
+    @op
+    def short_op():
+        pass
+
+    @op
+    def chain_op_1():
+        pass
+
+    @op
+    def chain_op_2(_x):
+        pass
+
+    @op
+    def chain_op_3(_x):
+        pass
+
+    @op(tags={"dagster/priority": "1"})
+    def priority_op():
+        pass
+
+    @job
+    def critical_path_job():
+        short_op()
+        chain_op_3(chain_op_2(chain_op_1()))
+        priority_op()
+
+    return critical_path_job
+
+
+def test_critical_path_lengths():
+    execution_plan = create_execution_plan(define_critical_path_job())
+
+    assert execution_plan.get_critical_path_lengths() == {
+        "short_op": 1.0,
+        "chain_op_1": 3.0,
+        "chain_op_2": 2.0,
+        "chain_op_3": 1.0,
+        "priority_op": 1.0,
+    }
+
+    # steps without a duration are weighted by the mean duration
+    assert execution_plan.get_critical_path_lengths(
+        {"short_op": 12.0, "chain_op_1": 1.0, "chain_op_2": 1.0, "chain_op_3": 2.0}
+    ) == {
+        "short_op": 12.0,
+        "chain_op_1": 4.0,
+        "chain_op_2": 3.0,
+        "chain_op_3": 2.0,
+        "priority_op": 4.0,
+    }
+
+
+def test_critical_path_order():
+    critical_path_job = define_critical_path_job()
+
+    with create_execution_plan(critical_path_job).start(RetryMode.DISABLED) as active_execution:
+        # the priority tag takes precedence, then the longest chain starts first
+        assert [step.key for step in active_execution.get_steps_to_execute()] == [
+            "priority_op",
+            "chain_op_1",
+            "short_op",
+        ]
+
+        for step_key in ["priority_op", "chain_op_1", "short_op"]:
+            _succeed_step(critical_path_job, active_execution, step_key)
+
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["chain_op_2"]
+        _succeed_step(critical_path_job, active_execution, "chain_op_2")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["chain_op_3"]
+        _succeed_step(critical_path_job, active_execution, "chain_op_3")
+
+
+def _succeed_step(pipeline_def, active_execution, step_key):
+    active_execution.handle_event(
+        DagsterEvent(
+            DagsterEventType.STEP_OUTPUT.value,
+            pipeline_name=pipeline_def.name,
+            event_specific_data=StepOutputData(
+                step_output_handle=StepOutputHandle(step_key, "result")
+            ),
+            step_key=step_key,
+        )
+    )
+    active_execution.handle_event(
+        DagsterEvent(
+            DagsterEventType.STEP_SUCCESS.value,
+            pipeline_name=pipeline_def.name,
+            event_specific_data=StepSuccessData(duration_ms=10.0),
+            step_key=step_key,
+        )
+    )
+
+
+def test_critical_path_from_history():
+    @op
+    def slow_op():
+        time.sleep(0.5)
+
+    @op
+    def fast_op_1():
+        pass
+
+    @op
+    def fast_op_2(_x):
+        pass
+
+    @job(tags={"dagster/critical_path_from_history": "true"})
+    def history_job():
+        slow_op()
+        fast_op_2(fast_op_1())
+
+    def _step_start_order(result):
+        return [event.step_key for event in result.all_events if event.is_step_start]
+
+    with instance_for_test() as instance:
+        # without a prior run, the longest chain of steps starts first
+        result = history_job.execute_in_process(instance=instance)
+        assert _step_start_order(result) == ["fast_op_1", "slow_op", "fast_op_2"]
+
+        # then it is weighted by the durations of the steps of the prior run
+        result = history_job.execute_in_process(instance=instance)
+        assert _step_start_order(result)[0] == "slow_op"
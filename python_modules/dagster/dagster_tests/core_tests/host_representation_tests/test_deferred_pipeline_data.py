@@ -0,0 +1,195 @@
+import subprocess
+
+import pytest
+
+from dagster import graph, op, pipeline, repository, solid
+from dagster.check import CheckError
+from dagster.core.definitions.reconstruct import ReconstructableRepository
+from dagster.core.errors import DagsterUserCodeProcessError
+from dagster.core.host_representation import (
+    ExternalPipelineRef,
+    ExternalPipelineSubsetResult,
+    ExternalRepository,
+    InProcessRepositoryLocation,
+    RepositoryHandle,
+    external_pipeline_data_from_def,
+    external_repository_data_from_def,
+)
+from dagster.core.host_representation.origin import (
+    GrpcServerRepositoryLocationOrigin,
+    InProcessRepositoryLocationOrigin,
+)
+from dagster.grpc.client import DagsterGrpcClient
+from dagster.grpc.server import wait_for_grpc_server
+from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster.utils import find_free_port
+from dagster.utils.error import SerializableErrorInfo
+
+
+@solid
+def do_something():
+    return 1
+
+
+@pipeline
+def a_pipeline():
+    do_something()
+
+
+@op
+def do_something_else():
+    return 2
+
+
+@graph
+def a_graph():
+    do_something_else()
+
+
+@repository
+def deferred_repo():
+    return [a_pipeline, a_graph.to_job(name="a_job")]
+
+
+@pytest.fixture(name="repository_handle")
+def repository_handle_fixture():
+    with InProcessRepositoryLocation(
+        InProcessRepositoryLocationOrigin(
+            ReconstructableRepository.for_file(__file__, "deferred_repo")
+        )
+    ) as location:
+        yield RepositoryHandle("deferred_repo", location)
+
+
+def test_deferred_repository_data():
+    repo_data = external_repository_data_from_def(deferred_repo, defer_pipeline_datas=True)
+    assert repo_data.has_deferred_pipeline_datas
+    assert repo_data.external_pipeline_datas == []
+    assert repo_data.external_pipeline_refs == [
+        ExternalPipelineRef(name="a_job", is_job=True),
+        ExternalPipelineRef(name="a_pipeline", is_job=False),
+    ]
+
+    assert (
+        deserialize_json_to_dagster_namedtuple(serialize_dagster_namedtuple(repo_data)) == repo_data
+    )
+    assert not external_repository_data_from_def(deferred_repo).has_deferred_pipeline_datas
+
+    with pytest.raises(CheckError, match="was deferred"):
+        repo_data.get_external_pipeline_data("a_pipeline")
+
+
+def test_deferred_external_repository(repository_handle):
+    loaded = []
+
+    def _loader(pipeline_name):
+        loaded.append(pipeline_name)
+        return external_pipeline_data_from_def(deferred_repo.get_pipeline(pipeline_name))
+
+    external_repo = ExternalRepository(
+        external_repository_data_from_def(deferred_repo, defer_pipeline_datas=True),
+        repository_handle,
+        pipeline_data_loader=_loader,
+    )
+
+    assert external_repo.has_external_pipeline("a_pipeline")
+    assert external_repo.has_external_job("a_job")
+    assert not external_repo.has_external_job("a_pipeline")
+    assert external_repo.get_pipeline_names() == ["a_job", "a_pipeline"]
+    assert loaded == []
+
+    external_job = external_repo.get_external_job("a_job")
+    assert external_job.name == "a_job"
+    assert loaded == ["a_job"]
+
+    # subsequent accesses are served from the cache
+    assert external_repo.get_full_external_pipeline("a_job").name == "a_job"
+    assert external_repo.get_pipeline_index("a_job").name == "a_job"
+    assert loaded == ["a_job"]
+
+    # listing pipelines does not load the data of the pipelines that were not accessed yet
+    all_pipelines = external_repo.get_all_external_pipelines()
+    assert [p.name for p in all_pipelines] == ["a_job", "a_pipeline"]
+    assert [p.is_job for p in all_pipelines] == [True, False]
+    assert [p.name for p in external_repo.get_external_jobs()] == ["a_job"]
+    assert loaded == ["a_job"]
+
+    # the data of a listed pipeline is loaded once it is accessed
+    assert all_pipelines[1].active_presets == []
+    assert loaded == ["a_job", "a_pipeline"]
+    assert all_pipelines[1].solid_names == ["do_something"]
+    assert all_pipelines[1].pipeline_snapshot.name == "a_pipeline"
+    assert not all_pipelines[1].external_pipeline_data.is_job
+
+    # and the listed pipeline shares the data and index cached by the repository
+    assert all_pipelines[1].get_pipeline_index_for_compat() is external_repo.get_pipeline_index(
+        "a_pipeline"
+    )
+    assert loaded == ["a_job", "a_pipeline"]
+
+
+def test_deferred_external_repository_no_loader(repository_handle):
+    external_repo = ExternalRepository(
+        external_repository_data_from_def(deferred_repo, defer_pipeline_datas=True),
+        repository_handle,
+    )
+    assert external_repo.has_external_pipeline("a_pipeline")
+    with pytest.raises(CheckError, match="no loader was provided"):
+        external_repo.get_full_external_pipeline("a_pipeline")
+
+
+@pytest.fixture(name="deferred_grpc_location")
+def deferred_grpc_location_fixture():
+    port = find_free_port()
+    subprocess_args = [
+        "dagster",
+        "api",
+        "grpc",
+        "--port",
+        str(port),
+        "--python-file",
+        __file__,
+        "--attribute",
+        "deferred_repo",
+        "--defer-pipeline-snapshots",
+    ]
+    process = subprocess.Popen(subprocess_args)
+    try:
+        wait_for_grpc_server(
+            process, DagsterGrpcClient(port=port, host="localhost"), subprocess_args
+        )
+        with GrpcServerRepositoryLocationOrigin(
+            host="localhost", port=port, location_name="deferred_location"
+        ).create_location() as location:
+            yield location
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def test_deferred_grpc_repository_location(deferred_grpc_location):
+    external_repo = deferred_grpc_location.get_repository("deferred_repo")
+    assert external_repo.external_repository_data.has_deferred_pipeline_datas
+    assert external_repo.external_repository_data.external_pipeline_datas == []
+
+    all_pipelines = external_repo.get_all_external_pipelines()
+    assert [p.name for p in all_pipelines] == ["a_job", "a_pipeline"]
+    assert deferred_grpc_location.get_subset_result_cache_stats().misses == 0
+
+    external_pipeline = external_repo.get_full_external_pipeline("a_pipeline")
+    assert external_pipeline.solid_names == ["do_something"]
+    assert all_pipelines[0].solid_names == ["do_something_else"]
+    assert deferred_grpc_location.get_subset_result_cache_stats().misses == 2
+
+
+def test_deferred_grpc_repository_location_error(deferred_grpc_location, monkeypatch):
+    error = SerializableErrorInfo("failed to load a_pipeline", stack=[], cls_name=None)
+    monkeypatch.setattr(
+        deferred_grpc_location,
+        "get_subset_external_pipeline_result",
+        lambda _selector: ExternalPipelineSubsetResult(success=False, error=error),
+    )
+
+    external_repo = deferred_grpc_location.get_repository("deferred_repo")
+    with pytest.raises(DagsterUserCodeProcessError, match="failed to load a_pipeline"):
+        external_repo.get_full_external_pipeline("a_pipeline")
@@ -0,0 +1,77 @@
+from dagster import AssetKey
+from dagster.core.asset_defs import asset, build_assets_job
+from dagster.core.host_representation import ExternalAssetGraph
+from dagster.core.host_representation.external_data import external_asset_graph_from_defs
+
+
+@asset
+def asset1():
+    return 1
+
+
+@asset
+def asset2(asset1):
+    return asset1 + 1
+
+
+@asset
+def asset3(asset1):
+    return asset1 + 2
+
+
+@asset
+def asset4(asset2, asset3):
+    return asset2 + asset3
+
+
+def _build_graph():
+    job1 = build_assets_job("job1", [asset1, asset2, asset3, asset4])
+    job2 = build_assets_job("job2", [asset2], source_assets=[asset1])
+    return ExternalAssetGraph(external_asset_graph_from_defs([job1, job2], source_assets_by_key={}))
+
+
+def test_asset_graph_lookups():
+    graph = _build_graph()
+
+    assert set(graph.asset_keys) == {
+        AssetKey("asset1"),
+        AssetKey("asset2"),
+        AssetKey("asset3"),
+        AssetKey("asset4"),
+    }
+    assert graph.has_node(AssetKey("asset2"))
+    assert not graph.has_node(AssetKey("nonexistent"))
+    assert graph.get_node(AssetKey("nonexistent")) is None
+    assert graph.get_node(AssetKey("asset2")).op_name == "asset2"
+
+    assert [node.asset_key for node in graph.get_nodes_for_job("job2")] == [AssetKey("asset2")]
+    assert len(graph.get_nodes_for_job("job1")) == 4
+    assert graph.get_nodes_for_job("nonexistent") == []
+    assert [node.asset_key for node in graph.get_nodes_for_op("asset3")] == [AssetKey("asset3")]
+
+
+def test_asset_graph_closures():
+    graph = _build_graph()
+
+    assert graph.get_upstream_asset_keys(AssetKey("asset4")) == {
+        AssetKey("asset2"),
+        AssetKey("asset3"),
+    }
+    assert graph.get_downstream_asset_keys(AssetKey("asset1")) == {
+        AssetKey("asset2"),
+        AssetKey("asset3"),
+    }
+
+    # compute a closure first so that the later closure reuses it
+    assert graph.get_all_upstream_asset_keys(AssetKey("asset2")) == {AssetKey("asset1")}
+    assert graph.get_all_upstream_asset_keys(AssetKey("asset4")) == {
+        AssetKey("asset1"),
+        AssetKey("asset2"),
+        AssetKey("asset3"),
+    }
+    assert graph.get_all_downstream_asset_keys(AssetKey("asset1")) == {
+        AssetKey("asset2"),
+        AssetKey("asset3"),
+        AssetKey("asset4"),
+    }
+    assert graph.get_all_downstream_asset_keys(AssetKey("asset4")) == set()
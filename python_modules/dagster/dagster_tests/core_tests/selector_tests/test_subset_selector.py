@@ -4,6 +4,7 @@
 from dagster.core.errors import DagsterExecutionStepNotFoundError, DagsterInvalidSubsetError
 from dagster.core.selector.subset_selector import (
     MAX_NUM,
+    SelectionIndex,
     Traverser,
     clause_to_subset,
     generate_dep_graph,
@@ -154,7 +155,28 @@ def test_parse_solid_selection_invalid():
 }
 
 
-@pytest.mark.parametrize(
+clause_graph = {
+    "upstream": {
+        "start": set(),
+        "a": {"start"},
+        "b": set(),
+        "c": {"b"},
+        "d": {"a", "b"},
+        "e": {"c"},
+        "f": {"e", "d"},
+        "final": {"a", "d"},
+    },
+    "downstream": {
+        "start": {"a"},
+        "b": {"c", "d"},
+        "a": {"final", "d"},
+        "c": {"e"},
+        "d": {"final", "f"},
+        "e": {"f"},
+    },
+}
+
+clause_params = pytest.mark.parametrize(
     "clause,expected_subset",
     [
         ("a", "a"),
@@ -164,30 +186,62 @@ def test_parse_solid_selection_invalid():
         ("+++final", "final,a,d,start,b"),
         ("b++", "b,c,d,e,f,final"),
         ("start*", "start,a,d,f,final"),
+        ("*f", "f,d,e,c,a,b,start"),
+        ("*d*", "d,a,b,start,f,final"),
     ],
 )
+
+
+@clause_params
 def test_clause_to_subset(clause, expected_subset):
-    graph = {
-        "upstream": {
-            "start": set(),
-            "a": {"start"},
-            "b": set(),
-            "c": {"b"},
-            "d": {"a", "b"},
-            "e": {"c"},
-            "f": {"e", "d"},
-            "final": {"a", "d"},
-        },
-        "downstream": {
-            "start": {"a"},
-            "b": {"c", "d"},
-            "a": {"final", "d"},
-            "c": {"e"},
-            "d": {"final", "f"},
-            "e": {"f"},
-        },
+    assert set(clause_to_subset(clause_graph, clause)) == set(expected_subset.split(","))
+
+
+@clause_params
+def test_selection_index(clause, expected_subset):
+    index = SelectionIndex(clause_graph)
+    assert index.names_for_mask(index.clause_to_mask(clause)) == set(expected_subset.split(","))
+    # resolving again reads from the memoized closures
+    assert index.resolve_selection([clause]) == set(expected_subset.split(","))
+    assert index.resolve_selection([clause]) == set(expected_subset.split(","))
+
+
+def test_selection_index_invalid():
+    index = SelectionIndex(clause_graph)
+    assert index.clause_to_mask("nonexistent") == 0
+    assert index.clause_to_mask("1+a") == 0
+    assert index.resolve_selection(["a", "nonexistent"]) is None
+
+
+def test_selection_index_full_closures_reused():
+    index = SelectionIndex(clause_graph)
+    # computing the closure of "d" first lets the closure of "start" reuse it
+    assert index.resolve_selection(["d*"]) == {"d", "f", "final"}
+    assert index.resolve_selection(["start*"]) == {"start", "a", "d", "f", "final"}
+    assert index.resolve_selection(["*final"]) == {"final", "a", "b", "d", "start"}
+
+
+def test_parse_solid_selection_cached_on_pipeline():
+    index = foo_pipeline.get_selection_index()
+    assert foo_pipeline.get_selection_index() is index
+    assert parse_solid_selection(foo_pipeline, ["*add_nums"]) == {
+        "return_one",
+        "return_two",
+        "add_nums",
     }
-    assert set(clause_to_subset(graph, clause)) == set(expected_subset.split(","))
+    assert parse_solid_selection(foo_pipeline, ["*add_nums"]) is parse_solid_selection(
+        foo_pipeline, ["*add_nums"]
+    )
+
+
+def test_pipeline_subset_def_memoized():
+    subset_def = foo_pipeline.get_pipeline_subset_def({"return_one", "add_nums"})
+    assert foo_pipeline.get_pipeline_subset_def(frozenset({"add_nums", "return_one"})) is subset_def
+    assert foo_pipeline.get_pipeline_subset_def({"return_one"}) is not subset_def
+
+    stats = foo_pipeline.get_subset_def_cache_stats()
+    assert stats.hits >= 1
+    assert stats.size >= 2
 
 
 def test_parse_step_selection_single():
@@ -126,6 +126,22 @@
           },
           "type_param_keys": null
         },
+        "Map.String.Float": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": null,
+          "given_name": null,
+          "key": "Map.String.Float",
+          "kind": {
+            "__enum__": "ConfigTypeKind.MAP"
+          },
+          "scalar_kind": null,
+          "type_param_keys": [
+            "String",
+            "Float"
+          ]
+        },
         "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -254,6 +270,38 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+              "description": null,
+              "is_required": false,
+              "name": "in_process",
+              "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+              "description": null,
+              "is_required": false,
+              "name": "multiprocess",
+              "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+            }
+          ],
+          "given_name": null,
+          "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+          "kind": {
+            "__enum__": "ConfigTypeKind.SELECTOR"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -491,38 +539,6 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-              "description": null,
-              "is_required": false,
-              "name": "in_process",
-              "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-              "description": null,
-              "is_required": false,
-              "name": "multiprocess",
-              "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-            }
-          ],
-          "given_name": null,
-          "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-          "kind": {
-            "__enum__": "ConfigTypeKind.SELECTOR"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
         "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -546,82 +562,6 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.1b89f17c57460ee6db612e2a543579b48100564d": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "field_aliases": {
-            "solids": "ops"
-          },
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"in_process\\": {}}",
-              "description": null,
-              "is_required": false,
-              "name": "execution",
-              "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{}",
-              "description": null,
-              "is_required": false,
-              "name": "loggers",
-              "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"io_manager\\": {}}",
-              "description": null,
-              "is_required": false,
-              "name": "resources",
-              "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"a_solid\\": {}}",
-              "description": null,
-              "is_required": false,
-              "name": "solids",
-              "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-              "description": null,
-              "is_required": false,
-              "name": "config",
-              "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
         "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -746,6 +686,59 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Shape.6646e51f523989a00efcd153449d5331519faf23": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "field_aliases": {
+            "solids": "ops"
+          },
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"in_process\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "execution",
+              "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{}",
+              "description": null,
+              "is_required": false,
+              "name": "loggers",
+              "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"io_manager\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "resources",
+              "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"a_solid\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "solids",
+              "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.6646e51f523989a00efcd153449d5331519faf23",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -781,6 +774,56 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "0",
+              "description": null,
+              "is_required": false,
+              "name": "max_concurrent",
+              "type_key": "Int"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+              "is_required": false,
+              "name": "resource_capacities",
+              "type_key": "Map.String.Float"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "retries",
+              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+              "is_required": false,
+              "name": "start_method",
+              "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -862,6 +905,29 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+              "description": null,
+              "is_required": false,
+              "name": "config",
+              "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -898,48 +964,7 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "0",
-              "description": null,
-              "is_required": false,
-              "name": "max_concurrent",
-              "type_key": "Int"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"enabled\\": {}}",
-              "description": null,
-              "is_required": false,
-              "name": "retries",
-              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
-              "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-              "is_required": false,
-              "name": "start_method",
-              "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+        "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -1121,7 +1146,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+        "root_config_key": "Shape.6646e51f523989a00efcd153449d5331519faf23"
       },
       {
         "__class__": "ModeDefSnap",
@@ -1159,7 +1184,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+        "root_config_key": "Shape.6646e51f523989a00efcd153449d5331519faf23"
       }
     ],
     "name": "a_pipeline",
@@ -1333,6 +1358,22 @@
               },
               "type_param_keys": null
             },
+            "Map.String.Float": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": null,
+              "given_name": null,
+              "key": "Map.String.Float",
+              "kind": {
+                "__enum__": "ConfigTypeKind.MAP"
+              },
+              "scalar_kind": null,
+              "type_param_keys": [
+                "String",
+                "Float"
+              ]
+            },
             "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1461,6 +1502,38 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "in_process",
+                  "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "multiprocess",
+                  "type_key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722"
+                }
+              ],
+              "given_name": null,
+              "key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060",
+              "kind": {
+                "__enum__": "ConfigTypeKind.SELECTOR"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Selector.a9799b971d12ace70a2d8803c883c863417d0725": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1698,38 +1771,6 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "in_process",
-                  "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "multiprocess",
-                  "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-                }
-              ],
-              "given_name": null,
-              "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-              "kind": {
-                "__enum__": "ConfigTypeKind.SELECTOR"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
             "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1753,82 +1794,6 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.1b89f17c57460ee6db612e2a543579b48100564d": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "field_aliases": {
-                "solids": "ops"
-              },
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"in_process\\": {}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "execution",
-                  "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "loggers",
-                  "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"io_manager\\": {}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "resources",
-                  "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"a_solid\\": {}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "solids",
-                  "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
-            "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
             "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1953,6 +1918,59 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Shape.6646e51f523989a00efcd153449d5331519faf23": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "field_aliases": {
+                "solids": "ops"
+              },
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"in_process\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "execution",
+                  "type_key": "Selector.50a94e08773ec48c4f66dd6f90691a607a82b060"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "loggers",
+                  "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"io_manager\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "resources",
+                  "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"a_solid\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "solids",
+                  "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.6646e51f523989a00efcd153449d5331519faf23",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Shape.69ff9be621991cc7961ea5e667d43edaac9d2339": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1988,6 +2006,56 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Shape.6bd7b08da8230713d869c1294c887b8b654b6858": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "0",
+                  "description": null,
+                  "is_required": false,
+                  "name": "max_concurrent",
+                  "type_key": "Int"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "The capacity of each resource (e.g. cpu, memory, or custom slots) that steps declare requirements for with the \\"dagster/resource_requirements\\" tag. Ready steps are only executed while their requirements fit within the remaining capacities. Resources without a capacity are not limited.",
+                  "is_required": false,
+                  "name": "resource_capacities",
+                  "type_key": "Map.String.Float"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "retries",
+                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+                  "is_required": false,
+                  "name": "start_method",
+                  "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Shape.743e47901855cb245064dd633e217bfcb49a11a7": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -2069,7 +2137,7 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+            "Shape.c7fda946c2a6517e9f12679788d265cf53c29722": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -2077,69 +2145,51 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
                   "description": null,
                   "is_required": false,
                   "name": "config",
-                  "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+                  "type_key": "Shape.6bd7b08da8230713d869c1294c887b8b654b6858"
                 }
               ],
               "given_name": null,
-              "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+              "key": "Shape.c7fda946c2a6517e9f12679788d265cf53c29722",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+            "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
-              "fields": [],
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "config",
+                  "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+                }
+              ],
               "given_name": null,
-              "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+              "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+            "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "0",
-                  "description": null,
-                  "is_required": false,
-                  "name": "max_concurrent",
-                  "type_key": "Int"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"enabled\\": {}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "retries",
-                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
-                  "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
-                  "is_required": false,
-                  "name": "start_method",
-                  "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
-                }
-              ],
+              "fields": [],
               "given_name": null,
-              "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+              "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -2328,7 +2378,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+            "root_config_key": "Shape.6646e51f523989a00efcd153449d5331519faf23"
           },
           {
             "__class__": "ModeDefSnap",
@@ -2366,7 +2416,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+            "root_config_key": "Shape.6646e51f523989a00efcd153449d5331519faf23"
           }
         ],
         "name": "a_pipeline",
@@ -2407,6 +2457,7 @@
       }
     }
   ],
+  "external_pipeline_refs": null,
   "external_schedule_datas": [
     {
       "__class__": "ExternalScheduleData",
@@ -11,7 +11,7 @@
   "artifacts_persisted": true,
   "executor_name": "in_process",
   "initial_known_state": null,
-  "pipeline_snapshot_id": "330e31c23c3edacaa7a9224039b53a703f011788",
+  "pipeline_snapshot_id": "8dc6055a449ea4230015da81e695d0ed3c711eb3",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "solid_one",
@@ -134,7 +134,7 @@
   "artifacts_persisted": true,
   "executor_name": "in_process",
   "initial_known_state": null,
-  "pipeline_snapshot_id": "7ffd65ba8633d4c172a7b15dfee5927bed301724",
+  "pipeline_snapshot_id": "a2f5011dbb98dfef71cb42b4d645420fcea702ed",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -187,7 +187,7 @@
   "artifacts_persisted": true,
   "executor_name": "in_process",
   "initial_known_state": null,
-  "pipeline_snapshot_id": "b96bfd4d61336a6ed2016679d1467c3e1daa3285",
+  "pipeline_snapshot_id": "1eb8c6d829b4e270ac6a69dc58e4b69e8b15931a",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -254,7 +254,7 @@
   "artifacts_persisted": true,
   "executor_name": "in_process",
   "initial_known_state": null,
-  "pipeline_snapshot_id": "7bb46b4373672e250386288663f7eca81f0a0a02",
+  "pipeline_snapshot_id": "cd1479d15d32e20e2cab7fc800d43bc8ef5ba4dc",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "comp_1.return_one",
@@ -0,0 +1,61 @@
+"""Measures the write throughput of SqliteEventLogStorage for a single large run.
+
+Usage:
+    python benchmark_sqlite_event_log.py [--num-events 10000]
+"""
+import argparse
+import time
+
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import EventLogEntry
+from dagster.core.storage.event_log import SqliteEventLogStorage
+from dagster.core.utils import make_new_run_id
+from dagster.utils.test import get_temp_dir
+
+
+def _engine_event(run_id, index):
+    return EventLogEntry(
+        error_info=None,
+        user_message=f"event {index}",
+        level="debug",
+        run_id=run_id,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            "benchmark_pipeline",
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+def benchmark_store_event(num_events):
+    with get_temp_dir() as base_dir:
+        storage = SqliteEventLogStorage(base_dir)
+        run_id = make_new_run_id()
+        events = [_engine_event(run_id, i) for i in range(num_events)]
+
+        start = time.perf_counter()
+        for event in events:
+            storage.store_event(event)
+        elapsed = time.perf_counter() - start
+
+        assert len(storage.get_logs_for_run(run_id)) == num_events
+        storage.dispose()
+
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-events", type=int, default=10000)
+    args = parser.parse_args()
+
+    elapsed = benchmark_store_event(args.num_events)
+    print(  # pylint: disable=print-call
+        f"Stored {args.num_events} events in {elapsed:.2f}s "
+        f"({args.num_events / elapsed:.0f} events/sec)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,16 @@
 import os
 import sys
 import tempfile
+import threading
+import time
 import traceback
 
+import mock
 import pytest
 import sqlalchemy
 
 from dagster.core.errors import DagsterEventLogInvalidForRun
+from dagster.core.events import DagsterEventType, EngineEventData
 from dagster.core.storage.event_log import (
     ConsolidatedSqliteEventLogStorage,
     InMemoryEventLogStorage,
@@ -17,7 +21,12 @@
 )
 from dagster.core.storage.sql import create_engine
 
-from .utils.event_log_storage import TestEventLogStorage
+from .utils.event_log_storage import (
+    DEFAULT_RUN_ID,
+    TestEventLogStorage,
+    _event_record,
+    create_test_event_log_record,
+)
 
 
 class TestInMemoryEventLogStorage(TestEventLogStorage):
@@ -79,6 +88,36 @@ def test_filesystem_event_log_storage_run_corrupted_bad_data(self, storage):
         with pytest.raises(DagsterEventLogInvalidForRun):
             storage.get_logs_for_run("bar")
 
+    def test_watch_debounces_and_reads_new_events(self, storage):
+        watched = []
+        storage.store_event(create_test_event_log_record("0"))
+
+        with mock.patch.object(
+            storage,
+            "get_logs_for_run_after_storage_id",
+            wraps=storage.get_logs_for_run_after_storage_id,
+        ) as read_mock:
+            storage.watch(DEFAULT_RUN_ID, 0, watched.append)
+
+            for i in range(1, 21):
+                storage.store_event(create_test_event_log_record(str(i)))
+
+            attempts = 10
+            while len(watched) < 20 and attempts > 0:
+                time.sleep(0.5)
+                attempts -= 1
+
+            storage.end_watch(DEFAULT_RUN_ID, watched.append)
+
+        assert [int(event.user_message) for event in watched] == list(range(1, 21))
+
+        # the burst of writes is picked up by fewer reads than there were writes, and each read
+        # starts after the last event that was seen
+        assert read_mock.call_count < 20
+        after_storage_ids = [call[0][1] for call in read_mock.call_args_list]
+        assert after_storage_ids == sorted(after_storage_ids)
+        assert after_storage_ids[0] == 1
+
     def cmd(self, exceptions, tmpdir_path):
         storage = SqliteEventLogStorage(tmpdir_path)
         try:
@@ -110,6 +149,55 @@ def test_concurrent_sqlite_event_log_connections(self, storage):
             excs.append(exceptions.get())
         assert not excs, excs
 
+    def test_concurrent_step_stats_writers(self, storage):
+        # the process executing a step and the orchestrator both write events for the step, each
+        # through its own storage
+        other_storage = SqliteEventLogStorage(storage._base_dir)  # pylint: disable=protected-access
+        now = time.time()
+        storage.store_event(_event_record(DEFAULT_RUN_ID, "A", now, DagsterEventType.STEP_START))
+
+        def _store_markers(event_log_storage, prefix):
+            for i in range(20):
+                event_log_storage.store_event(
+                    _event_record(
+                        DEFAULT_RUN_ID,
+                        "A",
+                        now + i,
+                        DagsterEventType.ENGINE_EVENT,
+                        EngineEventData(marker_start=f"{prefix}_{i}"),
+                    )
+                )
+
+        threads = [
+            threading.Thread(target=_store_markers, args=(storage, "worker")),
+            threading.Thread(target=_store_markers, args=(other_storage, "orchestrator")),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        try:
+            step_stats = storage.get_step_stats_for_run(DEFAULT_RUN_ID)
+            assert len(step_stats) == 1
+            assert step_stats[0].start_time == now
+            assert len(step_stats[0].markers) == 40
+        finally:
+            other_storage.dispose()
+
+    def test_prune_events_skips_unfinished_runs(self, storage):
+        now = time.time()
+        for run_id, event_types in [
+            ("finished", [DagsterEventType.RUN_START, DagsterEventType.RUN_SUCCESS]),
+            ("unfinished", [DagsterEventType.RUN_START, DagsterEventType.STEP_START]),
+        ]:
+            for event_type in event_types:
+                storage.store_event(_event_record(run_id, "A", now - 100, event_type))
+
+        assert storage.prune_events(now) == 2
+        assert storage.get_logs_for_run("finished") == []
+        assert len(storage.get_logs_for_run("unfinished")) == 2
+
 
 class TestConsolidatedSqliteEventLogStorage(TestEventLogStorage):
     __test__ = True
@@ -40,7 +40,11 @@
 from dagster.core.execution.api import execute_run
 from dagster.core.execution.plan.handle import StepHandle
 from dagster.core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster.core.execution.stats import StepEventStatus
+from dagster.core.execution.stats import (
+    StepEventStatus,
+    build_run_stats_from_events,
+    build_run_step_stats_from_events,
+)
 from dagster.core.storage.event_log import InMemoryEventLogStorage, SqlEventLogStorage
 from dagster.core.storage.event_log.base import (
     EventLogRecord,
@@ -48,10 +52,15 @@
     RunShardedEventsCursor,
 )
 from dagster.core.storage.event_log.migration import (
+    ASSET_PARTITIONS_TABLE,
+    CROSS_RUN_EVENT_INDEX_TABLE,
     EVENT_LOG_DATA_MIGRATIONS,
+    RUN_STATS_TABLE,
+    STEP_STATS_TABLE,
     migrate_asset_key_data,
 )
 from dagster.core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
+from dagster.core.storage.pipeline_run import RunsFilter
 from dagster.core.test_utils import instance_for_test
 from dagster.core.utils import make_new_run_id
 from dagster.loggers import colored_console_logger
@@ -425,6 +434,17 @@ def test_event_log_delete(self, storage):
         storage.delete_events(DEFAULT_RUN_ID)
         assert len(storage.get_logs_for_run(DEFAULT_RUN_ID)) == 0
 
+    def test_event_log_delete_in_batches(self, storage):
+        for i in range(5):
+            storage.store_event(create_test_event_log_record(str(i)))
+        storage.store_event(create_test_event_log_record("other", run_id="other_run"))
+
+        with mock.patch("dagster.core.storage.event_log.sql_event_log.DELETE_EVENTS_BATCH_SIZE", 2):
+            storage.delete_events(DEFAULT_RUN_ID)
+
+        assert len(storage.get_logs_for_run(DEFAULT_RUN_ID)) == 0
+        assert len(storage.get_logs_for_run("other_run")) == 1
+
     def test_event_log_get_stats_without_start_and_success(self, storage):
         # When an event log doesn't have a PIPELINE_START or PIPELINE_SUCCESS | PIPELINE_FAILURE event,
         # we want to ensure storage.get_stats_for_run(...) doesn't throw an error.
@@ -1165,6 +1185,152 @@ def _pipeline():
         assert len(step_stats[0].markers) == 1
         assert step_stats[0].markers[0].end_time >= step_stats[0].markers[0].start_time + 0.1
 
+    def test_run_step_stats_resumed_step(self, storage):
+        now = time.time()
+        for record in [
+            _event_record(DEFAULT_RUN_ID, "A", now - 300, DagsterEventType.STEP_START),
+            _event_record(DEFAULT_RUN_ID, "A", now - 250, DagsterEventType.STEP_UP_FOR_RETRY),
+            _event_record(DEFAULT_RUN_ID, "A", now - 240, DagsterEventType.STEP_RESTARTED),
+            # e.g. a step that was relaunched by a resumed run
+            _event_record(DEFAULT_RUN_ID, "A", now - 200, DagsterEventType.STEP_START),
+            _event_record(
+                DEFAULT_RUN_ID,
+                "A",
+                now - 150,
+                DagsterEventType.STEP_SUCCESS,
+                StepSuccessData(duration_ms=50000.0),
+            ),
+        ]:
+            storage.store_event(record)
+
+        def _assert_step_stats():
+            # the stats of a step that is started again are those of its latest start
+            step_stats = storage.get_step_stats_for_run(DEFAULT_RUN_ID)
+            assert len(step_stats) == 1
+            assert step_stats[0].start_time == now - 200
+            assert step_stats[0].end_time == now - 150
+            assert step_stats[0].attempts == 1
+            assert [(a.start_time, a.end_time) for a in step_stats[0].attempts_list] == [
+                (now - 300, now - 250),
+                (now - 200, now - 150),
+            ]
+
+        _assert_step_stats()
+
+        if isinstance(storage, SqlEventLogStorage):
+            # rebuilding the row from the event log yields the same stats
+            storage.rebuild_step_stats(DEFAULT_RUN_ID)
+            _assert_step_stats()
+
+    def test_run_step_stats_table(self, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        assert storage.has_secondary_index(STEP_STATS_TABLE)
+
+        @solid(input_defs=[InputDefinition("_input", str)], output_defs=[OutputDefinition(str)])
+        def should_retry(_, _input):
+            raise RetryRequested(max_retries=2)
+
+        @solid
+        def materialize(_):
+            yield AssetMaterialization(asset_key=AssetKey("asset_1"))
+            yield ExpectationResult(success=True, label="expected")
+            yield Output(1)
+
+        def _pipeline():
+            should_retry(should_succeed())
+            materialize()
+
+        events, result = _synthesize_events(_pipeline, check_success=False)
+        for event in events:
+            storage.store_event(event)
+
+        expected = build_run_step_stats_from_events(
+            result.run_id, storage.get_logs_for_run(result.run_id)
+        )
+        assert len(expected) == 3
+
+        step_stats = storage.get_step_stats_for_run(result.run_id)
+        assert sorted(step_stats, key=lambda x: x.step_key) == sorted(
+            expected, key=lambda x: x.step_key
+        )
+
+        materialize_stats = [stats for stats in step_stats if stats.step_key == "materialize"][0]
+        assert len(materialize_stats.materialization_events) == 1
+        assert len(materialize_stats.expectation_results) == 1
+
+        retry_stats = storage.get_step_stats_for_run(result.run_id, step_keys=["should_retry"])
+        assert len(retry_stats) == 1
+        assert retry_stats[0].attempts == 3
+        assert len(retry_stats[0].attempts_list) == 3
+
+        # rebuilding from the event log yields the same stats as the incremental updates
+        storage.rebuild_step_stats(result.run_id)
+        assert storage.get_step_stats_for_run(result.run_id) == step_stats
+
+        storage.delete_events(result.run_id)
+        assert storage.get_step_stats_for_run(result.run_id) == []
+
+    def test_run_stats_table(self, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        assert storage.has_secondary_index(RUN_STATS_TABLE)
+
+        @solid
+        def should_fail(_):
+            raise Exception("bar")
+
+        @solid
+        def materialize(_):
+            yield AssetMaterialization(asset_key=AssetKey("asset_1"))
+            yield ExpectationResult(success=True, label="expected")
+            yield Output(1)
+
+        def _pipeline():
+            should_succeed()
+            should_fail()
+            materialize()
+
+        run_ids = []
+        for _ in range(2):
+            events, result = _synthesize_events(_pipeline, check_success=False)
+            for event in events:
+                storage.store_event(event)
+            run_ids.append(result.run_id)
+
+        run_id = run_ids[0]
+        expected = build_run_stats_from_events(run_id, storage.get_logs_for_run(run_id))
+        stats = storage.get_stats_for_run(run_id)
+        assert stats == expected
+        assert stats.steps_succeeded == 2
+        assert stats.steps_failed == 1
+        assert stats.materializations == 1
+        assert stats.expectations == 1
+        assert stats.start_time and stats.end_time
+
+        # the stats of many runs are fetched together, including runs without any events
+        unknown_run_id = make_new_run_id()
+        stats_by_run_id = storage.get_stats_for_runs(run_ids + [unknown_run_id])
+        assert set(stats_by_run_id.keys()) == set(run_ids + [unknown_run_id])
+        assert stats_by_run_id[run_id] == stats
+        assert stats_by_run_id[unknown_run_id].steps_succeeded == 0
+        assert stats_by_run_id[unknown_run_id].start_time is None
+
+        # rebuilding from the event log yields the same counts as the incremental updates
+        storage.rebuild_run_stats(run_id)
+        rebuilt = storage.get_stats_for_run(run_id)
+        assert rebuilt.steps_succeeded == stats.steps_succeeded
+        assert rebuilt.steps_failed == stats.steps_failed
+        assert rebuilt.materializations == stats.materializations
+        assert rebuilt.expectations == stats.expectations
+        assert rebuilt.end_time == pytest.approx(stats.end_time)
+
+        storage.delete_events(run_id)
+        assert storage.get_stats_for_run(run_id).steps_succeeded == 0
+        assert storage.get_stats_for_run(run_ids[1]).steps_succeeded == 2
+
     @pytest.mark.parametrize(
         "cursor_dt", cursor_datetime_args()
     )  # test both tz-aware and naive datetimes
@@ -1364,6 +1530,90 @@ def a_pipe():
             ]
             assert [r.event_log_entry.run_id for r in filtered_records] == ["2", "3"]
 
+            if isinstance(storage, SqliteEventLogStorage):
+                # the ids of the runs updated after the cursor are bound in chunks, since sqlite
+                # limits the number of bound parameters of a statement
+                updated_run_records = instance.get_run_records(
+                    filters=RunsFilter(updated_after=tzaware_dt)
+                )
+                # the updated runs fall into different chunks of the run ids
+                many_run_records = (
+                    updated_run_records[:1]
+                    + [
+                        mock.MagicMock(pipeline_run=mock.MagicMock(run_id=make_new_run_id()))
+                        for _ in range(3)
+                    ]
+                    + updated_run_records[1:]
+                )
+                with mock.patch.object(
+                    storage._instance,  # pylint: disable=protected-access
+                    "get_run_records",
+                    return_value=many_run_records,
+                ), mock.patch(
+                    "dagster.core.storage.event_log.sqlite.sqlite_event_log.MAX_IN_CLAUSE_VALUES",
+                    2,
+                ):
+                    cursor_filter = EventRecordsFilter(
+                        event_type=DagsterEventType.PIPELINE_SUCCESS,
+                        after_cursor=RunShardedEventsCursor(id=0, run_updated_after=tzaware_dt),
+                    )
+                    filtered_records = storage.get_event_records(cursor_filter, ascending=True)
+                    assert [r.event_log_entry.run_id for r in filtered_records] == ["2", "3"]
+
+                    # the results of the chunked queries are merged in order before the limit
+                    filtered_records = storage.get_event_records(cursor_filter, limit=1)
+                    assert [r.event_log_entry.run_id for r in filtered_records] == ["3"]
+                    filtered_records = storage.get_event_records(
+                        cursor_filter, limit=1, ascending=True
+                    )
+                    assert [r.event_log_entry.run_id for r in filtered_records] == ["2"]
+
+    def test_cross_run_event_index_sqlite(self, storage):
+        if not isinstance(storage, SqliteEventLogStorage):
+            pytest.skip()
+
+        assert storage.has_secondary_index(CROSS_RUN_EVENT_INDEX_TABLE)
+
+        @solid
+        def return_one(_):
+            return 1
+
+        def _solids():
+            return_one()
+
+        run_ids = []
+        for _ in range(3):
+            events, result = _synthesize_events(_solids)
+            for event in events:
+                storage.store_event(event)
+            run_ids.append(result.run_id)
+
+        success_filter = EventRecordsFilter(event_type=DagsterEventType.PIPELINE_SUCCESS)
+        records = storage.get_event_records(success_filter, ascending=True)
+        assert [record.event_log_entry.run_id for record in records] == run_ids
+        assert (
+            _event_types([record.event_log_entry for record in records])
+            == [DagsterEventType.PIPELINE_SUCCESS] * 3
+        )
+
+        # storage ids point at the events in their run shards
+        for record in records:
+            assert storage.get_event_log_table_data(
+                record.event_log_entry.run_id, record.storage_id
+            )
+
+        [latest] = storage.get_event_records(success_filter, limit=1)
+        assert latest.event_log_entry.run_id == run_ids[-1]
+
+        # rebuilding the index from the run shards yields the same results
+        for run_id in run_ids:
+            storage.rebuild_cross_run_event_index(run_id)
+        assert storage.get_event_records(success_filter, ascending=True) == records
+
+        storage.delete_events(run_ids[0])
+        records = storage.get_event_records(success_filter, ascending=True)
+        assert [record.event_log_entry.run_id for record in records] == run_ids[1:]
+
     def test_watch_exc_recovery(self, storage):
         if not self.can_watch():
             pytest.skip("storage cannot watch runs")
@@ -1553,6 +1803,201 @@ def _fetch_events(storage):
             assert _event_tags(events_by_key[AssetKey("c")])["num"] == "2"
             assert _event_tags(events_by_key[AssetKey("d")])["num"] == "1"
 
+    def test_latest_materialization_summaries(self, storage):
+        a = AssetKey("summary_a")
+        b = AssetKey("summary_b")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(a, partition="x")
+            yield AssetMaterialization(a, partition="y")
+            yield AssetMaterialization(b)
+            yield AssetObservation(a, partition="z")
+            yield Output(None)
+
+        events, result = _synthesize_events(lambda: materialize())
+        for event in events:
+            storage.store_event(event)
+
+        summaries = storage.get_latest_materialization_summaries([a, b, AssetKey("unknown")])
+        assert summaries.get(AssetKey("unknown")) is None
+
+        # observations do not replace the latest materialization
+        events_by_key = storage.get_latest_materialization_events([a, b])
+        for asset_key, partition in [(a, "y"), (b, None)]:
+            summary = summaries[asset_key]
+            event = events_by_key[asset_key]
+            assert summary.asset_key == asset_key
+            assert summary.run_id == result.run_id
+            assert summary.partition == partition
+            assert event.dagster_event.partition == partition
+            assert summary.timestamp == pytest.approx(event.timestamp)
+
+        if isinstance(storage, SqlEventLogStorage):
+            [record] = storage.get_event_records(
+                EventRecordsFilter(event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=a),
+                limit=1,
+            )
+            assert summaries[a].storage_id == record.storage_id
+
+        if self.can_wipe():
+            storage.wipe_asset(a)
+            summaries = storage.get_latest_materialization_summaries([a, b])
+            assert summaries.get(a) is None
+            assert summaries[b].run_id == result.run_id
+
+    def test_latest_materialization_after_delete(self, storage):
+        asset_key = AssetKey("deleted_latest")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(asset_key)
+            yield Output(None)
+
+        first_run_id = make_new_run_id()
+        second_run_id = make_new_run_id()
+        for run_id in [first_run_id, second_run_id]:
+            events, _ = _synthesize_events(lambda: materialize(), run_id=run_id)
+            for event in events:
+                storage.store_event(event)
+
+        assert storage.get_latest_materialization_events([asset_key])[asset_key].run_id == (
+            second_run_id
+        )
+
+        # the latest materialization is gone, so the one before it is returned
+        storage.delete_events(second_run_id)
+        events_by_key = storage.get_latest_materialization_events([asset_key])
+        assert events_by_key[asset_key].run_id == first_run_id
+
+    def test_latest_materialization_after_wipe_and_delete(self, storage):
+        asset_key = AssetKey("wiped_then_deleted")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(asset_key)
+            yield Output(None)
+
+        first_run_id = make_new_run_id()
+        events, _ = _synthesize_events(lambda: materialize(), run_id=first_run_id)
+        for event in events:
+            storage.store_event(event)
+
+        storage.wipe_asset(asset_key)
+        assert not storage.get_latest_materialization_events([asset_key]).get(asset_key)
+
+        # the asset is materialized again after being wiped
+        second_run_id = make_new_run_id()
+        events, _ = _synthesize_events(lambda: materialize(), run_id=second_run_id)
+        for event in events:
+            storage.store_event(event)
+        assert storage.get_latest_materialization_events([asset_key])[asset_key].run_id == (
+            second_run_id
+        )
+
+        # once the materialization since the wipe is deleted, the one from before the wipe is not
+        # returned in its place
+        storage.delete_events(second_run_id)
+        assert not storage.get_latest_materialization_events([asset_key]).get(asset_key)
+
+    def test_prune_events(self, storage):
+        if not storage.supports_prune_events:
+            pytest.skip("This storage does not support pruning events")
+
+        asset_key = AssetKey("pruned_asset")
+
+        @solid
+        def materialize(_):
+            yield AssetMaterialization(asset_key, partition="a")
+            yield Output(1)
+
+        def _pipeline():
+            materialize()
+
+        old_events, old_result = _synthesize_events(_pipeline)
+        for event in old_events:
+            storage.store_event(event)
+
+        time.sleep(0.05)
+        before_timestamp = time.time()
+        time.sleep(0.05)
+
+        @solid
+        def noop(_):
+            yield Output(1)
+
+        new_events, new_result = _synthesize_events(lambda: noop())
+        for event in new_events:
+            storage.store_event(event)
+
+        deleted_count = storage.prune_events(before_timestamp, batch_size=2)
+        # only the latest materialization of the asset may remain in the event log of the run
+        remaining_events = storage.get_logs_for_run(old_result.run_id)
+        assert len(remaining_events) <= 1
+        assert all(
+            event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION
+            for event in remaining_events
+        )
+        assert deleted_count == len(old_events) - len(remaining_events)
+        assert len(storage.get_logs_for_run(new_result.run_id)) == len(new_events)
+
+        # the asset index is preserved, including the latest materialization of the asset
+        assert storage.has_asset_key(asset_key)
+        latest_event = storage.get_latest_materialization_events([asset_key])[asset_key]
+        assert latest_event.run_id == old_result.run_id
+        assert storage.get_materialization_count_by_partition([asset_key]) == {asset_key: {"a": 1}}
+
+        assert storage.prune_events(before_timestamp) == 0
+
+    def test_prune_events_out_of_order_timestamps(self, storage):
+        if not storage.supports_prune_events:
+            pytest.skip("This storage does not support pruning events")
+        if isinstance(storage, SqliteEventLogStorage):
+            pytest.skip("The run shards of unfinished runs are not pruned")
+
+        now = time.time()
+        # events are not necessarily stored in the order of their timestamps, e.g. when they are
+        # written by hosts with skewed clocks
+        for timestamp in [now - 10, now - 300, now - 5, now - 200, now - 1]:
+            storage.store_event(
+                _event_record(
+                    DEFAULT_RUN_ID, "A", timestamp, DagsterEventType.ENGINE_EVENT, EngineEventData()
+                )
+            )
+
+        assert storage.prune_events(now - 100, batch_size=1) == 2
+        assert [event.timestamp for event in storage.get_logs_for_run(DEFAULT_RUN_ID)] == [
+            now - 10,
+            now - 5,
+            now - 1,
+        ]
+
+    def test_prune_events_max_batches(self, storage):
+        if not storage.supports_prune_events:
+            pytest.skip("This storage does not support pruning events")
+        if isinstance(storage, (InMemoryEventLogStorage, SqliteEventLogStorage)):
+            pytest.skip("This storage does not prune events row by row")
+
+        now = time.time()
+        for i in range(5):
+            storage.store_event(
+                _event_record(
+                    DEFAULT_RUN_ID,
+                    "A",
+                    now - 100 + i,
+                    DagsterEventType.ENGINE_EVENT,
+                    EngineEventData(),
+                )
+            )
+
+        # pruning resumes where the previous call stopped
+        assert storage.prune_events(now, batch_size=2, max_batches=1) == 2
+        assert len(storage.get_logs_for_run(DEFAULT_RUN_ID)) == 3
+        assert storage.prune_events(now, batch_size=2, max_batches=1) == 2
+        assert storage.prune_events(now, batch_size=2, max_batches=1) == 1
+        assert storage.prune_events(now, batch_size=2, max_batches=1) == 0
+        assert storage.get_logs_for_run(DEFAULT_RUN_ID) == []
+
     def test_asset_keys(self, storage):
         with instance_for_test() as instance:
             if not storage._instance:  # pylint: disable=protected-access
@@ -1939,6 +2384,55 @@ def _fetch_counts(storage):
                 assert materialization_count_by_partition.get(c)["a"] == 1
                 assert materialization_count_by_partition.get(d)["x"] == 2
 
+    def test_asset_partitions_table(self, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        assert storage.has_secondary_index(ASSET_PARTITIONS_TABLE)
+
+        a = AssetKey("asset_partitions_a")
+        b = AssetKey("asset_partitions_b")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(a, partition="x")
+            yield AssetMaterialization(a, partition="y")
+            yield AssetMaterialization(b, partition="x")
+            yield AssetObservation(a, partition="x")
+            yield Output(None)
+
+        with instance_for_test() as instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(instance)
+
+            run_ids = []
+            for _ in range(2):
+                events, result = _synthesize_events(lambda: materialize(), instance=instance)
+                for event in events:
+                    storage.store_event(event)
+                run_ids.append(result.run_id)
+
+            # observations do not count as materializations of the partition
+            counts = storage.get_materialization_count_by_partition([a, b])
+            assert counts == {a: {"x": 2, "y": 2}, b: {"x": 2}}
+
+            # rebuilding from the event log yields the same counts as the incremental updates
+            storage.rebuild_asset_partitions(a)
+            assert storage.get_materialization_count_by_partition([a]) == {a: {"x": 2, "y": 2}}
+
+            storage.delete_events(run_ids[0])
+            counts = storage.get_materialization_count_by_partition([a, b])
+            assert counts == {a: {"x": 1, "y": 1}, b: {"x": 1}}
+
+            if self.can_wipe():
+                storage.wipe_asset(a)
+                counts = storage.get_materialization_count_by_partition([a, b])
+                assert counts == {a: {}, b: {"x": 1}}
+
+                # wiped materializations are not counted when the table is rebuilt
+                storage.rebuild_asset_partitions(a)
+                assert storage.get_materialization_count_by_partition([a]) == {a: {}}
+
     def test_get_observation(self, storage):
         a = AssetKey(["key_a"])
 
@@ -0,0 +1,146 @@
+# pylint: disable=redefined-outer-name
+
+import os
+import tempfile
+
+import mock
+import pendulum
+import pytest
+
+from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.storage.pipeline_run import PipelineRunStatus
+from dagster.core.test_utils import create_run_for_test, instance_for_test
+from dagster.daemon import get_default_daemon_logger
+from dagster.daemon.daemon import RetentionDaemon
+from dagster.daemon.retention import RetentionProgress, execute_retention_iteration
+from dagster.utils import touch_file
+
+
+@pytest.fixture
+def instance():
+    with instance_for_test(
+        overrides={
+            "retention": {
+                "runs": {"max_age_days": {"success": 7, "failure": 30}},
+                "batch_size": 2,
+                "batch_interval_seconds": 0.0,
+            },
+        }
+    ) as instance:
+        yield instance
+
+
+def _create_run(instance, status):
+    run = create_run_for_test(instance, pipeline_name="foo", status=status)
+    # simulate captured compute logs for the run
+    touch_file(instance.compute_log_manager.get_local_path(run.run_id, "bar", ComputeIOType.STDOUT))
+    return run
+
+
+def _run_ids(instance):
+    return {run.run_id for run in instance.get_runs()}
+
+
+def test_retention_daemon_required(instance):
+    assert RetentionDaemon.daemon_type() in instance.get_required_daemon_types()
+
+    with instance_for_test() as default_instance:
+        assert RetentionDaemon.daemon_type() not in default_instance.get_required_daemon_types()
+
+
+def test_purge_runs(instance):
+    logger = get_default_daemon_logger("RetentionDaemon")
+    progress = RetentionProgress()
+
+    success_runs = [_create_run(instance, PipelineRunStatus.SUCCESS) for _ in range(5)]
+    failure_run = _create_run(instance, PipelineRunStatus.FAILURE)
+    started_run = _create_run(instance, PipelineRunStatus.STARTED)
+    all_run_ids = _run_ids(instance)
+
+    list(execute_retention_iteration(instance, logger, progress))
+    assert _run_ids(instance) == all_run_ids
+    assert progress.runs_deleted == 0
+
+    # successful runs have aged out, failed runs are kept for longer
+    with pendulum.test(pendulum.now("UTC").add(days=8)):
+        list(execute_retention_iteration(instance, logger, progress))
+
+    assert _run_ids(instance) == {failure_run.run_id, started_run.run_id}
+    assert progress.runs_deleted == 5
+    for run in success_runs:
+        assert instance.all_logs(run.run_id) == []
+        assert not os.path.exists(
+            instance.compute_log_manager.get_local_path(run.run_id, "bar", ComputeIOType.STDOUT)
+        )
+
+    # runs that are still in progress are never deleted
+    with pendulum.test(pendulum.now("UTC").add(days=31)):
+        list(execute_retention_iteration(instance, logger, progress))
+
+    assert _run_ids(instance) == {started_run.run_id}
+    assert progress.to_dict() == {"runs_deleted": 6, "ticks_deleted": 0, "events_deleted": 0}
+
+
+def test_prune_events_unsupported():
+    logger = get_default_daemon_logger("RetentionDaemon")
+    progress = RetentionProgress()
+
+    with instance_for_test(
+        overrides={"retention": {"event_logs": {"max_age_days": 7}}}
+    ) as instance, mock.patch.object(
+        type(instance), "supports_event_log_pruning", new_callable=mock.PropertyMock
+    ) as supports_event_log_pruning, mock.patch.object(
+        instance, "prune_event_logs"
+    ) as prune_event_logs:
+        supports_event_log_pruning.return_value = False
+        # the event log storage is skipped, rather than failing every iteration
+        assert list(execute_retention_iteration(instance, logger, progress)) == []
+        prune_event_logs.assert_not_called()
+
+
+def test_prune_events_in_batches():
+    logger = get_default_daemon_logger("RetentionDaemon")
+    progress = RetentionProgress()
+
+    with tempfile.TemporaryDirectory() as temp_dir, instance_for_test(
+        overrides={
+            # events are deleted row by row from a non-sharded event log
+            "event_log_storage": {
+                "module": "dagster.core.storage.event_log",
+                "class": "ConsolidatedSqliteEventLogStorage",
+                "config": {"base_dir": temp_dir},
+            },
+            "retention": {
+                "event_logs": {"max_age_days": 7},
+                "batch_size": 2,
+                "batch_interval_seconds": 0.5,
+            },
+        }
+    ) as instance:
+        run = create_run_for_test(instance, pipeline_name="foo")
+        for i in range(5):
+            instance.report_engine_event(str(i), run)
+        num_events = len(instance.all_logs(run.run_id))
+
+        with pendulum.test(pendulum.now("UTC").add(days=8)), mock.patch(
+            "dagster.daemon.retention.retention_daemon.time.sleep"
+        ) as sleep, mock.patch.object(
+            instance, "prune_event_logs", wraps=instance.prune_event_logs
+        ) as prune_event_logs:
+            iteration = execute_retention_iteration(instance, logger, progress)
+
+            # the daemon yields after each batch, so it keeps heartbeating while it prunes
+            next(iteration)
+            assert progress.events_deleted == 2
+            assert len(instance.all_logs(run.run_id)) == num_events - 2
+
+            list(iteration)
+
+        assert instance.all_logs(run.run_id) == []
+        assert progress.events_deleted == num_events
+        # one batch per call, until a batch deletes no events
+        assert prune_event_logs.call_count == (num_events + 1) // 2 + 1
+        for call in prune_event_logs.call_args_list:
+            assert call.kwargs == {"batch_size": 2, "max_batches": 1}
+        sleep.assert_called_with(0.5)
+        assert sleep.call_count == (num_events + 1) // 2
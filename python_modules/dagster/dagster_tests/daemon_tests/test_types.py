@@ -20,6 +20,7 @@ def test_heartbeat_backcompat():
     assert heartbeat.daemon_type == "SCHEDULER"
     assert heartbeat.errors == []
     assert heartbeat.timestamp == 1612453213.775866
+    assert heartbeat.progress is None
 
 
 def test_run_status_sensor_cursor_backcompat():
@@ -0,0 +1,46 @@
+from dagster import execute_pipeline, pipeline, reconstructable, solid
+from dagster.core.test_utils import default_mode_def_for_test, instance_for_test
+
+
+@solid(tags={"dagster/resource_requirements": {"memory": 8}})
+def big(_):
+    pass
+
+
+@solid(tags={"dagster/resource_requirements": {"memory": 1}})
+def small(_):
+    pass
+
+
+@pipeline(mode_defs=[default_mode_def_for_test])
+def resource_capacities_test():
+    big()
+    big()
+    small()
+
+
+def test_resource_capacities_mp():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(resource_capacities_test),
+            {
+                "execution": {"multiprocess": {"config": {"resource_capacities": {"memory": 10}}}},
+            },
+            instance=instance,
+        )
+        assert result.success
+
+        step_events = [
+            (str(event.solid_handle), event.event_type_value)
+            for event in result.step_event_list
+            if event.is_step_start or event.is_step_success
+        ]
+        # the big steps don't fit within the memory capacity together, so run one after the other
+        first_big, second_big = [
+            handle
+            for handle, event_type in step_events
+            if handle.startswith("big") and event_type == "STEP_START"
+        ]
+        assert step_events.index((first_big, "STEP_SUCCESS")) < step_events.index(
+            (second_big, "STEP_START")
+        )
@@ -1,4 +1,5 @@
 import subprocess
+import time
 from typing import List
 
 from dagster import executor, pipeline, reconstructable, solid
@@ -6,9 +7,11 @@
 from dagster.core.definitions.executor_definition import multiple_process_executor_requirements
 from dagster.core.definitions.mode import ModeDefinition
 from dagster.core.events import DagsterEvent, DagsterEventType
+from dagster.core.events.log import EventLogEntry
 from dagster.core.execution.api import execute_pipeline
 from dagster.core.execution.retries import RetryMode
 from dagster.core.executor.step_delegating import StepDelegatingExecutor, StepHandler
+from dagster.core.executor.step_delegating.step_delegating_executor import WatchedEvents
 from dagster.core.storage.fs_io_manager import fs_io_manager
 from dagster.core.test_utils import instance_for_test
 
@@ -18,10 +21,12 @@ class TestStepHandler(StepHandler):
     # are left alive when the test ends. Non-test step handlers should not keep their own state in memory.
     processes = []  # type: ignore
     launch_step_count = 0  # type: ignore
+    launched_step_keys = []  # type: ignore
     saw_baz_solid = False
     check_step_health_count = 0  # type: ignore
     terminate_step_count = 0  # type: ignore
     verify_step_count = 0  # type: ignore
+    cleanup_run_count = 0  # type: ignore
 
     @property
     def name(self):
@@ -35,6 +40,9 @@ def launch_step(self, step_handler_context):
             assert step_handler_context.step_tags["baz_solid"] == {"foo": "bar"}
 
         TestStepHandler.launch_step_count += 1
+        TestStepHandler.launched_step_keys.append(
+            step_handler_context.execute_step_args.step_keys_to_execute
+        )
         print("TestStepHandler Launching Step!")  # pylint: disable=print-call
         TestStepHandler.processes.append(
             subprocess.Popen(step_handler_context.execute_step_args.get_command_args())
@@ -49,13 +57,18 @@ def terminate_step(self, step_handler_context):
         TestStepHandler.terminate_step_count += 1
         raise NotImplementedError()
 
+    def cleanup_run(self, run_id):
+        TestStepHandler.cleanup_run_count += 1
+
     @classmethod
     def reset(cls):
         cls.processes = []
         cls.launch_step_count = 0
+        cls.launched_step_keys = []
         cls.check_step_health_count = 0
         cls.terminate_step_count = 0
         cls.verify_step_count = 0
+        cls.cleanup_run_count = 0
 
     @classmethod
     def wait_for_processes(cls):
@@ -76,6 +89,9 @@ def test_step_delegating_executor(exc_init):
         check_step_health_interval_seconds=exc_init.executor_config.get(
             "check_step_health_interval_seconds"
         ),
+        max_steps_per_worker=exc_init.executor_config.get("max_steps_per_worker"),
+        watch_events=exc_init.executor_config.get("watch_events", False),
+        watch_fallback_sleep_seconds=exc_init.executor_config.get("watch_fallback_sleep_seconds"),
     )
 
 
@@ -122,6 +138,7 @@ def test_execute():
     assert result.success
     assert TestStepHandler.saw_baz_solid
     assert TestStepHandler.verify_step_count == 0
+    assert TestStepHandler.cleanup_run_count == 1
 
 
 def test_skip_execute():
@@ -220,6 +237,92 @@ def test_execute_intervals():
     assert TestStepHandler.check_step_health_count >= 3
 
 
+def test_execute_multiple_steps_per_worker():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(foo_pipline),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "test_step_delegating_executor": {
+                        "config": {
+                            "max_steps_per_worker": 2,
+                            "check_step_health_interval_seconds": 0,
+                        }
+                    }
+                }
+            },
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    # both untagged bar_solid steps are ready at the start and share a worker
+    assert TestStepHandler.launch_step_count == 2
+    assert sorted(TestStepHandler.launched_step_keys[0]) == ["bar_solid", "bar_solid_2"]
+    assert TestStepHandler.launched_step_keys[1] == ["baz_solid"]
+    assert TestStepHandler.terminate_step_count == 0
+    assert TestStepHandler.check_step_health_count >= 2
+    assert len([event for event in result.step_event_list if event.is_step_success]) == 3
+
+
+def test_execute_watch_events():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        start_time = time.time()
+        result = execute_pipeline(
+            reconstructable(foo_pipline),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "test_step_delegating_executor": {
+                        "config": {"watch_events": True, "watch_fallback_sleep_seconds": 120.0}
+                    }
+                }
+            },
+        )
+        end_time = time.time()
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert TestStepHandler.launch_step_count == 3
+    # the executor is woken by the written step events rather than the fallback poll
+    assert end_time - start_time < 120
+    # the events delivered by the watch are each consumed once
+    assert len([event for event in result.step_event_list if event.is_step_success]) == 3
+
+
+def _event_log_entry(message):
+    return EventLogEntry(
+        error_info=None, level="debug", user_message=message, run_id="foo", timestamp=time.time()
+    )
+
+
+def test_watched_events():
+    before_watch, queried_and_delivered, delivered = [
+        _event_log_entry(message) for message in ["before_watch", "queried", "delivered"]
+    ]
+    watched_events = WatchedEvents()
+
+    # the event log is queried until the cursor has caught up with the watch
+    assert watched_events.on_event_delivered(queried_and_delivered)
+    assert watched_events.pop_delivered() is None
+
+    # the delivered events returned by the query are consumed from the query
+    watched_events.on_events_queried([before_watch, queried_and_delivered])
+    assert watched_events.pop_delivered() == []
+
+    assert watched_events.on_event_delivered(delivered)
+    assert watched_events.pop_delivered() == [delivered]
+    assert watched_events.pop_delivered() == []
+
+    # events that are delivered after a query returned them are not consumed again
+    late = _event_log_entry("late")
+    watched_events.on_events_queried([late])
+    assert not watched_events.on_event_delivered(late)
+    assert watched_events.pop_delivered() == []
+
+
 @executor(
     name="test_step_delegating_executor_verify_step",
     requirements=multiple_process_executor_requirements(),
@@ -0,0 +1,231 @@
+import sys
+import threading
+import time
+
+import pytest
+
+from dagster import (
+    DynamicOut,
+    DynamicOutput,
+    Failure,
+    RetryPolicy,
+    execute_pipeline,
+    job,
+    mem_io_manager,
+    op,
+    resource,
+    threadpool_executor,
+)
+from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.test_utils import instance_for_test
+
+# raises if fewer than three steps are waiting on it at once, i.e. if the steps are not executed
+# concurrently
+barrier = threading.Barrier(3, timeout=10)
+
+resource_inits = []
+
+
+@resource
+def counted_resource(_):
+    resource_inits.append(1)
+    return "shared"
+
+
+@op
+def emit_one():
+    return 1
+
+
+@op(required_resource_keys={"counted"})
+def wait_and_add_one(context, x):
+    assert context.resources.counted == "shared"
+    print(f"stdout from {context.solid_handle.name}")  # pylint: disable=print-call
+    sys.stderr.write(f"stderr from {context.solid_handle.name}\n")
+    barrier.wait()
+    return x + 1
+
+
+@op
+def total(a, b, c):
+    return a + b + c
+
+
+@job(
+    executor_def=threadpool_executor,
+    resource_defs={"io_manager": mem_io_manager, "counted": counted_resource},
+)
+def concurrent_job():
+    one = emit_one()
+    total(
+        wait_and_add_one.alias("first")(one),
+        wait_and_add_one.alias("second")(one),
+        wait_and_add_one.alias("third")(one),
+    )
+
+
+def test_threadpool_executor():
+    barrier.reset()
+    del resource_inits[:]
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(concurrent_job, instance=instance)
+        assert result.success
+
+        # resources are initialized once, and shared by the steps
+        assert len(resource_inits) == 1
+
+        assert result.result_for_solid("total").output_value() == 6
+
+        # the logs written by each step's thread are attributed to that step
+        for step_key in ["first", "second", "third"]:
+            stdout = instance.compute_log_manager.read_logs_file(
+                result.run_id, step_key, ComputeIOType.STDOUT
+            ).data
+            assert stdout == f"stdout from {step_key}\n"
+
+            stderr = instance.compute_log_manager.read_logs_file(
+                result.run_id, step_key, ComputeIOType.STDERR
+            ).data
+            assert f"stderr from {step_key}" in stderr
+            assert not any(
+                f"stderr from {other_key}" in stderr
+                for other_key in ["first", "second", "third"]
+                if other_key != step_key
+            )
+
+
+running_ops = []
+max_running_ops = []
+running_ops_lock = threading.Lock()
+
+
+@op
+def track_concurrency():
+    with running_ops_lock:
+        running_ops.append(1)
+        max_running_ops.append(len(running_ops))
+    time.sleep(0.1)
+    with running_ops_lock:
+        running_ops.pop()
+
+
+@job(executor_def=threadpool_executor)
+def max_concurrent_job():
+    for i in range(6):
+        track_concurrency.alias(f"track_{i}")()
+
+
+def test_threadpool_executor_max_concurrent():
+    del max_running_ops[:]
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            max_concurrent_job,
+            run_config={"execution": {"config": {"max_concurrent": 2}}},
+            instance=instance,
+        )
+        assert result.success
+        assert max(max_running_ops) == 2
+
+
+@job(executor_def=threadpool_executor)
+def resource_capacities_job():
+    for i in range(4):
+        track_concurrency.alias(f"track_{i}").tag(
+            {"dagster/resource_requirements": {"memory": 4}}
+        )()
+
+
+def test_threadpool_executor_resource_capacities():
+    del max_running_ops[:]
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            resource_capacities_job,
+            run_config={
+                "execution": {
+                    "config": {"max_concurrent": 4, "resource_capacities": {"memory": 10}}
+                }
+            },
+            instance=instance,
+        )
+        assert result.success
+        # only two of the steps fit within the memory capacity at once
+        assert max(max_running_ops) == 2
+
+
+@op
+def fail_op():
+    raise Failure("fail_op failed")
+
+
+@op
+def after_fail(_x):
+    pass
+
+
+@op
+def independent_op():
+    return 1
+
+
+@job(executor_def=threadpool_executor, resource_defs={"io_manager": mem_io_manager})
+def failing_job():
+    after_fail(fail_op())
+    independent_op()
+
+
+def test_threadpool_executor_failure():
+    with instance_for_test() as instance:
+        result = execute_pipeline(failing_job, instance=instance, raise_on_error=False)
+        assert not result.success
+        assert result.result_for_solid("fail_op").failure_data
+        assert result.result_for_solid("after_fail").skipped
+        assert result.result_for_solid("independent_op").success
+
+        with pytest.raises(Failure, match="fail_op failed"):
+            execute_pipeline(failing_job, instance=instance)
+
+
+attempts = []
+
+
+@op(retry_policy=RetryPolicy(max_retries=2))
+def flaky_op():
+    attempts.append(1)
+    if len(attempts) < 3:
+        raise Exception("flaky")
+    return len(attempts)
+
+
+@op(out=DynamicOut())
+def dynamic_op():
+    for i in range(4):
+        yield DynamicOutput(i, mapping_key=str(i))
+
+
+@op
+def double(x):
+    return x * 2
+
+
+@op
+def sum_doubled(xs):
+    return sum(xs)
+
+
+@job(executor_def=threadpool_executor, resource_defs={"io_manager": mem_io_manager})
+def retry_and_dynamic_job():
+    flaky_op()
+    sum_doubled(dynamic_op().map(double).collect())
+
+
+def test_threadpool_executor_retries_and_dynamic_outputs():
+    del attempts[:]
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(retry_and_dynamic_job, instance=instance)
+        assert result.success
+        assert result.result_for_solid("flaky_op").output_value() == 3
+        assert result.result_for_solid("sum_doubled").output_value() == 12
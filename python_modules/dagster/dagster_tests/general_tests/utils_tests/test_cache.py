@@ -0,0 +1,60 @@
+from dagster.utils.cache import LRUCache
+
+
+def test_lru_cache_eviction():
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used entry
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+    stats = cache.get_stats()
+    assert stats.evictions == 1
+    assert stats.size == 2
+    assert stats.max_size == 2
+
+
+def test_lru_cache_stats():
+    cache = LRUCache(max_size=10)
+    assert cache.get_stats().hit_rate == 0.0
+
+    calls = []
+
+    def _compute():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_compute("key", _compute) == "value"
+    assert cache.get_or_compute("key", _compute) == "value"
+    assert cache.get_or_compute("key", _compute) == "value"
+    assert len(calls) == 1
+
+    stats = cache.get_stats()
+    assert stats.hits == 2
+    assert stats.misses == 1
+    assert stats.hit_rate == 2 / 3
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get("key") is None
+
+
+def test_lru_cache_on_evict():
+    evicted = []
+    cache = LRUCache(max_size=2, on_evict=lambda key, value: evicted.append((key, value)))
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert evicted == [("a", 1)]
+
+    assert cache.pop("b") == 2
+    assert cache.pop("b") is None
+    assert evicted == [("a", 1), ("b", 2)]
+
+    cache.clear()
+    assert evicted == [("a", 1), ("b", 2), ("c", 3)]
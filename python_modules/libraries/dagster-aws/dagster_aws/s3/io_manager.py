@@ -1,9 +1,100 @@
 import io
+import os
 import pickle
+import threading
 
-from dagster import Field, MemoizableIOManager, StringSource, check, io_manager
+from boto3.s3.transfer import TransferConfig
+
+from dagster import Field, IntSource, MemoizableIOManager, StringSource, check, io_manager
 from dagster.utils import PICKLE_PROTOCOL
 
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024  # 8 MB, the boto3 default
+MIN_MULTIPART_CHUNKSIZE = 5 * 1024 * 1024  # 5 MB, the minimum size of a part allowed by S3
+DEFAULT_MAX_CONCURRENCY = 10  # the boto3 default
+
+# size of the reads from the streaming body of an object being unpickled
+LOAD_BUFFER_SIZE = 1024 * 1024  # 1 MB
+
+S3_PICKLE_IO_MANAGER_CONFIG = {
+    "s3_bucket": Field(StringSource),
+    "s3_prefix": Field(StringSource, is_required=False, default_value="dagster"),
+    "multipart_chunksize": Field(
+        IntSource,
+        is_required=False,
+        default_value=DEFAULT_MULTIPART_CHUNKSIZE,
+        description="The size in bytes of each part of the multipart uploads of outputs, at least "
+        "5 MB (5242880 bytes), the minimum size of a part allowed by S3. Outputs smaller than a "
+        "single part are uploaded in a single request.",
+    ),
+    "max_concurrency": Field(
+        IntSource,
+        is_required=False,
+        default_value=DEFAULT_MAX_CONCURRENCY,
+        description="The maximum number of parts of an output uploaded concurrently.",
+    ),
+}
+
+
+class _PickledObjectStream:
+    """Read-only, non-seekable file-like object over the pickled bytes of an object.
+
+    The object is pickled by a background thread into a pipe as the bytes are read, so that an
+    upload never holds more than the parts in flight in memory. Reaching the end of the stream
+    raises the error of the pickling, if any, so that a partially pickled object fails the upload
+    rather than being stored.
+    """
+
+    def __init__(self, obj):
+        read_fd, write_fd = os.pipe()
+        self._read_file = os.fdopen(read_fd, "rb")
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._pickle, args=(obj, write_fd), name="s3-pickle-io-manager", daemon=True
+        )
+        self._thread.start()
+
+    def _pickle(self, obj, write_fd):
+        try:
+            with os.fdopen(write_fd, "wb") as write_file:
+                pickle.dump(obj, write_file, PICKLE_PROTOCOL)
+        except Exception as e:  # pylint: disable=broad-except
+            self._error = e
+
+    def read(self, size=-1):
+        data = self._read_file.read(size)
+        if not data or size is None or size < 0:
+            # the pickling thread closes the pipe when it's done, successfully or not
+            self._thread.join()
+            if self._error:
+                raise self._error
+        return data
+
+    def close(self):
+        # closing the read end of the pipe stops the pickling thread if the upload was abandoned
+        self._read_file.close()
+        self._thread.join()
+
+
+class _StreamingBodyReader(io.RawIOBase):
+    """Raw reader over the streaming body of an S3 object, so that it can be buffered and read by
+    the unpickler as it downloads."""
+
+    def __init__(self, body):
+        self._body = body
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._body.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed and callable(getattr(self._body, "close", None)):
+            self._body.close()
+        super().close()
+
 
 class PickledObjectS3IOManager(MemoizableIOManager):
     def __init__(
@@ -11,12 +102,28 @@ def __init__(
         s3_bucket,
         s3_session,
         s3_prefix=None,
+        multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
     ):
         self.bucket = check.str_param(s3_bucket, "s3_bucket")
         self.s3_prefix = check.str_param(s3_prefix, "s3_prefix")
         self.s3 = s3_session
         self.s3.head_bucket(Bucket=self.bucket)
 
+        multipart_chunksize = check.int_param(multipart_chunksize, "multipart_chunksize")
+        check.invariant(
+            multipart_chunksize >= MIN_MULTIPART_CHUNKSIZE,
+            f"multipart_chunksize must be at least {MIN_MULTIPART_CHUNKSIZE} bytes, the minimum "
+            "size of a part of a multipart upload allowed by S3",
+        )
+        max_concurrency = check.int_param(max_concurrency, "max_concurrency")
+        self.transfer_config = TransferConfig(
+            # upload any output spanning more than a single part as a multipart upload
+            multipart_threshold=multipart_chunksize,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+        )
+
     def _get_path(self, context):
         return "/".join([self.s3_prefix, "storage", *context.get_output_identifier()])
 
@@ -24,13 +131,6 @@ def has_output(self, context):
         key = self._get_path(context)
         return self._has_object(key)
 
-    def _rm_object(self, key):
-        check.str_param(key, "key")
-        check.param_invariant(len(key) > 0, "key")
-
-        # delete_object wont fail even if the item has been deleted.
-        self.s3.delete_object(Bucket=self.bucket, Key=key)
-
     def _has_object(self, key):
         check.str_param(key, "key")
         check.param_invariant(len(key) > 0, "key")
@@ -52,7 +152,11 @@ def _uri_for_key(self, key):
     def load_input(self, context):
         key = self._get_path(context.upstream_output)
         context.log.debug(f"Loading S3 object from: {self._uri_for_key(key)}")
-        obj = pickle.loads(self.s3.get_object(Bucket=self.bucket, Key=key)["Body"].read())
+        body = self.s3.get_object(Bucket=self.bucket, Key=key)["Body"]
+
+        # unpickle from the body as it downloads, rather than reading the whole object first
+        with io.BufferedReader(_StreamingBodyReader(body), LOAD_BUFFER_SIZE) as reader:
+            obj = pickle.load(reader)
 
         return obj
 
@@ -60,20 +164,20 @@ def handle_output(self, context, obj):
         key = self._get_path(context)
         context.log.debug(f"Writing S3 object at: {self._uri_for_key(key)}")
 
-        if self._has_object(key):
-            context.log.warning(f"Removing existing S3 key: {key}")
-            self._rm_object(key)
-
-        pickled_obj = pickle.dumps(obj, PICKLE_PROTOCOL)
-        pickled_obj_bytes = io.BytesIO(pickled_obj)
-        self.s3.upload_fileobj(pickled_obj_bytes, self.bucket, key)
+        # a PUT to an existing key replaces the object, so there is no need to check for or delete
+        # a previous output first. The object is pickled as the upload reads it, and uploaded in
+        # parts once it is larger than a single part.
+        pickled_obj_stream = _PickledObjectStream(obj)
+        try:
+            self.s3.upload_fileobj(
+                pickled_obj_stream, self.bucket, key, Config=self.transfer_config
+            )
+        finally:
+            pickled_obj_stream.close()
 
 
 @io_manager(
-    config_schema={
-        "s3_bucket": Field(StringSource),
-        "s3_prefix": Field(StringSource, is_required=False, default_value="dagster"),
-    },
+    config_schema=S3_PICKLE_IO_MANAGER_CONFIG,
     required_resource_keys={"s3"},
 )
 def s3_pickle_io_manager(init_context):
@@ -82,6 +186,10 @@ def s3_pickle_io_manager(init_context):
     Serializes objects via pickling. Suitable for objects storage for distributed executors, so long
     as each execution node has network connectivity and credentials for S3 and the backing bucket.
 
+    Objects are pickled as they are uploaded and unpickled as they are downloaded, so they are never
+    held in memory as bytes in full. Objects larger than ``multipart_chunksize`` are uploaded in
+    parts, up to ``max_concurrency`` of them at once.
+
     Attach this resource definition to your job to make it available to your ops.
 
     .. code-block:: python
@@ -99,11 +207,19 @@ def my_job():
                 config:
                     s3_bucket: my-cool-bucket
                     s3_prefix: good/prefix-for-files-
+                    multipart_chunksize: 16777216 # optional, 8 MB by default
+                    max_concurrency: 4 # optional, 10 by default
     """
     s3_session = init_context.resources.s3
     s3_bucket = init_context.resource_config["s3_bucket"]
     s3_prefix = init_context.resource_config.get("s3_prefix")  # s3_prefix is optional
-    pickled_io_manager = PickledObjectS3IOManager(s3_bucket, s3_session, s3_prefix=s3_prefix)
+    pickled_io_manager = PickledObjectS3IOManager(
+        s3_bucket,
+        s3_session,
+        s3_prefix=s3_prefix,
+        multipart_chunksize=init_context.resource_config["multipart_chunksize"],
+        max_concurrency=init_context.resource_config["max_concurrency"],
+    )
     return pickled_io_manager
 
 
@@ -113,10 +229,7 @@ def _get_path(self, context):
 
 
 @io_manager(
-    config_schema={
-        "s3_bucket": Field(StringSource),
-        "s3_prefix": Field(StringSource, is_required=False, default_value="dagster"),
-    },
+    config_schema=S3_PICKLE_IO_MANAGER_CONFIG,
     required_resource_keys={"s3"},
 )
 def s3_pickle_asset_io_manager(init_context):
@@ -128,6 +241,10 @@ def s3_pickle_asset_io_manager(init_context):
     Serializes objects via pickling. Suitable for objects storage for distributed executors, so long
     as each execution node has network connectivity and credentials for S3 and the backing bucket.
 
+    Objects are pickled as they are uploaded and unpickled as they are downloaded, so they are never
+    held in memory as bytes in full. Objects larger than ``multipart_chunksize`` are uploaded in
+    parts, up to ``max_concurrency`` of them at once.
+
     Attach this resource definition to your job to make it available to your ops.
 
     .. code-block:: python
@@ -146,9 +263,17 @@ def s3_pickle_asset_io_manager(init_context):
                 config:
                     s3_bucket: my-cool-bucket
                     s3_prefix: good/prefix-for-files-
+                    multipart_chunksize: 16777216 # optional, 8 MB by default
+                    max_concurrency: 4 # optional, 10 by default
     """
     s3_session = init_context.resources.s3
     s3_bucket = init_context.resource_config["s3_bucket"]
     s3_prefix = init_context.resource_config.get("s3_prefix")  # s3_prefix is optional
-    pickled_io_manager = PickledObjectS3AssetIOManager(s3_bucket, s3_session, s3_prefix=s3_prefix)
+    pickled_io_manager = PickledObjectS3AssetIOManager(
+        s3_bucket,
+        s3_session,
+        s3_prefix=s3_prefix,
+        multipart_chunksize=init_context.resource_config["multipart_chunksize"],
+        max_concurrency=init_context.resource_config["max_concurrency"],
+    )
     return pickled_io_manager
@@ -1,4 +1,10 @@
-from dagster_aws.s3.io_manager import s3_pickle_asset_io_manager, s3_pickle_io_manager
+import pytest
+from dagster_aws.s3.io_manager import (
+    PickledObjectS3IOManager,
+    s3_pickle_asset_io_manager,
+    s3_pickle_io_manager,
+)
+from dagster_aws.s3.s3_fake_resource import create_s3_fake_resource
 from dagster_aws.s3.utils import construct_s3_client
 
 from dagster import (
@@ -9,6 +15,7 @@
     VersionStrategy,
     asset,
     build_assets_job,
+    check,
     job,
     op,
     resource,
@@ -59,6 +66,111 @@ def test_s3_pickle_io_manager_execution(mock_s3_bucket):
     assert len(list(mock_s3_bucket.objects.all())) == 2
 
 
+def define_large_assets_job(s3_resource):
+    @asset
+    def large():
+        # large enough to be uploaded in three parts of the minimum part size
+        return b"x" * 12 * 1024 * 1024
+
+    @asset
+    def length(large):
+        return len(large)
+
+    return build_assets_job(
+        name="large_assets",
+        assets=[large, length],
+        resource_defs={"io_manager": s3_pickle_asset_io_manager, "s3": s3_resource},
+    )
+
+
+def test_s3_pickle_io_manager_multipart_overwrite(mock_s3_bucket):
+    large_assets_job = define_large_assets_job(s3_test_resource)
+
+    run_config = {
+        "resources": {
+            "io_manager": {
+                "config": {
+                    "s3_bucket": mock_s3_bucket.name,
+                    "multipart_chunksize": 5 * 1024 * 1024,
+                    "max_concurrency": 2,
+                }
+            }
+        }
+    }
+
+    # each materialization overwrites the previous one
+    for _ in range(2):
+        result = large_assets_job.execute_in_process(run_config)
+        assert result.success
+        assert result.output_for_node("length") == 12 * 1024 * 1024
+
+    objects = {obj.key: obj for obj in mock_s3_bucket.objects.all()}
+    assert set(objects.keys()) == {"dagster/large", "dagster/length"}
+
+    # the etags of multipart uploads are suffixed by their number of parts
+    assert objects["dagster/large"].e_tag.endswith('-3"')
+    assert "-" not in objects["dagster/length"].e_tag
+
+
+def test_s3_pickle_io_manager_overwrite_without_round_trips():
+    s3_session = create_s3_fake_resource()
+
+    @resource
+    def fake_s3_resource(_):
+        return s3_session
+
+    large_assets_job = define_large_assets_job(fake_s3_resource)
+    run_config = {"resources": {"io_manager": {"config": {"s3_bucket": "test-bucket"}}}}
+
+    for _ in range(2):
+        result = large_assets_job.execute_in_process(run_config)
+        assert result.success
+        assert result.output_for_node("length") == 12 * 1024 * 1024
+
+    assert set(s3_session.buckets["test-bucket"].keys()) == {"dagster/large", "dagster/length"}
+
+    # existing objects are overwritten by the uploads, without being checked for or deleted first
+    assert not s3_session.mock_extras.head_object.called
+    assert not s3_session.mock_extras.delete_object.called
+    assert s3_session.mock_extras.upload_fileobj.call_count == 4
+
+
+def test_s3_pickle_io_manager_pickling_failure():
+    s3_session = create_s3_fake_resource()
+
+    @resource
+    def fake_s3_resource(_):
+        return s3_session
+
+    @op
+    def return_unpicklable():
+        return lambda: None
+
+    @job(resource_defs={"io_manager": s3_pickle_io_manager, "s3": fake_s3_resource})
+    def unpicklable_job():
+        return_unpicklable()
+
+    run_config = {"resources": {"io_manager": {"config": {"s3_bucket": "test-bucket"}}}}
+
+    with pytest.raises(Exception, match="pickle"):
+        unpicklable_job.execute_in_process(run_config)
+
+    # the partially pickled object is not stored
+    assert not s3_session.buckets["test-bucket"]
+
+
+def test_s3_pickle_io_manager_multipart_chunksize_minimum():
+    s3_session = create_s3_fake_resource()
+
+    # S3 rejects the parts of a multipart upload that are smaller than 5 MB, except the last one
+    with pytest.raises(check.CheckError, match="multipart_chunksize must be at least 5242880"):
+        PickledObjectS3IOManager("test-bucket", s3_session, "dagster", multipart_chunksize=1024)
+
+    PickledObjectS3IOManager(
+        "test-bucket", s3_session, "dagster", multipart_chunksize=5 * 1024 * 1024
+    )
+
+
 def define_multiple_output_job():
     @op(
         out={
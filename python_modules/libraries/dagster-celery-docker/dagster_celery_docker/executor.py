@@ -251,7 +251,7 @@ def _execute_step_docker(
             )
 
         # Post event for starting execution
-        engine_event = instance.report_engine_event(
+        instance.report_engine_event(
             "Executing steps {} in Docker container {}".format(step_keys_str, docker_image),
             pipeline_run,
             EngineEventData(
@@ -266,8 +266,6 @@ def _execute_step_docker(
             step_key=execute_step_args.step_keys_to_execute[0],
         )
 
-        serialized_events = [serialize_dagster_namedtuple(engine_event)]
-
         docker_env = {}
         if docker_config.get("env_vars"):
             docker_env = {env_name: os.getenv(env_name) for env_name in docker_config["env_vars"]}
@@ -302,8 +300,8 @@ def _execute_step_docker(
             if res is None:
                 raise Exception("No response from execute_step in CeleryDockerExecutor")
 
-            serialized_events += [event for event in res.split("\n") if event]
-
-        return serialized_events
+        # The step events are written to the event log by the step container, where the
+        # orchestrator reads them from, so they are not returned in the task result
+        return execute_step_args.step_keys_to_execute
 
     return _execute_step_docker
@@ -22,9 +22,6 @@
 )
 from dagster_k8s.utils import (
     delete_job,
-    filter_dagster_events_from_pod_logs,
-    get_pod_names_in_job,
-    retrieve_pod_logs,
     wait_for_job_success,
 )
 
@@ -45,7 +42,7 @@
 from dagster.core.execution.plan.objects import StepFailureData, UserFailureData
 from dagster.core.execution.retries import RetryMode
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
-from dagster.serdes import pack_value, serialize_dagster_namedtuple, unpack_value
+from dagster.serdes import pack_value, unpack_value
 from dagster.utils.error import serializable_error_info_from_exc_info
 
 from .config import CELERY_K8S_CONFIG_KEY, celery_k8s_executor_config
@@ -382,12 +379,9 @@ def _execute_step_k8s_job(
             },
         )
 
-        # Running list of events generated from this task execution
-        events = []
-
         # Post event for starting execution
         job_name = job.metadata.name
-        engine_event = instance.report_engine_event(
+        instance.report_engine_event(
             "Executing step {} in Kubernetes job {}".format(step_key, job_name),
             pipeline_run,
             EngineEventData(
@@ -408,7 +402,6 @@ def _execute_step_k8s_job(
             # execution plan in this function (Celery K8s workers should not access to user code)
             step_key=step_key,
         )
-        events.append(engine_event)
         try:
             kubernetes.client.BatchV1Api().create_namespaced_job(body=job, namespace=job_namespace)
         except kubernetes.client.rest.ApiException as e:
@@ -453,10 +446,7 @@ def _execute_step_k8s_job(
                 wait_timeout=job_wait_timeout,
             )
         except (DagsterK8sError, DagsterK8sTimeoutError) as err:
-            step_failure_event = construct_step_failure_event_and_handle(
-                pipeline_run, step_key, err, instance=instance
-            )
-            events.append(step_failure_event)
+            construct_step_failure_event_and_handle(pipeline_run, step_key, err, instance=instance)
         except DagsterK8sPipelineStatusException:
             instance.report_engine_event(
                 "Terminating Kubernetes Job because dagster run status is not STARTED",
@@ -496,58 +486,8 @@ def _execute_step_k8s_job(
             )
             return []
 
-        try:
-            pod_names = get_pod_names_in_job(job_name, namespace=job_namespace)
-        except kubernetes.client.rest.ApiException as e:
-            instance.report_engine_event(
-                "Encountered unexpected error retreiving Pods for Kubernetes job {} for step {}, "
-                "exiting.".format(job_name, step_key),
-                pipeline_run,
-                EngineEventData(
-                    [
-                        MetadataEntry("Step key", value=step_key),
-                    ],
-                    error=serializable_error_info_from_exc_info(sys.exc_info()),
-                ),
-                CeleryK8sJobExecutor,
-                step_key=step_key,
-            )
-            return []
-
-        # Post engine event for log retrieval
-        engine_event = instance.report_engine_event(
-            "Retrieving logs from Kubernetes Job pods",
-            pipeline_run,
-            EngineEventData([MetadataEntry("Pod names", value="\n".join(pod_names))]),
-            CeleryK8sJobExecutor,
-            step_key=step_key,
-        )
-        events.append(engine_event)
-
-        logs = []
-        for pod_name in pod_names:
-            try:
-                raw_logs = retrieve_pod_logs(pod_name, namespace=job_namespace)
-                logs += raw_logs.split("\n")
-            except kubernetes.client.rest.ApiException as e:
-                instance.report_engine_event(
-                    "Encountered unexpected error while fetching pod logs for Kubernetes job {}, "
-                    "Pod name {} for step {}. Will attempt to continue with other pods.".format(
-                        job_name, pod_name, step_key
-                    ),
-                    pipeline_run,
-                    EngineEventData(
-                        [
-                            MetadataEntry("Step key", value=step_key),
-                        ],
-                        error=serializable_error_info_from_exc_info(sys.exc_info()),
-                    ),
-                    CeleryK8sJobExecutor,
-                    step_key=step_key,
-                )
-
-        events += filter_dagster_events_from_pod_logs(logs)
-        serialized_events = [serialize_dagster_namedtuple(event) for event in events]
-        return serialized_events
+        # The step events are written to the event log by the step job, where the orchestrator
+        # reads them from, so they are not returned in the task result
+        return [step_key]
 
     return _execute_step_k8s_job
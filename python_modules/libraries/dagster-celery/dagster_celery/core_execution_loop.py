@@ -5,11 +5,11 @@
 
 from dagster import check
 from dagster.core.errors import DagsterSubprocessError
-from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.execution.context.system import PlanOrchestrationContext
+from dagster.core.execution.plan.active import get_prior_step_durations
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.storage.tags import PRIORITY_TAG
-from dagster.serdes import deserialize_json_to_dagster_namedtuple
 from dagster.utils.error import serializable_error_info_from_exc_info
 
 from .defaults import task_default_priority, task_default_queue
@@ -21,6 +21,7 @@
 )
 
 TICK_SECONDS = 1
+POLL_ALL_RESULTS_SECONDS = 10
 DELEGATE_MARKER = "celery_queue_wait"
 
 
@@ -54,10 +55,17 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
 
     step_results = {}  # Dict[ExecutionStep, celery.AsyncResult]
     step_errors = {}
+    # Step events are streamed from the event log as the workers write them, rather than returned
+    # by the celery tasks once the steps complete
+    event_cursor = -1
+    # steps whose tasks should be complete, since the step finished
+    finished_step_keys = set()
+    last_poll_all_results_time = time.time()
 
     with execution_plan.start(
         retry_mode=pipeline_context.executor.retries,
         sort_key_fn=priority_for_step,
+        step_durations=get_prior_step_durations(pipeline_context, execution_plan),
     ) as active_execution:
 
         stopping = False
@@ -74,37 +82,41 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
                 for result in step_results.values():
                     result.revoke()
             results_to_pop = []
-            for step_key, result in sorted(
-                step_results.items(), key=lambda x: priority_for_key(x[0])
-            ):
-                if result.ready():
-                    try:
-                        step_events = result.get()
-                    except TaskRevokedError:
-                        step_events = []
-                        yield DagsterEvent.engine_event(
-                            pipeline_context,
-                            'celery task for running step "{step_key}" was revoked.'.format(
-                                step_key=step_key,
-                            ),
-                            EngineEventData(marker_end=DELEGATE_MARKER),
-                            step_handle=active_execution.get_step_by_key(step_key).handle,
-                        )
-                    except Exception:
-                        # We will want to do more to handle the exception here.. maybe subclass Task
-                        # Certainly yield an engine or pipeline event
-                        step_events = []
-                        step_errors[step_key] = serializable_error_info_from_exc_info(
-                            sys.exc_info()
-                        )
-                    for step_event in step_events:
-                        event = deserialize_json_to_dagster_namedtuple(step_event)
-                        yield event
-                        active_execution.handle_event(event)
-
-                    results_to_pop.append(step_key)
+
+            # Task completion is normally noticed from the step events that the tasks write, so
+            # that only the tasks of finished steps need to be polled. All of the in-flight tasks
+            # are only polled periodically, to notice tasks that failed or were revoked before
+            # their step finished.
+            curr_time = time.time()
+            if stopping or curr_time - last_poll_all_results_time >= POLL_ALL_RESULTS_SECONDS:
+                last_poll_all_results_time = curr_time
+                step_keys_to_poll = step_results.keys()
+            else:
+                step_keys_to_poll = finished_step_keys
+
+            # Polled before reading the event log. A task writes all of the events of its step
+            # before it completes, so all of the events of the completed tasks are read below,
+            # before their steps are verified as complete.
+            yield from _poll_results(
+                pipeline_context,
+                active_execution,
+                step_results,
+                sorted(step_keys_to_poll, key=priority_for_key),
+                step_errors,
+                results_to_pop,
+            )
+
+            new_events, event_cursor = _pop_step_events(
+                pipeline_context, event_cursor, step_results.keys()
+            )
+            for event in new_events:
+                yield event
+                active_execution.handle_event(event)
+                if event.is_step_success or event.is_step_failure or event.is_step_up_for_retry:
+                    finished_step_keys.add(event.step_key)
 
             for step_key in results_to_pop:
+                finished_step_keys.discard(step_key)
                 if step_key in step_results:
                     del step_results[step_key]
                     active_execution.verify_complete(pipeline_context, step_key)
@@ -137,6 +149,10 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
                     # Get the Celery priority for this step
                     priority = _get_step_priority(pipeline_context, step)
 
+                    # a step that is retried replaces the task of its previous attempt
+                    finished_step_keys.discard(step.key)
+                    step_results.pop(step.key, None)
+
                     # Submit the Celery tasks
                     step_results[step.key] = step_execution_fn(
                         app,
@@ -173,6 +189,47 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
             )
 
 
+def _poll_results(context, active_execution, step_results, step_keys, step_errors, results_to_pop):
+    for step_key in step_keys:
+        result = step_results[step_key]
+        if not result.ready():
+            continue
+
+        try:
+            result.get()
+        except TaskRevokedError:
+            yield DagsterEvent.engine_event(
+                context,
+                'celery task for running step "{step_key}" was revoked.'.format(
+                    step_key=step_key,
+                ),
+                EngineEventData(marker_end=DELEGATE_MARKER),
+                step_handle=active_execution.get_step_by_key(step_key).handle,
+            )
+        except Exception:
+            # We will want to do more to handle the exception here.. maybe subclass Task
+            # Certainly yield an engine or pipeline event
+            step_errors[step_key] = serializable_error_info_from_exc_info(sys.exc_info())
+
+        results_to_pop.append(step_key)
+
+
+def _pop_step_events(context, cursor, step_keys):
+    """Returns the step events that the workers have written to the event log for the given steps
+    since the cursor, along with the new cursor.
+
+    Engine events are skipped, since those for the steps are also written by the orchestrator
+    itself.
+    """
+    records = context.instance.logs_after(context.run_id, cursor, of_type=set(DagsterEventType))
+    events = [
+        record.dagster_event
+        for record in records
+        if record.dagster_event.step_key in step_keys and not record.dagster_event.is_engine_event
+    ]
+    return events, cursor + len(records)
+
+
 def _get_step_priority(context, step):
     """Step priority is (currently) set as the overall pipeline run priority plus the individual
     step priority.
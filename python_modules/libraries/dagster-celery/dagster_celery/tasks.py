@@ -3,7 +3,7 @@
 from dagster.core.events import EngineEventData
 from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster.grpc.types import ExecuteStepArgs
-from dagster.serdes import serialize_dagster_namedtuple, unpack_value
+from dagster.serdes import unpack_value
 
 from .core_execution_loop import DELEGATE_MARKER
 from .executor import CeleryExecutor
@@ -42,7 +42,7 @@ def _execute_plan(self, execute_step_args_packed, executable_dict):
             known_state=execute_step_args.known_state,
         )
 
-        engine_event = instance.report_engine_event(
+        instance.report_engine_event(
             "Executing steps {} in celery worker".format(step_keys_str),
             pipeline_run,
             EngineEventData(
@@ -56,8 +56,9 @@ def _execute_plan(self, execute_step_args_packed, executable_dict):
             step_key=execution_plan.step_handle_for_single_step_plans().to_key(),
         )
 
-        events = [engine_event]
-        for step_event in execute_plan_iterator(
+        # The step events are written to the event log as they happen, where the orchestrator
+        # reads them from, so they are not returned in the (potentially large) task result
+        for _ in execute_plan_iterator(
             execution_plan=execution_plan,
             pipeline=pipeline,
             pipeline_run=pipeline_run,
@@ -65,9 +66,8 @@ def _execute_plan(self, execute_step_args_packed, executable_dict):
             retry_mode=retry_mode,
             run_config=pipeline_run.run_config,
         ):
-            events.append(step_event)
+            pass
 
-        serialized_events = [serialize_dagster_namedtuple(event) for event in events]
-        return serialized_events
+        return execute_step_args.step_keys_to_execute
 
     return _execute_plan
@@ -311,3 +311,50 @@ def test_memoization_celery_executor(instance, dagster_celery_worker):
     ) as result:
         assert result.success
         assert len(result.step_event_list) == 0
+
+
+def test_pop_step_events(instance):
+    from dagster_celery.core_execution_loop import _pop_step_events
+
+    with execute_eagerly_on_celery("test_serial_pipeline", instance=instance) as result:
+        context = mock.MagicMock(instance=instance, run_id=result.run_id)
+
+        events, cursor = _pop_step_events(context, -1, {"simple"})
+        assert [event.event_type_value for event in events] == [
+            event.event_type_value for event in result.step_event_list if event.step_key == "simple"
+        ]
+        # engine events of the step, such as the celery submission, are skipped
+        assert not any(event.is_engine_event for event in events)
+        assert cursor == len(instance.all_logs(result.run_id)) - 1
+
+        assert _pop_step_events(context, cursor, {"simple", "add_one"}) == ([], cursor)
+
+
+def test_poll_results():
+    from dagster_celery.core_execution_loop import _poll_results
+
+    step_results = {
+        "done": mock.MagicMock(**{"ready.return_value": True}),
+        "running": mock.MagicMock(**{"ready.return_value": False}),
+        "errored": mock.MagicMock(
+            **{"ready.return_value": True, "get.side_effect": Exception("worker died")}
+        ),
+    }
+    step_errors = {}
+    results_to_pop = []
+
+    events = list(
+        _poll_results(
+            mock.MagicMock(),
+            mock.MagicMock(),
+            step_results,
+            ["done", "running", "errored"],
+            step_errors,
+            results_to_pop,
+        )
+    )
+
+    assert events == []
+    assert results_to_pop == ["done", "errored"]
+    assert list(step_errors.keys()) == ["errored"]
+    step_results["running"].get.assert_not_called()
@@ -1,3 +1,7 @@
+import sys
+import threading
+from collections import OrderedDict
+
 import dask
 import dask.distributed
 
@@ -12,18 +16,24 @@
     seven,
 )
 from dagster.core.definitions.executor_definition import executor
-from dagster.core.errors import raise_execution_interrupts
-from dagster.core.events import DagsterEvent
-from dagster.core.execution.api import create_execution_plan, execute_plan
+from dagster.core.errors import DagsterSubprocessError
+from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.execution.api import execute_plan
 from dagster.core.execution.context.system import PlanOrchestrationContext
+from dagster.core.execution.plan.active import get_prior_step_durations
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.retries import RetryMode
 from dagster.core.instance import DagsterInstance
-from dagster.utils import frozentags, iterate_with_context
+from dagster.core.system_config.objects import ResolvedRunConfig
+from dagster.serdes import serialize_dagster_namedtuple
+from dagster.utils import frozentags
+from dagster.utils.error import serializable_error_info_from_exc_info
 
 # Dask resource requirements are specified under this key
 DASK_RESOURCE_REQUIREMENTS_KEY = "dagster-dask/resource_requirements"
 
+TICK_SECONDS = 1
+
 
 @executor(
     name="dask",
@@ -113,8 +123,65 @@ def dask_enabled_job():
     return DaskExecutor(cluster_type, cluster_configuration)
 
 
+class _WorkerRunState:
+    def __init__(self, pipeline, resolved_run_config):
+        self.pipeline = pipeline
+        self.resolved_run_config = resolved_run_config
+        # The full execution plan built for the most recently seen known state of the run
+        self.known_state_key = None
+        self.execution_plan = None
+
+
+# Dask workers are long-lived processes that execute many of the steps of a run, so the subset
+# pipeline and the execution plan that they reconstruct are cached per run rather than rebuilt for
+# every step.
+WORKER_RUN_CACHE_SIZE = 8
+_worker_run_cache_lock = threading.Lock()
+_worker_run_cache: "OrderedDict[str, _WorkerRunState]" = OrderedDict()
+
+
+def _get_worker_run_state(recon_pipeline, pipeline_run, run_config, mode):
+    run_state = _worker_run_cache.get(pipeline_run.run_id)
+    if run_state is not None:
+        _worker_run_cache.move_to_end(pipeline_run.run_id)
+        return run_state
+
+    subset_pipeline = recon_pipeline.subset_for_execution_from_existing_pipeline(
+        pipeline_run.solids_to_execute
+    )
+    run_state = _WorkerRunState(
+        subset_pipeline,
+        ResolvedRunConfig.build(subset_pipeline.get_definition(), run_config, mode=mode),
+    )
+    _worker_run_cache[pipeline_run.run_id] = run_state
+    while len(_worker_run_cache) > WORKER_RUN_CACHE_SIZE:
+        _worker_run_cache.popitem(last=False)
+
+    return run_state
+
+
+def get_step_execution_plan(recon_pipeline, pipeline_run, run_config, step_keys, mode, known_state):
+    """Returns the subset pipeline of the run and the execution plan for the given steps, reusing
+    the pipeline and full execution plan previously built on this worker for the same run.
+    """
+    with _worker_run_cache_lock:
+        run_state = _get_worker_run_state(recon_pipeline, pipeline_run, run_config, mode)
+
+        # The known state resolves the dynamic outputs (and memoized versions) of the plan, so the
+        # full plan is only rebuilt once the run has made progress on those
+        known_state_key = serialize_dagster_namedtuple(known_state) if known_state else None
+        if run_state.execution_plan is None or run_state.known_state_key != known_state_key:
+            run_state.execution_plan = ExecutionPlan.build(
+                run_state.pipeline, run_state.resolved_run_config, known_state=known_state
+            )
+            run_state.known_state_key = known_state_key
+
+        return run_state.pipeline, run_state.execution_plan.build_subset_plan(
+            step_keys, run_state.pipeline.get_definition(), run_state.resolved_run_config
+        )
+
+
 def query_on_dask_worker(
-    dependencies,
     recon_pipeline,
     pipeline_run,
     run_config,
@@ -122,22 +189,10 @@ def query_on_dask_worker(
     mode,
     instance_ref,
     known_state,
-):  # pylint: disable=unused-argument
-    """Note that we need to pass "dependencies" to ensure Dask sequences futures during task
-    scheduling, even though we do not use this argument within the function.
-    """
-
+):
     with DagsterInstance.from_ref(instance_ref) as instance:
-        subset_pipeline = recon_pipeline.subset_for_execution_from_existing_pipeline(
-            pipeline_run.solids_to_execute
-        )
-
-        execution_plan = create_execution_plan(
-            subset_pipeline,
-            run_config=run_config,
-            step_keys_to_execute=step_keys,
-            mode=mode,
-            known_state=known_state,
+        subset_pipeline, execution_plan = get_step_execution_plan(
+            recon_pipeline, pipeline_run, run_config, step_keys, mode, known_state
         )
 
         return execute_plan(
@@ -179,8 +234,6 @@ def execute(self, plan_context, execution_plan):
             "Dask execution requires a persistent DagsterInstance",
         )
 
-        step_levels = execution_plan.get_steps_to_execute_by_level()
-
         pipeline_name = plan_context.pipeline_name
 
         instance = plan_context.instance
@@ -234,54 +287,93 @@ def execute(self, plan_context, execution_plan):
                 f"Must be providing one of the following ('existing', 'local', 'yarn', 'ssh', 'pbs', 'moab', 'sge', 'lsf', 'slurm', 'oar', 'kube') not {cluster_type}"
             )
 
-        with dask.distributed.Client(cluster) as client:
-            execution_futures = []
-            execution_futures_dict = {}
-
-            for step_level in step_levels:
-                for step in step_level:
-                    # We ensure correctness in sequencing by letting Dask schedule futures and
-                    # awaiting dependencies within each step.
-                    dependencies = []
-                    for step_input in step.step_inputs:
-                        for key in step_input.dependency_keys:
-                            dependencies.append(execution_futures_dict[key])
-
-                    if plan_context.pipeline.get_definition().is_job:
-                        run_config = plan_context.run_config
-                    else:
-                        run_config = dict(plan_context.run_config, execution={"in_process": {}})
-
-                    dask_task_name = "%s.%s" % (pipeline_name, step.key)
-
-                    recon_pipeline = plan_context.reconstructable_pipeline
-
-                    future = client.submit(
-                        query_on_dask_worker,
-                        dependencies,
-                        recon_pipeline,
-                        plan_context.pipeline_run,
-                        run_config,
-                        [step.key],
-                        plan_context.pipeline_run.mode,
-                        instance.get_ref(),
-                        execution_plan.known_state,
-                        key=dask_task_name,
-                        resources=get_dask_resource_requirements(step.tags),
-                    )
-
-                    execution_futures.append(future)
-                    execution_futures_dict[step.key] = future
+        if plan_context.pipeline.get_definition().is_job:
+            run_config = plan_context.run_config
+        else:
+            run_config = dict(plan_context.run_config, execution={"in_process": {}})
 
-            # This tells Dask to awaits the step executions and retrieve their results to the
-            # master
-            futures = dask.distributed.as_completed(execution_futures, with_results=True)
+        recon_pipeline = plan_context.reconstructable_pipeline
+        pipeline_run = plan_context.pipeline_run
 
-            # Allow interrupts while waiting for the results from Dask
-            for future, result in iterate_with_context(raise_execution_interrupts, futures):
-                for step_event in result:
-                    check.inst(step_event, DagsterEvent)
-                    yield step_event
+        with dask.distributed.Client(cluster) as client:
+            # Steps are submitted as soon as their upstream steps have completed, so that
+            # independent branches of the plan run concurrently and dynamic outputs are resolved
+            # before their downstream steps are submitted
+            step_futures = {}
+            step_errors = {}
+
+            with execution_plan.start(
+                retry_mode=self.retries,
+                step_durations=get_prior_step_durations(plan_context, execution_plan),
+            ) as active_execution:
+                stopping = False
+
+                while (not active_execution.is_complete and not stopping) or step_futures:
+                    if active_execution.check_for_interrupts():
+                        yield DagsterEvent.engine_event(
+                            plan_context,
+                            "Dask executor: received termination signal - cancelling active "
+                            "steps",
+                            EngineEventData.interrupted(list(step_futures.keys())),
+                        )
+                        stopping = True
+                        active_execution.mark_interrupted()
+                        client.cancel(list(step_futures.values()))
+
+                    # don't submit any new steps if we are stopping
+                    if not stopping:
+                        for step in active_execution.get_steps_to_execute():
+                            step_futures[step.key] = client.submit(
+                                query_on_dask_worker,
+                                recon_pipeline,
+                                pipeline_run,
+                                run_config,
+                                [step.key],
+                                pipeline_run.mode,
+                                instance.get_ref(),
+                                active_execution.get_known_state(),
+                                key="%s.%s" % (pipeline_name, step.key),
+                                resources=get_dask_resource_requirements(step.tags),
+                            )
+
+                    for step_key in _wait_for_completed_steps(step_futures):
+                        future = step_futures.pop(step_key)
+                        try:
+                            for step_event in future.result():
+                                check.inst(step_event, DagsterEvent)
+                                yield step_event
+                                active_execution.handle_event(step_event)
+                        except dask.distributed.CancelledError:
+                            yield DagsterEvent.engine_event(
+                                plan_context,
+                                'Dask task for step "{step_key}" was cancelled.'.format(
+                                    step_key=step_key
+                                ),
+                                EngineEventData(),
+                                step_handle=active_execution.get_step_by_key(step_key).handle,
+                            )
+                        except Exception:
+                            step_errors[step_key] = serializable_error_info_from_exc_info(
+                                sys.exc_info()
+                            )
+
+                        active_execution.verify_complete(plan_context, step_key)
+
+                    # process skips from failures or uncovered inputs
+                    yield from active_execution.plan_events_iterator(plan_context)
+
+                if step_errors:
+                    raise DagsterSubprocessError(
+                        "During dask execution errors occurred in workers:\n{error_list}".format(
+                            error_list="\n".join(
+                                [
+                                    "[{step}]: {err}".format(step=key, err=err.to_string())
+                                    for key, err in step_errors.items()
+                                ]
+                            )
+                        ),
+                        subprocess_error_infos=list(step_errors.values()),
+                    )
 
     def build_dict(self, pipeline_name):
         """Returns a dict we can use for kwargs passed to dask client instantiation.
@@ -314,3 +406,20 @@ def build_dict(self, pipeline_name):
             dask_cfg["threads_per_worker"] = 1
 
         return dask_cfg
+
+
+def _wait_for_completed_steps(step_futures):
+    """Waits up to a tick for any of the step futures to complete, returning the keys of the
+    completed steps.
+    """
+    if not step_futures:
+        return []
+
+    try:
+        dask.distributed.wait(
+            list(step_futures.values()), timeout=TICK_SECONDS, return_when="FIRST_COMPLETED"
+        )
+    except dask.distributed.TimeoutError:
+        pass
+
+    return [step_key for step_key, future in step_futures.items() if future.done()]
@@ -10,6 +10,8 @@
 
 from dagster import (
     DagsterUnmetExecutorRequirementsError,
+    DynamicOut,
+    DynamicOutput,
     InputDefinition,
     ModeDefinition,
     VersionStrategy,
@@ -335,3 +337,36 @@ def test_dask_executor_job():
         )
         assert result.success
         assert result.output_for_solid("the_op") == 5
+
+
+@op(out=DynamicOut())
+def emit_numbers():
+    for i in range(3):
+        yield DynamicOutput(i, mapping_key=str(i))
+
+
+@op
+def double(num):
+    return num * 2
+
+
+@op
+def sum_numbers(nums):
+    return sum(nums)
+
+
+@job(executor_def=dask_executor, resource_defs={"io_manager": fs_io_manager})
+def dynamic_job():
+    sum_numbers(emit_numbers().map(double).collect())
+
+
+def test_dask_executor_dynamic_outputs():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(dynamic_job),
+            instance=instance,
+            run_config={"execution": {"config": {"cluster": {"local": {"timeout": 30}}}}},
+        )
+        assert result.success
+        assert result.output_for_solid("double") == {"0": 0, "1": 2, "2": 4}
+        assert result.output_for_solid("sum_numbers") == 6
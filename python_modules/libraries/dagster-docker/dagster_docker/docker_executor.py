@@ -1,11 +1,14 @@
 import os
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 
 import docker
 from dagster_docker.utils import DOCKER_CONFIG_SCHEMA, validate_docker_config, validate_docker_image
 
-from dagster import check, executor
-from dagster.core.definitions.executor_definition import multiple_process_executor_requirements
+from dagster import Field, check, executor
+from dagster.core.definitions.executor_definition import (
+    get_resource_capacities_config,
+    multiple_process_executor_requirements,
+)
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData, MetadataEntry
 from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.retries import RetryMode, get_retries_config
@@ -13,10 +16,20 @@
 from dagster.core.executor.init import InitExecutorContext
 from dagster.core.executor.step_delegating import StepDelegatingExecutor
 from dagster.core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
+from dagster.grpc.types import ExecuteStepArgs
+from dagster.serdes import deserialize_as
 from dagster.serdes.utils import hash_str
 from dagster.utils import merge_dicts
 from dagster.utils.backcompat import experimental
 
+# Pooled containers idle until steps are executed in them via `docker exec`
+POOLED_CONTAINER_COMMAND = ["python", "-c", "import time\nwhile True: time.sleep(60)"]
+
+# Labels of the pooled containers, by which they are found again when a run is resumed
+POOLED_CONTAINER_RUN_ID_LABEL = "dagster/run-id"
+POOLED_CONTAINER_IMAGE_LABEL = "dagster/step-container-pool-image"
+POOLED_CONTAINER_INDEX_LABEL = "dagster/step-container-pool-index"
+
 
 @executor(
     name="docker",
@@ -24,6 +37,30 @@
         DOCKER_CONFIG_SCHEMA,
         {
             "retries": get_retries_config(),
+            "max_steps_per_worker": Field(
+                int,
+                is_required=False,
+                default_value=1,
+                description="The maximum number of ready steps with the same tags to launch in a "
+                "single container.",
+            ),
+            "watch_events": Field(
+                bool,
+                is_required=False,
+                default_value=False,
+                description="Whether the event log storage should notify the executor of new "
+                "step events (e.g. via LISTEN/NOTIFY in postgres), rather than the executor "
+                "polling for them. Storages without notifications, such as MySQL, poll for the "
+                "events on the executor's behalf.",
+            ),
+            "resource_capacities": get_resource_capacities_config(),
+            "step_container_pool_size": Field(
+                int,
+                is_required=False,
+                description="When set, steps are executed in a pool of at most this many "
+                "long-lived containers per image, which are reused across the steps of the run "
+                "and removed once it finishes, rather than in a new container per step.",
+            ),
         },
     ),
     requirements=multiple_process_executor_requirements(),
@@ -50,6 +87,10 @@ def docker_executor(init_context: InitExecutorContext) -> Executor:
             network: ...
             networks: ...
             container_kwargs: ...
+            max_steps_per_worker: ...
+            watch_events: ...
+            resource_capacities: ...
+            step_container_pool_size: ...
 
     If you're using the DockerRunLauncher, configuration set on the containers created by the run
     launcher will also be set on the containers that are created for each step.
@@ -81,8 +122,12 @@ def docker_executor(init_context: InitExecutorContext) -> Executor:
             network,
             networks,
             container_kwargs,
+            init_context.executor_config.get("step_container_pool_size"),
         ),
         retries=RetryMode.from_config(init_context.executor_config["retries"]),
+        max_steps_per_worker=init_context.executor_config.get("max_steps_per_worker"),
+        watch_events=init_context.executor_config.get("watch_events", False),
+        resource_capacities=init_context.executor_config.get("resource_capacities"),
     )
 
 
@@ -95,6 +140,7 @@ def __init__(
         network=None,
         networks=None,
         container_kwargs=None,
+        step_container_pool_size=None,
     ):
         super().__init__()
 
@@ -113,6 +159,27 @@ def __init__(
             container_kwargs, "container_kwargs", key_type=str
         )
 
+        self._step_container_pool_size = check.opt_int_param(
+            step_container_pool_size, "step_container_pool_size"
+        )
+        check.invariant(
+            self._step_container_pool_size is None or self._step_container_pool_size > 0,
+            "step_container_pool_size must be greater than 0",
+        )
+        # When pooling, the long-lived containers are only used by the run that is executed by this
+        # step handler, so they are tracked in memory, and found again by their labels when the
+        # run is resumed:
+        # image -> ids of the pooled containers
+        self._pooled_containers: Dict[str, List[str]] = {}
+        # image -> number of pooled containers started, which indexes their names
+        self._pooled_container_counts: Dict[str, int] = {}
+        # pooled container id -> ids of the step processes executed in it
+        self._pooled_container_execs: Dict[str, List[str]] = {}
+        # name of the step launch (see _get_container_name) -> (pooled container id, exec id)
+        self._pooled_step_execs: Dict[str, Tuple[str, str]] = {}
+        # ids of the runs whose pooled containers from a previous execution have been looked up
+        self._rediscovered_run_ids: Set[str] = set()
+
     @property
     def name(self) -> str:
         return "DockerStepHandler"
@@ -127,26 +194,200 @@ def _get_client(self):
             )
         return client
 
-    def _get_container_name(self, run_id, step_key):
-        return f"dagster-step-{hash_str(run_id + step_key)}"
+    def _get_container_name(self, run_id, step_keys):
+        return f"dagster-step-{hash_str(run_id + '-'.join(step_keys))}"
+
+    def _get_step_failure_events(self, step_handler_context, message):
+        return [
+            DagsterEvent(
+                event_type_value=DagsterEventType.STEP_FAILURE.value,
+                pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
+                step_key=step_key,
+                message=message,
+                event_specific_data=StepFailureData(
+                    error=None,
+                    user_failure_data=None,
+                ),
+            )
+            for step_key in step_handler_context.execute_step_args.step_keys_to_execute
+        ]
+
+    def _create_container(self, client, step_image, name, command, labels=None):
+        try:
+            return self._create_container_for_image(client, step_image, name, command, labels)
+        except docker.errors.ImageNotFound:
+            client.images.pull(step_image)
+            return self._create_container_for_image(client, step_image, name, command, labels)
+
+    def _create_container_for_image(self, client, step_image, name, command, labels=None):
+        container_kwargs = self._container_kwargs
+        if labels:
+            container_kwargs = merge_dicts(
+                container_kwargs,
+                {"labels": merge_dicts(container_kwargs.get("labels") or {}, labels)},
+            )
 
-    def _create_step_container(self, client, step_image, execute_step_args):
-        return client.containers.create(
+        container = client.containers.create(
             step_image,
-            name=self._get_container_name(
-                execute_step_args.pipeline_run_id, execute_step_args.step_keys_to_execute[0]
-            ),
+            name=name,
             detach=True,
             network=self._networks[0] if len(self._networks) else None,
-            command=execute_step_args.get_command_args(),
+            command=command,
             environment=(
                 {env_name: os.getenv(env_name) for env_name in self._env_vars}
                 if self._env_vars
                 else {}
             ),
-            **self._container_kwargs,
+            **container_kwargs,
         )
 
+        if len(self._networks) > 1:
+            for network_name in self._networks[1:]:
+                network = client.networks.get(network_name)
+                network.connect(container)
+
+        return container
+
+    def _get_pooled_container(self, client, step_image, run_id):
+        """Returns a pooled container for the image to execute a step in. Idle containers are
+        preferred, then new containers while the pool is not full, then the container that is
+        executing the fewest steps.
+        """
+        containers = []
+        running_exec_counts = {}
+        for container_id in self._pooled_containers.get(step_image, []):
+            container = client.containers.get(container_id)
+            if container.status != "running":
+                # the steps that were executing in it fail their health checks
+                continue
+
+            exec_ids = [
+                exec_id
+                for exec_id in self._pooled_container_execs[container_id]
+                if client.api.exec_inspect(exec_id).get("Running")
+            ]
+            self._pooled_container_execs[container_id] = exec_ids
+            running_exec_counts[container_id] = len(exec_ids)
+            containers.append(container)
+
+        self._pooled_containers[step_image] = [container.id for container in containers]
+
+        least_busy = min(
+            containers, key=lambda container: running_exec_counts[container.id], default=None
+        )
+        if least_busy is not None and (
+            running_exec_counts[least_busy.id] == 0
+            or len(containers) >= self._step_container_pool_size
+        ):
+            return least_busy
+
+        index = self._pooled_container_counts.get(step_image, 0)
+        self._pooled_container_counts[step_image] = index + 1
+
+        container = self._start_pooled_container(client, step_image, run_id, index)
+        self._pooled_containers[step_image].append(container.id)
+        self._pooled_container_execs.setdefault(container.id, [])
+        return container
+
+    def _start_pooled_container(self, client, step_image, run_id, index):
+        name = f"dagster-step-worker-{hash_str(run_id + step_image)}-{index}"
+
+        # A container from a previous execution of the run (e.g. before it was resumed) is reused
+        # if it is still running
+        try:
+            container = client.containers.get(name)
+        except docker.errors.NotFound:
+            container = None
+
+        if container is not None:
+            if container.status == "running":
+                return container
+            container.remove(force=True)
+
+        container = self._create_container(
+            client,
+            step_image,
+            name,
+            POOLED_CONTAINER_COMMAND,
+            labels={
+                POOLED_CONTAINER_RUN_ID_LABEL: run_id,
+                POOLED_CONTAINER_IMAGE_LABEL: step_image,
+                POOLED_CONTAINER_INDEX_LABEL: str(index),
+            },
+        )
+        container.start()
+        return container
+
+    def _rediscover_pooled_containers(self, client, run_id):
+        """Tracks the pooled containers of the run that were started by a previous execution of it
+        (e.g. before it was resumed), along with the step processes executed in them, so that the
+        steps still executing in them are not launched again.
+        """
+        self._rediscovered_run_ids.add(run_id)
+
+        containers = client.containers.list(
+            all=True, filters={"label": f"{POOLED_CONTAINER_RUN_ID_LABEL}={run_id}"}
+        )
+        rediscovered_step_execs: Dict[str, Tuple[str, str]] = {}
+        for container in containers:
+            step_image = container.labels.get(POOLED_CONTAINER_IMAGE_LABEL)
+            if not step_image:
+                continue
+
+            pooled_container_ids = self._pooled_containers.setdefault(step_image, [])
+            if container.id not in pooled_container_ids:
+                pooled_container_ids.append(container.id)
+            self._pooled_container_counts[step_image] = max(
+                self._pooled_container_counts.get(step_image, 0),
+                int(container.labels.get(POOLED_CONTAINER_INDEX_LABEL, 0)) + 1,
+            )
+
+            exec_ids = self._pooled_container_execs.setdefault(container.id, [])
+            for exec_id in container.attrs.get("ExecIDs") or []:
+                if exec_id in exec_ids:
+                    continue
+
+                exec_info = client.api.exec_inspect(exec_id)
+                execute_step_args = _get_pooled_execute_step_args(exec_info)
+                if not execute_step_args:
+                    continue
+
+                exec_ids.append(exec_id)
+                container_name = self._get_container_name(
+                    run_id, execute_step_args.step_keys_to_execute
+                )
+                # the steps may have been executed more than once, e.g. when retried, in which case
+                # the process that is still running is the one to check on
+                if container_name not in rediscovered_step_execs or exec_info.get("Running"):
+                    rediscovered_step_execs[container_name] = (container.id, exec_id)
+
+        for container_name, step_exec in rediscovered_step_execs.items():
+            self._pooled_step_execs.setdefault(container_name, step_exec)
+
+    def _get_pooled_step_exec(self, client, run_id, container_name):
+        if (
+            container_name not in self._pooled_step_execs
+            and run_id not in self._rediscovered_run_ids
+        ):
+            self._rediscover_pooled_containers(client, run_id)
+
+        return self._pooled_step_execs.get(container_name)
+
+    def _launch_pooled_step(self, client, step_image, execute_step_args):
+        container = self._get_pooled_container(
+            client, step_image, execute_step_args.pipeline_run_id
+        )
+        exec_id = client.api.exec_create(container.id, execute_step_args.get_command_args())["Id"]
+        client.api.exec_start(exec_id, detach=True)
+
+        self._pooled_container_execs[container.id].append(exec_id)
+        self._pooled_step_execs[
+            self._get_container_name(
+                execute_step_args.pipeline_run_id, execute_step_args.step_keys_to_execute
+            )
+        ] = (container.id, exec_id)
+        return container
+
     def launch_step(self, step_handler_context: StepHandlerContext) -> List[DagsterEvent]:
         client = self._get_client()
 
@@ -162,25 +403,19 @@ def launch_step(self, step_handler_context: StepHandlerContext) -> List[DagsterE
 
         validate_docker_image(step_image)
 
-        try:
-            step_container = self._create_step_container(
-                client, step_image, step_handler_context.execute_step_args
-            )
-        except docker.errors.ImageNotFound:
-            client.images.pull(step_image)
-            step_container = self._create_step_container(
-                client, step_image, step_handler_context.execute_step_args
-            )
+        execute_step_args = step_handler_context.execute_step_args
 
-        if len(self._networks) > 1:
-            for network_name in self._networks[1:]:
-                network = client.networks.get(network_name)
-                network.connect(step_container)
-
-        assert (
-            len(step_handler_context.execute_step_args.step_keys_to_execute) == 1
-        ), "Launching multiple steps is not currently supported"
-        step_key = step_handler_context.execute_step_args.step_keys_to_execute[0]
+        if self._step_container_pool_size:
+            step_container = self._launch_pooled_step(client, step_image, execute_step_args)
+        else:
+            step_container = self._create_container(
+                client,
+                step_image,
+                self._get_container_name(
+                    execute_step_args.pipeline_run_id, execute_step_args.step_keys_to_execute
+                ),
+                execute_step_args.get_command_args(),
+            )
 
         events = [
             DagsterEvent(
@@ -195,38 +430,65 @@ def launch_step(self, step_handler_context: StepHandlerContext) -> List[DagsterE
                     ],
                 ),
             )
+            for step_key in step_handler_context.execute_step_args.step_keys_to_execute
         ]
 
-        step_container.start()
+        if not self._step_container_pool_size:
+            step_container.start()
 
         return events
 
-    def check_step_health(self, step_handler_context: StepHandlerContext) -> List[DagsterEvent]:
-        step_key = step_handler_context.execute_step_args.step_keys_to_execute[0]
+    def _check_pooled_step_health(self, client, step_handler_context, container_name):
+        step_exec = self._get_pooled_step_exec(
+            client, step_handler_context.execute_step_args.pipeline_run_id, container_name
+        )
+        if not step_exec:
+            return self._get_step_failure_events(
+                step_handler_context, "Step was not launched in a pooled Docker container"
+            )
+
+        container_id, exec_id = step_exec
+
+        try:
+            container = client.containers.get(container_id)
+            exec_info = client.api.exec_inspect(exec_id)
+        except Exception as e:
+            return self._get_step_failure_events(
+                step_handler_context, f"Error when checking on step container health: {e}"
+            )
 
+        if container.status != "running":
+            return self._get_step_failure_events(
+                step_handler_context,
+                f"Pooled container status is {container.status}.",
+            )
+
+        if exec_info.get("Running") or exec_info.get("ExitCode") == 0:
+            return []
+
+        return self._get_step_failure_events(
+            step_handler_context,
+            f"Step process in pooled container exited with code {exec_info.get('ExitCode')}.",
+        )
+
+    def check_step_health(self, step_handler_context: StepHandlerContext) -> List[DagsterEvent]:
         client = self._get_client()
 
         container_name = self._get_container_name(
             step_handler_context.execute_step_args.pipeline_run_id,
-            step_key,
+            step_handler_context.execute_step_args.step_keys_to_execute,
         )
 
+        if self._step_container_pool_size:
+            return self._check_pooled_step_health(client, step_handler_context, container_name)
+
         try:
             container = client.containers.get(container_name)
 
         except Exception as e:
-            return [
-                DagsterEvent(
-                    event_type_value=DagsterEventType.STEP_FAILURE.value,
-                    pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                    step_key=step_key,
-                    message=f"Error when checking on step container health: {e}",
-                    event_specific_data=StepFailureData(
-                        error=None,
-                        user_failure_data=None,
-                    ),
-                )
-            ]
+            return self._get_step_failure_events(
+                step_handler_context, f"Error when checking on step container health: {e}"
+            )
 
         if container.status == "running":
             return []
@@ -234,42 +496,22 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> List[Da
         try:
             container_info = container.wait(timeout=0.1)
         except Exception as e:
-            return [
-                DagsterEvent(
-                    event_type_value=DagsterEventType.STEP_FAILURE.value,
-                    pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                    step_key=step_key,
-                    message=f"Container status is {container.status}. Hit exception attempting to get its return code: {e}",
-                    event_specific_data=StepFailureData(
-                        error=None,
-                        user_failure_data=None,
-                    ),
-                )
-            ]
+            return self._get_step_failure_events(
+                step_handler_context,
+                f"Container status is {container.status}. Hit exception attempting to get its return code: {e}",
+            )
 
         ret_code = container_info.get("StatusCode")
         if ret_code == 0:
             return []
 
-        return [
-            DagsterEvent(
-                event_type_value=DagsterEventType.STEP_FAILURE.value,
-                pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                step_key=step_key,
-                message=f"Container status is {container.status}. Return code is {str(ret_code)}.",
-                event_specific_data=StepFailureData(
-                    error=None,
-                    user_failure_data=None,
-                ),
-            )
-        ]
+        return self._get_step_failure_events(
+            step_handler_context,
+            f"Container status is {container.status}. Return code is {str(ret_code)}.",
+        )
 
     def terminate_step(self, step_handler_context: StepHandlerContext) -> List[DagsterEvent]:
-
-        assert (
-            len(step_handler_context.execute_step_args.step_keys_to_execute) == 1
-        ), "Launching multiple steps is not currently supported"
-        step_key = step_handler_context.execute_step_args.step_keys_to_execute[0]
+        step_keys = step_handler_context.execute_step_args.step_keys_to_execute
 
         events = [
             DagsterEvent(
@@ -279,27 +521,76 @@ def terminate_step(self, step_handler_context: StepHandlerContext) -> List[Dagst
                 message="Stopping Docker container for step",
                 event_specific_data=EngineEventData(),
             )
+            for step_key in step_keys
         ]
 
         client = self._get_client()
 
+        container_name = self._get_container_name(
+            step_handler_context.execute_step_args.pipeline_run_id, step_keys
+        )
+
         try:
-            container = client.containers.get(
-                self._get_container_name(
-                    step_handler_context.execute_step_args.pipeline_run_id,
-                    step_handler_context.execute_step_args.step_keys_to_execute[0],
+            if self._step_container_pool_size:
+                # Docker can't signal the process of an exec, so the pooled container that the
+                # step is executing in is stopped, along with any other steps executing in it
+                container_id, _ = check.not_none(
+                    self._get_pooled_step_exec(
+                        client,
+                        step_handler_context.execute_step_args.pipeline_run_id,
+                        container_name,
+                    ),
+                    "Step was not launched in a pooled Docker container",
                 )
-            )
+                container = client.containers.get(container_id)
+            else:
+                container = client.containers.get(container_name)
             container.stop()
         except Exception as e:
             events.append(
                 DagsterEvent(
                     event_type_value=DagsterEventType.ENGINE_EVENT.value,
                     pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                    step_key=step_key,
+                    step_key=step_keys[0],
                     message=f"Hit error while terminating Docker container:\n{e}",
                     event_specific_data=EngineEventData(),
                 )
             )
 
         return events
+
+    def cleanup_run(self, run_id: str) -> None:
+        if self._step_container_pool_size and run_id not in self._rediscovered_run_ids:
+            # the run may have been resumed, leaving pooled containers from before that are not
+            # tracked yet
+            self._rediscover_pooled_containers(self._get_client(), run_id)
+
+        if not self._pooled_containers:
+            return
+
+        client = self._get_client()
+        for container_ids in self._pooled_containers.values():
+            for container_id in container_ids:
+                try:
+                    client.containers.get(container_id).remove(force=True)
+                except docker.errors.NotFound:
+                    pass
+
+        self._pooled_containers = {}
+        self._pooled_container_counts = {}
+        self._pooled_container_execs = {}
+        self._pooled_step_execs = {}
+        self._rediscovered_run_ids = set()
+
+
+def _get_pooled_execute_step_args(exec_info) -> Optional[ExecuteStepArgs]:
+    # the step processes in pooled containers are started with `ExecuteStepArgs.get_command_args`,
+    # which ends with the serialized args
+    arguments = (exec_info.get("ProcessConfig") or {}).get("arguments") or []
+    if len(arguments) < 3 or arguments[-2] != "execute_step":
+        return None
+
+    try:
+        return deserialize_as(arguments[-1], ExecuteStepArgs)
+    except Exception:  # pylint: disable=broad-except
+        return None
@@ -3,6 +3,7 @@
 
 import os
 
+import docker
 from dagster_test.test_project import (
     find_local_test_image,
     get_buildkite_registry_config,
@@ -13,6 +14,7 @@
 
 from dagster.core.execution.api import execute_pipeline
 from dagster.core.test_utils import environ
+from dagster.serdes.utils import hash_str
 from dagster.utils.merger import merge_dicts
 from dagster.utils.yaml_utils import merge_yamls
 
@@ -64,6 +66,57 @@ def test_docker_executor():
             ).success
 
 
+def test_docker_executor_step_container_pool():
+    executor_config = {
+        "execution": {
+            "docker": {
+                "config": {
+                    "networks": ["container:test-postgres-db-docker"],
+                    "env_vars": [
+                        "AWS_ACCESS_KEY_ID",
+                        "AWS_SECRET_ACCESS_KEY",
+                    ],
+                    "step_container_pool_size": 2,
+                }
+            }
+        }
+    }
+
+    docker_image = get_test_project_docker_image()
+    if IS_BUILDKITE:
+        executor_config["execution"]["docker"]["config"][
+            "registry"
+        ] = get_buildkite_registry_config()
+    else:
+        find_local_test_image(docker_image)
+
+    run_config = merge_dicts(
+        merge_yamls(
+            [
+                os.path.join(get_test_project_environments_path(), "env.yaml"),
+                os.path.join(get_test_project_environments_path(), "env_s3.yaml"),
+            ]
+        ),
+        executor_config,
+    )
+
+    with environ({"DOCKER_LAUNCHER_NETWORK": "container:test-postgres-db-docker"}):
+        with docker_postgres_instance() as instance:
+            recon_pipeline = get_test_project_recon_pipeline("demo_pipeline_docker", docker_image)
+            result = execute_pipeline(recon_pipeline, run_config=run_config, instance=instance)
+            assert result.success
+
+            # the pooled containers are removed once the run finishes
+            client = docker.client.from_env()
+            assert not [
+                container
+                for container in client.containers.list(all=True)
+                if container.name.startswith(
+                    f"dagster-step-worker-{hash_str(result.run_id + docker_image)}"
+                )
+            ]
+
+
 def test_docker_executor_check_step_health():
     # missing network causes step to fail
 
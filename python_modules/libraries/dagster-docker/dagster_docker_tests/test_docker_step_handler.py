@@ -0,0 +1,232 @@
+import docker
+from dagster_docker.docker_executor import POOLED_CONTAINER_RUN_ID_LABEL, DockerStepHandler
+
+from dagster import pipeline, reconstructable, solid
+from dagster.core.events import DagsterEventType
+from dagster.core.executor.step_delegating.step_handler.base import StepHandlerContext
+from dagster.grpc.types import ExecuteStepArgs
+
+STEP_IMAGE = "fake-step-image:latest"
+
+
+class FakeContainer:
+    def __init__(self, client, container_id, name, labels):
+        self._client = client
+        self.id = container_id
+        self.name = name
+        self.labels = labels
+        self.status = "created"
+        self.attrs = {"ExecIDs": []}
+
+    def start(self):
+        self.status = "running"
+
+    def stop(self):
+        self.status = "exited"
+        for exec_id in self.attrs["ExecIDs"]:
+            self._client.api.execs[exec_id].update({"Running": False, "ExitCode": 137})
+
+    def remove(self, force=False):  # pylint: disable=unused-argument
+        del self._client.containers.by_id[self.id]
+
+
+class FakeContainers:
+    def __init__(self, client):
+        self._client = client
+        self.by_id = {}
+        self.created_count = 0
+
+    def create(
+        self, image, name, command, labels=None, **kwargs
+    ):  # pylint: disable=unused-argument
+        self.created_count += 1
+        container = FakeContainer(
+            self._client, f"container-{self.created_count}", name, labels or {}
+        )
+        self.by_id[container.id] = container
+        return container
+
+    def get(self, container_id_or_name):
+        for container in self.by_id.values():
+            if container_id_or_name in (container.id, container.name):
+                return container
+        raise docker.errors.NotFound(f"No such container: {container_id_or_name}")
+
+    def list(self, all=False, filters=None):  # pylint: disable=redefined-builtin
+        assert all
+        label_key, label_value = filters["label"].split("=", 1)
+        return [
+            container
+            for container in self.by_id.values()
+            if container.labels.get(label_key) == label_value
+        ]
+
+
+class FakeAPI:
+    def __init__(self, client):
+        self._client = client
+        self.execs = {}
+
+    def exec_create(self, container_id, cmd):
+        exec_id = f"exec-{len(self.execs) + 1}"
+        self.execs[exec_id] = {
+            "Running": False,
+            "ExitCode": None,
+            "ProcessConfig": {"entrypoint": cmd[0], "arguments": cmd[1:]},
+        }
+        self._client.containers.by_id[container_id].attrs["ExecIDs"].append(exec_id)
+        return {"Id": exec_id}
+
+    def exec_start(self, exec_id, detach=False):
+        assert detach
+        self.execs[exec_id]["Running"] = True
+
+    def exec_inspect(self, exec_id):
+        return dict(self.execs[exec_id])
+
+    def finish_exec(self, exec_id, exit_code):
+        self.execs[exec_id].update({"Running": False, "ExitCode": exit_code})
+
+
+class FakeDockerClient:
+    def __init__(self):
+        self.containers = FakeContainers(self)
+        self.api = FakeAPI(self)
+
+
+@solid
+def noop_solid():
+    pass
+
+
+@pipeline
+def noop_pipeline():
+    noop_solid()
+
+
+def _step_handler_context(run_id, step_keys):
+    return StepHandlerContext(
+        instance=None,
+        execute_step_args=ExecuteStepArgs(
+            pipeline_origin=reconstructable(noop_pipeline).get_python_origin(),
+            pipeline_run_id=run_id,
+            step_keys_to_execute=step_keys,
+        ),
+        step_tags={step_key: {} for step_key in step_keys},
+    )
+
+
+def _step_handler(client, pool_size):
+    step_handler = DockerStepHandler(image=STEP_IMAGE, step_container_pool_size=pool_size)
+    step_handler._get_client = lambda: client  # pylint: disable=protected-access
+    return step_handler
+
+
+def _exec_id(client, step_handler, context):
+    step_exec = step_handler._get_pooled_step_exec(  # pylint: disable=protected-access
+        client,
+        context.execute_step_args.pipeline_run_id,
+        step_handler._get_container_name(  # pylint: disable=protected-access
+            context.execute_step_args.pipeline_run_id,
+            context.execute_step_args.step_keys_to_execute,
+        ),
+    )
+    return step_exec[1]
+
+
+def _failure_messages(events):
+    assert all(event.event_type == DagsterEventType.STEP_FAILURE for event in events)
+    return [event.message for event in events]
+
+
+def test_pooled_step_health():
+    client = FakeDockerClient()
+    step_handler = _step_handler(client, pool_size=2)
+
+    succeeding = _step_handler_context("run", ["succeeding"])
+    failing = _step_handler_context("run", ["failing"])
+    step_handler.launch_step(succeeding)
+    step_handler.launch_step(failing)
+    assert client.containers.created_count == 2
+
+    assert step_handler.check_step_health(succeeding) == []
+    assert step_handler.check_step_health(failing) == []
+
+    client.api.finish_exec(_exec_id(client, step_handler, succeeding), 0)
+    client.api.finish_exec(_exec_id(client, step_handler, failing), 1)
+    assert step_handler.check_step_health(succeeding) == []
+    assert _failure_messages(step_handler.check_step_health(failing)) == [
+        "Step process in pooled container exited with code 1."
+    ]
+
+    # the steps executing in a container that stopped fail their health checks
+    stopped = _step_handler_context("run", ["stopped"])
+    step_handler.launch_step(stopped)
+    container_id = step_handler._get_pooled_step_exec(  # pylint: disable=protected-access
+        client, "run", step_handler._get_container_name("run", ["stopped"])
+    )[0]
+    client.containers.get(container_id).stop()
+    assert _failure_messages(step_handler.check_step_health(stopped)) == [
+        "Pooled container status is exited."
+    ]
+
+    # steps that were never launched in a pooled container fail their health checks
+    assert _failure_messages(
+        step_handler.check_step_health(_step_handler_context("run", ["unknown"]))
+    ) == ["Step was not launched in a pooled Docker container"]
+
+
+def test_rediscover_pooled_containers_after_resume():
+    client = FakeDockerClient()
+    step_handler = _step_handler(client, pool_size=1)
+
+    running = _step_handler_context("run", ["running"])
+    retried = _step_handler_context("run", ["retried"])
+    step_handler.launch_step(running)
+    step_handler.launch_step(retried)
+    client.api.finish_exec(_exec_id(client, step_handler, retried), 1)
+    step_handler.launch_step(retried)
+    assert client.containers.created_count == 1
+
+    # the executor of the resumed run starts with a new step handler, which finds the steps that
+    # are still executing from the arguments of the processes in the pooled containers
+    resumed_step_handler = _step_handler(client, pool_size=1)
+    assert resumed_step_handler.check_step_health(running) == []
+    assert resumed_step_handler.check_step_health(retried) == []
+    assert _exec_id(client, resumed_step_handler, retried) == _exec_id(
+        client, step_handler, retried
+    )
+
+    client.api.finish_exec(_exec_id(client, step_handler, running), 2)
+    assert _failure_messages(resumed_step_handler.check_step_health(running)) == [
+        "Step process in pooled container exited with code 2."
+    ]
+
+    # the rediscovered container is reused rather than another one started
+    resumed_step_handler.launch_step(_step_handler_context("run", ["new"]))
+    assert client.containers.created_count == 1
+
+
+def test_cleanup_run_removes_pooled_containers():
+    client = FakeDockerClient()
+    step_handler = _step_handler(client, pool_size=2)
+    other_run_step_handler = _step_handler(client, pool_size=2)
+
+    step_handler.launch_step(_step_handler_context("run", ["one"]))
+    step_handler.launch_step(_step_handler_context("run", ["two"]))
+    other_run_step_handler.launch_step(_step_handler_context("other_run", ["one"]))
+    assert client.containers.created_count == 3
+
+    step_handler.cleanup_run("run")
+    assert [
+        container.labels[POOLED_CONTAINER_RUN_ID_LABEL]
+        for container in client.containers.by_id.values()
+    ] == ["other_run"]
+
+    # the pool of a resumed run includes the containers started before it was resumed
+    resumed_step_handler = _step_handler(client, pool_size=2)
+    resumed_step_handler.cleanup_run("other_run")
+    assert client.containers.by_id == {}
+
+    # a step handler that did not pool any containers has nothing to remove
+    _step_handler(client, pool_size=2).cleanup_run("run")
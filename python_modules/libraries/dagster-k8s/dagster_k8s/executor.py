@@ -2,7 +2,10 @@
 from dagster_k8s.launcher import K8sRunLauncher
 
 from dagster import Field, StringSource, check, executor
-from dagster.core.definitions.executor_definition import multiple_process_executor_requirements
+from dagster.core.definitions.executor_definition import (
+    get_resource_capacities_config,
+    multiple_process_executor_requirements,
+)
 from dagster.core.errors import DagsterUnmetExecutorRequirementsError
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData, MetadataEntry
 from dagster.core.execution.plan.objects import StepFailureData
@@ -21,6 +24,7 @@
     get_k8s_job_name,
     get_user_defined_k8s_config,
 )
+from .job_status_cache import K8sJobStatusCache
 from .utils import delete_job
 
 
@@ -30,6 +34,25 @@
         DagsterK8sJobConfig.config_type_job(),
         {"job_namespace": Field(StringSource, is_required=False)},
         {"retries": get_retries_config()},
+        {
+            "max_steps_per_worker": Field(
+                int,
+                is_required=False,
+                default_value=1,
+                description="The maximum number of ready steps with the same tags to launch in a "
+                "single Kubernetes Job.",
+            ),
+            "watch_events": Field(
+                bool,
+                is_required=False,
+                default_value=False,
+                description="Whether the event log storage should notify the executor of new "
+                "step events (e.g. via LISTEN/NOTIFY in postgres), rather than the executor "
+                "polling for them. Storages without notifications, such as MySQL, poll for the "
+                "events on the executor's behalf.",
+            ),
+            "resource_capacities": get_resource_capacities_config(),
+        },
     ),
     requirements=multiple_process_executor_requirements(),
 )
@@ -58,6 +81,9 @@ def k8s_job_executor(init_context: InitExecutorContext) -> Executor:
             env_secrets: ...
             env_vars: ...
             job_image: ... # leave out if using userDeployments
+            max_steps_per_worker: ...
+            watch_events: ...
+            resource_capacities: ...
 
     Configuration set on the Kubernetes Jobs and Pods created by the `K8sRunLauncher` will also be
     set on Kubernetes Jobs and Pods created by the `k8s_job_executor`.
@@ -109,6 +135,9 @@ def k8s_job_executor(init_context: InitExecutorContext) -> Executor:
         ),
         retries=RetryMode.from_config(init_context.executor_config["retries"]),
         should_verify_step=True,
+        max_steps_per_worker=exc_cfg.get("max_steps_per_worker"),
+        watch_events=exc_cfg.get("watch_events", False),
+        resource_capacities=exc_cfg.get("resource_capacities"),
     )
 
 
@@ -130,6 +159,8 @@ def __init__(
         self._job_config = job_config
         self._job_namespace = job_namespace
         self._fixed_k8s_client_batch_api = k8s_client_batch_api
+        # health checks for all of the steps of the run are answered from a single list call
+        self._job_status_cache = K8sJobStatusCache(lambda: self._batch_api, job_namespace)
 
         if load_incluster_config:
             check.invariant(
@@ -146,27 +177,40 @@ def _batch_api(self):
         return self._fixed_k8s_client_batch_api or kubernetes.client.BatchV1Api()
 
     def _get_k8s_step_job_name(self, step_handler_context):
-        step_key = step_handler_context.execute_step_args.step_keys_to_execute[0]
+        step_keys = step_handler_context.execute_step_args.step_keys_to_execute
 
         name_key = get_k8s_job_name(
             step_handler_context.execute_step_args.pipeline_run_id,
-            step_key,
+            "-".join(step_keys),
         )
 
         if step_handler_context.execute_step_args.known_state:
             retry_state = step_handler_context.execute_step_args.known_state.get_retry_state()
-            if retry_state.get_attempt_count(step_key):
-                return "dagster-step-%s-%d" % (name_key, retry_state.get_attempt_count(step_key))
+            attempt_count = max(retry_state.get_attempt_count(step_key) for step_key in step_keys)
+            if attempt_count:
+                return "dagster-step-%s-%d" % (name_key, attempt_count)
 
         return "dagster-step-%s" % (name_key)
 
+    def _get_step_failure_events(self, step_handler_context, job_name):
+        return [
+            DagsterEvent(
+                event_type_value=DagsterEventType.STEP_FAILURE.value,
+                pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
+                step_key=step_key,
+                message=f"Discovered failed Kubernetes job {job_name} for step {step_key}",
+                event_specific_data=StepFailureData(
+                    error=None,
+                    user_failure_data=None,
+                ),
+            )
+            for step_key in step_handler_context.execute_step_args.step_keys_to_execute
+        ]
+
     def launch_step(self, step_handler_context: StepHandlerContext):
         events = []
 
-        assert (
-            len(step_handler_context.execute_step_args.step_keys_to_execute) == 1
-        ), "Launching multiple steps is not currently supported"
-        step_key = step_handler_context.execute_step_args.step_keys_to_execute[0]
+        step_keys = step_handler_context.execute_step_args.step_keys_to_execute
 
         job_name = self._get_k8s_step_job_name(step_handler_context)
         pod_name = job_name
@@ -182,10 +226,18 @@ def launch_step(self, step_handler_context: StepHandlerContext):
         if not job_config.job_image:
             raise Exception("No image included in either executor config or the job")
 
+        # steps are only launched together if they have the same tags
         user_defined_k8s_config = get_user_defined_k8s_config(
-            frozentags(step_handler_context.step_tags[step_key])
+            frozentags(step_handler_context.step_tags[step_keys[0]])
         )
 
+        labels = {
+            "dagster/job": step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
+            "dagster/run-id": step_handler_context.execute_step_args.pipeline_run_id,
+        }
+        if len(step_keys) == 1:
+            labels["dagster/op"] = step_keys[0]
+
         job = construct_dagster_k8s_job(
             job_config=job_config,
             args=args,
@@ -193,61 +245,41 @@ def launch_step(self, step_handler_context: StepHandlerContext):
             pod_name=pod_name,
             component="step_worker",
             user_defined_k8s_config=user_defined_k8s_config,
-            labels={
-                "dagster/job": step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                "dagster/op": step_key,
-                "dagster/run-id": step_handler_context.execute_step_args.pipeline_run_id,
-            },
+            labels=labels,
         )
 
-        events.append(
-            DagsterEvent(
-                event_type_value=DagsterEventType.ENGINE_EVENT.value,
-                pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                step_key=step_key,
-                message=f"Executing step {step_key} in Kubernetes job {job_name}",
-                event_specific_data=EngineEventData(
-                    [
-                        MetadataEntry("Step key", value=step_key),
-                        MetadataEntry("Kubernetes Job name", value=job_name),
-                    ],
-                ),
+        for step_key in step_keys:
+            events.append(
+                DagsterEvent(
+                    event_type_value=DagsterEventType.ENGINE_EVENT.value,
+                    pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
+                    step_key=step_key,
+                    message=f"Executing step {step_key} in Kubernetes job {job_name}",
+                    event_specific_data=EngineEventData(
+                        [
+                            MetadataEntry("Step key", value=step_key),
+                            MetadataEntry("Kubernetes Job name", value=job_name),
+                        ],
+                    ),
+                )
             )
-        )
 
         self._batch_api.create_namespaced_job(body=job, namespace=self._job_namespace)
 
         return events
 
     def check_step_health(self, step_handler_context: StepHandlerContext):
-        assert (
-            len(step_handler_context.execute_step_args.step_keys_to_execute) == 1
-        ), "Launching multiple steps is not currently supported"
-        step_key = step_handler_context.execute_step_args.step_keys_to_execute[0]
-
         job_name = self._get_k8s_step_job_name(step_handler_context)
 
-        job = self._batch_api.read_namespaced_job(namespace=self._job_namespace, name=job_name)
-        if job.status.failed:
-            return [
-                DagsterEvent(
-                    event_type_value=DagsterEventType.STEP_FAILURE.value,
-                    pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                    step_key=step_key,
-                    message=f"Discovered failed Kubernetes job {job_name} for step {step_key}",
-                    event_specific_data=StepFailureData(
-                        error=None,
-                        user_failure_data=None,
-                    ),
-                )
-            ]
+        job_status = self._job_status_cache.get_job_status(
+            job_name, {"dagster/run-id": step_handler_context.execute_step_args.pipeline_run_id}
+        )
+        if job_status.failed:
+            # the steps of a job that have already completed are ignored by the executor
+            return self._get_step_failure_events(step_handler_context, job_name)
         return []
 
     def terminate_step(self, step_handler_context: StepHandlerContext):
-        assert (
-            len(step_handler_context.execute_step_args.step_keys_to_execute) == 1
-        ), "Launching multiple steps is not currently supported"
-
         job_name = self._get_k8s_step_job_name(step_handler_context)
 
         delete_job(job_name=job_name, namespace=self._job_namespace)
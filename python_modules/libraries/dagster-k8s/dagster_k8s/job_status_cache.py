@@ -0,0 +1,72 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from dagster import check
+
+from .utils import sanitize_k8s_label
+
+DEFAULT_JOB_STATUS_CACHE_MAX_AGE_SECONDS = 5.0
+
+
+def get_label_selector(labels: Dict[str, str]) -> str:
+    return ",".join(f"{key}={sanitize_k8s_label(value)}" for key, value in sorted(labels.items()))
+
+
+class K8sJobStatusCache:
+    """Answers Kubernetes Job status lookups from memory.
+
+    Rather than reading each Job individually, the statuses of all Jobs matching a label selector
+    (e.g. all of the step Jobs of a run) are refreshed together with a single list call whenever
+    the cached statuses for that selector are older than `max_age_seconds`. Jobs that were
+    created since the last list are read individually.
+
+    Args:
+        batch_api_fn (Callable[[], Any]): Returns the kubernetes BatchV1Api to query.
+        namespace (str): The namespace of the Jobs.
+        max_age_seconds (Optional[float]): How long listed statuses are served from memory before
+            they are refreshed.
+    """
+
+    def __init__(
+        self,
+        batch_api_fn: Callable[[], Any],
+        namespace: str,
+        max_age_seconds: Optional[float] = None,
+    ):
+        self._batch_api_fn = check.callable_param(batch_api_fn, "batch_api_fn")
+        self._namespace = check.str_param(namespace, "namespace")
+        self._max_age_seconds = check.opt_numeric_param(
+            max_age_seconds, "max_age_seconds", default=DEFAULT_JOB_STATUS_CACHE_MAX_AGE_SECONDS
+        )
+        self._lock = threading.Lock()
+        # label selector -> (time of the list call, job statuses by job name)
+        self._statuses: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+    def _list_job_statuses(self, label_selector: str) -> Dict[str, Any]:
+        jobs = self._batch_api_fn().list_namespaced_job(
+            namespace=self._namespace, label_selector=label_selector
+        )
+        return {job.metadata.name: job.status for job in jobs.items}
+
+    def get_job_status(self, job_name: str, labels: Dict[str, str]) -> Any:
+        """Returns the V1JobStatus of the given Job, which must have the given labels."""
+        check.str_param(job_name, "job_name")
+        check.dict_param(labels, "labels", key_type=str, value_type=str)
+
+        label_selector = get_label_selector(labels)
+        with self._lock:
+            listed_at, statuses = self._statuses.get(label_selector, (None, {}))
+            if listed_at is None or time.time() - listed_at >= self._max_age_seconds:
+                listed_at = time.time()
+                statuses = self._list_job_statuses(label_selector)
+                self._statuses[label_selector] = (listed_at, statuses)
+
+        if job_name in statuses:
+            return statuses[job_name]
+
+        return (
+            self._batch_api_fn()
+            .read_namespaced_job(namespace=self._namespace, name=job_name)
+            .status
+        )
@@ -20,8 +20,13 @@
     get_job_name_from_run_id,
     get_user_defined_k8s_config,
 )
+from .job_status_cache import K8sJobStatusCache
 from .utils import delete_job
 
+# Identifies the deployment that launched a run worker Job, so that the run worker health checks of
+# a deployment list its own Jobs rather than every run worker Job in the namespace
+INSTANCE_CONFIG_MAP_LABEL = "dagster/instance-config-map"
+
 
 class K8sRunLauncher(RunLauncher, ConfigurableClass):
     """RunLauncher that starts a Kubernetes Job for each Dagster job run.
@@ -82,6 +87,8 @@ def __init__(
             kubernetes.config.load_kube_config(kubeconfig_file)
 
         self._fixed_batch_api = k8s_client_batch_api
+        # run monitoring checks on all of the run workers are answered from a single list call
+        self._job_status_cache = K8sJobStatusCache(lambda: self._batch_api, self.job_namespace)
 
         self._job_config = None
         self._job_image = check.opt_str_param(job_image, "job_image")
@@ -258,6 +265,7 @@ def _launch_k8s_job_with_args(self, job_name, args, run, pipeline_origin):
             labels={
                 "dagster/job": pipeline_origin.pipeline_name,
                 "dagster/run-id": run.run_id,
+                INSTANCE_CONFIG_MAP_LABEL: self.instance_config_map,
             },
         )
 
@@ -391,13 +399,19 @@ def check_run_worker_health(self, run: PipelineRun):
             run.run_id, resume_attempt_number=self._instance.count_resume_run_attempts(run.run_id)
         )
         try:
-            job = self._batch_api.read_namespaced_job(namespace=self.job_namespace, name=job_name)
+            job_status = self._job_status_cache.get_job_status(
+                job_name,
+                {
+                    "app.kubernetes.io/component": "run_worker",
+                    INSTANCE_CONFIG_MAP_LABEL: self.instance_config_map,
+                },
+            )
         except Exception:
             return CheckRunHealthResult(
                 WorkerStatus.UNKNOWN, str(serializable_error_info_from_exc_info(sys.exc_info()))
             )
-        if job.status.failed:
+        if job_status.failed:
             return CheckRunHealthResult(WorkerStatus.FAILED, "K8s job failed")
-        if job.status.succeeded:
+        if job_status.succeeded:
             return CheckRunHealthResult(WorkerStatus.SUCCESS)
         return CheckRunHealthResult(WorkerStatus.RUNNING)
@@ -183,3 +183,45 @@ def test_step_handler_image_override(kubeconfig_file):
         method_name, _args, kwargs = mock_method_calls[0]
         assert method_name == "create_namespaced_job"
         assert kwargs["body"].spec.template.spec.containers[0].image == "new-image"
+
+
+def test_step_handler_multiple_steps(kubeconfig_file):
+
+    mock_k8s_client_batch_api = mock.MagicMock()
+    handler = K8sStepHandler(
+        job_config=DagsterK8sJobConfig(instance_config_map="foobar", job_image="bizbuz"),
+        job_namespace="foo",
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=mock_k8s_client_batch_api,
+    )
+
+    with instance_for_test() as instance:
+        run = create_run_for_test(
+            instance,
+            pipeline_name="bar",
+        )
+        step_handler_context = StepHandlerContext(
+            instance,
+            ExecuteStepArgs(
+                reconstructable(bar).get_python_origin(), run.run_id, ["foo_solid", "bar_solid"]
+            ),
+            {"foo_solid": {}, "bar_solid": {}},
+        )
+        events = handler.launch_step(step_handler_context)
+        assert [event.step_key for event in events] == ["foo_solid", "bar_solid"]
+
+        # Both steps are executed in a single k8s job.
+        mock_method_calls = mock_k8s_client_batch_api.method_calls
+        assert len(mock_method_calls) == 1
+        method_name, _args, kwargs = mock_method_calls[0]
+        assert method_name == "create_namespaced_job"
+        job_name = kwargs["body"].metadata.name
+        assert "dagster/op" not in kwargs["body"].metadata.labels
+
+        # A failed job fails each of its steps.
+        mock_k8s_client_batch_api.read_namespaced_job.return_value.status.failed = 1
+        health_events = handler.check_step_health(step_handler_context)
+        assert [event.step_key for event in health_events] == ["foo_solid", "bar_solid"]
+        assert all(event.is_step_failure for event in health_events)
+        assert mock_k8s_client_batch_api.read_namespaced_job.call_args[1]["name"] == job_name
@@ -0,0 +1,95 @@
+import time
+
+import pytest
+from dagster_k8s.job_status_cache import K8sJobStatusCache, get_label_selector
+from kubernetes.client.models.v1_job import V1Job
+from kubernetes.client.models.v1_job_list import V1JobList
+from kubernetes.client.models.v1_job_status import V1JobStatus
+from kubernetes.client.models.v1_object_meta import V1ObjectMeta
+from kubernetes.client.rest import ApiException
+
+
+class FakeBatchApi:
+    def __init__(self):
+        self.jobs = {}
+        self.list_count = 0
+        self.read_count = 0
+
+    def add_job(self, name, labels, status):
+        self.jobs[name] = V1Job(metadata=V1ObjectMeta(name=name, labels=labels), status=status)
+
+    def list_namespaced_job(self, namespace, label_selector):
+        assert namespace == "foo"
+        self.list_count += 1
+        selector = dict(term.split("=") for term in label_selector.split(","))
+        return V1JobList(
+            items=[
+                job
+                for job in self.jobs.values()
+                if all(job.metadata.labels.get(key) == value for key, value in selector.items())
+            ]
+        )
+
+    def read_namespaced_job(self, namespace, name):
+        assert namespace == "foo"
+        self.read_count += 1
+        if name not in self.jobs:
+            raise ApiException(status=404, reason="Not Found")
+        return self.jobs[name]
+
+
+def test_label_selector():
+    assert get_label_selector({"dagster/run-id": "abc", "app": "dagster"}) == (
+        "app=dagster,dagster/run-id=abc"
+    )
+    assert get_label_selector({"dagster/job": "my job"}) == "dagster/job=my-job"
+
+
+def test_job_status_cache():
+    batch_api = FakeBatchApi()
+    for i in range(500):
+        batch_api.add_job(
+            f"step-{i}", {"dagster/run-id": "run_one"}, V1JobStatus(active=1, failed=None)
+        )
+    batch_api.add_job("other", {"dagster/run-id": "run_two"}, V1JobStatus(succeeded=1))
+
+    cache = K8sJobStatusCache(lambda: batch_api, "foo", max_age_seconds=60)
+
+    for i in range(500):
+        status = cache.get_job_status(f"step-{i}", {"dagster/run-id": "run_one"})
+        assert status.active == 1
+
+    # all of the statuses were answered from a single list call
+    assert batch_api.list_count == 1
+    assert batch_api.read_count == 0
+
+    # cached statuses are not refreshed until they expire
+    batch_api.jobs["step-0"].status = V1JobStatus(failed=1)
+    assert not cache.get_job_status("step-0", {"dagster/run-id": "run_one"}).failed
+    assert batch_api.list_count == 1
+
+    # other label selectors are listed separately
+    assert cache.get_job_status("other", {"dagster/run-id": "run_two"}).succeeded == 1
+    assert batch_api.list_count == 2
+
+    # jobs created since the last list are read individually
+    batch_api.add_job("step-new", {"dagster/run-id": "run_one"}, V1JobStatus(active=1))
+    assert cache.get_job_status("step-new", {"dagster/run-id": "run_one"}).active == 1
+    assert batch_api.list_count == 2
+    assert batch_api.read_count == 1
+
+    with pytest.raises(ApiException):
+        cache.get_job_status("missing", {"dagster/run-id": "run_one"})
+
+
+def test_job_status_cache_expiry():
+    batch_api = FakeBatchApi()
+    batch_api.add_job("step", {"dagster/run-id": "run_one"}, V1JobStatus(active=1))
+
+    cache = K8sJobStatusCache(lambda: batch_api, "foo", max_age_seconds=0.1)
+    assert not cache.get_job_status("step", {"dagster/run-id": "run_one"}).failed
+
+    batch_api.jobs["step"].status = V1JobStatus(failed=1)
+    time.sleep(0.2)
+    assert cache.get_job_status("step", {"dagster/run-id": "run_one"}).failed == 1
+    assert batch_api.list_count == 2
@@ -4,6 +4,7 @@
 from dagster_k8s import K8sRunLauncher
 from dagster_k8s.job import DAGSTER_PG_PASSWORD_ENV_VAR, UserDefinedDagsterK8sConfig
 from kubernetes.client.models.v1_job import V1Job
+from kubernetes.client.models.v1_job_list import V1JobList
 from kubernetes.client.models.v1_job_status import V1JobStatus
 
 from dagster import pipeline, reconstructable
@@ -134,6 +135,7 @@ def test_user_defined_k8s_config_in_run_tags(kubeconfig_file):
 
         labels = kwargs["body"].spec.template.metadata.labels
         assert labels["foo_label_key"] == "bar_label_value"
+        assert kwargs["body"].metadata.labels["dagster/instance-config-map"] == "dagster-instance"
 
         args = container.args
         assert (
@@ -272,7 +274,8 @@ def test_check_run_health(kubeconfig_file):
     labels = {"foo_label_key": "bar_label_value"}
 
     # Construct a K8s run launcher in a fake k8s environment.
-    mock_k8s_client_batch_api = mock.Mock(spec_set=["read_namespaced_job"])
+    mock_k8s_client_batch_api = mock.Mock(spec_set=["list_namespaced_job", "read_namespaced_job"])
+    mock_k8s_client_batch_api.list_namespaced_job.return_value = V1JobList(items=[])
     mock_k8s_client_batch_api.read_namespaced_job.side_effect = [
         V1Job(status=V1JobStatus(failed=0, succeeded=0)),
         V1Job(status=V1JobStatus(failed=0, succeeded=1)),
@@ -321,3 +324,9 @@ def test_check_run_health(kubeconfig_file):
             assert k8s_run_launcher.check_run_worker_health(run).status == WorkerStatus.RUNNING
             assert k8s_run_launcher.check_run_worker_health(run).status == WorkerStatus.SUCCESS
             assert k8s_run_launcher.check_run_worker_health(run).status == WorkerStatus.FAILED
+
+            # only the run worker Jobs launched by this deployment are listed
+            _, kwargs = mock_k8s_client_batch_api.list_namespaced_job.call_args
+            assert kwargs["label_selector"] == (
+                "app.kubernetes.io/component=run_worker,dagster/instance-config-map=dagster-instance"
+            )
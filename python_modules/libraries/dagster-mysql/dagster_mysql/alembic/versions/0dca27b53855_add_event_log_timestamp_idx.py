@@ -0,0 +1,22 @@
+"""add event log timestamp idx
+
+Revision ID: 0dca27b53855
+Revises: fbc23426f0f7
+Create Date: 2026-10-19 18:02:41.519347
+
+"""
+from dagster.core.storage.migration.utils import create_event_log_timestamp_idx
+
+# revision identifiers, used by Alembic.
+revision = "0dca27b53855"
+down_revision = "fbc23426f0f7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_event_log_timestamp_idx()
+
+
+def downgrade():
+    pass
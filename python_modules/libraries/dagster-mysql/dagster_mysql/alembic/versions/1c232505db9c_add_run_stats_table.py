@@ -0,0 +1,22 @@
+"""add run stats table
+
+Revision ID: 1c232505db9c
+Revises: 8dfe8ba19782
+Create Date: 2026-10-19 11:36:58.657467
+
+"""
+from dagster.core.storage.migration.utils import create_run_stats_table
+
+# revision identifiers, used by Alembic.
+revision = "1c232505db9c"
+down_revision = "8dfe8ba19782"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_run_stats_table()
+
+
+def downgrade():
+    pass
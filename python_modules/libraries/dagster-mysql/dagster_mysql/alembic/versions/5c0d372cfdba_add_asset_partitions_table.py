@@ -0,0 +1,22 @@
+"""add asset partitions table
+
+Revision ID: 5c0d372cfdba
+Revises: 1c232505db9c
+Create Date: 2026-10-19 14:02:41.517203
+
+"""
+from dagster.core.storage.migration.utils import create_asset_partitions_table
+
+# revision identifiers, used by Alembic.
+revision = "5c0d372cfdba"
+down_revision = "1c232505db9c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_asset_partitions_table()
+
+
+def downgrade():
+    pass
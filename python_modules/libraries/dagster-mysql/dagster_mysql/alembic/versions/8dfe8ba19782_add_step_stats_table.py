@@ -0,0 +1,22 @@
+"""add step stats table
+
+Revision ID: 8dfe8ba19782
+Revises: 130b087bc274
+Create Date: 2026-10-19 10:55:05.906025
+
+"""
+from dagster.core.storage.migration.utils import create_step_stats_table
+
+# revision identifiers, used by Alembic.
+revision = "8dfe8ba19782"
+down_revision = "130b087bc274"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_step_stats_table()
+
+
+def downgrade():
+    pass
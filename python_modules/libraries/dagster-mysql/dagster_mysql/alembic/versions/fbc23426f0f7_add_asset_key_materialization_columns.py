@@ -0,0 +1,22 @@
+"""add asset key materialization columns
+
+Revision ID: fbc23426f0f7
+Revises: 5c0d372cfdba
+Create Date: 2026-10-19 15:21:09.804412
+
+"""
+from dagster.core.storage.migration.utils import add_asset_key_materialization_columns
+
+# revision identifiers, used by Alembic.
+revision = "fbc23426f0f7"
+down_revision = "5c0d372cfdba"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_asset_key_materialization_columns()
+
+
+def downgrade():
+    pass
@@ -137,12 +137,13 @@ def store_asset_observation(self, event):
                     )
                 )
 
-    def store_asset_materialization(self, event):
+    def store_asset_materialization(self, event, storage_id=None):
         # last_materialization_timestamp is updated upon observation or materialization
         # See store_asset method in SqlEventLogStorage for more details
         materialization = event.dagster_event.step_materialization_data.materialization
 
         if self.has_secondary_index(ASSET_KEY_INDEX_COLS):
+            materialization_values = self.get_asset_key_materialization_values(event, storage_id)
             with self.index_connection() as conn:
                 conn.execute(
                     db.dialects.mysql.insert(AssetKeyTable)
@@ -154,6 +155,7 @@ def store_asset_materialization(self, event):
                         tags=seven.json.dumps(materialization.tags)
                         if materialization.tags
                         else None,
+                        **materialization_values,
                     )
                     .on_duplicate_key_update(
                         last_materialization=serialize_dagster_namedtuple(materialization),
@@ -162,6 +164,7 @@ def store_asset_materialization(self, event):
                         tags=seven.json.dumps(materialization.tags)
                         if materialization.tags
                         else None,
+                        **materialization_values,
                     )
                 )
         else:
@@ -0,0 +1,22 @@
+"""add asset partitions table
+
+Revision ID: 1e3f6bb53862
+Revises: a828ef5850ab
+Create Date: 2026-10-19 14:02:41.517203
+
+"""
+from dagster.core.storage.migration.utils import create_asset_partitions_table
+
+# revision identifiers, used by Alembic.
+revision = "1e3f6bb53862"
+down_revision = "a828ef5850ab"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_asset_partitions_table()
+
+
+def downgrade():
+    pass
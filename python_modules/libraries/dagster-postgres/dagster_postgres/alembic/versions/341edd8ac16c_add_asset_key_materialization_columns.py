@@ -0,0 +1,22 @@
+"""add asset key materialization columns
+
+Revision ID: 341edd8ac16c
+Revises: 1e3f6bb53862
+Create Date: 2026-10-19 15:21:09.804412
+
+"""
+from dagster.core.storage.migration.utils import add_asset_key_materialization_columns
+
+# revision identifiers, used by Alembic.
+revision = "341edd8ac16c"
+down_revision = "1e3f6bb53862"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_asset_key_materialization_columns()
+
+
+def downgrade():
+    pass
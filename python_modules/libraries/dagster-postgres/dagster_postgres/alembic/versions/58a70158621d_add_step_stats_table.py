@@ -0,0 +1,22 @@
+"""add step stats table
+
+Revision ID: 58a70158621d
+Revises: 9c5f00e80ef2
+Create Date: 2026-10-19 10:55:05.906025
+
+"""
+from dagster.core.storage.migration.utils import create_step_stats_table
+
+# revision identifiers, used by Alembic.
+revision = "58a70158621d"
+down_revision = "9c5f00e80ef2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_step_stats_table()
+
+
+def downgrade():
+    pass
@@ -0,0 +1,22 @@
+"""add run stats table
+
+Revision ID: a828ef5850ab
+Revises: 58a70158621d
+Create Date: 2026-10-19 11:36:58.657467
+
+"""
+from dagster.core.storage.migration.utils import create_run_stats_table
+
+# revision identifiers, used by Alembic.
+revision = "a828ef5850ab"
+down_revision = "58a70158621d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_run_stats_table()
+
+
+def downgrade():
+    pass
@@ -0,0 +1,22 @@
+"""add event log timestamp idx
+
+Revision ID: d5449655e2e5
+Revises: 341edd8ac16c
+Create Date: 2026-10-19 18:02:41.519347
+
+"""
+from dagster.core.storage.migration.utils import create_event_log_timestamp_idx
+
+# revision identifiers, used by Alembic.
+revision = "d5449655e2e5"
+down_revision = "341edd8ac16c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_event_log_timestamp_idx()
+
+
+def downgrade():
+    pass
@@ -1,6 +1,9 @@
 import logging
+import re
 import threading
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from contextlib import contextmanager
+from datetime import datetime
 from typing import Callable, List, MutableMapping, Optional
 
 import sqlalchemy as db
@@ -13,7 +16,14 @@
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
 )
-from dagster.core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
+from dagster.core.storage.event_log.base import (
+    DEFAULT_IDS_PER_EVENT_PARTITION,
+    DEFAULT_PRUNE_EVENTS_BATCH_SIZE,
+)
+from dagster.core.storage.event_log.migration import (
+    ASSET_KEY_INDEX_COLS,
+    ASSET_KEY_MATERIALIZATION_COLS,
+)
 from dagster.core.storage.event_log.polling_event_watcher import CallbackAfterCursor
 from dagster.core.storage.sql import create_engine, run_alembic_upgrade, stamp_alembic_rev
 from dagster.serdes import (
@@ -37,6 +47,24 @@
 
 CHANNEL_NAME = "run_events"
 
+# The number of range partitions kept ahead of the latest storage id of a partitioned event log, so
+# that new events are stored in a range partition rather than in the default partition
+EVENT_LOG_PARTITIONS_AHEAD = 2
+
+# The partition holding the events stored before the event log was partitioned
+EVENT_LOG_LEGACY_PARTITION = "event_logs_legacy"
+
+# The partition holding the events whose storage ids are not covered by a range partition
+EVENT_LOG_DEFAULT_PARTITION = "event_logs_default"
+
+PARTITION_BOUND_REGEX = re.compile(r"FOR VALUES FROM \((.+)\) TO \((.+)\)")
+
+
+class EventLogPartition(namedtuple("_EventLogPartition", "name lower_id upper_id")):
+    """A range partition of the event log, holding the storage ids from lower_id (inclusive) to
+    upper_id (exclusive). The lower_id of the legacy partition is None.
+    """
+
 
 class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """Postgres-backed event log storage.
@@ -164,7 +192,10 @@ def store_event(self, event):
             )
             and event.dagster_event.asset_key
         ):
-            self.store_asset(event)
+            self.store_asset(event, res[1])
+
+        self.store_step_stats(event)
+        self.store_run_stats(event)
 
     def store_asset_observation(self, event):
         # last_materialization_timestamp is updated upon observation or materialization
@@ -187,11 +218,12 @@ def store_asset_observation(self, event):
                     )
                 )
 
-    def store_asset_materialization(self, event):
+    def store_asset_materialization(self, event, storage_id=None):
         # last_materialization_timestamp is updated upon observation or materialization
         # See store_asset method in SqlEventLogStorage for more details
         materialization = event.dagster_event.step_materialization_data.materialization
         if self.has_secondary_index(ASSET_KEY_INDEX_COLS):
+            materialization_values = self.get_asset_key_materialization_values(event, storage_id)
             with self.index_connection() as conn:
                 conn.execute(
                     db.dialects.postgresql.insert(AssetKeyTable)
@@ -203,6 +235,7 @@ def store_asset_materialization(self, event):
                         tags=seven.json.dumps(materialization.tags)
                         if materialization.tags
                         else None,
+                        **materialization_values,
                     )
                     .on_conflict_do_update(
                         index_elements=[AssetKeyTable.c.asset_key],
@@ -215,6 +248,7 @@ def store_asset_materialization(self, event):
                             tags=seven.json.dumps(materialization.tags)
                             if materialization.tags
                             else None,
+                            **materialization_values,
                         ),
                     )
                 )
@@ -258,9 +292,216 @@ def enable_secondary_index(self, name):
         if name in self._secondary_index_cache:
             del self._secondary_index_cache[name]
 
+    @property
+    def supports_partition_events(self):
+        return True
+
+    def partition_events(self, ids_per_partition=DEFAULT_IDS_PER_EVENT_PARTITION):
+        """Converts the event log table into a table partitioned by ranges of storage ids, which
+        requires Postgres 11 or later.
+
+        The existing table is attached as a single legacy partition, so no events are copied, and
+        new events are stored in range partitions of ids_per_partition storage ids, which are
+        created ahead of the storage ids in use whenever events are pruned. Events whose storage ids
+        are not covered by a range partition are stored in a default partition. The event log table
+        is locked while it is converted.
+        """
+        check.int_param(ids_per_partition, "ids_per_partition")
+        check.invariant(ids_per_partition > 0, "ids_per_partition must be greater than 0")
+
+        with self._transaction() as conn:
+            check.invariant(
+                not self._is_event_log_partitioned(conn), "The event log is already partitioned"
+            )
+            conn.execute("LOCK TABLE event_logs IN ACCESS EXCLUSIVE MODE")
+
+            inspector = db.inspect(conn)
+            primary_key_name = inspector.get_pk_constraint("event_logs")["name"]
+            index_names = [index["name"] for index in inspector.get_indexes("event_logs")]
+            sequence_name = conn.execute(
+                "SELECT pg_get_serial_sequence('event_logs', 'id')"
+            ).scalar()
+            upper_id = conn.execute("SELECT coalesce(max(id), 0) + 1 FROM event_logs").scalar()
+
+            # free the names of the table, its primary key and its indexes for the new table
+            conn.execute(f"ALTER TABLE event_logs RENAME TO {EVENT_LOG_LEGACY_PARTITION}")
+            conn.execute(
+                f'ALTER TABLE {EVENT_LOG_LEGACY_PARTITION} RENAME CONSTRAINT "{primary_key_name}" '
+                f"TO {EVENT_LOG_LEGACY_PARTITION}_pkey"
+            )
+            for index_name in index_names:
+                conn.execute(
+                    f'ALTER INDEX "{index_name}" RENAME TO '
+                    f'"{EVENT_LOG_LEGACY_PARTITION}_{index_name}"'
+                )
+
+            # a constraint implying the partition bounds lets the attach skip validating them
+            conn.execute(
+                f"ALTER TABLE {EVENT_LOG_LEGACY_PARTITION} ADD CONSTRAINT "
+                f"{EVENT_LOG_LEGACY_PARTITION}_id_range CHECK (id < {upper_id})"
+            )
+            conn.execute(
+                f"CREATE TABLE event_logs (LIKE {EVENT_LOG_LEGACY_PARTITION} INCLUDING DEFAULTS) "
+                "PARTITION BY RANGE (id)"
+            )
+            # the storage id sequence must outlive the legacy partition
+            conn.execute(f"ALTER SEQUENCE {sequence_name} OWNED BY event_logs.id")
+            conn.execute("ALTER TABLE event_logs ADD PRIMARY KEY (id)")
+            for index in SqlEventLogStorageTable.indexes:
+                index.create(conn)
+
+            conn.execute(
+                f"ALTER TABLE event_logs ATTACH PARTITION {EVENT_LOG_LEGACY_PARTITION} "
+                f"FOR VALUES FROM (MINVALUE) TO ({upper_id})"
+            )
+            conn.execute(
+                f"CREATE TABLE {EVENT_LOG_DEFAULT_PARTITION} PARTITION OF event_logs DEFAULT"
+            )
+            self._create_event_log_partition(conn, upper_id, upper_id + ids_per_partition)
+            self._create_event_log_partitions(conn)
+
+    def _is_event_log_partitioned(self, conn):
+        return (
+            conn.execute("SELECT relkind FROM pg_class WHERE oid = 'event_logs'::regclass").scalar()
+            == "p"
+        )
+
+    def _get_event_log_partitions(self, conn):
+        # the range partitions of the event log, ordered by storage id
+        rows = conn.execute(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = 'event_logs'::regclass"
+        ).fetchall()
+
+        partitions = []
+        for name, partition_bound in rows:
+            match = PARTITION_BOUND_REGEX.match(partition_bound)
+            if not match:
+                # the default partition
+                continue
+            lower_bound, upper_bound = (bound.strip("'") for bound in match.groups())
+            partitions.append(
+                EventLogPartition(
+                    name,
+                    None if lower_bound == "MINVALUE" else int(lower_bound),
+                    int(upper_bound),
+                )
+            )
+        return sorted(partitions, key=lambda partition: partition.upper_id)
+
+    def _create_event_log_partition(self, conn, lower_id, upper_id):
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS event_logs_{lower_id} PARTITION OF event_logs "
+            f"FOR VALUES FROM ({lower_id}) TO ({upper_id})"
+        )
+
+    def _create_event_log_partitions(self, conn):
+        # creates range partitions, of the size of the latest one, ahead of the latest storage id
+        latest_partition = self._get_event_log_partitions(conn)[-1]
+        check.invariant(
+            latest_partition.lower_id is not None, "The event log has no range partition"
+        )
+        ids_per_partition = latest_partition.upper_id - latest_partition.lower_id
+        max_id = conn.execute("SELECT coalesce(max(id), 0) FROM event_logs").scalar()
+
+        # events that overflowed into the default partition must not overlap a new partition
+        lower_id = max(
+            latest_partition.upper_id,
+            conn.execute(
+                f"SELECT coalesce(max(id), 0) + 1 FROM {EVENT_LOG_DEFAULT_PARTITION}"
+            ).scalar(),
+        )
+        while lower_id <= max_id + EVENT_LOG_PARTITIONS_AHEAD * ids_per_partition:
+            self._create_event_log_partition(conn, lower_id, lower_id + ids_per_partition)
+            lower_id += ids_per_partition
+
+    def prune_events(
+        self, before_timestamp, batch_size=DEFAULT_PRUNE_EVENTS_BATCH_SIZE, max_batches=None
+    ):
+        """Overridden method to drop the range partitions of a partitioned event log whose events
+        were all stored before the given timestamp as a whole, instead of deleting their events row
+        by row. The latest materialization event of each asset is moved to the default partition
+        before its partition is dropped. The remaining events are pruned like the events of a
+        non-partitioned event log. Each dropped partition counts as a batch towards max_batches.
+        """
+        check.float_param(before_timestamp, "before_timestamp")
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be greater than 0")
+        check.opt_int_param(max_batches, "max_batches")
+
+        with self._connect() as conn:
+            is_partitioned = self._is_event_log_partitioned(conn)
+
+        deleted_count = 0
+        batch_count = 0
+        if is_partitioned:
+            deleted_count, batch_count = self._drop_event_log_partitions(
+                before_timestamp, max_batches
+            )
+
+        if max_batches is not None and batch_count >= max_batches:
+            return deleted_count
+
+        return deleted_count + super().prune_events(
+            before_timestamp,
+            batch_size,
+            None if max_batches is None else max_batches - batch_count,
+        )
+
+    def _drop_event_log_partitions(self, before_timestamp, max_batches):
+        # returns the number of deleted events and of dropped partitions that held events
+        before_datetime = datetime.utcfromtimestamp(before_timestamp)
+
+        with self._transaction() as conn:
+            self._create_event_log_partitions(conn)
+            partitions = self._get_event_log_partitions(conn)
+            max_id = conn.execute("SELECT coalesce(max(id), 0) FROM event_logs").scalar()
+
+        deleted_count = 0
+        batch_count = 0
+        for partition in partitions:
+            if max_batches is not None and batch_count >= max_batches:
+                break
+            if partition.upper_id > max_id:
+                # new events may still be stored in this partition
+                break
+
+            with self._transaction() as conn:
+                event_count, max_timestamp = conn.execute(
+                    f"SELECT count(*), max(timestamp) FROM {partition.name}"
+                ).fetchone()
+                if max_timestamp is not None and max_timestamp >= before_datetime:
+                    continue
+
+                conn.execute(f"ALTER TABLE event_logs DETACH PARTITION {partition.name}")
+                preserved_count = 0
+                if self.has_secondary_index(ASSET_KEY_MATERIALIZATION_COLS):
+                    # storage ids outside of the range partitions land in the default partition
+                    preserved_count = conn.execute(
+                        f"INSERT INTO event_logs SELECT * FROM {partition.name} WHERE id IN "
+                        "(SELECT last_materialization_storage_id FROM asset_keys)"
+                    ).rowcount
+                conn.execute(f"DROP TABLE {partition.name}")
+
+            deleted_count += event_count - preserved_count
+            if event_count:
+                batch_count += 1
+
+        return deleted_count, batch_count
+
+    @contextmanager
+    def _transaction(self):
+        # the engine autocommits each statement, so partition maintenance, which must hold its locks
+        # and apply its statements atomically, runs in an explicit transaction
+        with self._connect() as conn:
+            conn = conn.execution_options(isolation_level="READ COMMITTED")
+            with conn.begin():
+                yield conn
+
     def watch(self, run_id, start_cursor, callback):
         if self._event_watcher is None:
-            self._event_watcher = PostgresEventWatcher(self.postgres_url, self._engine)
+            self._event_watcher = PostgresEventWatcher(self.postgres_url)
 
         self._event_watcher.watch_run(run_id, start_cursor, callback)
 
@@ -286,34 +527,38 @@ def dispose(self):
 
 def watcher_thread(
     conn_string: str,
-    engine: db.engine.Engine,
     handlers_dict: MutableMapping[str, List[CallbackAfterCursor]],
     dict_lock: threading.Lock,
     watcher_thread_exit: threading.Event,
     watcher_thread_started: threading.Event,
 ):
-    for notif in await_pg_notifications(
-        conn_string,
-        channels=[CHANNEL_NAME],
-        timeout=POLLING_CADENCE,
-        yield_on_timeout=True,
-        exit_event=watcher_thread_exit,
-        started_event=watcher_thread_started,
-    ):
-        if notif is None:
-            if watcher_thread_exit.is_set():
-                break
-        else:
-            run_id, index_str = notif.payload.split("_")
-            with dict_lock:
-                if run_id not in handlers_dict:
-                    continue
-
-            index = int(index_str)
-            with dict_lock:
-                handlers = handlers_dict.get(run_id, [])
+    # the events of all notifications are read over a single pooled connection, rather than over a
+    # new connection for each event
+    engine = create_engine(
+        conn_string, isolation_level="AUTOCOMMIT", pool_size=1, pool_pre_ping=True
+    )
+    try:
+        for notif in await_pg_notifications(
+            conn_string,
+            channels=[CHANNEL_NAME],
+            timeout=POLLING_CADENCE,
+            yield_on_timeout=True,
+            exit_event=watcher_thread_exit,
+            started_event=watcher_thread_started,
+        ):
+            if notif is None:
+                if watcher_thread_exit.is_set():
+                    break
+            else:
+                run_id, index_str = notif.payload.split("_")
+                with dict_lock:
+                    if run_id not in handlers_dict:
+                        continue
+
+                index = int(index_str)
+                with dict_lock:
+                    handlers = handlers_dict.get(run_id, [])
 
-            try:
                 with engine.connect() as conn:
                     cursor_res = conn.execute(
                         db.select([SqlEventLogStorageTable.c.event]).where(
@@ -323,23 +568,22 @@ def watcher_thread(
                     dagster_event: EventLogEntry = deserialize_json_to_dagster_namedtuple(
                         cursor_res.scalar()
                     )
-            finally:
-                engine.dispose()
 
-            for callback_with_cursor in handlers:
-                if callback_with_cursor.start_cursor < index:
-                    try:
-                        callback_with_cursor.callback(dagster_event)
-                    except Exception:
-                        logging.exception(
-                            "Exception in callback for event watch on run %s.", run_id
-                        )
+                for callback_with_cursor in handlers:
+                    if callback_with_cursor.start_cursor < index:
+                        try:
+                            callback_with_cursor.callback(dagster_event)
+                        except Exception:
+                            logging.exception(
+                                "Exception in callback for event watch on run %s.", run_id
+                            )
+    finally:
+        engine.dispose()
 
 
 class PostgresEventWatcher:
-    def __init__(self, conn_string: str, engine: db.engine.Engine):
+    def __init__(self, conn_string: str):
         self._conn_string: str = check.str_param(conn_string, "conn_string")
-        self._engine = engine
         self._handlers_dict: MutableMapping[str, List[CallbackAfterCursor]] = defaultdict(list)
         self._dict_lock: threading.Lock = threading.Lock()
         self._watcher_thread_exit: Optional[threading.Event] = None
@@ -364,7 +608,6 @@ def watch_run(
                 target=watcher_thread,
                 args=(
                     self._conn_string,
-                    self._engine,
                     self._handlers_dict,
                     self._dict_lock,
                     self._watcher_thread_exit,
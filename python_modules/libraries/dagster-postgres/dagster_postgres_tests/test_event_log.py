@@ -3,11 +3,13 @@
 import pytest
 import yaml
 from dagster_postgres.event_log import PostgresEventLogStorage
+from dagster_postgres.event_log.event_log import EVENT_LOG_LEGACY_PARTITION
 from dagster_tests.core_tests.storage_tests.utils.event_log_storage import (
     TestEventLogStorage,
     create_test_event_log_record,
 )
 
+from dagster import check
 from dagster.core.test_utils import instance_for_test
 
 
@@ -75,6 +77,44 @@ def test_event_log_storage_two_watchers(self, storage):
         assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
         assert [int(evt.message) for evt in watched_2] == [4, 5]
 
+    def test_prune_partitioned_events(self, storage):
+        run_id = "foo"
+        for i in range(5):
+            storage.store_event(create_test_event_log_record(str(i), run_id=run_id))
+
+        storage.partition_events(ids_per_partition=3)
+        with pytest.raises(check.CheckError, match="already partitioned"):
+            storage.partition_events(ids_per_partition=3)
+
+        for i in range(5, 10):
+            storage.store_event(create_test_event_log_record(str(i), run_id=run_id))
+        assert len(storage.get_logs_for_run(run_id)) == 10
+
+        time.sleep(0.05)
+        before_timestamp = time.time()
+        time.sleep(0.05)
+
+        for i in range(10, 12):
+            storage.store_event(create_test_event_log_record(str(i), run_id=run_id))
+
+        # the legacy partition and the first range partition are dropped as a whole, the old events
+        # of the partition holding the cutoff are deleted row by row
+        assert storage.prune_events(before_timestamp) == 10
+        assert [event.user_message for event in storage.get_logs_for_run(run_id)] == ["10", "11"]
+        with storage._connect() as conn:  # pylint: disable=protected-access
+            partition_names = [
+                partition.name
+                for partition in storage._get_event_log_partitions(  # pylint: disable=protected-access
+                    conn
+                )
+            ]
+        assert EVENT_LOG_LEGACY_PARTITION not in partition_names
+        assert "event_logs_6" not in partition_names
+        assert "event_logs_9" in partition_names
+
+        storage.store_event(create_test_event_log_record("12", run_id=run_id))
+        assert len(storage.get_logs_for_run(run_id)) == 3
+
     def test_load_from_config(self, hostname):
         url_cfg = """
         event_log_storage: